@@ -1,2307 +0,0 @@
-
-CIE_XYZ_Func = {
-    360: (0.000129900000, 0.000003917000, 0.000606100000),
-    361: (0.000145847000, 0.000004393581, 0.000680879200),
-    362: (0.000163802100, 0.000004929604, 0.000765145600),
-    363: (0.000184003700, 0.000005532136, 0.000860012400),
-    364: (0.000206690200, 0.000006208245, 0.000966592800),
-    365: (0.000232100000, 0.000006965000, 0.001086000000),
-    366: (0.000260728000, 0.000007813219, 0.001220586000),
-    367: (0.000293075000, 0.000008767336, 0.001372729000),
-    368: (0.000329388000, 0.000009839844, 0.001543579000),
-    369: (0.000369914000, 0.000011043230, 0.001734286000),
-    370: (0.000414900000, 0.000012390000, 0.001946000000),
-    371: (0.000464158700, 0.000013886410, 0.002177777000),
-    372: (0.000518986000, 0.000015557280, 0.002435809000),
-    373: (0.000581854000, 0.000017442960, 0.002731953000),
-    374: (0.000655234700, 0.000019583750, 0.003078064000),
-    375: (0.000741600000, 0.000022020000, 0.003486000000),
-    376: (0.000845029600, 0.000024839650, 0.003975227000),
-    377: (0.000964526800, 0.000028041260, 0.004540880000),
-    378: (0.001094949000, 0.000031531040, 0.005158320000),
-    379: (0.001231154000, 0.000035215210, 0.005802907000),
-    380: (0.001368000000, 0.000039000000, 0.006450001000),
-    381: (0.001502050000, 0.000042826400, 0.007083216000),
-    382: (0.001642328000, 0.000046914600, 0.007745488000),
-    383: (0.001802382000, 0.000051589600, 0.008501152000),
-    384: (0.001995757000, 0.000057176400, 0.009414544000),
-    385: (0.002236000000, 0.000064000000, 0.010549990000),
-    386: (0.002535385000, 0.000072344210, 0.011965800000),
-    387: (0.002892603000, 0.000082212240, 0.013655870000),
-    388: (0.003300829000, 0.000093508160, 0.015588050000),
-    389: (0.003753236000, 0.000106136100, 0.017730150000),
-    390: (0.004243000000, 0.000120000000, 0.020050010000),
-    391: (0.004762389000, 0.000134984000, 0.022511360000),
-    392: (0.005330048000, 0.000151492000, 0.025202880000),
-    393: (0.005978712000, 0.000170208000, 0.028279720000),
-    394: (0.006741117000, 0.000191816000, 0.031897040000),
-    395: (0.007650000000, 0.000217000000, 0.036210000000),
-    396: (0.008751373000, 0.000246906700, 0.041437710000),
-    397: (0.010028880000, 0.000281240000, 0.047503720000),
-    398: (0.011421700000, 0.000318520000, 0.054119880000),
-    399: (0.012869010000, 0.000357266700, 0.060998030000),
-    400: (0.014310000000, 0.000396000000, 0.067850010000),
-    401: (0.015704430000, 0.000433714700, 0.074486320000),
-    402: (0.017147440000, 0.000473024000, 0.081361560000),
-    403: (0.018781220000, 0.000517876000, 0.089153640000),
-    404: (0.020748010000, 0.000572218700, 0.098540480000),
-    405: (0.023190000000, 0.000640000000, 0.110200000000),
-    406: (0.026207360000, 0.000724560000, 0.124613300000),
-    407: (0.029782480000, 0.000825500000, 0.141701700000),
-    408: (0.033880920000, 0.000941160000, 0.161303500000),
-    409: (0.038468240000, 0.001069880000, 0.183256800000),
-    410: (0.043510000000, 0.001210000000, 0.207400000000),
-    411: (0.048995600000, 0.001362091000, 0.233692100000),
-    412: (0.055022600000, 0.001530752000, 0.262611400000),
-    413: (0.061718800000, 0.001720368000, 0.294774600000),
-    414: (0.069212000000, 0.001935323000, 0.330798500000),
-    415: (0.077630000000, 0.002180000000, 0.371300000000),
-    416: (0.086958110000, 0.002454800000, 0.416209100000),
-    417: (0.097176720000, 0.002764000000, 0.465464200000),
-    418: (0.108406300000, 0.003117800000, 0.519694800000),
-    419: (0.120767200000, 0.003526400000, 0.579530300000),
-    420: (0.134380000000, 0.004000000000, 0.645600000000),
-    421: (0.149358200000, 0.004546240000, 0.718483800000),
-    422: (0.165395700000, 0.005159320000, 0.796713300000),
-    423: (0.181983100000, 0.005829280000, 0.877845900000),
-    424: (0.198611000000, 0.006546160000, 0.959439000000),
-    425: (0.214770000000, 0.007300000000, 1.039050100000),
-    426: (0.230186800000, 0.008086507000, 1.115367300000),
-    427: (0.244879700000, 0.008908720000, 1.188497100000),
-    428: (0.258777300000, 0.009767680000, 1.258123300000),
-    429: (0.271807900000, 0.010664430000, 1.323929600000),
-    430: (0.283900000000, 0.011600000000, 1.385600000000),
-    431: (0.294943800000, 0.012573170000, 1.442635200000),
-    432: (0.304896500000, 0.013582720000, 1.494803500000),
-    433: (0.313787300000, 0.014629680000, 1.542190300000),
-    434: (0.321645400000, 0.015715090000, 1.584880700000),
-    435: (0.328500000000, 0.016840000000, 1.622960000000),
-    436: (0.334351300000, 0.018007360000, 1.656404800000),
-    437: (0.339210100000, 0.019214480000, 1.685295900000),
-    438: (0.343121300000, 0.020453920000, 1.709874500000),
-    439: (0.346129600000, 0.021718240000, 1.730382100000),
-    440: (0.348280000000, 0.023000000000, 1.747060000000),
-    441: (0.349599900000, 0.024294610000, 1.760044600000),
-    442: (0.350147400000, 0.025610240000, 1.769623300000),
-    443: (0.350013000000, 0.026958570000, 1.776263700000),
-    444: (0.349287000000, 0.028351250000, 1.780433400000),
-    445: (0.348060000000, 0.029800000000, 1.782600000000),
-    446: (0.346373300000, 0.031310830000, 1.782968200000),
-    447: (0.344262400000, 0.032883680000, 1.781699800000),
-    448: (0.341808800000, 0.034521120000, 1.779198200000),
-    449: (0.339094100000, 0.036225710000, 1.775867100000),
-    450: (0.336200000000, 0.038000000000, 1.772110000000),
-    451: (0.333197700000, 0.039846670000, 1.768258900000),
-    452: (0.330041100000, 0.041768000000, 1.764039000000),
-    453: (0.326635700000, 0.043766000000, 1.758943800000),
-    454: (0.322886800000, 0.045842670000, 1.752466300000),
-    455: (0.318700000000, 0.048000000000, 1.744100000000),
-    456: (0.314025100000, 0.050243680000, 1.733559500000),
-    457: (0.308884000000, 0.052573040000, 1.720858100000),
-    458: (0.303290400000, 0.054980560000, 1.705936900000),
-    459: (0.297257900000, 0.057458720000, 1.688737200000),
-    460: (0.290800000000, 0.060000000000, 1.669200000000),
-    461: (0.283970100000, 0.062601970000, 1.647528700000),
-    462: (0.276721400000, 0.065277520000, 1.623412700000),
-    463: (0.268917800000, 0.068042080000, 1.596022300000),
-    464: (0.260422700000, 0.070911090000, 1.564528000000),
-    465: (0.251100000000, 0.073900000000, 1.528100000000),
-    466: (0.240847500000, 0.077016000000, 1.486111400000),
-    467: (0.229851200000, 0.080266400000, 1.439521500000),
-    468: (0.218407200000, 0.083666800000, 1.389879900000),
-    469: (0.206811500000, 0.087232800000, 1.338736200000),
-    470: (0.195360000000, 0.090980000000, 1.287640000000),
-    471: (0.184213600000, 0.094917550000, 1.237422300000),
-    472: (0.173327300000, 0.099045840000, 1.187824300000),
-    473: (0.162688100000, 0.103367400000, 1.138761100000),
-    474: (0.152283300000, 0.107884600000, 1.090148000000),
-    475: (0.142100000000, 0.112600000000, 1.041900000000),
-    476: (0.132178600000, 0.117532000000, 0.994197600000),
-    477: (0.122569600000, 0.122674400000, 0.947347300000),
-    478: (0.113275200000, 0.127992800000, 0.901453100000),
-    479: (0.104297900000, 0.133452800000, 0.856619300000),
-    480: (0.095640000000, 0.139020000000, 0.812950100000),
-    481: (0.087299550000, 0.144676400000, 0.770517300000),
-    482: (0.079308040000, 0.150469300000, 0.729444800000),
-    483: (0.071717760000, 0.156461900000, 0.689913600000),
-    484: (0.064580990000, 0.162717700000, 0.652104900000),
-    485: (0.057950010000, 0.169300000000, 0.616200000000),
-    486: (0.051862110000, 0.176243100000, 0.582328600000),
-    487: (0.046281520000, 0.183558100000, 0.550416200000),
-    488: (0.041150880000, 0.191273500000, 0.520337600000),
-    489: (0.036412830000, 0.199418000000, 0.491967300000),
-    490: (0.032010000000, 0.208020000000, 0.465180000000),
-    491: (0.027917200000, 0.217119900000, 0.439924600000),
-    492: (0.024144400000, 0.226734500000, 0.416183600000),
-    493: (0.020687000000, 0.236857100000, 0.393882200000),
-    494: (0.017540400000, 0.247481200000, 0.372945900000),
-    495: (0.014700000000, 0.258600000000, 0.353300000000),
-    496: (0.012161790000, 0.270184900000, 0.334857800000),
-    497: (0.009919960000, 0.282293900000, 0.317552100000),
-    498: (0.007967240000, 0.295050500000, 0.301337500000),
-    499: (0.006296346000, 0.308578000000, 0.286168600000),
-    500: (0.004900000000, 0.323000000000, 0.272000000000),
-    501: (0.003777173000, 0.338402100000, 0.258817100000),
-    502: (0.002945320000, 0.354685800000, 0.246483800000),
-    503: (0.002424880000, 0.371698600000, 0.234771800000),
-    504: (0.002236293000, 0.389287500000, 0.223453300000),
-    505: (0.002400000000, 0.407300000000, 0.212300000000),
-    506: (0.002925520000, 0.425629900000, 0.201169200000),
-    507: (0.003836560000, 0.444309600000, 0.190119600000),
-    508: (0.005174840000, 0.463394400000, 0.179225400000),
-    509: (0.006982080000, 0.482939500000, 0.168560800000),
-    510: (0.009300000000, 0.503000000000, 0.158200000000),
-    511: (0.012149490000, 0.523569300000, 0.148138300000),
-    512: (0.015535880000, 0.544512000000, 0.138375800000),
-    513: (0.019477520000, 0.565690000000, 0.128994200000),
-    514: (0.023992770000, 0.586965300000, 0.120075100000),
-    515: (0.029100000000, 0.608200000000, 0.111700000000),
-    516: (0.034814850000, 0.629345600000, 0.103904800000),
-    517: (0.041120160000, 0.650306800000, 0.096667480000),
-    518: (0.047985040000, 0.670875200000, 0.089982720000),
-    519: (0.055378610000, 0.690842400000, 0.083845310000),
-    520: (0.063270000000, 0.710000000000, 0.078249990000),
-    521: (0.071635010000, 0.728185200000, 0.073208990000),
-    522: (0.080462240000, 0.745463600000, 0.068678160000),
-    523: (0.089739960000, 0.761969400000, 0.064567840000),
-    524: (0.099456450000, 0.777836800000, 0.060788350000),
-    525: (0.109600000000, 0.793200000000, 0.057250010000),
-    526: (0.120167400000, 0.808110400000, 0.053904350000),
-    527: (0.131114500000, 0.822496200000, 0.050746640000),
-    528: (0.142367900000, 0.836306800000, 0.047752760000),
-    529: (0.153854200000, 0.849491600000, 0.044898590000),
-    530: (0.165500000000, 0.862000000000, 0.042160000000),
-    531: (0.177257100000, 0.873810800000, 0.039507280000),
-    532: (0.189140000000, 0.884962400000, 0.036935640000),
-    533: (0.201169400000, 0.895493600000, 0.034458360000),
-    534: (0.213365800000, 0.905443200000, 0.032088720000),
-    535: (0.225749900000, 0.914850100000, 0.029840000000),
-    536: (0.238320900000, 0.923734800000, 0.027711810000),
-    537: (0.251066800000, 0.932092400000, 0.025694440000),
-    538: (0.263992200000, 0.939922600000, 0.023787160000),
-    539: (0.277101700000, 0.947225200000, 0.021989250000),
-    540: (0.290400000000, 0.954000000000, 0.020300000000),
-    541: (0.303891200000, 0.960256100000, 0.018718050000),
-    542: (0.317572600000, 0.966007400000, 0.017240360000),
-    543: (0.331438400000, 0.971260600000, 0.015863640000),
-    544: (0.345482800000, 0.976022500000, 0.014584610000),
-    545: (0.359700000000, 0.980300000000, 0.013400000000),
-    546: (0.374083900000, 0.984092400000, 0.012307230000),
-    547: (0.388639600000, 0.987418200000, 0.011301880000),
-    548: (0.403378400000, 0.990312800000, 0.010377920000),
-    549: (0.418311500000, 0.992811600000, 0.009529306000),
-    550: (0.433449900000, 0.994950100000, 0.008749999000),
-    551: (0.448795300000, 0.996710800000, 0.008035200000),
-    552: (0.464336000000, 0.998098300000, 0.007381600000),
-    553: (0.480064000000, 0.999112000000, 0.006785400000),
-    554: (0.495971300000, 0.999748200000, 0.006242800000),
-    555: (0.512050100000, 1.000000000000, 0.005749999000),
-    556: (0.528295900000, 0.999856700000, 0.005303600000),
-    557: (0.544691600000, 0.999304600000, 0.004899800000),
-    558: (0.561209400000, 0.998325500000, 0.004534200000),
-    559: (0.577821500000, 0.996898700000, 0.004202400000),
-    560: (0.594500000000, 0.995000000000, 0.003900000000),
-    561: (0.611220900000, 0.992600500000, 0.003623200000),
-    562: (0.627975800000, 0.989742600000, 0.003370600000),
-    563: (0.644760200000, 0.986444400000, 0.003141400000),
-    564: (0.661569700000, 0.982724100000, 0.002934800000),
-    565: (0.678400000000, 0.978600000000, 0.002749999000),
-    566: (0.695239200000, 0.974083700000, 0.002585200000),
-    567: (0.712058600000, 0.969171200000, 0.002438600000),
-    568: (0.728828400000, 0.963856800000, 0.002309400000),
-    569: (0.745518800000, 0.958134900000, 0.002196800000),
-    570: (0.762100000000, 0.952000000000, 0.002100000000),
-    571: (0.778543200000, 0.945450400000, 0.002017733000),
-    572: (0.794825600000, 0.938499200000, 0.001948200000),
-    573: (0.810926400000, 0.931162800000, 0.001889800000),
-    574: (0.826824800000, 0.923457600000, 0.001840933000),
-    575: (0.842500000000, 0.915400000000, 0.001800000000),
-    576: (0.857932500000, 0.907006400000, 0.001766267000),
-    577: (0.873081600000, 0.898277200000, 0.001737800000),
-    578: (0.887894400000, 0.889204800000, 0.001711200000),
-    579: (0.902318100000, 0.879781600000, 0.001683067000),
-    580: (0.916300000000, 0.870000000000, 0.001650001000),
-    581: (0.929799500000, 0.859861300000, 0.001610133000),
-    582: (0.942798400000, 0.849392000000, 0.001564400000),
-    583: (0.955277600000, 0.838622000000, 0.001513600000),
-    584: (0.967217900000, 0.827581300000, 0.001458533000),
-    585: (0.978600000000, 0.816300000000, 0.001400000000),
-    586: (0.989385600000, 0.804794700000, 0.001336667000),
-    587: (0.999548800000, 0.793082000000, 0.001270000000),
-    588: (1.009089200000, 0.781192000000, 0.001205000000),
-    589: (1.018006400000, 0.769154700000, 0.001146667000),
-    590: (1.026300000000, 0.757000000000, 0.001100000000),
-    591: (1.033982700000, 0.744754100000, 0.001068800000),
-    592: (1.040986000000, 0.732422400000, 0.001049400000),
-    593: (1.047188000000, 0.720003600000, 0.001035600000),
-    594: (1.052466700000, 0.707496500000, 0.001021200000),
-    595: (1.056700000000, 0.694900000000, 0.001000000000),
-    596: (1.059794400000, 0.682219200000, 0.000968640000),
-    597: (1.061799200000, 0.669471600000, 0.000929920000),
-    598: (1.062806800000, 0.656674400000, 0.000886880000),
-    599: (1.062909600000, 0.643844800000, 0.000842560000),
-    600: (1.062200000000, 0.631000000000, 0.000800000000),
-    601: (1.060735200000, 0.618155500000, 0.000760960000),
-    602: (1.058443600000, 0.605314400000, 0.000723680000),
-    603: (1.055224400000, 0.592475600000, 0.000685920000),
-    604: (1.050976800000, 0.579637900000, 0.000645440000),
-    605: (1.045600000000, 0.566800000000, 0.000600000000),
-    606: (1.039036900000, 0.553961100000, 0.000547866700),
-    607: (1.031360800000, 0.541137200000, 0.000491600000),
-    608: (1.022666200000, 0.528352800000, 0.000435400000),
-    609: (1.013047700000, 0.515632300000, 0.000383466700),
-    610: (1.002600000000, 0.503000000000, 0.000340000000),
-    611: (0.991367500000, 0.490468800000, 0.000307253300),
-    612: (0.979331400000, 0.478030400000, 0.000283160000),
-    613: (0.966491600000, 0.465677600000, 0.000265440000),
-    614: (0.952847900000, 0.453403200000, 0.000251813300),
-    615: (0.938400000000, 0.441200000000, 0.000240000000),
-    616: (0.923194000000, 0.429080000000, 0.000229546700),
-    617: (0.907244000000, 0.417036000000, 0.000220640000),
-    618: (0.890502000000, 0.405032000000, 0.000211960000),
-    619: (0.872920000000, 0.393032000000, 0.000202186700),
-    620: (0.854449900000, 0.381000000000, 0.000190000000),
-    621: (0.835084000000, 0.368918400000, 0.000174213300),
-    622: (0.814946000000, 0.356827200000, 0.000155640000),
-    623: (0.794186000000, 0.344776800000, 0.000135960000),
-    624: (0.772954000000, 0.332817600000, 0.000116853300),
-    625: (0.751400000000, 0.321000000000, 0.000100000000),
-    626: (0.729583600000, 0.309338100000, 0.000086133330),
-    627: (0.707588800000, 0.297850400000, 0.000074600000),
-    628: (0.685602200000, 0.286593600000, 0.000065000000),
-    629: (0.663810400000, 0.275624500000, 0.000056933330),
-    630: (0.642400000000, 0.265000000000, 0.000049999990),
-    631: (0.621514900000, 0.254763200000, 0.000044160000),
-    632: (0.601113800000, 0.244889600000, 0.000039480000),
-    633: (0.581105200000, 0.235334400000, 0.000035720000),
-    634: (0.561397700000, 0.226052800000, 0.000032640000),
-    635: (0.541900000000, 0.217000000000, 0.000030000000),
-    636: (0.522599500000, 0.208161600000, 0.000027653330),
-    637: (0.503546400000, 0.199548800000, 0.000025560000),
-    638: (0.484743600000, 0.191155200000, 0.000023640000),
-    639: (0.466193900000, 0.182974400000, 0.000021813330),
-    640: (0.447900000000, 0.175000000000, 0.000020000000),
-    641: (0.429861300000, 0.167223500000, 0.000018133330),
-    642: (0.412098000000, 0.159646400000, 0.000016200000),
-    643: (0.394644000000, 0.152277600000, 0.000014200000),
-    644: (0.377533300000, 0.145125900000, 0.000012133330),
-    645: (0.360800000000, 0.138200000000, 0.000010000000),
-    646: (0.344456300000, 0.131500300000, 0.000007733333),
-    647: (0.328516800000, 0.125024800000, 0.000005400000),
-    648: (0.313019200000, 0.118779200000, 0.000003200000),
-    649: (0.298001100000, 0.112769100000, 0.000001333333),
-    650: (0.283500000000, 0.107000000000, 0.000000000000),
-    651: (0.269544800000, 0.101476200000, 0.000000000000),
-    652: (0.256118400000, 0.096188640000, 0.000000000000),
-    653: (0.243189600000, 0.091122960000, 0.000000000000),
-    654: (0.230727200000, 0.086264850000, 0.000000000000),
-    655: (0.218700000000, 0.081600000000, 0.000000000000),
-    656: (0.207097100000, 0.077120640000, 0.000000000000),
-    657: (0.195923200000, 0.072825520000, 0.000000000000),
-    658: (0.185170800000, 0.068710080000, 0.000000000000),
-    659: (0.174832300000, 0.064769760000, 0.000000000000),
-    660: (0.164900000000, 0.061000000000, 0.000000000000),
-    661: (0.155366700000, 0.057396210000, 0.000000000000),
-    662: (0.146230000000, 0.053955040000, 0.000000000000),
-    663: (0.137490000000, 0.050673760000, 0.000000000000),
-    664: (0.129146700000, 0.047549650000, 0.000000000000),
-    665: (0.121200000000, 0.044580000000, 0.000000000000),
-    666: (0.113639700000, 0.041758720000, 0.000000000000),
-    667: (0.106465000000, 0.039084960000, 0.000000000000),
-    668: (0.099690440000, 0.036563840000, 0.000000000000),
-    669: (0.093330610000, 0.034200480000, 0.000000000000),
-    670: (0.087400000000, 0.032000000000, 0.000000000000),
-    671: (0.081900960000, 0.029962610000, 0.000000000000),
-    672: (0.076804280000, 0.028076640000, 0.000000000000),
-    673: (0.072077120000, 0.026329360000, 0.000000000000),
-    674: (0.067686640000, 0.024708050000, 0.000000000000),
-    675: (0.063600000000, 0.023200000000, 0.000000000000),
-    676: (0.059806850000, 0.021800770000, 0.000000000000),
-    677: (0.056282160000, 0.020501120000, 0.000000000000),
-    678: (0.052971040000, 0.019281080000, 0.000000000000),
-    679: (0.049818610000, 0.018120690000, 0.000000000000),
-    680: (0.046770000000, 0.017000000000, 0.000000000000),
-    681: (0.043784050000, 0.015903790000, 0.000000000000),
-    682: (0.040875360000, 0.014837180000, 0.000000000000),
-    683: (0.038072640000, 0.013810680000, 0.000000000000),
-    684: (0.035404610000, 0.012834780000, 0.000000000000),
-    685: (0.032900000000, 0.011920000000, 0.000000000000),
-    686: (0.030564190000, 0.011068310000, 0.000000000000),
-    687: (0.028380560000, 0.010273390000, 0.000000000000),
-    688: (0.026344840000, 0.009533311000, 0.000000000000),
-    689: (0.024452750000, 0.008846157000, 0.000000000000),
-    690: (0.022700000000, 0.008210000000, 0.000000000000),
-    691: (0.021084290000, 0.007623781000, 0.000000000000),
-    692: (0.019599880000, 0.007085424000, 0.000000000000),
-    693: (0.018237320000, 0.006591476000, 0.000000000000),
-    694: (0.016987170000, 0.006138485000, 0.000000000000),
-    695: (0.015840000000, 0.005723000000, 0.000000000000),
-    696: (0.014790640000, 0.005343059000, 0.000000000000),
-    697: (0.013831320000, 0.004995796000, 0.000000000000),
-    698: (0.012948680000, 0.004676404000, 0.000000000000),
-    699: (0.012129200000, 0.004380075000, 0.000000000000),
-    700: (0.011359160000, 0.004102000000, 0.000000000000),
-    701: (0.010629350000, 0.003838453000, 0.000000000000),
-    702: (0.009938846000, 0.003589099000, 0.000000000000),
-    703: (0.009288422000, 0.003354219000, 0.000000000000),
-    704: (0.008678854000, 0.003134093000, 0.000000000000),
-    705: (0.008110916000, 0.002929000000, 0.000000000000),
-    706: (0.007582388000, 0.002738139000, 0.000000000000),
-    707: (0.007088746000, 0.002559876000, 0.000000000000),
-    708: (0.006627313000, 0.002393244000, 0.000000000000),
-    709: (0.006195408000, 0.002237275000, 0.000000000000),
-    710: (0.005790346000, 0.002091000000, 0.000000000000),
-    711: (0.005409826000, 0.001953587000, 0.000000000000),
-    712: (0.005052583000, 0.001824580000, 0.000000000000),
-    713: (0.004717512000, 0.001703580000, 0.000000000000),
-    714: (0.004403507000, 0.001590187000, 0.000000000000),
-    715: (0.004109457000, 0.001484000000, 0.000000000000),
-    716: (0.003833913000, 0.001384496000, 0.000000000000),
-    717: (0.003575748000, 0.001291268000, 0.000000000000),
-    718: (0.003334342000, 0.001204092000, 0.000000000000),
-    719: (0.003109075000, 0.001122744000, 0.000000000000),
-    720: (0.002899327000, 0.001047000000, 0.000000000000),
-    721: (0.002704348000, 0.000976589600, 0.000000000000),
-    722: (0.002523020000, 0.000911108800, 0.000000000000),
-    723: (0.002354168000, 0.000850133200, 0.000000000000),
-    724: (0.002196616000, 0.000793238400, 0.000000000000),
-    725: (0.002049190000, 0.000740000000, 0.000000000000),
-    726: (0.001910960000, 0.000690082700, 0.000000000000),
-    727: (0.001781438000, 0.000643310000, 0.000000000000),
-    728: (0.001660110000, 0.000599496000, 0.000000000000),
-    729: (0.001546459000, 0.000558454700, 0.000000000000),
-    730: (0.001439971000, 0.000520000000, 0.000000000000),
-    731: (0.001340042000, 0.000483913600, 0.000000000000),
-    732: (0.001246275000, 0.000450052800, 0.000000000000),
-    733: (0.001158471000, 0.000418345200, 0.000000000000),
-    734: (0.001076430000, 0.000388718400, 0.000000000000),
-    735: (0.000999949300, 0.000361100000, 0.000000000000),
-    736: (0.000928735800, 0.000335383500, 0.000000000000),
-    737: (0.000862433200, 0.000311440400, 0.000000000000),
-    738: (0.000800750300, 0.000289165600, 0.000000000000),
-    739: (0.000743396000, 0.000268453900, 0.000000000000),
-    740: (0.000690078600, 0.000249200000, 0.000000000000),
-    741: (0.000640515600, 0.000231301900, 0.000000000000),
-    742: (0.000594502100, 0.000214685600, 0.000000000000),
-    743: (0.000551864600, 0.000199288400, 0.000000000000),
-    744: (0.000512429000, 0.000185047500, 0.000000000000),
-    745: (0.000476021300, 0.000171900000, 0.000000000000),
-    746: (0.000442453600, 0.000159778100, 0.000000000000),
-    747: (0.000411511700, 0.000148604400, 0.000000000000),
-    748: (0.000382981400, 0.000138301600, 0.000000000000),
-    749: (0.000356649100, 0.000128792500, 0.000000000000),
-    750: (0.000332301100, 0.000120000000, 0.000000000000),
-    751: (0.000309758600, 0.000111859500, 0.000000000000),
-    752: (0.000288887100, 0.000104322400, 0.000000000000),
-    753: (0.000269539400, 0.000097335600, 0.000000000000),
-    754: (0.000251568200, 0.000090845870, 0.000000000000),
-    755: (0.000234826100, 0.000084800000, 0.000000000000),
-    756: (0.000219171000, 0.000079146670, 0.000000000000),
-    757: (0.000204525800, 0.000073858000, 0.000000000000),
-    758: (0.000190840500, 0.000068916000, 0.000000000000),
-    759: (0.000178065400, 0.000064302670, 0.000000000000),
-    760: (0.000166150500, 0.000060000000, 0.000000000000),
-    761: (0.000155023600, 0.000055981870, 0.000000000000),
-    762: (0.000144621900, 0.000052225600, 0.000000000000),
-    763: (0.000134909800, 0.000048718400, 0.000000000000),
-    764: (0.000125852000, 0.000045447470, 0.000000000000),
-    765: (0.000117413000, 0.000042400000, 0.000000000000),
-    766: (0.000109551500, 0.000039561040, 0.000000000000),
-    767: (0.000102224500, 0.000036915120, 0.000000000000),
-    768: (0.000095394450, 0.000034448680, 0.000000000000),
-    769: (0.000089023900, 0.000032148160, 0.000000000000),
-    770: (0.000083075270, 0.000030000000, 0.000000000000),
-    771: (0.000077512690, 0.000027991250, 0.000000000000),
-    772: (0.000072313040, 0.000026113560, 0.000000000000),
-    773: (0.000067457780, 0.000024360240, 0.000000000000),
-    774: (0.000062928440, 0.000022724610, 0.000000000000),
-    775: (0.000058706520, 0.000021200000, 0.000000000000),
-    776: (0.000054770280, 0.000019778550, 0.000000000000),
-    777: (0.000051099180, 0.000018452850, 0.000000000000),
-    778: (0.000047676540, 0.000017216870, 0.000000000000),
-    779: (0.000044485670, 0.000016064590, 0.000000000000),
-    780: (0.000041509940, 0.000014990000, 0.000000000000),
-    781: (0.000038733240, 0.000013987280, 0.000000000000),
-    782: (0.000036142030, 0.000013051550, 0.000000000000),
-    783: (0.000033723520, 0.000012178180, 0.000000000000),
-    784: (0.000031464870, 0.000011362540, 0.000000000000),
-    785: (0.000029353260, 0.000010600000, 0.000000000000),
-    786: (0.000027375730, 0.000009885877, 0.000000000000),
-    787: (0.000025524330, 0.000009217304, 0.000000000000),
-    788: (0.000023793760, 0.000008592362, 0.000000000000),
-    789: (0.000022178700, 0.000008009133, 0.000000000000),
-    790: (0.000020673830, 0.000007465700, 0.000000000000),
-    791: (0.000019272260, 0.000006959567, 0.000000000000),
-    792: (0.000017966400, 0.000006487995, 0.000000000000),
-    793: (0.000016749910, 0.000006048699, 0.000000000000),
-    794: (0.000015616480, 0.000005639396, 0.000000000000),
-    795: (0.000014559770, 0.000005257800, 0.000000000000),
-    796: (0.000013573870, 0.000004901771, 0.000000000000),
-    797: (0.000012654360, 0.000004569720, 0.000000000000),
-    798: (0.000011797230, 0.000004260194, 0.000000000000),
-    799: (0.000010998440, 0.000003971739, 0.000000000000),
-    800: (0.000010253980, 0.000003702900, 0.000000000000),
-    801: (0.000009559646, 0.000003452163, 0.000000000000),
-    802: (0.000008912044, 0.000003218302, 0.000000000000),
-    803: (0.000008308358, 0.000003000300, 0.000000000000),
-    804: (0.000007745769, 0.000002797139, 0.000000000000),
-    805: (0.000007221456, 0.000002607800, 0.000000000000),
-    806: (0.000006732475, 0.000002431220, 0.000000000000),
-    807: (0.000006276423, 0.000002266531, 0.000000000000),
-    808: (0.000005851304, 0.000002113013, 0.000000000000),
-    809: (0.000005455118, 0.000001969943, 0.000000000000),
-    810: (0.000005085868, 0.000001836600, 0.000000000000),
-    811: (0.000004741466, 0.000001712230, 0.000000000000),
-    812: (0.000004420236, 0.000001596228, 0.000000000000),
-    813: (0.000004120783, 0.000001488090, 0.000000000000),
-    814: (0.000003841716, 0.000001387314, 0.000000000000),
-    815: (0.000003581652, 0.000001293400, 0.000000000000),
-    816: (0.000003339127, 0.000001205820, 0.000000000000),
-    817: (0.000003112949, 0.000001124143, 0.000000000000),
-    818: (0.000002902121, 0.000001048009, 0.000000000000),
-    819: (0.000002705645, 0.000000977058, 0.000000000000),
-    820: (0.000002522525, 0.000000910930, 0.000000000000),
-    821: (0.000002351726, 0.000000849251, 0.000000000000),
-    822: (0.000002192415, 0.000000791721, 0.000000000000),
-    823: (0.000002043902, 0.000000738090, 0.000000000000),
-    824: (0.000001905497, 0.000000688110, 0.000000000000),
-    825: (0.000001776509, 0.000000641530, 0.000000000000),
-    826: (0.000001656215, 0.000000598090, 0.000000000000),
-    827: (0.000001544022, 0.000000557575, 0.000000000000),
-    828: (0.000001439440, 0.000000519808, 0.000000000000),
-    829: (0.000001341977, 0.000000484612, 0.000000000000),
-    830: (0.000001251141, 0.000000451810, 0.000000000000),
-}
-Scotopic_func = {
-    360: 0.0000039170000,
-    361: 0.0000043935810,
-    362: 0.0000049296040,
-    363: 0.0000055321360,
-    364: 0.0000062082450,
-    365: 0.0000069650000,
-    366: 0.0000078132190,
-    367: 0.0000087673360,
-    368: 0.0000098398440,
-    369: 0.0000110432300,
-    370: 0.0000123900000,
-    371: 0.0000138864100,
-    372: 0.0000155572800,
-    373: 0.0000174429600,
-    374: 0.0000195837500,
-    375: 0.0000220200000,
-    376: 0.0000248396500,
-    377: 0.0000280412600,
-    378: 0.0000315310400,
-    379: 0.0000352152100,
-    380: 0.0000390000000,
-    381: 0.0000428264000,
-    382: 0.0000469146000,
-    383: 0.0000515896000,
-    384: 0.0000571764000,
-    385: 0.0000640000000,
-    386: 0.0000723442100,
-    387: 0.0000822122400,
-    388: 0.0000935081600,
-    389: 0.0001061361000,
-    390: 0.0001200000000,
-    391: 0.0001349840000,
-    392: 0.0001514920000,
-    393: 0.0001702080000,
-    394: 0.0001918160000,
-    395: 0.0002170000000,
-    396: 0.0002469067000,
-    397: 0.0002812400000,
-    398: 0.0003185200000,
-    399: 0.0003572667000,
-    400: 0.0003960000000,
-    401: 0.0004337147000,
-    402: 0.0004730240000,
-    403: 0.0005178760000,
-    404: 0.0005722187000,
-    405: 0.0006400000000,
-    406: 0.0007245600000,
-    407: 0.0008255000000,
-    408: 0.0009411600000,
-    409: 0.0010698800000,
-    410: 0.0012100000000,
-    411: 0.0013620910000,
-    412: 0.0015307520000,
-    413: 0.0017203680000,
-    414: 0.0019353230000,
-    415: 0.0021800000000,
-    416: 0.0024548000000,
-    417: 0.0027640000000,
-    418: 0.0031178000000,
-    419: 0.0035264000000,
-    420: 0.0040000000000,
-    421: 0.0045462400000,
-    422: 0.0051593200000,
-    423: 0.0058292800000,
-    424: 0.0065461600000,
-    425: 0.0073000000000,
-    426: 0.0080865070000,
-    427: 0.0089087200000,
-    428: 0.0097676800000,
-    429: 0.0106644300000,
-    430: 0.0116000000000,
-    431: 0.0125731700000,
-    432: 0.0135827200000,
-    433: 0.0146296800000,
-    434: 0.0157150900000,
-    435: 0.0168400000000,
-    436: 0.0180073600000,
-    437: 0.0192144800000,
-    438: 0.0204539200000,
-    439: 0.0217182400000,
-    440: 0.0230000000000,
-    441: 0.0242946100000,
-    442: 0.0256102400000,
-    443: 0.0269585700000,
-    444: 0.0283512500000,
-    445: 0.0298000000000,
-    446: 0.0313108300000,
-    447: 0.0328836800000,
-    448: 0.0345211200000,
-    449: 0.0362257100000,
-    450: 0.0380000000000,
-    451: 0.0398466700000,
-    452: 0.0417680000000,
-    453: 0.0437660000000,
-    454: 0.0458426700000,
-    455: 0.0480000000000,
-    456: 0.0502436800000,
-    457: 0.0525730400000,
-    458: 0.0549805600000,
-    459: 0.0574587200000,
-    460: 0.0600000000000,
-    461: 0.0626019700000,
-    462: 0.0652775200000,
-    463: 0.0680420800000,
-    464: 0.0709110900000,
-    465: 0.0739000000000,
-    466: 0.0770160000000,
-    467: 0.0802664000000,
-    468: 0.0836668000000,
-    469: 0.0872328000000,
-    470: 0.0909800000000,
-    471: 0.0949175500000,
-    472: 0.0990458400000,
-    473: 0.1033674000000,
-    474: 0.1078846000000,
-    475: 0.1126000000000,
-    476: 0.1175320000000,
-    477: 0.1226744000000,
-    478: 0.1279928000000,
-    479: 0.1334528000000,
-    480: 0.1390200000000,
-    481: 0.1446764000000,
-    482: 0.1504693000000,
-    483: 0.1564619000000,
-    484: 0.1627177000000,
-    485: 0.1693000000000,
-    486: 0.1762431000000,
-    487: 0.1835581000000,
-    488: 0.1912735000000,
-    489: 0.1994180000000,
-    490: 0.2080200000000,
-    491: 0.2171199000000,
-    492: 0.2267345000000,
-    493: 0.2368571000000,
-    494: 0.2474812000000,
-    495: 0.2586000000000,
-    496: 0.2701849000000,
-    497: 0.2822939000000,
-    498: 0.2950505000000,
-    499: 0.3085780000000,
-    500: 0.3230000000000,
-    501: 0.3384021000000,
-    502: 0.3546858000000,
-    503: 0.3716986000000,
-    504: 0.3892875000000,
-    505: 0.4073000000000,
-    506: 0.4256299000000,
-    507: 0.4443096000000,
-    508: 0.4633944000000,
-    509: 0.4829395000000,
-    510: 0.5030000000000,
-    511: 0.5235693000000,
-    512: 0.5445120000000,
-    513: 0.5656900000000,
-    514: 0.5869653000000,
-    515: 0.6082000000000,
-    516: 0.6293456000000,
-    517: 0.6503068000000,
-    518: 0.6708752000000,
-    519: 0.6908424000000,
-    520: 0.7100000000000,
-    521: 0.7281852000000,
-    522: 0.7454636000000,
-    523: 0.7619694000000,
-    524: 0.7778368000000,
-    525: 0.7932000000000,
-    526: 0.8081104000000,
-    527: 0.8224962000000,
-    528: 0.8363068000000,
-    529: 0.8494916000000,
-    530: 0.8620000000000,
-    531: 0.8738108000000,
-    532: 0.8849624000000,
-    533: 0.8954936000000,
-    534: 0.9054432000000,
-    535: 0.9148501000000,
-    536: 0.9237348000000,
-    537: 0.9320924000000,
-    538: 0.9399226000000,
-    539: 0.9472252000000,
-    540: 0.9540000000000,
-    541: 0.9602561000000,
-    542: 0.9660074000000,
-    543: 0.9712606000000,
-    544: 0.9760225000000,
-    545: 0.9803000000000,
-    546: 0.9840924000000,
-    547: 0.9874182000000,
-    548: 0.9903128000000,
-    549: 0.9928116000000,
-    550: 0.9949501000000,
-    551: 0.9967108000000,
-    552: 0.9980983000000,
-    553: 0.9991120000000,
-    554: 0.9997482000000,
-    555: 1.0000000000000,
-    556: 0.9998567000000,
-    557: 0.9993046000000,
-    558: 0.9983255000000,
-    559: 0.9968987000000,
-    560: 0.9950000000000,
-    561: 0.9926005000000,
-    562: 0.9897426000000,
-    563: 0.9864444000000,
-    564: 0.9827241000000,
-    565: 0.9786000000000,
-    566: 0.9740837000000,
-    567: 0.9691712000000,
-    568: 0.9638568000000,
-    569: 0.9581349000000,
-    570: 0.9520000000000,
-    571: 0.9454504000000,
-    572: 0.9384992000000,
-    573: 0.9311628000000,
-    574: 0.9234576000000,
-    575: 0.9154000000000,
-    576: 0.9070064000000,
-    577: 0.8982772000000,
-    578: 0.8892048000000,
-    579: 0.8797816000000,
-    580: 0.8700000000000,
-    581: 0.8598613000000,
-    582: 0.8493920000000,
-    583: 0.8386220000000,
-    584: 0.8275813000000,
-    585: 0.8163000000000,
-    586: 0.8047947000000,
-    587: 0.7930820000000,
-    588: 0.7811920000000,
-    589: 0.7691547000000,
-    590: 0.7570000000000,
-    591: 0.7447541000000,
-    592: 0.7324224000000,
-    593: 0.7200036000000,
-    594: 0.7074965000000,
-    595: 0.6949000000000,
-    596: 0.6822192000000,
-    597: 0.6694716000000,
-    598: 0.6566744000000,
-    599: 0.6438448000000,
-    600: 0.6310000000000,
-    601: 0.6181555000000,
-    602: 0.6053144000000,
-    603: 0.5924756000000,
-    604: 0.5796379000000,
-    605: 0.5668000000000,
-    606: 0.5539611000000,
-    607: 0.5411372000000,
-    608: 0.5283528000000,
-    609: 0.5156323000000,
-    610: 0.5030000000000,
-    611: 0.4904688000000,
-    612: 0.4780304000000,
-    613: 0.4656776000000,
-    614: 0.4534032000000,
-    615: 0.4412000000000,
-    616: 0.4290800000000,
-    617: 0.4170360000000,
-    618: 0.4050320000000,
-    619: 0.3930320000000,
-    620: 0.3810000000000,
-    621: 0.3689184000000,
-    622: 0.3568272000000,
-    623: 0.3447768000000,
-    624: 0.3328176000000,
-    625: 0.3210000000000,
-    626: 0.3093381000000,
-    627: 0.2978504000000,
-    628: 0.2865936000000,
-    629: 0.2756245000000,
-    630: 0.2650000000000,
-    631: 0.2547632000000,
-    632: 0.2448896000000,
-    633: 0.2353344000000,
-    634: 0.2260528000000,
-    635: 0.2170000000000,
-    636: 0.2081616000000,
-    637: 0.1995488000000,
-    638: 0.1911552000000,
-    639: 0.1829744000000,
-    640: 0.1750000000000,
-    641: 0.1672235000000,
-    642: 0.1596464000000,
-    643: 0.1522776000000,
-    644: 0.1451259000000,
-    645: 0.1382000000000,
-    646: 0.1315003000000,
-    647: 0.1250248000000,
-    648: 0.1187792000000,
-    649: 0.1127691000000,
-    650: 0.1070000000000,
-    651: 0.1014762000000,
-    652: 0.0961886400000,
-    653: 0.0911229600000,
-    654: 0.0862648500000,
-    655: 0.0816000000000,
-    656: 0.0771206400000,
-    657: 0.0728255200000,
-    658: 0.0687100800000,
-    659: 0.0647697600000,
-    660: 0.0610000000000,
-    661: 0.0573962100000,
-    662: 0.0539550400000,
-    663: 0.0506737600000,
-    664: 0.0475496500000,
-    665: 0.0445800000000,
-    666: 0.0417587200000,
-    667: 0.0390849600000,
-    668: 0.0365638400000,
-    669: 0.0342004800000,
-    670: 0.0320000000000,
-    671: 0.0299626100000,
-    672: 0.0280766400000,
-    673: 0.0263293600000,
-    674: 0.0247080500000,
-    675: 0.0232000000000,
-    676: 0.0218007700000,
-    677: 0.0205011200000,
-    678: 0.0192810800000,
-    679: 0.0181206900000,
-    680: 0.0170000000000,
-    681: 0.0159037900000,
-    682: 0.0148371800000,
-    683: 0.0138106800000,
-    684: 0.0128347800000,
-    685: 0.0119200000000,
-    686: 0.0110683100000,
-    687: 0.0102733900000,
-    688: 0.0095333110000,
-    689: 0.0088461570000,
-    690: 0.0082100000000,
-    691: 0.0076237810000,
-    692: 0.0070854240000,
-    693: 0.0065914760000,
-    694: 0.0061384850000,
-    695: 0.0057230000000,
-    696: 0.0053430590000,
-    697: 0.0049957960000,
-    698: 0.0046764040000,
-    699: 0.0043800750000,
-    700: 0.0041020000000,
-    701: 0.0038384530000,
-    702: 0.0035890990000,
-    703: 0.0033542190000,
-    704: 0.0031340930000,
-    705: 0.0029290000000,
-    706: 0.0027381390000,
-    707: 0.0025598760000,
-    708: 0.0023932440000,
-    709: 0.0022372750000,
-    710: 0.0020910000000,
-    711: 0.0019535870000,
-    712: 0.0018245800000,
-    713: 0.0017035800000,
-    714: 0.0015901870000,
-    715: 0.0014840000000,
-    716: 0.0013844960000,
-    717: 0.0012912680000,
-    718: 0.0012040920000,
-    719: 0.0011227440000,
-    720: 0.0010470000000,
-    721: 0.0009765896000,
-    722: 0.0009111088000,
-    723: 0.0008501332000,
-    724: 0.0007932384000,
-    725: 0.0007400000000,
-    726: 0.0006900827000,
-    727: 0.0006433100000,
-    728: 0.0005994960000,
-    729: 0.0005584547000,
-    730: 0.0005200000000,
-    731: 0.0004839136000,
-    732: 0.0004500528000,
-    733: 0.0004183452000,
-    734: 0.0003887184000,
-    735: 0.0003611000000,
-    736: 0.0003353835000,
-    737: 0.0003114404000,
-    738: 0.0002891656000,
-    739: 0.0002684539000,
-    740: 0.0002492000000,
-    741: 0.0002313019000,
-    742: 0.0002146856000,
-    743: 0.0001992884000,
-    744: 0.0001850475000,
-    745: 0.0001719000000,
-    746: 0.0001597781000,
-    747: 0.0001486044000,
-    748: 0.0001383016000,
-    749: 0.0001287925000,
-    750: 0.0001200000000,
-    751: 0.0001118595000,
-    752: 0.0001043224000,
-    753: 0.0000973356000,
-    754: 0.0000908458700,
-    755: 0.0000848000000,
-    756: 0.0000791466700,
-    757: 0.0000738580000,
-    758: 0.0000689160000,
-    759: 0.0000643026700,
-    760: 0.0000600000000,
-    761: 0.0000559818700,
-    762: 0.0000522256000,
-    763: 0.0000487184000,
-    764: 0.0000454474700,
-    765: 0.0000424000000,
-    766: 0.0000395610400,
-    767: 0.0000369151200,
-    768: 0.0000344486800,
-    769: 0.0000321481600,
-    770: 0.0000300000000,
-    771: 0.0000279912500,
-    772: 0.0000261135600,
-    773: 0.0000243602400,
-    774: 0.0000227246100,
-    775: 0.0000212000000,
-    776: 0.0000197785500,
-    777: 0.0000184528500,
-    778: 0.0000172168700,
-    779: 0.0000160645900,
-    780: 0.0000149900000,
-    781: 0.0000139872800,
-    782: 0.0000130515500,
-    783: 0.0000121781800,
-    784: 0.0000113625400,
-    785: 0.0000106000000,
-    786: 0.0000098858770,
-    787: 0.0000092173040,
-    788: 0.0000085923620,
-    789: 0.0000080091330,
-    790: 0.0000074657000,
-    791: 0.0000069595670,
-    792: 0.0000064879950,
-    793: 0.0000060486990,
-    794: 0.0000056393960,
-    795: 0.0000052578000,
-    796: 0.0000049017710,
-    797: 0.0000045697200,
-    798: 0.0000042601940,
-    799: 0.0000039717390,
-    800: 0.0000037029000,
-    801: 0.0000034521630,
-    802: 0.0000032183020,
-    803: 0.0000030003000,
-    804: 0.0000027971390,
-    805: 0.0000026078000,
-    806: 0.0000024312200,
-    807: 0.0000022665310,
-    808: 0.0000021130130,
-    809: 0.0000019699430,
-    810: 0.0000018366000,
-    811: 0.0000017122300,
-    812: 0.0000015962280,
-    813: 0.0000014880900,
-    814: 0.0000013873140,
-    815: 0.0000012934000,
-    816: 0.0000012058200,
-    817: 0.0000011241430,
-    818: 0.0000010480090,
-    819: 0.0000009770578,
-    820: 0.0000009109300,
-    821: 0.0000008492513,
-    822: 0.0000007917212,
-    823: 0.0000007380904,
-    824: 0.0000006881098,
-    825: 0.0000006415300,
-    826: 0.0000005980895,
-    827: 0.0000005575746,
-    828: 0.0000005198080,
-    829: 0.0000004846123,
-    830: 0.0000004518100,
-}
-color_standards = {
-    "1": {
-        360: 0.116,
-        365: 0.136,
-        370: 0.159,
-        375: 0.190,
-        380: 0.219,
-        385: 0.239,
-        390: 0.252,
-        395: 0.256,
-        400: 0.256,
-        405: 0.254,
-        410: 0.252,
-        415: 0.248,
-        420: 0.244,
-        425: 0.240,
-        430: 0.237,
-        435: 0.232,
-        440: 0.230,
-        445: 0.226,
-        450: 0.225,
-        455: 0.222,
-        460: 0.220,
-        465: 0.218,
-        470: 0.216,
-        475: 0.214,
-        480: 0.214,
-        485: 0.214,
-        490: 0.216,
-        495: 0.218,
-        500: 0.223,
-        505: 0.225,
-        510: 0.226,
-        515: 0.226,
-        520: 0.225,
-        525: 0.225,
-        530: 0.227,
-        535: 0.230,
-        540: 0.236,
-        545: 0.245,
-        550: 0.253,
-        555: 0.262,
-        560: 0.272,
-        565: 0.283,
-        570: 0.298,
-        575: 0.318,
-        580: 0.341,
-        585: 0.367,
-        590: 0.390,
-        595: 0.409,
-        600: 0.424,
-        605: 0.435,
-        610: 0.442,
-        615: 0.448,
-        620: 0.450,
-        625: 0.451,
-        630: 0.451,
-        635: 0.451,
-        640: 0.451,
-        645: 0.451,
-        650: 0.450,
-        655: 0.450,
-        660: 0.451,
-        665: 0.451,
-        670: 0.453,
-        675: 0.454,
-        680: 0.455,
-        685: 0.457,
-        690: 0.458,
-        695: 0.460,
-        700: 0.462,
-        705: 0.463,
-        710: 0.464,
-        715: 0.465,
-        720: 0.466,
-        725: 0.466,
-        730: 0.466,
-        735: 0.466,
-        740: 0.467,
-        745: 0.467,
-        750: 0.467,
-        755: 0.467,
-        760: 0.467,
-        765: 0.467,
-        770: 0.467,
-        775: 0.467,
-        780: 0.467,
-        785: 0.467,
-        790: 0.467,
-        795: 0.466,
-        800: 0.466,
-        805: 0.466,
-        810: 0.466,
-        815: 0.466,
-        820: 0.465,
-        825: 0.464,
-        830: 0.464,
-    },
-    "2": {
-        360: 0.053,
-        365: 0.055,
-        370: 0.059,
-        375: 0.064,
-        380: 0.070,
-        385: 0.079,
-        390: 0.089,
-        395: 0.101,
-        400: 0.111,
-        405: 0.116,
-        410: 0.118,
-        415: 0.120,
-        420: 0.121,
-        425: 0.122,
-        430: 0.122,
-        435: 0.122,
-        440: 0.123,
-        445: 0.124,
-        450: 0.127,
-        455: 0.128,
-        460: 0.131,
-        465: 0.134,
-        470: 0.138,
-        475: 0.143,
-        480: 0.150,
-        485: 0.159,
-        490: 0.174,
-        495: 0.190,
-        500: 0.207,
-        505: 0.225,
-        510: 0.242,
-        515: 0.253,
-        520: 0.260,
-        525: 0.264,
-        530: 0.267,
-        535: 0.269,
-        540: 0.272,
-        545: 0.276,
-        550: 0.282,
-        555: 0.289,
-        560: 0.299,
-        565: 0.309,
-        570: 0.322,
-        575: 0.329,
-        580: 0.335,
-        585: 0.339,
-        590: 0.341,
-        595: 0.341,
-        600: 0.342,
-        605: 0.342,
-        610: 0.342,
-        615: 0.341,
-        620: 0.341,
-        625: 0.339,
-        630: 0.339,
-        635: 0.338,
-        640: 0.338,
-        645: 0.337,
-        650: 0.336,
-        655: 0.335,
-        660: 0.334,
-        665: 0.332,
-        670: 0.332,
-        675: 0.331,
-        680: 0.331,
-        685: 0.330,
-        690: 0.329,
-        695: 0.328,
-        700: 0.328,
-        705: 0.327,
-        710: 0.326,
-        715: 0.325,
-        720: 0.324,
-        725: 0.324,
-        730: 0.324,
-        735: 0.323,
-        740: 0.322,
-        745: 0.321,
-        750: 0.320,
-        755: 0.318,
-        760: 0.316,
-        765: 0.315,
-        770: 0.315,
-        775: 0.314,
-        780: 0.314,
-        785: 0.313,
-        790: 0.313,
-        795: 0.312,
-        800: 0.312,
-        805: 0.311,
-        810: 0.311,
-        815: 0.311,
-        820: 0.311,
-        825: 0.311,
-        830: 0.310,
-    },
-    "3": {
-        360: 0.058,
-        365: 0.059,
-        370: 0.061,
-        375: 0.063,
-        380: 0.065,
-        385: 0.068,
-        390: 0.070,
-        395: 0.072,
-        400: 0.073,
-        405: 0.073,
-        410: 0.074,
-        415: 0.074,
-        420: 0.074,
-        425: 0.073,
-        430: 0.073,
-        435: 0.073,
-        440: 0.073,
-        445: 0.073,
-        450: 0.074,
-        455: 0.075,
-        460: 0.077,
-        465: 0.080,
-        470: 0.085,
-        475: 0.094,
-        480: 0.109,
-        485: 0.126,
-        490: 0.148,
-        495: 0.172,
-        500: 0.198,
-        505: 0.221,
-        510: 0.241,
-        515: 0.260,
-        520: 0.278,
-        525: 0.302,
-        530: 0.339,
-        535: 0.370,
-        540: 0.392,
-        545: 0.399,
-        550: 0.400,
-        555: 0.393,
-        560: 0.380,
-        565: 0.365,
-        570: 0.349,
-        575: 0.332,
-        580: 0.315,
-        585: 0.299,
-        590: 0.285,
-        595: 0.272,
-        600: 0.264,
-        605: 0.257,
-        610: 0.252,
-        615: 0.247,
-        620: 0.241,
-        625: 0.235,
-        630: 0.229,
-        635: 0.224,
-        640: 0.220,
-        645: 0.217,
-        650: 0.216,
-        655: 0.216,
-        660: 0.219,
-        665: 0.224,
-        670: 0.230,
-        675: 0.238,
-        680: 0.251,
-        685: 0.269,
-        690: 0.288,
-        695: 0.312,
-        700: 0.340,
-        705: 0.366,
-        710: 0.390,
-        715: 0.412,
-        720: 0.431,
-        725: 0.447,
-        730: 0.460,
-        735: 0.472,
-        740: 0.481,
-        745: 0.488,
-        750: 0.493,
-        755: 0.497,
-        760: 0.500,
-        765: 0.502,
-        770: 0.505,
-        775: 0.510,
-        780: 0.516,
-        785: 0.520,
-        790: 0.524,
-        795: 0.527,
-        800: 0.531,
-        805: 0.535,
-        810: 0.539,
-        815: 0.544,
-        820: 0.548,
-        825: 0.552,
-        830: 0.555,
-    },
-    "4": {
-        360: 0.057,
-        365: 0.059,
-        370: 0.062,
-        375: 0.067,
-        380: 0.074,
-        385: 0.083,
-        390: 0.093,
-        395: 0.105,
-        400: 0.116,
-        405: 0.121,
-        410: 0.124,
-        415: 0.126,
-        420: 0.128,
-        425: 0.131,
-        430: 0.135,
-        435: 0.139,
-        440: 0.144,
-        445: 0.151,
-        450: 0.161,
-        455: 0.172,
-        460: 0.186,
-        465: 0.205,
-        470: 0.229,
-        475: 0.254,
-        480: 0.281,
-        485: 0.308,
-        490: 0.332,
-        495: 0.352,
-        500: 0.370,
-        505: 0.383,
-        510: 0.390,
-        515: 0.394,
-        520: 0.395,
-        525: 0.392,
-        530: 0.385,
-        535: 0.377,
-        540: 0.367,
-        545: 0.354,
-        550: 0.341,
-        555: 0.327,
-        560: 0.312,
-        565: 0.296,
-        570: 0.280,
-        575: 0.263,
-        580: 0.247,
-        585: 0.229,
-        590: 0.214,
-        595: 0.198,
-        600: 0.185,
-        605: 0.175,
-        610: 0.169,
-        615: 0.164,
-        620: 0.160,
-        625: 0.156,
-        630: 0.154,
-        635: 0.152,
-        640: 0.151,
-        645: 0.149,
-        650: 0.148,
-        655: 0.148,
-        660: 0.148,
-        665: 0.149,
-        670: 0.151,
-        675: 0.154,
-        680: 0.158,
-        685: 0.162,
-        690: 0.165,
-        695: 0.168,
-        700: 0.170,
-        705: 0.171,
-        710: 0.170,
-        715: 0.168,
-        720: 0.166,
-        725: 0.164,
-        730: 0.164,
-        735: 0.165,
-        740: 0.168,
-        745: 0.172,
-        750: 0.177,
-        755: 0.181,
-        760: 0.185,
-        765: 0.189,
-        770: 0.192,
-        775: 0.194,
-        780: 0.197,
-        785: 0.200,
-        790: 0.204,
-        795: 0.210,
-        800: 0.218,
-        805: 0.225,
-        810: 0.233,
-        815: 0.243,
-        820: 0.254,
-        825: 0.264,
-        830: 0.274,
-    },
-    "5": {
-        360: 0.143,
-        365: 0.187,
-        370: 0.233,
-        375: 0.269,
-        380: 0.295,
-        385: 0.306,
-        390: 0.310,
-        395: 0.312,
-        400: 0.313,
-        405: 0.315,
-        410: 0.319,
-        415: 0.322,
-        420: 0.326,
-        425: 0.330,
-        430: 0.334,
-        435: 0.339,
-        440: 0.346,
-        445: 0.352,
-        450: 0.360,
-        455: 0.369,
-        460: 0.381,
-        465: 0.394,
-        470: 0.403,
-        475: 0.410,
-        480: 0.415,
-        485: 0.418,
-        490: 0.419,
-        495: 0.417,
-        500: 0.413,
-        505: 0.409,
-        510: 0.403,
-        515: 0.396,
-        520: 0.389,
-        525: 0.381,
-        530: 0.372,
-        535: 0.363,
-        540: 0.353,
-        545: 0.342,
-        550: 0.331,
-        555: 0.320,
-        560: 0.308,
-        565: 0.296,
-        570: 0.284,
-        575: 0.271,
-        580: 0.260,
-        585: 0.247,
-        590: 0.232,
-        595: 0.220,
-        600: 0.210,
-        605: 0.200,
-        610: 0.194,
-        615: 0.189,
-        620: 0.185,
-        625: 0.183,
-        630: 0.180,
-        635: 0.177,
-        640: 0.176,
-        645: 0.175,
-        650: 0.175,
-        655: 0.175,
-        660: 0.175,
-        665: 0.177,
-        670: 0.180,
-        675: 0.183,
-        680: 0.186,
-        685: 0.189,
-        690: 0.192,
-        695: 0.195,
-        700: 0.199,
-        705: 0.200,
-        710: 0.199,
-        715: 0.198,
-        720: 0.196,
-        725: 0.195,
-        730: 0.195,
-        735: 0.196,
-        740: 0.197,
-        745: 0.200,
-        750: 0.203,
-        755: 0.205,
-        760: 0.208,
-        765: 0.212,
-        770: 0.215,
-        775: 0.217,
-        780: 0.219,
-        785: 0.222,
-        790: 0.226,
-        795: 0.231,
-        800: 0.237,
-        805: 0.243,
-        810: 0.249,
-        815: 0.257,
-        820: 0.265,
-        825: 0.273,
-        830: 0.280,
-    },
-    "6": {
-        360: 0.079,
-        365: 0.081,
-        370: 0.089,
-        375: 0.113,
-        380: 0.151,
-        385: 0.203,
-        390: 0.265,
-        395: 0.339,
-        400: 0.410,
-        405: 0.464,
-        410: 0.492,
-        415: 0.508,
-        420: 0.517,
-        425: 0.524,
-        430: 0.531,
-        435: 0.538,
-        440: 0.544,
-        445: 0.551,
-        450: 0.556,
-        455: 0.556,
-        460: 0.554,
-        465: 0.549,
-        470: 0.541,
-        475: 0.531,
-        480: 0.519,
-        485: 0.504,
-        490: 0.488,
-        495: 0.469,
-        500: 0.450,
-        505: 0.431,
-        510: 0.414,
-        515: 0.395,
-        520: 0.377,
-        525: 0.358,
-        530: 0.341,
-        535: 0.325,
-        540: 0.309,
-        545: 0.293,
-        550: 0.279,
-        555: 0.265,
-        560: 0.253,
-        565: 0.241,
-        570: 0.234,
-        575: 0.227,
-        580: 0.225,
-        585: 0.222,
-        590: 0.221,
-        595: 0.220,
-        600: 0.220,
-        605: 0.220,
-        610: 0.220,
-        615: 0.220,
-        620: 0.223,
-        625: 0.227,
-        630: 0.233,
-        635: 0.239,
-        640: 0.244,
-        645: 0.251,
-        650: 0.258,
-        655: 0.263,
-        660: 0.268,
-        665: 0.273,
-        670: 0.278,
-        675: 0.281,
-        680: 0.283,
-        685: 0.286,
-        690: 0.291,
-        695: 0.296,
-        700: 0.302,
-        705: 0.313,
-        710: 0.325,
-        715: 0.338,
-        720: 0.351,
-        725: 0.364,
-        730: 0.376,
-        735: 0.389,
-        740: 0.401,
-        745: 0.413,
-        750: 0.425,
-        755: 0.436,
-        760: 0.447,
-        765: 0.458,
-        770: 0.469,
-        775: 0.477,
-        780: 0.485,
-        785: 0.493,
-        790: 0.500,
-        795: 0.506,
-        800: 0.512,
-        805: 0.517,
-        810: 0.521,
-        815: 0.525,
-        820: 0.529,
-        825: 0.532,
-        830: 0.535,
-    },
-    "7": {
-        360: 0.150,
-        365: 0.177,
-        370: 0.218,
-        375: 0.293,
-        380: 0.378,
-        385: 0.459,
-        390: 0.524,
-        395: 0.546,
-        400: 0.551,
-        405: 0.555,
-        410: 0.559,
-        415: 0.560,
-        420: 0.561,
-        425: 0.558,
-        430: 0.556,
-        435: 0.551,
-        440: 0.544,
-        445: 0.535,
-        450: 0.522,
-        455: 0.506,
-        460: 0.488,
-        465: 0.469,
-        470: 0.448,
-        475: 0.429,
-        480: 0.408,
-        485: 0.385,
-        490: 0.363,
-        495: 0.341,
-        500: 0.324,
-        505: 0.311,
-        510: 0.301,
-        515: 0.291,
-        520: 0.283,
-        525: 0.273,
-        530: 0.265,
-        535: 0.260,
-        540: 0.257,
-        545: 0.257,
-        550: 0.259,
-        555: 0.260,
-        560: 0.260,
-        565: 0.258,
-        570: 0.256,
-        575: 0.254,
-        580: 0.254,
-        585: 0.259,
-        590: 0.270,
-        595: 0.284,
-        600: 0.302,
-        605: 0.324,
-        610: 0.344,
-        615: 0.362,
-        620: 0.377,
-        625: 0.389,
-        630: 0.400,
-        635: 0.410,
-        640: 0.420,
-        645: 0.429,
-        650: 0.438,
-        655: 0.445,
-        660: 0.452,
-        665: 0.457,
-        670: 0.462,
-        675: 0.466,
-        680: 0.468,
-        685: 0.470,
-        690: 0.473,
-        695: 0.477,
-        700: 0.483,
-        705: 0.489,
-        710: 0.496,
-        715: 0.503,
-        720: 0.511,
-        725: 0.518,
-        730: 0.525,
-        735: 0.532,
-        740: 0.539,
-        745: 0.546,
-        750: 0.553,
-        755: 0.559,
-        760: 0.565,
-        765: 0.570,
-        770: 0.575,
-        775: 0.578,
-        780: 0.581,
-        785: 0.583,
-        790: 0.585,
-        795: 0.587,
-        800: 0.588,
-        805: 0.589,
-        810: 0.590,
-        815: 0.590,
-        820: 0.590,
-        825: 0.591,
-        830: 0.592,
-    },
-    "8": {
-        360: 0.075,
-        365: 0.078,
-        370: 0.084,
-        375: 0.090,
-        380: 0.104,
-        385: 0.129,
-        390: 0.170,
-        395: 0.240,
-        400: 0.319,
-        405: 0.416,
-        410: 0.462,
-        415: 0.482,
-        420: 0.490,
-        425: 0.488,
-        430: 0.482,
-        435: 0.473,
-        440: 0.462,
-        445: 0.450,
-        450: 0.439,
-        455: 0.426,
-        460: 0.413,
-        465: 0.397,
-        470: 0.382,
-        475: 0.366,
-        480: 0.352,
-        485: 0.337,
-        490: 0.325,
-        495: 0.310,
-        500: 0.299,
-        505: 0.289,
-        510: 0.283,
-        515: 0.276,
-        520: 0.270,
-        525: 0.262,
-        530: 0.256,
-        535: 0.251,
-        540: 0.250,
-        545: 0.251,
-        550: 0.254,
-        555: 0.258,
-        560: 0.264,
-        565: 0.269,
-        570: 0.272,
-        575: 0.274,
-        580: 0.278,
-        585: 0.284,
-        590: 0.295,
-        595: 0.316,
-        600: 0.348,
-        605: 0.384,
-        610: 0.434,
-        615: 0.482,
-        620: 0.528,
-        625: 0.568,
-        630: 0.604,
-        635: 0.629,
-        640: 0.648,
-        645: 0.663,
-        650: 0.676,
-        655: 0.685,
-        660: 0.693,
-        665: 0.700,
-        670: 0.705,
-        675: 0.709,
-        680: 0.712,
-        685: 0.715,
-        690: 0.717,
-        695: 0.719,
-        700: 0.721,
-        705: 0.720,
-        710: 0.719,
-        715: 0.722,
-        720: 0.725,
-        725: 0.727,
-        730: 0.729,
-        735: 0.730,
-        740: 0.730,
-        745: 0.730,
-        750: 0.730,
-        755: 0.730,
-        760: 0.730,
-        765: 0.730,
-        770: 0.730,
-        775: 0.730,
-        780: 0.730,
-        785: 0.730,
-        790: 0.731,
-        795: 0.731,
-        800: 0.731,
-        805: 0.731,
-        810: 0.731,
-        815: 0.731,
-        820: 0.731,
-        825: 0.731,
-        830: 0.731,
-    },
-    "9": {
-        360: 0.069,
-        365: 0.072,
-        370: 0.073,
-        375: 0.070,
-        380: 0.066,
-        385: 0.062,
-        390: 0.058,
-        395: 0.055,
-        400: 0.052,
-        405: 0.052,
-        410: 0.051,
-        415: 0.050,
-        420: 0.050,
-        425: 0.049,
-        430: 0.048,
-        435: 0.047,
-        440: 0.046,
-        445: 0.044,
-        450: 0.042,
-        455: 0.041,
-        460: 0.038,
-        465: 0.035,
-        470: 0.033,
-        475: 0.031,
-        480: 0.030,
-        485: 0.029,
-        490: 0.028,
-        495: 0.028,
-        500: 0.028,
-        505: 0.029,
-        510: 0.030,
-        515: 0.030,
-        520: 0.031,
-        525: 0.031,
-        530: 0.032,
-        535: 0.032,
-        540: 0.033,
-        545: 0.034,
-        550: 0.035,
-        555: 0.037,
-        560: 0.041,
-        565: 0.044,
-        570: 0.048,
-        575: 0.052,
-        580: 0.060,
-        585: 0.076,
-        590: 0.102,
-        595: 0.136,
-        600: 0.190,
-        605: 0.256,
-        610: 0.336,
-        615: 0.418,
-        620: 0.505,
-        625: 0.581,
-        630: 0.641,
-        635: 0.682,
-        640: 0.717,
-        645: 0.740,
-        650: 0.758,
-        655: 0.770,
-        660: 0.781,
-        665: 0.790,
-        670: 0.797,
-        675: 0.803,
-        680: 0.809,
-        685: 0.814,
-        690: 0.819,
-        695: 0.824,
-        700: 0.828,
-        705: 0.830,
-        710: 0.831,
-        715: 0.833,
-        720: 0.835,
-        725: 0.836,
-        730: 0.836,
-        735: 0.837,
-        740: 0.838,
-        745: 0.839,
-        750: 0.839,
-        755: 0.839,
-        760: 0.839,
-        765: 0.839,
-        770: 0.839,
-        775: 0.839,
-        780: 0.839,
-        785: 0.839,
-        790: 0.839,
-        795: 0.839,
-        800: 0.839,
-        805: 0.839,
-        810: 0.838,
-        815: 0.837,
-        820: 0.837,
-        825: 0.836,
-        830: 0.836,
-    },
-    "10": {
-        360: 0.042,
-        365: 0.043,
-        370: 0.045,
-        375: 0.047,
-        380: 0.050,
-        385: 0.054,
-        390: 0.059,
-        395: 0.063,
-        400: 0.066,
-        405: 0.067,
-        410: 0.068,
-        415: 0.069,
-        420: 0.069,
-        425: 0.070,
-        430: 0.072,
-        435: 0.073,
-        440: 0.076,
-        445: 0.078,
-        450: 0.083,
-        455: 0.088,
-        460: 0.095,
-        465: 0.103,
-        470: 0.113,
-        475: 0.125,
-        480: 0.142,
-        485: 0.162,
-        490: 0.189,
-        495: 0.219,
-        500: 0.262,
-        505: 0.305,
-        510: 0.365,
-        515: 0.416,
-        520: 0.465,
-        525: 0.509,
-        530: 0.546,
-        535: 0.581,
-        540: 0.610,
-        545: 0.634,
-        550: 0.653,
-        555: 0.666,
-        560: 0.678,
-        565: 0.687,
-        570: 0.693,
-        575: 0.698,
-        580: 0.701,
-        585: 0.704,
-        590: 0.705,
-        595: 0.705,
-        600: 0.706,
-        605: 0.707,
-        610: 0.707,
-        615: 0.707,
-        620: 0.708,
-        625: 0.708,
-        630: 0.710,
-        635: 0.711,
-        640: 0.712,
-        645: 0.714,
-        650: 0.716,
-        655: 0.718,
-        660: 0.720,
-        665: 0.722,
-        670: 0.725,
-        675: 0.729,
-        680: 0.731,
-        685: 0.735,
-        690: 0.739,
-        695: 0.742,
-        700: 0.746,
-        705: 0.748,
-        710: 0.749,
-        715: 0.751,
-        720: 0.753,
-        725: 0.754,
-        730: 0.755,
-        735: 0.755,
-        740: 0.755,
-        745: 0.755,
-        750: 0.756,
-        755: 0.757,
-        760: 0.758,
-        765: 0.759,
-        770: 0.759,
-        775: 0.759,
-        780: 0.759,
-        785: 0.759,
-        790: 0.759,
-        795: 0.759,
-        800: 0.759,
-        805: 0.759,
-        810: 0.758,
-        815: 0.757,
-        820: 0.757,
-        825: 0.756,
-        830: 0.756,
-    },
-    "11": {
-        360: 0.074,
-        365: 0.079,
-        370: 0.086,
-        375: 0.098,
-        380: 0.111,
-        385: 0.121,
-        390: 0.127,
-        395: 0.129,
-        400: 0.127,
-        405: 0.121,
-        410: 0.116,
-        415: 0.112,
-        420: 0.108,
-        425: 0.105,
-        430: 0.104,
-        435: 0.104,
-        440: 0.105,
-        445: 0.106,
-        450: 0.110,
-        455: 0.115,
-        460: 0.123,
-        465: 0.134,
-        470: 0.148,
-        475: 0.167,
-        480: 0.192,
-        485: 0.219,
-        490: 0.252,
-        495: 0.291,
-        500: 0.325,
-        505: 0.347,
-        510: 0.356,
-        515: 0.353,
-        520: 0.346,
-        525: 0.333,
-        530: 0.314,
-        535: 0.294,
-        540: 0.271,
-        545: 0.248,
-        550: 0.227,
-        555: 0.206,
-        560: 0.188,
-        565: 0.170,
-        570: 0.153,
-        575: 0.138,
-        580: 0.125,
-        585: 0.114,
-        590: 0.106,
-        595: 0.100,
-        600: 0.096,
-        605: 0.092,
-        610: 0.090,
-        615: 0.087,
-        620: 0.085,
-        625: 0.082,
-        630: 0.080,
-        635: 0.079,
-        640: 0.078,
-        645: 0.078,
-        650: 0.078,
-        655: 0.078,
-        660: 0.081,
-        665: 0.083,
-        670: 0.088,
-        675: 0.093,
-        680: 0.102,
-        685: 0.112,
-        690: 0.125,
-        695: 0.141,
-        700: 0.161,
-        705: 0.182,
-        710: 0.203,
-        715: 0.223,
-        720: 0.242,
-        725: 0.257,
-        730: 0.270,
-        735: 0.282,
-        740: 0.292,
-        745: 0.302,
-        750: 0.310,
-        755: 0.314,
-        760: 0.317,
-        765: 0.323,
-        770: 0.330,
-        775: 0.334,
-        780: 0.338,
-        785: 0.343,
-        790: 0.348,
-        795: 0.353,
-        800: 0.359,
-        805: 0.365,
-        810: 0.372,
-        815: 0.380,
-        820: 0.388,
-        825: 0.396,
-        830: 0.403,
-    },
-    "12": {
-        360: 0.189,
-        365: 0.175,
-        370: 0.158,
-        375: 0.139,
-        380: 0.120,
-        385: 0.103,
-        390: 0.090,
-        395: 0.082,
-        400: 0.076,
-        405: 0.068,
-        410: 0.064,
-        415: 0.065,
-        420: 0.075,
-        425: 0.093,
-        430: 0.123,
-        435: 0.160,
-        440: 0.207,
-        445: 0.256,
-        450: 0.300,
-        455: 0.331,
-        460: 0.346,
-        465: 0.347,
-        470: 0.341,
-        475: 0.328,
-        480: 0.307,
-        485: 0.282,
-        490: 0.257,
-        495: 0.230,
-        500: 0.204,
-        505: 0.178,
-        510: 0.154,
-        515: 0.129,
-        520: 0.109,
-        525: 0.090,
-        530: 0.075,
-        535: 0.062,
-        540: 0.051,
-        545: 0.041,
-        550: 0.035,
-        555: 0.029,
-        560: 0.025,
-        565: 0.022,
-        570: 0.019,
-        575: 0.017,
-        580: 0.017,
-        585: 0.017,
-        590: 0.016,
-        595: 0.016,
-        600: 0.016,
-        605: 0.016,
-        610: 0.016,
-        615: 0.016,
-        620: 0.016,
-        625: 0.016,
-        630: 0.018,
-        635: 0.018,
-        640: 0.018,
-        645: 0.018,
-        650: 0.019,
-        655: 0.020,
-        660: 0.023,
-        665: 0.024,
-        670: 0.026,
-        675: 0.030,
-        680: 0.035,
-        685: 0.043,
-        690: 0.056,
-        695: 0.074,
-        700: 0.097,
-        705: 0.128,
-        710: 0.166,
-        715: 0.210,
-        720: 0.257,
-        725: 0.305,
-        730: 0.354,
-        735: 0.401,
-        740: 0.446,
-        745: 0.485,
-        750: 0.520,
-        755: 0.551,
-        760: 0.577,
-        765: 0.599,
-        770: 0.618,
-        775: 0.633,
-        780: 0.645,
-        785: 0.656,
-        790: 0.666,
-        795: 0.674,
-        800: 0.680,
-        805: 0.686,
-        810: 0.691,
-        815: 0.694,
-        820: 0.697,
-        825: 0.700,
-        830: 0.702,
-    },
-    "13": {
-        360: 0.071,
-        365: 0.076,
-        370: 0.082,
-        375: 0.090,
-        380: 0.104,
-        385: 0.127,
-        390: 0.161,
-        395: 0.211,
-        400: 0.264,
-        405: 0.313,
-        410: 0.341,
-        415: 0.352,
-        420: 0.359,
-        425: 0.361,
-        430: 0.364,
-        435: 0.365,
-        440: 0.367,
-        445: 0.369,
-        450: 0.372,
-        455: 0.374,
-        460: 0.376,
-        465: 0.379,
-        470: 0.384,
-        475: 0.389,
-        480: 0.397,
-        485: 0.405,
-        490: 0.416,
-        495: 0.429,
-        500: 0.443,
-        505: 0.454,
-        510: 0.461,
-        515: 0.466,
-        520: 0.469,
-        525: 0.471,
-        530: 0.474,
-        535: 0.476,
-        540: 0.483,
-        545: 0.490,
-        550: 0.506,
-        555: 0.526,
-        560: 0.553,
-        565: 0.582,
-        570: 0.618,
-        575: 0.651,
-        580: 0.680,
-        585: 0.701,
-        590: 0.717,
-        595: 0.729,
-        600: 0.736,
-        605: 0.742,
-        610: 0.745,
-        615: 0.747,
-        620: 0.748,
-        625: 0.748,
-        630: 0.748,
-        635: 0.748,
-        640: 0.748,
-        645: 0.748,
-        650: 0.748,
-        655: 0.748,
-        660: 0.747,
-        665: 0.747,
-        670: 0.747,
-        675: 0.747,
-        680: 0.747,
-        685: 0.747,
-        690: 0.747,
-        695: 0.746,
-        700: 0.746,
-        705: 0.746,
-        710: 0.745,
-        715: 0.744,
-        720: 0.743,
-        725: 0.744,
-        730: 0.745,
-        735: 0.748,
-        740: 0.750,
-        745: 0.750,
-        750: 0.749,
-        755: 0.748,
-        760: 0.748,
-        765: 0.747,
-        770: 0.747,
-        775: 0.747,
-        780: 0.747,
-        785: 0.746,
-        790: 0.746,
-        795: 0.746,
-        800: 0.746,
-        805: 0.745,
-        810: 0.745,
-        815: 0.745,
-        820: 0.745,
-        825: 0.745,
-        830: 0.745,
-    },
-    "14": {
-        360: 0.036,
-        365: 0.036,
-        370: 0.036,
-        375: 0.036,
-        380: 0.036,
-        385: 0.036,
-        390: 0.037,
-        395: 0.038,
-        400: 0.039,
-        405: 0.039,
-        410: 0.040,
-        415: 0.041,
-        420: 0.042,
-        425: 0.042,
-        430: 0.043,
-        435: 0.044,
-        440: 0.044,
-        445: 0.045,
-        450: 0.045,
-        455: 0.046,
-        460: 0.047,
-        465: 0.048,
-        470: 0.050,
-        475: 0.052,
-        480: 0.055,
-        485: 0.057,
-        490: 0.062,
-        495: 0.067,
-        500: 0.075,
-        505: 0.083,
-        510: 0.092,
-        515: 0.100,
-        520: 0.108,
-        525: 0.121,
-        530: 0.133,
-        535: 0.142,
-        540: 0.150,
-        545: 0.154,
-        550: 0.155,
-        555: 0.152,
-        560: 0.147,
-        565: 0.140,
-        570: 0.133,
-        575: 0.125,
-        580: 0.118,
-        585: 0.112,
-        590: 0.106,
-        595: 0.101,
-        600: 0.098,
-        605: 0.095,
-        610: 0.093,
-        615: 0.090,
-        620: 0.089,
-        625: 0.087,
-        630: 0.086,
-        635: 0.085,
-        640: 0.084,
-        645: 0.084,
-        650: 0.084,
-        655: 0.084,
-        660: 0.085,
-        665: 0.087,
-        670: 0.092,
-        675: 0.096,
-        680: 0.102,
-        685: 0.110,
-        690: 0.123,
-        695: 0.137,
-        700: 0.152,
-        705: 0.169,
-        710: 0.188,
-        715: 0.207,
-        720: 0.226,
-        725: 0.243,
-        730: 0.260,
-        735: 0.277,
-        740: 0.294,
-        745: 0.310,
-        750: 0.325,
-        755: 0.339,
-        760: 0.353,
-        765: 0.366,
-        770: 0.379,
-        775: 0.390,
-        780: 0.399,
-        785: 0.408,
-        790: 0.416,
-        795: 0.422,
-        800: 0.428,
-        805: 0.434,
-        810: 0.439,
-        815: 0.444,
-        820: 0.448,
-        825: 0.451,
-        830: 0.454,
-    },
-}
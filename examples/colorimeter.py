@@ -1,5 +1,7 @@
 import numpy as np
-from pyspectrum import Spectrum
+from pyspectrum import Colorimetry, Spectrum
+from pyspectrum.colorimetry import XYZ_to_xyY, XYZ_to_RGB, XYZ_to_Lab, XYZ_to_Luv, to_LCh, rgb_matrix, adaptation_matrix
+from pyspectrum.colorimetry import delta_E, nearest_reference
 
 import colorimeter_data as data
 
@@ -8,78 +10,55 @@ class Colorimeter:
         self.reference_spectrum = reference_spectrum
         self.illuminant = illuminant
         self.observer = observer
+        self._colorimetry = Colorimetry(data.OBSERVER_SENSITIVITY[observer], data.ILLUMINANT_INTENSITY[illuminant])
 
     def _rgb_space_matrix(self, rgb_space: str):
-        [[xr, yr], [xg, yg], [xb, yb]] = data.RGB_PRIMARIES[rgb_space]
-        w = data.RGB_WHITE_POINT[rgb_space][self.observer]
-        m1 = np.matrix([[xr/yr, xg/yg, xb/yb], [1, 1, 1], [(1 - xr - yr)/yr, (1 - xg - yg)/yg, (1 - xb - yb)/yb]])
-        m = m1 * np.diag((m1.I * np.matrix(w).T).A1)
-        return m.I
+        return rgb_matrix(data.RGB_PRIMARIES[rgb_space], data.RGB_WHITE_POINT[rgb_space][self.observer])
 
     def _adaptation_matrix(self, rgb_space: str, adaptation_method: str):
-        w_src = data.ILLUMINANT_WHITE_POINT[self.illuminant][self.observer]
-        w_dst = data.RGB_WHITE_POINT[rgb_space][self.observer]
-        m1 = data.CHROMATIC_ADAPTATION_MATRIX[adaptation_method]
-        s = (m1 * np.matrix(w_src).T).A1
-        d = (m1 * np.matrix(w_dst).T).A1
-        m = m1.I * np.diag(d / s) * m1
-        return m
+        return adaptation_matrix(data.CHROMATIC_ADAPTATION_MATRIX[adaptation_method],
+                                 data.ILLUMINANT_WHITE_POINT[self.illuminant][self.observer],
+                                 data.RGB_WHITE_POINT[rgb_space][self.observer])
 
     def measure(self, spectrum: Spectrum):
-        illuminant_data = data.ILLUMINANT_INTENSITY[self.illuminant]
-        observer_data = data.OBSERVER_SENSITIVITY[self.observer]
+        # XYZ всех измерений одним матричным произведением
+        self._XYZ_all = self._colorimetry.XYZ(spectrum, reference=self.reference_spectrum.intensity[-1])
+        self._XYZ = self._XYZ_all[-1]
+        return self._XYZ_all
 
-        ind = [illuminant_data['wavelength'][0] <= x <= illuminant_data['wavelength'][-1] for x in spectrum.wavelength]
-        wl = spectrum.wavelength[ind]
-        dwl = np.diff(spectrum.wavelength, append=0)[ind]
-        intensity = (spectrum.intensity[-1] / self.reference_spectrum.intensity[-1])[ind]
+    def _values(self, all_frames: bool):
+        # преобразования работают с массивами (..., 3): последнее измерение или все сразу
+        return self._XYZ_all if all_frames else self._XYZ
 
-        sens_x = np.interp(wl, observer_data['wavelength'], observer_data['X'])
-        sens_y = np.interp(wl, observer_data['wavelength'], observer_data['Y'])
-        sens_z = np.interp(wl, observer_data['wavelength'], observer_data['Z'])
+    def _white_point(self):
+        return data.ILLUMINANT_WHITE_POINT[self.illuminant][self.observer]
 
-        illuminant_intensity = np.interp(wl, illuminant_data['wavelength'], illuminant_data['intensity'])
+    def XYZ(self, all_frames: bool=False):
+        return np.copy(self._values(all_frames))
 
-        k = 1 / np.sum(sens_y * illuminant_intensity * dwl)
-        X = k * np.sum(sens_x * intensity * illuminant_intensity * dwl)
-        Y = k * np.sum(sens_y * intensity * illuminant_intensity * dwl)
-        Z = k * np.sum(sens_z * intensity * illuminant_intensity * dwl)
-        self._XYZ = np.array([X, Y, Z])
+    def xyY(self, all_frames: bool=False):
+        return XYZ_to_xyY(self._values(all_frames))
 
-    def XYZ(self):
-        return np.copy(self._XYZ)
+    def RGB(self, rgb_space: str='sRGB', adaptation_method: str | None='Bradford', all_frames: bool=False):
+        m_adapt = self._adaptation_matrix(rgb_space, adaptation_method) if adaptation_method is not None else None
+        m = self._rgb_space_matrix(rgb_space)
+        return XYZ_to_RGB(self._values(all_frames), m, gamma=data.RGB_GAMMA[rgb_space], adaptation=m_adapt)
 
-    def xyY(self):
-        X, Y, Z = self._XYZ
-        return np.array([X / (X + Y + Z), Y / (X + Y + Z), Y])
+    def Lab(self, all_frames: bool=False):
+        return XYZ_to_Lab(self._values(all_frames), self._white_point())
 
-    def RGB(self, rgb_space: str='sRGB', adaptation_method: str | None='Bradford'):
-        m_adapt = self._adaptation_matrix(rgb_space, adaptation_method) if adaptation_method is not None else 1
-        m = self._rgb_space_matrix(rgb_space)
-        v = (m * m_adapt * np.matrix(self._XYZ).T).A1
-        return np.vectorize(data.RGB_GAMMA[rgb_space])(np.clip(v, 0, 1))
-
-    def Lab(self):
-        w = data.ILLUMINANT_WHITE_POINT[self.illuminant][self.observer]
-        fx, fy, fz = np.vectorize(lambda x: x ** (1/3) if x > 0.008856 else (903.3 * x + 16) / 116)(self._XYZ / w)
-        return np.array([116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)])
-
-    def LCh_ab(self):
-        L, a, b = self.Lab()
-        C = (a**2 + b**2) ** 0.5
-        h = np.arctan2(b, a) * 180 / np.pi
-        return np.array([L, C, h])
-
-    def Luv(self):
-        X, Y, Z = self._XYZ
-        wx, wy, wz = data.ILLUMINANT_WHITE_POINT[self.illuminant][self.observer]
-        L = 116 * Y ** (1/3) - 16 if Y > 0.008856 else 903.3 * Y
-        u = 13 * L * (4 * X / (X + 15 * Y + 3 * Z) - 4 * wx / (wx + 15 * wy + 3 * wz))
-        v = 13 * L * (9 * Y / (X + 15 * Y + 3 * Z) - 9 * wy / (wx + 15 * wy + 3 * wz))
-        return np.array([L, u, v])
-
-    def LCh_uv(self):
-        L, u, v = self.Luv()
-        C = (u**2 + v**2) ** 0.5
-        h = np.arctan2(v, u) * 180 / np.pi
-        return np.array([L, C, h])
+    def LCh_ab(self, all_frames: bool=False):
+        return to_LCh(self.Lab(all_frames))
+
+    def Luv(self, all_frames: bool=False):
+        return XYZ_to_Luv(self._values(all_frames), self._white_point())
+
+    def LCh_uv(self, all_frames: bool=False):
+        return to_LCh(self.Luv(all_frames))
+
+    def delta_E(self, reference_Lab, method: str='2000', all_frames: bool=False):
+        # различия с каталогом эталонов (M, 3): массив эталонов или измерения x эталоны
+        return delta_E(self.Lab(all_frames), reference_Lab, method)
+
+    def nearest(self, reference_Lab, method: str='2000', all_frames: bool=False):
+        return nearest_reference(self.Lab(all_frames), reference_Lab, method)
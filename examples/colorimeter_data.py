@@ -1,1430 +1,10 @@
 import numpy as np
 
-OBSERVER_SENSITIVITY = {
-    '2deg': np.array([
-        (360, 0.000129900000, 0.000003917000, 0.000606100000),
-        (361, 0.000145847000, 0.000004393581, 0.000680879200),
-        (362, 0.000163802100, 0.000004929604, 0.000765145600),
-        (363, 0.000184003700, 0.000005532136, 0.000860012400),
-        (364, 0.000206690200, 0.000006208245, 0.000966592800),
-        (365, 0.000232100000, 0.000006965000, 0.001086000000),
-        (366, 0.000260728000, 0.000007813219, 0.001220586000),
-        (367, 0.000293075000, 0.000008767336, 0.001372729000),
-        (368, 0.000329388000, 0.000009839844, 0.001543579000),
-        (369, 0.000369914000, 0.000011043230, 0.001734286000),
-        (370, 0.000414900000, 0.000012390000, 0.001946000000),
-        (371, 0.000464158700, 0.000013886410, 0.002177777000),
-        (372, 0.000518986000, 0.000015557280, 0.002435809000),
-        (373, 0.000581854000, 0.000017442960, 0.002731953000),
-        (374, 0.000655234700, 0.000019583750, 0.003078064000),
-        (375, 0.000741600000, 0.000022020000, 0.003486000000),
-        (376, 0.000845029600, 0.000024839650, 0.003975227000),
-        (377, 0.000964526800, 0.000028041260, 0.004540880000),
-        (378, 0.001094949000, 0.000031531040, 0.005158320000),
-        (379, 0.001231154000, 0.000035215210, 0.005802907000),
-        (380, 0.001368000000, 0.000039000000, 0.006450001000),
-        (381, 0.001502050000, 0.000042826400, 0.007083216000),
-        (382, 0.001642328000, 0.000046914600, 0.007745488000),
-        (383, 0.001802382000, 0.000051589600, 0.008501152000),
-        (384, 0.001995757000, 0.000057176400, 0.009414544000),
-        (385, 0.002236000000, 0.000064000000, 0.010549990000),
-        (386, 0.002535385000, 0.000072344210, 0.011965800000),
-        (387, 0.002892603000, 0.000082212240, 0.013655870000),
-        (388, 0.003300829000, 0.000093508160, 0.015588050000),
-        (389, 0.003753236000, 0.000106136100, 0.017730150000),
-        (390, 0.004243000000, 0.000120000000, 0.020050010000),
-        (391, 0.004762389000, 0.000134984000, 0.022511360000),
-        (392, 0.005330048000, 0.000151492000, 0.025202880000),
-        (393, 0.005978712000, 0.000170208000, 0.028279720000),
-        (394, 0.006741117000, 0.000191816000, 0.031897040000),
-        (395, 0.007650000000, 0.000217000000, 0.036210000000),
-        (396, 0.008751373000, 0.000246906700, 0.041437710000),
-        (397, 0.010028880000, 0.000281240000, 0.047503720000),
-        (398, 0.011421700000, 0.000318520000, 0.054119880000),
-        (399, 0.012869010000, 0.000357266700, 0.060998030000),
-        (400, 0.014310000000, 0.000396000000, 0.067850010000),
-        (401, 0.015704430000, 0.000433714700, 0.074486320000),
-        (402, 0.017147440000, 0.000473024000, 0.081361560000),
-        (403, 0.018781220000, 0.000517876000, 0.089153640000),
-        (404, 0.020748010000, 0.000572218700, 0.098540480000),
-        (405, 0.023190000000, 0.000640000000, 0.110200000000),
-        (406, 0.026207360000, 0.000724560000, 0.124613300000),
-        (407, 0.029782480000, 0.000825500000, 0.141701700000),
-        (408, 0.033880920000, 0.000941160000, 0.161303500000),
-        (409, 0.038468240000, 0.001069880000, 0.183256800000),
-        (410, 0.043510000000, 0.001210000000, 0.207400000000),
-        (411, 0.048995600000, 0.001362091000, 0.233692100000),
-        (412, 0.055022600000, 0.001530752000, 0.262611400000),
-        (413, 0.061718800000, 0.001720368000, 0.294774600000),
-        (414, 0.069212000000, 0.001935323000, 0.330798500000),
-        (415, 0.077630000000, 0.002180000000, 0.371300000000),
-        (416, 0.086958110000, 0.002454800000, 0.416209100000),
-        (417, 0.097176720000, 0.002764000000, 0.465464200000),
-        (418, 0.108406300000, 0.003117800000, 0.519694800000),
-        (419, 0.120767200000, 0.003526400000, 0.579530300000),
-        (420, 0.134380000000, 0.004000000000, 0.645600000000),
-        (421, 0.149358200000, 0.004546240000, 0.718483800000),
-        (422, 0.165395700000, 0.005159320000, 0.796713300000),
-        (423, 0.181983100000, 0.005829280000, 0.877845900000),
-        (424, 0.198611000000, 0.006546160000, 0.959439000000),
-        (425, 0.214770000000, 0.007300000000, 1.039050100000),
-        (426, 0.230186800000, 0.008086507000, 1.115367300000),
-        (427, 0.244879700000, 0.008908720000, 1.188497100000),
-        (428, 0.258777300000, 0.009767680000, 1.258123300000),
-        (429, 0.271807900000, 0.010664430000, 1.323929600000),
-        (430, 0.283900000000, 0.011600000000, 1.385600000000),
-        (431, 0.294943800000, 0.012573170000, 1.442635200000),
-        (432, 0.304896500000, 0.013582720000, 1.494803500000),
-        (433, 0.313787300000, 0.014629680000, 1.542190300000),
-        (434, 0.321645400000, 0.015715090000, 1.584880700000),
-        (435, 0.328500000000, 0.016840000000, 1.622960000000),
-        (436, 0.334351300000, 0.018007360000, 1.656404800000),
-        (437, 0.339210100000, 0.019214480000, 1.685295900000),
-        (438, 0.343121300000, 0.020453920000, 1.709874500000),
-        (439, 0.346129600000, 0.021718240000, 1.730382100000),
-        (440, 0.348280000000, 0.023000000000, 1.747060000000),
-        (441, 0.349599900000, 0.024294610000, 1.760044600000),
-        (442, 0.350147400000, 0.025610240000, 1.769623300000),
-        (443, 0.350013000000, 0.026958570000, 1.776263700000),
-        (444, 0.349287000000, 0.028351250000, 1.780433400000),
-        (445, 0.348060000000, 0.029800000000, 1.782600000000),
-        (446, 0.346373300000, 0.031310830000, 1.782968200000),
-        (447, 0.344262400000, 0.032883680000, 1.781699800000),
-        (448, 0.341808800000, 0.034521120000, 1.779198200000),
-        (449, 0.339094100000, 0.036225710000, 1.775867100000),
-        (450, 0.336200000000, 0.038000000000, 1.772110000000),
-        (451, 0.333197700000, 0.039846670000, 1.768258900000),
-        (452, 0.330041100000, 0.041768000000, 1.764039000000),
-        (453, 0.326635700000, 0.043766000000, 1.758943800000),
-        (454, 0.322886800000, 0.045842670000, 1.752466300000),
-        (455, 0.318700000000, 0.048000000000, 1.744100000000),
-        (456, 0.314025100000, 0.050243680000, 1.733559500000),
-        (457, 0.308884000000, 0.052573040000, 1.720858100000),
-        (458, 0.303290400000, 0.054980560000, 1.705936900000),
-        (459, 0.297257900000, 0.057458720000, 1.688737200000),
-        (460, 0.290800000000, 0.060000000000, 1.669200000000),
-        (461, 0.283970100000, 0.062601970000, 1.647528700000),
-        (462, 0.276721400000, 0.065277520000, 1.623412700000),
-        (463, 0.268917800000, 0.068042080000, 1.596022300000),
-        (464, 0.260422700000, 0.070911090000, 1.564528000000),
-        (465, 0.251100000000, 0.073900000000, 1.528100000000),
-        (466, 0.240847500000, 0.077016000000, 1.486111400000),
-        (467, 0.229851200000, 0.080266400000, 1.439521500000),
-        (468, 0.218407200000, 0.083666800000, 1.389879900000),
-        (469, 0.206811500000, 0.087232800000, 1.338736200000),
-        (470, 0.195360000000, 0.090980000000, 1.287640000000),
-        (471, 0.184213600000, 0.094917550000, 1.237422300000),
-        (472, 0.173327300000, 0.099045840000, 1.187824300000),
-        (473, 0.162688100000, 0.103367400000, 1.138761100000),
-        (474, 0.152283300000, 0.107884600000, 1.090148000000),
-        (475, 0.142100000000, 0.112600000000, 1.041900000000),
-        (476, 0.132178600000, 0.117532000000, 0.994197600000),
-        (477, 0.122569600000, 0.122674400000, 0.947347300000),
-        (478, 0.113275200000, 0.127992800000, 0.901453100000),
-        (479, 0.104297900000, 0.133452800000, 0.856619300000),
-        (480, 0.095640000000, 0.139020000000, 0.812950100000),
-        (481, 0.087299550000, 0.144676400000, 0.770517300000),
-        (482, 0.079308040000, 0.150469300000, 0.729444800000),
-        (483, 0.071717760000, 0.156461900000, 0.689913600000),
-        (484, 0.064580990000, 0.162717700000, 0.652104900000),
-        (485, 0.057950010000, 0.169300000000, 0.616200000000),
-        (486, 0.051862110000, 0.176243100000, 0.582328600000),
-        (487, 0.046281520000, 0.183558100000, 0.550416200000),
-        (488, 0.041150880000, 0.191273500000, 0.520337600000),
-        (489, 0.036412830000, 0.199418000000, 0.491967300000),
-        (490, 0.032010000000, 0.208020000000, 0.465180000000),
-        (491, 0.027917200000, 0.217119900000, 0.439924600000),
-        (492, 0.024144400000, 0.226734500000, 0.416183600000),
-        (493, 0.020687000000, 0.236857100000, 0.393882200000),
-        (494, 0.017540400000, 0.247481200000, 0.372945900000),
-        (495, 0.014700000000, 0.258600000000, 0.353300000000),
-        (496, 0.012161790000, 0.270184900000, 0.334857800000),
-        (497, 0.009919960000, 0.282293900000, 0.317552100000),
-        (498, 0.007967240000, 0.295050500000, 0.301337500000),
-        (499, 0.006296346000, 0.308578000000, 0.286168600000),
-        (500, 0.004900000000, 0.323000000000, 0.272000000000),
-        (501, 0.003777173000, 0.338402100000, 0.258817100000),
-        (502, 0.002945320000, 0.354685800000, 0.246483800000),
-        (503, 0.002424880000, 0.371698600000, 0.234771800000),
-        (504, 0.002236293000, 0.389287500000, 0.223453300000),
-        (505, 0.002400000000, 0.407300000000, 0.212300000000),
-        (506, 0.002925520000, 0.425629900000, 0.201169200000),
-        (507, 0.003836560000, 0.444309600000, 0.190119600000),
-        (508, 0.005174840000, 0.463394400000, 0.179225400000),
-        (509, 0.006982080000, 0.482939500000, 0.168560800000),
-        (510, 0.009300000000, 0.503000000000, 0.158200000000),
-        (511, 0.012149490000, 0.523569300000, 0.148138300000),
-        (512, 0.015535880000, 0.544512000000, 0.138375800000),
-        (513, 0.019477520000, 0.565690000000, 0.128994200000),
-        (514, 0.023992770000, 0.586965300000, 0.120075100000),
-        (515, 0.029100000000, 0.608200000000, 0.111700000000),
-        (516, 0.034814850000, 0.629345600000, 0.103904800000),
-        (517, 0.041120160000, 0.650306800000, 0.096667480000),
-        (518, 0.047985040000, 0.670875200000, 0.089982720000),
-        (519, 0.055378610000, 0.690842400000, 0.083845310000),
-        (520, 0.063270000000, 0.710000000000, 0.078249990000),
-        (521, 0.071635010000, 0.728185200000, 0.073208990000),
-        (522, 0.080462240000, 0.745463600000, 0.068678160000),
-        (523, 0.089739960000, 0.761969400000, 0.064567840000),
-        (524, 0.099456450000, 0.777836800000, 0.060788350000),
-        (525, 0.109600000000, 0.793200000000, 0.057250010000),
-        (526, 0.120167400000, 0.808110400000, 0.053904350000),
-        (527, 0.131114500000, 0.822496200000, 0.050746640000),
-        (528, 0.142367900000, 0.836306800000, 0.047752760000),
-        (529, 0.153854200000, 0.849491600000, 0.044898590000),
-        (530, 0.165500000000, 0.862000000000, 0.042160000000),
-        (531, 0.177257100000, 0.873810800000, 0.039507280000),
-        (532, 0.189140000000, 0.884962400000, 0.036935640000),
-        (533, 0.201169400000, 0.895493600000, 0.034458360000),
-        (534, 0.213365800000, 0.905443200000, 0.032088720000),
-        (535, 0.225749900000, 0.914850100000, 0.029840000000),
-        (536, 0.238320900000, 0.923734800000, 0.027711810000),
-        (537, 0.251066800000, 0.932092400000, 0.025694440000),
-        (538, 0.263992200000, 0.939922600000, 0.023787160000),
-        (539, 0.277101700000, 0.947225200000, 0.021989250000),
-        (540, 0.290400000000, 0.954000000000, 0.020300000000),
-        (541, 0.303891200000, 0.960256100000, 0.018718050000),
-        (542, 0.317572600000, 0.966007400000, 0.017240360000),
-        (543, 0.331438400000, 0.971260600000, 0.015863640000),
-        (544, 0.345482800000, 0.976022500000, 0.014584610000),
-        (545, 0.359700000000, 0.980300000000, 0.013400000000),
-        (546, 0.374083900000, 0.984092400000, 0.012307230000),
-        (547, 0.388639600000, 0.987418200000, 0.011301880000),
-        (548, 0.403378400000, 0.990312800000, 0.010377920000),
-        (549, 0.418311500000, 0.992811600000, 0.009529306000),
-        (550, 0.433449900000, 0.994950100000, 0.008749999000),
-        (551, 0.448795300000, 0.996710800000, 0.008035200000),
-        (552, 0.464336000000, 0.998098300000, 0.007381600000),
-        (553, 0.480064000000, 0.999112000000, 0.006785400000),
-        (554, 0.495971300000, 0.999748200000, 0.006242800000),
-        (555, 0.512050100000, 1.000000000000, 0.005749999000),
-        (556, 0.528295900000, 0.999856700000, 0.005303600000),
-        (557, 0.544691600000, 0.999304600000, 0.004899800000),
-        (558, 0.561209400000, 0.998325500000, 0.004534200000),
-        (559, 0.577821500000, 0.996898700000, 0.004202400000),
-        (560, 0.594500000000, 0.995000000000, 0.003900000000),
-        (561, 0.611220900000, 0.992600500000, 0.003623200000),
-        (562, 0.627975800000, 0.989742600000, 0.003370600000),
-        (563, 0.644760200000, 0.986444400000, 0.003141400000),
-        (564, 0.661569700000, 0.982724100000, 0.002934800000),
-        (565, 0.678400000000, 0.978600000000, 0.002749999000),
-        (566, 0.695239200000, 0.974083700000, 0.002585200000),
-        (567, 0.712058600000, 0.969171200000, 0.002438600000),
-        (568, 0.728828400000, 0.963856800000, 0.002309400000),
-        (569, 0.745518800000, 0.958134900000, 0.002196800000),
-        (570, 0.762100000000, 0.952000000000, 0.002100000000),
-        (571, 0.778543200000, 0.945450400000, 0.002017733000),
-        (572, 0.794825600000, 0.938499200000, 0.001948200000),
-        (573, 0.810926400000, 0.931162800000, 0.001889800000),
-        (574, 0.826824800000, 0.923457600000, 0.001840933000),
-        (575, 0.842500000000, 0.915400000000, 0.001800000000),
-        (576, 0.857932500000, 0.907006400000, 0.001766267000),
-        (577, 0.873081600000, 0.898277200000, 0.001737800000),
-        (578, 0.887894400000, 0.889204800000, 0.001711200000),
-        (579, 0.902318100000, 0.879781600000, 0.001683067000),
-        (580, 0.916300000000, 0.870000000000, 0.001650001000),
-        (581, 0.929799500000, 0.859861300000, 0.001610133000),
-        (582, 0.942798400000, 0.849392000000, 0.001564400000),
-        (583, 0.955277600000, 0.838622000000, 0.001513600000),
-        (584, 0.967217900000, 0.827581300000, 0.001458533000),
-        (585, 0.978600000000, 0.816300000000, 0.001400000000),
-        (586, 0.989385600000, 0.804794700000, 0.001336667000),
-        (587, 0.999548800000, 0.793082000000, 0.001270000000),
-        (588, 1.009089200000, 0.781192000000, 0.001205000000),
-        (589, 1.018006400000, 0.769154700000, 0.001146667000),
-        (590, 1.026300000000, 0.757000000000, 0.001100000000),
-        (591, 1.033982700000, 0.744754100000, 0.001068800000),
-        (592, 1.040986000000, 0.732422400000, 0.001049400000),
-        (593, 1.047188000000, 0.720003600000, 0.001035600000),
-        (594, 1.052466700000, 0.707496500000, 0.001021200000),
-        (595, 1.056700000000, 0.694900000000, 0.001000000000),
-        (596, 1.059794400000, 0.682219200000, 0.000968640000),
-        (597, 1.061799200000, 0.669471600000, 0.000929920000),
-        (598, 1.062806800000, 0.656674400000, 0.000886880000),
-        (599, 1.062909600000, 0.643844800000, 0.000842560000),
-        (600, 1.062200000000, 0.631000000000, 0.000800000000),
-        (601, 1.060735200000, 0.618155500000, 0.000760960000),
-        (602, 1.058443600000, 0.605314400000, 0.000723680000),
-        (603, 1.055224400000, 0.592475600000, 0.000685920000),
-        (604, 1.050976800000, 0.579637900000, 0.000645440000),
-        (605, 1.045600000000, 0.566800000000, 0.000600000000),
-        (606, 1.039036900000, 0.553961100000, 0.000547866700),
-        (607, 1.031360800000, 0.541137200000, 0.000491600000),
-        (608, 1.022666200000, 0.528352800000, 0.000435400000),
-        (609, 1.013047700000, 0.515632300000, 0.000383466700),
-        (610, 1.002600000000, 0.503000000000, 0.000340000000),
-        (611, 0.991367500000, 0.490468800000, 0.000307253300),
-        (612, 0.979331400000, 0.478030400000, 0.000283160000),
-        (613, 0.966491600000, 0.465677600000, 0.000265440000),
-        (614, 0.952847900000, 0.453403200000, 0.000251813300),
-        (615, 0.938400000000, 0.441200000000, 0.000240000000),
-        (616, 0.923194000000, 0.429080000000, 0.000229546700),
-        (617, 0.907244000000, 0.417036000000, 0.000220640000),
-        (618, 0.890502000000, 0.405032000000, 0.000211960000),
-        (619, 0.872920000000, 0.393032000000, 0.000202186700),
-        (620, 0.854449900000, 0.381000000000, 0.000190000000),
-        (621, 0.835084000000, 0.368918400000, 0.000174213300),
-        (622, 0.814946000000, 0.356827200000, 0.000155640000),
-        (623, 0.794186000000, 0.344776800000, 0.000135960000),
-        (624, 0.772954000000, 0.332817600000, 0.000116853300),
-        (625, 0.751400000000, 0.321000000000, 0.000100000000),
-        (626, 0.729583600000, 0.309338100000, 0.000086133330),
-        (627, 0.707588800000, 0.297850400000, 0.000074600000),
-        (628, 0.685602200000, 0.286593600000, 0.000065000000),
-        (629, 0.663810400000, 0.275624500000, 0.000056933330),
-        (630, 0.642400000000, 0.265000000000, 0.000049999990),
-        (631, 0.621514900000, 0.254763200000, 0.000044160000),
-        (632, 0.601113800000, 0.244889600000, 0.000039480000),
-        (633, 0.581105200000, 0.235334400000, 0.000035720000),
-        (634, 0.561397700000, 0.226052800000, 0.000032640000),
-        (635, 0.541900000000, 0.217000000000, 0.000030000000),
-        (636, 0.522599500000, 0.208161600000, 0.000027653330),
-        (637, 0.503546400000, 0.199548800000, 0.000025560000),
-        (638, 0.484743600000, 0.191155200000, 0.000023640000),
-        (639, 0.466193900000, 0.182974400000, 0.000021813330),
-        (640, 0.447900000000, 0.175000000000, 0.000020000000),
-        (641, 0.429861300000, 0.167223500000, 0.000018133330),
-        (642, 0.412098000000, 0.159646400000, 0.000016200000),
-        (643, 0.394644000000, 0.152277600000, 0.000014200000),
-        (644, 0.377533300000, 0.145125900000, 0.000012133330),
-        (645, 0.360800000000, 0.138200000000, 0.000010000000),
-        (646, 0.344456300000, 0.131500300000, 0.000007733333),
-        (647, 0.328516800000, 0.125024800000, 0.000005400000),
-        (648, 0.313019200000, 0.118779200000, 0.000003200000),
-        (649, 0.298001100000, 0.112769100000, 0.000001333333),
-        (650, 0.283500000000, 0.107000000000, 0.000000000000),
-        (651, 0.269544800000, 0.101476200000, 0.000000000000),
-        (652, 0.256118400000, 0.096188640000, 0.000000000000),
-        (653, 0.243189600000, 0.091122960000, 0.000000000000),
-        (654, 0.230727200000, 0.086264850000, 0.000000000000),
-        (655, 0.218700000000, 0.081600000000, 0.000000000000),
-        (656, 0.207097100000, 0.077120640000, 0.000000000000),
-        (657, 0.195923200000, 0.072825520000, 0.000000000000),
-        (658, 0.185170800000, 0.068710080000, 0.000000000000),
-        (659, 0.174832300000, 0.064769760000, 0.000000000000),
-        (660, 0.164900000000, 0.061000000000, 0.000000000000),
-        (661, 0.155366700000, 0.057396210000, 0.000000000000),
-        (662, 0.146230000000, 0.053955040000, 0.000000000000),
-        (663, 0.137490000000, 0.050673760000, 0.000000000000),
-        (664, 0.129146700000, 0.047549650000, 0.000000000000),
-        (665, 0.121200000000, 0.044580000000, 0.000000000000),
-        (666, 0.113639700000, 0.041758720000, 0.000000000000),
-        (667, 0.106465000000, 0.039084960000, 0.000000000000),
-        (668, 0.099690440000, 0.036563840000, 0.000000000000),
-        (669, 0.093330610000, 0.034200480000, 0.000000000000),
-        (670, 0.087400000000, 0.032000000000, 0.000000000000),
-        (671, 0.081900960000, 0.029962610000, 0.000000000000),
-        (672, 0.076804280000, 0.028076640000, 0.000000000000),
-        (673, 0.072077120000, 0.026329360000, 0.000000000000),
-        (674, 0.067686640000, 0.024708050000, 0.000000000000),
-        (675, 0.063600000000, 0.023200000000, 0.000000000000),
-        (676, 0.059806850000, 0.021800770000, 0.000000000000),
-        (677, 0.056282160000, 0.020501120000, 0.000000000000),
-        (678, 0.052971040000, 0.019281080000, 0.000000000000),
-        (679, 0.049818610000, 0.018120690000, 0.000000000000),
-        (680, 0.046770000000, 0.017000000000, 0.000000000000),
-        (681, 0.043784050000, 0.015903790000, 0.000000000000),
-        (682, 0.040875360000, 0.014837180000, 0.000000000000),
-        (683, 0.038072640000, 0.013810680000, 0.000000000000),
-        (684, 0.035404610000, 0.012834780000, 0.000000000000),
-        (685, 0.032900000000, 0.011920000000, 0.000000000000),
-        (686, 0.030564190000, 0.011068310000, 0.000000000000),
-        (687, 0.028380560000, 0.010273390000, 0.000000000000),
-        (688, 0.026344840000, 0.009533311000, 0.000000000000),
-        (689, 0.024452750000, 0.008846157000, 0.000000000000),
-        (690, 0.022700000000, 0.008210000000, 0.000000000000),
-        (691, 0.021084290000, 0.007623781000, 0.000000000000),
-        (692, 0.019599880000, 0.007085424000, 0.000000000000),
-        (693, 0.018237320000, 0.006591476000, 0.000000000000),
-        (694, 0.016987170000, 0.006138485000, 0.000000000000),
-        (695, 0.015840000000, 0.005723000000, 0.000000000000),
-        (696, 0.014790640000, 0.005343059000, 0.000000000000),
-        (697, 0.013831320000, 0.004995796000, 0.000000000000),
-        (698, 0.012948680000, 0.004676404000, 0.000000000000),
-        (699, 0.012129200000, 0.004380075000, 0.000000000000),
-        (700, 0.011359160000, 0.004102000000, 0.000000000000),
-        (701, 0.010629350000, 0.003838453000, 0.000000000000),
-        (702, 0.009938846000, 0.003589099000, 0.000000000000),
-        (703, 0.009288422000, 0.003354219000, 0.000000000000),
-        (704, 0.008678854000, 0.003134093000, 0.000000000000),
-        (705, 0.008110916000, 0.002929000000, 0.000000000000),
-        (706, 0.007582388000, 0.002738139000, 0.000000000000),
-        (707, 0.007088746000, 0.002559876000, 0.000000000000),
-        (708, 0.006627313000, 0.002393244000, 0.000000000000),
-        (709, 0.006195408000, 0.002237275000, 0.000000000000),
-        (710, 0.005790346000, 0.002091000000, 0.000000000000),
-        (711, 0.005409826000, 0.001953587000, 0.000000000000),
-        (712, 0.005052583000, 0.001824580000, 0.000000000000),
-        (713, 0.004717512000, 0.001703580000, 0.000000000000),
-        (714, 0.004403507000, 0.001590187000, 0.000000000000),
-        (715, 0.004109457000, 0.001484000000, 0.000000000000),
-        (716, 0.003833913000, 0.001384496000, 0.000000000000),
-        (717, 0.003575748000, 0.001291268000, 0.000000000000),
-        (718, 0.003334342000, 0.001204092000, 0.000000000000),
-        (719, 0.003109075000, 0.001122744000, 0.000000000000),
-        (720, 0.002899327000, 0.001047000000, 0.000000000000),
-        (721, 0.002704348000, 0.000976589600, 0.000000000000),
-        (722, 0.002523020000, 0.000911108800, 0.000000000000),
-        (723, 0.002354168000, 0.000850133200, 0.000000000000),
-        (724, 0.002196616000, 0.000793238400, 0.000000000000),
-        (725, 0.002049190000, 0.000740000000, 0.000000000000),
-        (726, 0.001910960000, 0.000690082700, 0.000000000000),
-        (727, 0.001781438000, 0.000643310000, 0.000000000000),
-        (728, 0.001660110000, 0.000599496000, 0.000000000000),
-        (729, 0.001546459000, 0.000558454700, 0.000000000000),
-        (730, 0.001439971000, 0.000520000000, 0.000000000000),
-        (731, 0.001340042000, 0.000483913600, 0.000000000000),
-        (732, 0.001246275000, 0.000450052800, 0.000000000000),
-        (733, 0.001158471000, 0.000418345200, 0.000000000000),
-        (734, 0.001076430000, 0.000388718400, 0.000000000000),
-        (735, 0.000999949300, 0.000361100000, 0.000000000000),
-        (736, 0.000928735800, 0.000335383500, 0.000000000000),
-        (737, 0.000862433200, 0.000311440400, 0.000000000000),
-        (738, 0.000800750300, 0.000289165600, 0.000000000000),
-        (739, 0.000743396000, 0.000268453900, 0.000000000000),
-        (740, 0.000690078600, 0.000249200000, 0.000000000000),
-        (741, 0.000640515600, 0.000231301900, 0.000000000000),
-        (742, 0.000594502100, 0.000214685600, 0.000000000000),
-        (743, 0.000551864600, 0.000199288400, 0.000000000000),
-        (744, 0.000512429000, 0.000185047500, 0.000000000000),
-        (745, 0.000476021300, 0.000171900000, 0.000000000000),
-        (746, 0.000442453600, 0.000159778100, 0.000000000000),
-        (747, 0.000411511700, 0.000148604400, 0.000000000000),
-        (748, 0.000382981400, 0.000138301600, 0.000000000000),
-        (749, 0.000356649100, 0.000128792500, 0.000000000000),
-        (750, 0.000332301100, 0.000120000000, 0.000000000000),
-        (751, 0.000309758600, 0.000111859500, 0.000000000000),
-        (752, 0.000288887100, 0.000104322400, 0.000000000000),
-        (753, 0.000269539400, 0.000097335600, 0.000000000000),
-        (754, 0.000251568200, 0.000090845870, 0.000000000000),
-        (755, 0.000234826100, 0.000084800000, 0.000000000000),
-        (756, 0.000219171000, 0.000079146670, 0.000000000000),
-        (757, 0.000204525800, 0.000073858000, 0.000000000000),
-        (758, 0.000190840500, 0.000068916000, 0.000000000000),
-        (759, 0.000178065400, 0.000064302670, 0.000000000000),
-        (760, 0.000166150500, 0.000060000000, 0.000000000000),
-        (761, 0.000155023600, 0.000055981870, 0.000000000000),
-        (762, 0.000144621900, 0.000052225600, 0.000000000000),
-        (763, 0.000134909800, 0.000048718400, 0.000000000000),
-        (764, 0.000125852000, 0.000045447470, 0.000000000000),
-        (765, 0.000117413000, 0.000042400000, 0.000000000000),
-        (766, 0.000109551500, 0.000039561040, 0.000000000000),
-        (767, 0.000102224500, 0.000036915120, 0.000000000000),
-        (768, 0.000095394450, 0.000034448680, 0.000000000000),
-        (769, 0.000089023900, 0.000032148160, 0.000000000000),
-        (770, 0.000083075270, 0.000030000000, 0.000000000000),
-        (771, 0.000077512690, 0.000027991250, 0.000000000000),
-        (772, 0.000072313040, 0.000026113560, 0.000000000000),
-        (773, 0.000067457780, 0.000024360240, 0.000000000000),
-        (774, 0.000062928440, 0.000022724610, 0.000000000000),
-        (775, 0.000058706520, 0.000021200000, 0.000000000000),
-        (776, 0.000054770280, 0.000019778550, 0.000000000000),
-        (777, 0.000051099180, 0.000018452850, 0.000000000000),
-        (778, 0.000047676540, 0.000017216870, 0.000000000000),
-        (779, 0.000044485670, 0.000016064590, 0.000000000000),
-        (780, 0.000041509940, 0.000014990000, 0.000000000000),
-        (781, 0.000038733240, 0.000013987280, 0.000000000000),
-        (782, 0.000036142030, 0.000013051550, 0.000000000000),
-        (783, 0.000033723520, 0.000012178180, 0.000000000000),
-        (784, 0.000031464870, 0.000011362540, 0.000000000000),
-        (785, 0.000029353260, 0.000010600000, 0.000000000000),
-        (786, 0.000027375730, 0.000009885877, 0.000000000000),
-        (787, 0.000025524330, 0.000009217304, 0.000000000000),
-        (788, 0.000023793760, 0.000008592362, 0.000000000000),
-        (789, 0.000022178700, 0.000008009133, 0.000000000000),
-        (790, 0.000020673830, 0.000007465700, 0.000000000000),
-        (791, 0.000019272260, 0.000006959567, 0.000000000000),
-        (792, 0.000017966400, 0.000006487995, 0.000000000000),
-        (793, 0.000016749910, 0.000006048699, 0.000000000000),
-        (794, 0.000015616480, 0.000005639396, 0.000000000000),
-        (795, 0.000014559770, 0.000005257800, 0.000000000000),
-        (796, 0.000013573870, 0.000004901771, 0.000000000000),
-        (797, 0.000012654360, 0.000004569720, 0.000000000000),
-        (798, 0.000011797230, 0.000004260194, 0.000000000000),
-        (799, 0.000010998440, 0.000003971739, 0.000000000000),
-        (800, 0.000010253980, 0.000003702900, 0.000000000000),
-        (801, 0.000009559646, 0.000003452163, 0.000000000000),
-        (802, 0.000008912044, 0.000003218302, 0.000000000000),
-        (803, 0.000008308358, 0.000003000300, 0.000000000000),
-        (804, 0.000007745769, 0.000002797139, 0.000000000000),
-        (805, 0.000007221456, 0.000002607800, 0.000000000000),
-        (806, 0.000006732475, 0.000002431220, 0.000000000000),
-        (807, 0.000006276423, 0.000002266531, 0.000000000000),
-        (808, 0.000005851304, 0.000002113013, 0.000000000000),
-        (809, 0.000005455118, 0.000001969943, 0.000000000000),
-        (810, 0.000005085868, 0.000001836600, 0.000000000000),
-        (811, 0.000004741466, 0.000001712230, 0.000000000000),
-        (812, 0.000004420236, 0.000001596228, 0.000000000000),
-        (813, 0.000004120783, 0.000001488090, 0.000000000000),
-        (814, 0.000003841716, 0.000001387314, 0.000000000000),
-        (815, 0.000003581652, 0.000001293400, 0.000000000000),
-        (816, 0.000003339127, 0.000001205820, 0.000000000000),
-        (817, 0.000003112949, 0.000001124143, 0.000000000000),
-        (818, 0.000002902121, 0.000001048009, 0.000000000000),
-        (819, 0.000002705645, 0.000000977057, 0.000000000000),
-        (820, 0.000002522525, 0.000000910930, 0.000000000000),
-        (821, 0.000002351726, 0.000000849251, 0.000000000000),
-        (822, 0.000002192415, 0.000000791721, 0.000000000000),
-        (823, 0.000002043902, 0.000000738090, 0.000000000000),
-        (824, 0.000001905497, 0.000000688109, 0.000000000000),
-        (825, 0.000001776509, 0.000000641530, 0.000000000000),
-        (826, 0.000001656215, 0.000000598089, 0.000000000000),
-        (827, 0.000001544022, 0.000000557574, 0.000000000000),
-        (828, 0.000001439440, 0.000000519808, 0.000000000000),
-        (829, 0.000001341977, 0.000000484612, 0.000000000000),
-        (830, 0.000001251141, 0.000000451810, 0.000000000000),
-    ], dtype=[('wavelength', 'f'), ('X', 'f'), ('Y', 'f'), ('Z', 'f')]),
-    '10deg': np.array([
-        (360, 0.000000122200, 0.000000013398, 0.000000535027),
-        (361, 0.000000185138, 0.000000020294, 0.000000810720),
-        (362, 0.00000027883, 0.00000003056, 0.00000122120),
-        (363, 0.00000041747, 0.00000004574, 0.00000182870),
-        (364, 0.00000062133, 0.00000006805, 0.00000272220),
-        (365, 0.00000091927, 0.00000010065, 0.00000402830),
-        (366, 0.00000135198, 0.00000014798, 0.00000592570),
-        (367, 0.00000197654, 0.00000021627, 0.00000866510),
-        (368, 0.0000028725, 0.0000003142, 0.0000125960),
-        (369, 0.0000041495, 0.0000004537, 0.0000182010),
-        (370, 0.0000059586, 0.0000006511, 0.0000261437),
-        (371, 0.0000085056, 0.0000009288, 0.0000373300),
-        (372, 0.0000120686, 0.0000013175, 0.0000529870),
-        (373, 0.0000170226, 0.0000018572, 0.0000747640),
-        (374, 0.000023868, 0.000002602, 0.000104870),
-        (375, 0.000033266, 0.000003625, 0.000146220),
-        (376, 0.000046087, 0.000005019, 0.000202660),
-        (377, 0.000063472, 0.000006907, 0.000279230),
-        (378, 0.000086892, 0.000009449, 0.000382450),
-        (379, 0.000118246, 0.000012848, 0.000520720),
-        (380, 0.000159952, 0.000017364, 0.000704776),
-        (381, 0.000215080, 0.000023327, 0.000948230),
-        (382, 0.00028749, 0.00003115, 0.00126820),
-        (383, 0.00038199, 0.00004135, 0.00168610),
-        (384, 0.00050455, 0.00005456, 0.00222850),
-        (385, 0.00066244, 0.00007156, 0.00292780),
-        (386, 0.00086450, 0.00009330, 0.00382370),
-        (387, 0.00112150, 0.00012087, 0.00496420),
-        (388, 0.00144616, 0.00015564, 0.00640670),
-        (389, 0.00185359, 0.00019920, 0.00821930),
-        (390, 0.0023616, 0.0002534, 0.0104822),
-        (391, 0.0029906, 0.0003202, 0.0132890),
-        (392, 0.0037645, 0.0004024, 0.0167470),
-        (393, 0.0047102, 0.0005023, 0.0209800),
-        (394, 0.0058581, 0.0006232, 0.0261270),
-        (395, 0.0072423, 0.0007685, 0.0323440),
-        (396, 0.0088996, 0.0009417, 0.0398020),
-        (397, 0.0108709, 0.0011478, 0.0486910),
-        (398, 0.0131989, 0.0013903, 0.0592100),
-        (399, 0.0159292, 0.0016740, 0.0715760),
-        (400, 0.0191097, 0.0020044, 0.0860109),
-        (401, 0.022788, 0.002386, 0.102740),
-        (402, 0.027011, 0.002822, 0.122000),
-        (403, 0.031829, 0.003319, 0.144020),
-        (404, 0.037278, 0.003880, 0.168990),
-        (405, 0.043400, 0.004509, 0.197120),
-        (406, 0.050223, 0.005209, 0.228570),
-        (407, 0.057764, 0.005985, 0.263470),
-        (408, 0.066038, 0.006833, 0.301900),
-        (409, 0.075033, 0.007757, 0.343870),
-        (410, 0.084736, 0.008756, 0.389366),
-        (411, 0.095041, 0.009816, 0.437970),
-        (412, 0.105836, 0.010918, 0.489220),
-        (413, 0.117066, 0.012058, 0.542900),
-        (414, 0.128682, 0.013237, 0.598810),
-        (415, 0.140638, 0.014456, 0.656760),
-        (416, 0.152893, 0.015717, 0.716580),
-        (417, 0.165416, 0.017025, 0.778120),
-        (418, 0.178191, 0.018399, 0.841310),
-        (419, 0.191214, 0.019848, 0.906110),
-        (420, 0.204492, 0.021391, 0.972542),
-        (421, 0.217650, 0.022992, 1.038900),
-        (422, 0.230267, 0.024598, 1.103100),
-        (423, 0.242311, 0.026213, 1.165100),
-        (424, 0.253793, 0.027841, 1.224900),
-        (425, 0.264737, 0.029497, 1.282500),
-        (426, 0.275195, 0.031195, 1.338200),
-        (427, 0.285301, 0.032927, 1.392600),
-        (428, 0.295143, 0.034738, 1.446100),
-        (429, 0.304869, 0.036654, 1.499400),
-        (430, 0.314679, 0.038676, 1.553480),
-        (431, 0.324355, 0.040792, 1.607200),
-        (432, 0.333570, 0.042946, 1.658900),
-        (433, 0.342243, 0.045114, 1.708200),
-        (434, 0.350312, 0.047333, 1.754800),
-        (435, 0.357719, 0.049602, 1.798500),
-        (436, 0.364482, 0.051934, 1.839200),
-        (437, 0.370493, 0.054337, 1.876600),
-        (438, 0.375727, 0.056822, 1.910500),
-        (439, 0.380158, 0.059399, 1.940800),
-        (440, 0.383734, 0.062077, 1.967280),
-        (441, 0.386327, 0.064737, 1.989100),
-        (442, 0.387858, 0.067285, 2.005700),
-        (443, 0.388396, 0.069764, 2.017400),
-        (444, 0.387978, 0.072218, 2.024400),
-        (445, 0.386726, 0.074704, 2.027300),
-        (446, 0.384696, 0.077272, 2.026400),
-        (447, 0.382006, 0.079979, 2.022300),
-        (448, 0.378709, 0.082874, 2.015300),
-        (449, 0.374915, 0.086000, 2.006000),
-        (450, 0.370702, 0.089456, 1.994800),
-        (451, 0.366089, 0.092947, 1.981400),
-        (452, 0.361045, 0.096275, 1.965300),
-        (453, 0.355518, 0.099535, 1.946400),
-        (454, 0.349486, 0.102829, 1.924800),
-        (455, 0.342957, 0.106256, 1.900700),
-        (456, 0.335893, 0.109901, 1.874100),
-        (457, 0.328284, 0.113835, 1.845100),
-        (458, 0.320150, 0.118167, 1.813900),
-        (459, 0.311475, 0.122932, 1.780600),
-        (460, 0.302273, 0.128201, 1.745370),
-        (461, 0.292858, 0.133457, 1.709100),
-        (462, 0.283502, 0.138323, 1.672300),
-        (463, 0.274044, 0.143042, 1.634700),
-        (464, 0.264263, 0.147787, 1.595600),
-        (465, 0.254085, 0.152761, 1.554900),
-        (466, 0.243392, 0.158102, 1.512200),
-        (467, 0.232187, 0.163941, 1.467300),
-        (468, 0.220488, 0.170362, 1.419900),
-        (469, 0.208198, 0.177425, 1.370000),
-        (470, 0.195618, 0.185190, 1.317560),
-        (471, 0.183034, 0.193025, 1.262400),
-        (472, 0.170222, 0.200313, 1.205000),
-        (473, 0.157348, 0.207156, 1.146600),
-        (474, 0.144650, 0.213644, 1.088000),
-        (475, 0.132349, 0.219940, 1.030200),
-        (476, 0.120584, 0.226170, 0.973830),
-        (477, 0.109456, 0.232467, 0.919430),
-        (478, 0.099042, 0.239025, 0.867460),
-        (479, 0.089388, 0.245997, 0.818280),
-        (480, 0.080507, 0.253589, 0.772125),
-        (481, 0.072034, 0.261876, 0.728290),
-        (482, 0.063710, 0.270643, 0.686040),
-        (483, 0.055694, 0.279645, 0.645530),
-        (484, 0.048117, 0.288694, 0.606850),
-        (485, 0.041072, 0.297665, 0.570060),
-        (486, 0.034642, 0.306469, 0.535220),
-        (487, 0.028896, 0.315035, 0.502340),
-        (488, 0.023876, 0.323335, 0.471400),
-        (489, 0.019628, 0.331366, 0.442390),
-        (490, 0.016172, 0.339133, 0.415254),
-        (491, 0.013300, 0.347860, 0.390024),
-        (492, 0.010759, 0.358326, 0.366399),
-        (493, 0.008542, 0.370001, 0.344015),
-        (494, 0.006661, 0.382464, 0.322689),
-        (495, 0.005132, 0.395379, 0.302356),
-        (496, 0.003982, 0.408482, 0.283036),
-        (497, 0.003239, 0.421588, 0.264816),
-        (498, 0.002934, 0.434619, 0.247848),
-        (499, 0.003114, 0.447601, 0.232318),
-        (500, 0.003816, 0.460777, 0.218502),
-        (501, 0.005095, 0.474340, 0.205851),
-        (502, 0.006936, 0.488200, 0.193596),
-        (503, 0.009299, 0.502340, 0.181736),
-        (504, 0.012147, 0.516740, 0.170281),
-        (505, 0.015444, 0.531360, 0.159249),
-        (506, 0.019156, 0.546190, 0.148673),
-        (507, 0.023250, 0.561180, 0.138609),
-        (508, 0.027690, 0.576290, 0.129096),
-        (509, 0.032444, 0.591500, 0.120215),
-        (510, 0.037465, 0.606741, 0.112044),
-        (511, 0.042956, 0.622150, 0.104710),
-        (512, 0.049114, 0.637830, 0.098196),
-        (513, 0.055920, 0.653710, 0.092361),
-        (514, 0.063349, 0.669680, 0.087088),
-        (515, 0.071358, 0.685660, 0.082248),
-        (516, 0.079901, 0.701550, 0.077744),
-        (517, 0.088909, 0.717230, 0.073456),
-        (518, 0.098293, 0.732570, 0.069268),
-        (519, 0.107949, 0.747460, 0.065060),
-        (520, 0.117749, 0.761757, 0.060709),
-        (521, 0.127839, 0.775340, 0.056457),
-        (522, 0.138450, 0.788220, 0.052609),
-        (523, 0.149516, 0.800460, 0.049122),
-        (524, 0.161041, 0.812140, 0.045954),
-        (525, 0.172953, 0.823330, 0.043050),
-        (526, 0.185209, 0.834120, 0.040368),
-        (527, 0.197755, 0.844600, 0.037839),
-        (528, 0.210538, 0.854870, 0.035384),
-        (529, 0.223460, 0.865040, 0.032949),
-        (530, 0.236491, 0.875211, 0.030451),
-        (531, 0.249633, 0.885370, 0.028029),
-        (532, 0.262972, 0.895370, 0.025862),
-        (533, 0.276515, 0.905150, 0.023920),
-        (534, 0.290269, 0.914650, 0.022174),
-        (535, 0.304213, 0.923810, 0.020584),
-        (536, 0.318361, 0.932550, 0.019127),
-        (537, 0.332705, 0.940810, 0.017740),
-        (538, 0.347232, 0.948520, 0.016403),
-        (539, 0.361926, 0.955600, 0.015064),
-        (540, 0.376772, 0.961988, 0.013676),
-        (541, 0.391683, 0.967540, 0.012308),
-        (542, 0.406594, 0.972230, 0.011056),
-        (543, 0.421539, 0.976170, 0.009915),
-        (544, 0.436517, 0.979460, 0.008872),
-        (545, 0.451584, 0.982200, 0.007918),
-        (546, 0.466782, 0.984520, 0.007030),
-        (547, 0.482147, 0.986520, 0.006223),
-        (548, 0.497738, 0.988320, 0.005453),
-        (549, 0.513606, 0.990020, 0.004714),
-        (550, 0.529826, 0.991761, 0.003988),
-        (551, 0.546440, 0.993530, 0.003289),
-        (552, 0.563426, 0.995230, 0.002646),
-        (553, 0.580726, 0.996770, 0.002063),
-        (554, 0.598290, 0.998090, 0.001533),
-        (555, 0.616053, 0.999110, 0.001091),
-        (556, 0.633948, 0.999770, 0.000711),
-        (557, 0.651901, 1.000000, 0.000407),
-        (558, 0.669824, 0.999710, 0.000184),
-        (559, 0.687632, 0.998850, 0.000047),
-        (560, 0.705224, 0.997340, 0.000000),
-        (561, 0.722773, 0.995260, 0.000000),
-        (562, 0.740483, 0.992740, 0.000000),
-        (563, 0.758273, 0.989750, 0.000000),
-        (564, 0.776083, 0.986300, 0.000000),
-        (565, 0.793832, 0.982380, 0.000000),
-        (566, 0.811436, 0.977980, 0.000000),
-        (567, 0.828822, 0.973110, 0.000000),
-        (568, 0.845879, 0.967740, 0.000000),
-        (569, 0.862525, 0.961890, 0.000000),
-        (570, 0.878655, 0.955552, 0.000000),
-        (571, 0.894208, 0.948601, 0.000000),
-        (572, 0.909206, 0.940981, 0.000000),
-        (573, 0.923672, 0.932798, 0.000000),
-        (574, 0.937638, 0.924158, 0.000000),
-        (575, 0.951162, 0.915175, 0.000000),
-        (576, 0.964283, 0.905954, 0.000000),
-        (577, 0.977068, 0.896608, 0.000000),
-        (578, 0.989590, 0.887249, 0.000000),
-        (579, 1.00191, 0.87799, 0.00000),
-        (580, 1.01416, 0.86893, 0.00000),
-        (581, 1.02650, 0.86016, 0.00000),
-        (582, 1.03880, 0.85152, 0.00000),
-        (583, 1.05100, 0.84296, 0.00000),
-        (584, 1.06290, 0.83439, 0.00000),
-        (585, 1.07430, 0.82562, 0.00000),
-        (586, 1.08520, 0.81676, 0.00000),
-        (587, 1.09520, 0.80754, 0.00000),
-        (588, 1.10420, 0.79795, 0.00000),
-        (589, 1.11200, 0.78789, 0.00000),
-        (590, 1.11852, 0.77741, 0.00000),
-        (591, 1.12380, 0.76649, 0.00000),
-        (592, 1.12800, 0.75531, 0.00000),
-        (593, 1.13110, 0.74385, 0.00000),
-        (594, 1.13320, 0.73219, 0.00000),
-        (595, 1.13430, 0.72035, 0.00000),
-        (596, 1.13430, 0.70828, 0.00000),
-        (597, 1.13330, 0.69606, 0.00000),
-        (598, 1.13120, 0.68362, 0.00000),
-        (599, 1.12810, 0.67105, 0.00000),
-        (600, 1.12399, 0.65834, 0.00000),
-        (601, 1.11890, 0.64555, 0.00000),
-        (602, 1.11290, 0.63272, 0.00000),
-        (603, 1.10590, 0.61982, 0.00000),
-        (604, 1.09800, 0.60689, 0.00000),
-        (605, 1.08910, 0.59388, 0.00000),
-        (606, 1.07920, 0.58078, 0.00000),
-        (607, 1.06840, 0.56765, 0.00000),
-        (608, 1.05670, 0.55449, 0.00000),
-        (609, 1.04400, 0.54123, 0.00000),
-        (610, 1.03048, 0.52796, 0.00000),
-        (611, 1.01600, 0.51463, 0.00000),
-        (612, 1.00080, 0.50136, 0.00000),
-        (613, 0.984790, 0.488124, 0.000000),
-        (614, 0.968080, 0.474935, 0.000000),
-        (615, 0.950740, 0.461834, 0.000000),
-        (616, 0.932800, 0.448823, 0.000000),
-        (617, 0.914340, 0.435917, 0.000000),
-        (618, 0.895390, 0.423153, 0.000000),
-        (619, 0.876030, 0.410526, 0.000000),
-        (620, 0.856297, 0.398057, 0.000000),
-        (621, 0.836350, 0.385835, 0.000000),
-        (622, 0.816290, 0.373951, 0.000000),
-        (623, 0.796050, 0.362311, 0.000000),
-        (624, 0.775610, 0.350863, 0.000000),
-        (625, 0.754930, 0.339554, 0.000000),
-        (626, 0.733990, 0.328309, 0.000000),
-        (627, 0.712780, 0.317118, 0.000000),
-        (628, 0.691290, 0.305936, 0.000000),
-        (629, 0.669520, 0.294737, 0.000000),
-        (630, 0.647467, 0.283493, 0.000000),
-        (631, 0.625110, 0.272222, 0.000000),
-        (632, 0.602520, 0.260990, 0.000000),
-        (633, 0.579890, 0.249877, 0.000000),
-        (634, 0.557370, 0.238946, 0.000000),
-        (635, 0.535110, 0.228254, 0.000000),
-        (636, 0.513240, 0.217853, 0.000000),
-        (637, 0.491860, 0.207780, 0.000000),
-        (638, 0.471080, 0.198072, 0.000000),
-        (639, 0.450960, 0.188748, 0.000000),
-        (640, 0.431567, 0.179828, 0.000000),
-        (641, 0.412870, 0.171285, 0.000000),
-        (642, 0.394750, 0.163059, 0.000000),
-        (643, 0.377210, 0.155151, 0.000000),
-        (644, 0.360190, 0.147535, 0.000000),
-        (645, 0.343690, 0.140211, 0.000000),
-        (646, 0.327690, 0.133170, 0.000000),
-        (647, 0.312170, 0.126400, 0.000000),
-        (648, 0.297110, 0.119892, 0.000000),
-        (649, 0.282500, 0.113640, 0.000000),
-        (650, 0.268329, 0.107633, 0.000000),
-        (651, 0.254590, 0.101870, 0.000000),
-        (652, 0.241300, 0.096347, 0.000000),
-        (653, 0.228480, 0.091063, 0.000000),
-        (654, 0.216140, 0.086010, 0.000000),
-        (655, 0.204300, 0.081187, 0.000000),
-        (656, 0.192950, 0.076583, 0.000000),
-        (657, 0.182110, 0.072198, 0.000000),
-        (658, 0.171770, 0.068024, 0.000000),
-        (659, 0.161920, 0.064052, 0.000000),
-        (660, 0.152568, 0.060281, 0.000000),
-        (661, 0.143670, 0.056697, 0.000000),
-        (662, 0.135200, 0.053292, 0.000000),
-        (663, 0.127130, 0.050059, 0.000000),
-        (664, 0.119480, 0.046998, 0.000000),
-        (665, 0.112210, 0.044096, 0.000000),
-        (666, 0.105310, 0.041345, 0.000000),
-        (667, 0.0987860, 0.0387507, 0.0000000),
-        (668, 0.0926100, 0.0362978, 0.0000000),
-        (669, 0.0867730, 0.0339832, 0.0000000),
-        (670, 0.0812606, 0.0318004, 0.0000000),
-        (671, 0.0760480, 0.0297395, 0.0000000),
-        (672, 0.0711140, 0.0277918, 0.0000000),
-        (673, 0.0664540, 0.0259551, 0.0000000),
-        (674, 0.0620620, 0.0242263, 0.0000000),
-        (675, 0.0579300, 0.0226017, 0.0000000),
-        (676, 0.0540500, 0.0210779, 0.0000000),
-        (677, 0.0504120, 0.0196505, 0.0000000),
-        (678, 0.0470060, 0.0183153, 0.0000000),
-        (679, 0.0438230, 0.0170686, 0.0000000),
-        (680, 0.0408508, 0.0159051, 0.0000000),
-        (681, 0.0380720, 0.0148183, 0.0000000),
-        (682, 0.0354680, 0.0138008, 0.0000000),
-        (683, 0.0330310, 0.0128495, 0.0000000),
-        (684, 0.0307530, 0.0119607, 0.0000000),
-        (685, 0.0286230, 0.0111303, 0.0000000),
-        (686, 0.0266350, 0.0103555, 0.0000000),
-        (687, 0.0247810, 0.0096332, 0.0000000),
-        (688, 0.0230520, 0.0089599, 0.0000000),
-        (689, 0.0214410, 0.0083324, 0.0000000),
-        (690, 0.0199413, 0.0077488, 0.0000000),
-        (691, 0.0185440, 0.0072046, 0.0000000),
-        (692, 0.0172410, 0.0066975, 0.0000000),
-        (693, 0.0160270, 0.0062251, 0.0000000),
-        (694, 0.0148960, 0.0057850, 0.0000000),
-        (695, 0.0138420, 0.0053751, 0.0000000),
-        (696, 0.0128620, 0.0049941, 0.0000000),
-        (697, 0.0119490, 0.0046392, 0.0000000),
-        (698, 0.0111000, 0.0043093, 0.0000000),
-        (699, 0.0103110, 0.0040028, 0.0000000),
-        (700, 0.00957688, 0.00371774, 0.00000000),
-        (701, 0.00889400, 0.00345262, 0.00000000),
-        (702, 0.00825810, 0.00320583, 0.00000000),
-        (703, 0.00766640, 0.00297623, 0.00000000),
-        (704, 0.00711630, 0.00276281, 0.00000000),
-        (705, 0.00660520, 0.00256456, 0.00000000),
-        (706, 0.00613060, 0.00238048, 0.00000000),
-        (707, 0.00569030, 0.00220971, 0.00000000),
-        (708, 0.00528190, 0.00205132, 0.00000000),
-        (709, 0.00490330, 0.00190449, 0.00000000),
-        (710, 0.00455263, 0.00176847, 0.00000000),
-        (711, 0.00422750, 0.00164236, 0.00000000),
-        (712, 0.00392580, 0.00152535, 0.00000000),
-        (713, 0.00364570, 0.00141672, 0.00000000),
-        (714, 0.00338590, 0.00131595, 0.00000000),
-        (715, 0.00314470, 0.00122239, 0.00000000),
-        (716, 0.00292080, 0.00113555, 0.00000000),
-        (717, 0.00271300, 0.00105494, 0.00000000),
-        (718, 0.00252020, 0.00098014, 0.00000000),
-        (719, 0.00234110, 0.00091066, 0.00000000),
-        (720, 0.00217496, 0.00084619, 0.00000000),
-        (721, 0.00202060, 0.00078629, 0.00000000),
-        (722, 0.00187730, 0.00073068, 0.00000000),
-        (723, 0.00174410, 0.00067899, 0.00000000),
-        (724, 0.00162050, 0.00063101, 0.00000000),
-        (725, 0.00150570, 0.00058644, 0.00000000),
-        (726, 0.00139920, 0.00054511, 0.00000000),
-        (727, 0.00130040, 0.00050672, 0.00000000),
-        (728, 0.00120870, 0.00047111, 0.00000000),
-        (729, 0.00112360, 0.00043805, 0.00000000),
-        (730, 0.00104476, 0.00040741, 0.00000000),
-        (731, 0.000971560, 0.000378962, 0.000000000),
-        (732, 0.000903600, 0.000352543, 0.000000000),
-        (733, 0.000840480, 0.000328001, 0.000000000),
-        (734, 0.000781870, 0.000305208, 0.000000000),
-        (735, 0.000727450, 0.000284041, 0.000000000),
-        (736, 0.000676900, 0.000264375, 0.000000000),
-        (737, 0.000629960, 0.000246109, 0.000000000),
-        (738, 0.000586370, 0.000229143, 0.000000000),
-        (739, 0.000545870, 0.000213376, 0.000000000),
-        (740, 0.000508258, 0.000198730, 0.000000000),
-        (741, 0.000473300, 0.000185115, 0.000000000),
-        (742, 0.000440800, 0.000172454, 0.000000000),
-        (743, 0.000410580, 0.000160678, 0.000000000),
-        (744, 0.000382490, 0.000149730, 0.000000000),
-        (745, 0.000356380, 0.000139550, 0.000000000),
-        (746, 0.000332110, 0.000130086, 0.000000000),
-        (747, 0.000309550, 0.000121290, 0.000000000),
-        (748, 0.000288580, 0.000113106, 0.000000000),
-        (749, 0.000269090, 0.000105501, 0.000000000),
-        (750, 0.000250969, 0.000098428, 0.000000000),
-        (751, 0.000234130, 0.000091853, 0.000000000),
-        (752, 0.000218470, 0.000085738, 0.000000000),
-        (753, 0.000203910, 0.000080048, 0.000000000),
-        (754, 0.000190350, 0.000074751, 0.000000000),
-        (755, 0.000177730, 0.000069819, 0.000000000),
-        (756, 0.000165970, 0.000065222, 0.000000000),
-        (757, 0.000155020, 0.000060939, 0.000000000),
-        (758, 0.000144800, 0.000056942, 0.000000000),
-        (759, 0.000135280, 0.000053217, 0.000000000),
-        (760, 0.000126390, 0.000049737, 0.000000000),
-        (761, 0.000118100, 0.000046491, 0.000000000),
-        (762, 0.000110370, 0.000043464, 0.000000000),
-        (763, 0.000103150, 0.000040635, 0.000000000),
-        (764, 0.0000964270, 0.0000380000, 0.0000000000),
-        (765, 0.0000901510, 0.0000355405, 0.0000000000),
-        (766, 0.0000842940, 0.0000332448, 0.0000000000),
-        (767, 0.0000788300, 0.0000311006, 0.0000000000),
-        (768, 0.0000737290, 0.0000290990, 0.0000000000),
-        (769, 0.0000689690, 0.0000272307, 0.0000000000),
-        (770, 0.0000645258, 0.0000254860, 0.0000000000),
-        (771, 0.0000603760, 0.0000238561, 0.0000000000),
-        (772, 0.0000565000, 0.0000223332, 0.0000000000),
-        (773, 0.0000528800, 0.0000209104, 0.0000000000),
-        (774, 0.0000494980, 0.0000195808, 0.0000000000),
-        (775, 0.0000463390, 0.0000183384, 0.0000000000),
-        (776, 0.0000433890, 0.0000171777, 0.0000000000),
-        (777, 0.0000406340, 0.0000160934, 0.0000000000),
-        (778, 0.0000380600, 0.0000150800, 0.0000000000),
-        (779, 0.0000356570, 0.0000141336, 0.0000000000),
-        (780, 0.0000334117, 0.0000132490, 0.0000000000),
-        (781, 0.0000313150, 0.0000124226, 0.0000000000),
-        (782, 0.0000293550, 0.0000116499, 0.0000000000),
-        (783, 0.0000275240, 0.0000109277, 0.0000000000),
-        (784, 0.0000258110, 0.0000102519, 0.0000000000),
-        (785, 0.0000242090, 0.0000096196, 0.0000000000),
-        (786, 0.0000227110, 0.0000090281, 0.0000000000),
-        (787, 0.0000213080, 0.0000084740, 0.0000000000),
-        (788, 0.0000199940, 0.0000079548, 0.0000000000),
-        (789, 0.0000187640, 0.0000074686, 0.0000000000),
-        (790, 0.0000176115, 0.0000070128, 0.0000000000),
-        (791, 0.0000165320, 0.0000065858, 0.0000000000),
-        (792, 0.0000155210, 0.0000061857, 0.0000000000),
-        (793, 0.0000145740, 0.0000058107, 0.0000000000),
-        (794, 0.0000136860, 0.0000054590, 0.0000000000),
-        (795, 0.0000128550, 0.0000051298, 0.0000000000),
-        (796, 0.0000120750, 0.0000048206, 0.0000000000),
-        (797, 0.0000113450, 0.0000045312, 0.0000000000),
-        (798, 0.0000106590, 0.0000042591, 0.0000000000),
-        (799, 0.0000100170, 0.0000040042, 0.0000000000),
-        (800, 0.00000941363, 0.00000376473, 0.00000000000),
-        (801, 0.00000884790, 0.00000353995, 0.00000000000),
-        (802, 0.00000831710, 0.00000332914, 0.00000000000),
-        (803, 0.00000781900, 0.00000313115, 0.00000000000),
-        (804, 0.00000735160, 0.00000294529, 0.00000000000),
-        (805, 0.00000691300, 0.00000277081, 0.00000000000),
-        (806, 0.00000650150, 0.00000260705, 0.00000000000),
-        (807, 0.00000611530, 0.00000245329, 0.00000000000),
-        (808, 0.00000575290, 0.00000230894, 0.00000000000),
-        (809, 0.00000541270, 0.00000217338, 0.00000000000),
-        (810, 0.00000509347, 0.00000204613, 0.00000000000),
-        (811, 0.00000479380, 0.00000192662, 0.00000000000),
-        (812, 0.00000451250, 0.00000181440, 0.00000000000),
-        (813, 0.00000424830, 0.00000170895, 0.00000000000),
-        (814, 0.00000400020, 0.00000160988, 0.00000000000),
-        (815, 0.00000376710, 0.00000151677, 0.00000000000),
-        (816, 0.00000354800, 0.00000142921, 0.00000000000),
-        (817, 0.00000334210, 0.00000134686, 0.00000000000),
-        (818, 0.00000314850, 0.00000126945, 0.00000000000),
-        (819, 0.00000296650, 0.00000119662, 0.00000000000),
-        (820, 0.00000279531, 0.00000112809, 0.00000000000),
-        (821, 0.00000263450, 0.00000106368, 0.00000000000),
-        (822, 0.00000248340, 0.00000100313, 0.00000000000),
-        (823, 0.00000234140, 0.00000094622, 0.00000000000),
-        (824, 0.00000220780, 0.00000089263, 0.00000000000),
-        (825, 0.00000208200, 0.00000084216, 0.00000000000),
-        (826, 0.00000196360, 0.00000079464, 0.00000000000),
-        (827, 0.00000185190, 0.00000074978, 0.00000000000),
-        (828, 0.00000174650, 0.00000070744, 0.00000000000),
-        (829, 0.00000164710, 0.00000066748, 0.00000000000),
-        (830, 0.00000155314, 0.00000062970, 0.00000000000),
-    ], dtype=[('wavelength', 'f'), ('X', 'f'), ('Y', 'f'), ('Z', 'f')]),
-}
+from pyspectrum import tables
 
-ILLUMINANT_INTENSITY = {
-    'D65': np.array([
-        (360, 46.6383),
-        (361, 47.1834),
-        (362, 47.7285),
-        (363, 48.2735),
-        (364, 48.8186),
-        (365, 49.3637),
-        (366, 49.9088),
-        (367, 50.4539),
-        (368, 50.9989),
-        (369, 51.544),
-        (370, 52.0891),
-        (371, 51.8777),
-        (372, 51.6664),
-        (373, 51.455),
-        (374, 51.2437),
-        (375, 51.0323),
-        (376, 50.8209),
-        (377, 50.6096),
-        (378, 50.3982),
-        (379, 50.1869),
-        (380, 49.9755),
-        (381, 50.4428),
-        (382, 50.91),
-        (383, 51.3773),
-        (384, 51.8446),
-        (385, 52.3118),
-        (386, 52.7791),
-        (387, 53.2464),
-        (388, 53.7137),
-        (389, 54.1809),
-        (390, 54.6482),
-        (391, 57.4589),
-        (392, 60.2695),
-        (393, 63.0802),
-        (394, 65.8909),
-        (395, 68.7015),
-        (396, 71.5122),
-        (397, 74.3229),
-        (398, 77.1336),
-        (399, 79.9442),
-        (400, 82.7549),
-        (401, 83.628),
-        (402, 84.5011),
-        (403, 85.3742),
-        (404, 86.2473),
-        (405, 87.1204),
-        (406, 87.9936),
-        (407, 88.8667),
-        (408, 89.7398),
-        (409, 90.6129),
-        (410, 91.486),
-        (411, 91.6806),
-        (412, 91.8752),
-        (413, 92.0697),
-        (414, 92.2643),
-        (415, 92.4589),
-        (416, 92.6535),
-        (417, 92.8481),
-        (418, 93.0426),
-        (419, 93.2372),
-        (420, 93.4318),
-        (421, 92.7568),
-        (422, 92.0819),
-        (423, 91.4069),
-        (424, 90.732),
-        (425, 90.057),
-        (426, 89.3821),
-        (427, 88.7071),
-        (428, 88.0322),
-        (429, 87.3572),
-        (430, 86.6823),
-        (431, 88.5006),
-        (432, 90.3188),
-        (433, 92.1371),
-        (434, 93.9554),
-        (435, 95.7736),
-        (436, 97.5919),
-        (437, 99.4102),
-        (438, 101.228),
-        (439, 103.047),
-        (440, 104.865),
-        (441, 106.079),
-        (442, 107.294),
-        (443, 108.508),
-        (444, 109.722),
-        (445, 110.936),
-        (446, 112.151),
-        (447, 113.365),
-        (448, 114.579),
-        (449, 115.794),
-        (450, 117.008),
-        (451, 117.088),
-        (452, 117.169),
-        (453, 117.249),
-        (454, 117.33),
-        (455, 117.41),
-        (456, 117.49),
-        (457, 117.571),
-        (458, 117.651),
-        (459, 117.732),
-        (460, 117.812),
-        (461, 117.517),
-        (462, 117.222),
-        (463, 116.927),
-        (464, 116.632),
-        (465, 116.336),
-        (466, 116.041),
-        (467, 115.746),
-        (468, 115.451),
-        (469, 115.156),
-        (470, 114.861),
-        (471, 114.967),
-        (472, 115.073),
-        (473, 115.18),
-        (474, 115.286),
-        (475, 115.392),
-        (476, 115.498),
-        (477, 115.604),
-        (478, 115.711),
-        (479, 115.817),
-        (480, 115.923),
-        (481, 115.212),
-        (482, 114.501),
-        (483, 113.789),
-        (484, 113.078),
-        (485, 112.367),
-        (486, 111.656),
-        (487, 110.945),
-        (488, 110.233),
-        (489, 109.522),
-        (490, 108.811),
-        (491, 108.865),
-        (492, 108.92),
-        (493, 108.974),
-        (494, 109.028),
-        (495, 109.082),
-        (496, 109.137),
-        (497, 109.191),
-        (498, 109.245),
-        (499, 109.3),
-        (500, 109.354),
-        (501, 109.199),
-        (502, 109.044),
-        (503, 108.888),
-        (504, 108.733),
-        (505, 108.578),
-        (506, 108.423),
-        (507, 108.268),
-        (508, 108.112),
-        (509, 107.957),
-        (510, 107.802),
-        (511, 107.501),
-        (512, 107.2),
-        (513, 106.898),
-        (514, 106.597),
-        (515, 106.296),
-        (516, 105.995),
-        (517, 105.694),
-        (518, 105.392),
-        (519, 105.091),
-        (520, 104.79),
-        (521, 105.08),
-        (522, 105.37),
-        (523, 105.66),
-        (524, 105.95),
-        (525, 106.239),
-        (526, 106.529),
-        (527, 106.819),
-        (528, 107.109),
-        (529, 107.399),
-        (530, 107.689),
-        (531, 107.361),
-        (532, 107.032),
-        (533, 106.704),
-        (534, 106.375),
-        (535, 106.047),
-        (536, 105.719),
-        (537, 105.39),
-        (538, 105.062),
-        (539, 104.733),
-        (540, 104.405),
-        (541, 104.369),
-        (542, 104.333),
-        (543, 104.297),
-        (544, 104.261),
-        (545, 104.225),
-        (546, 104.19),
-        (547, 104.154),
-        (548, 104.118),
-        (549, 104.082),
-        (550, 104.046),
-        (551, 103.641),
-        (552, 103.237),
-        (553, 102.832),
-        (554, 102.428),
-        (555, 102.023),
-        (556, 101.618),
-        (557, 101.214),
-        (558, 100.809),
-        (559, 100.405),
-        (560, 100),
-        (561, 99.6334),
-        (562, 99.2668),
-        (563, 98.9003),
-        (564, 98.5337),
-        (565, 98.1671),
-        (566, 97.8005),
-        (567, 97.4339),
-        (568, 97.0674),
-        (569, 96.7008),
-        (570, 96.3342),
-        (571, 96.2796),
-        (572, 96.225),
-        (573, 96.1703),
-        (574, 96.1157),
-        (575, 96.0611),
-        (576, 96.0065),
-        (577, 95.9519),
-        (578, 95.8972),
-        (579, 95.8426),
-        (580, 95.788),
-        (581, 95.0778),
-        (582, 94.3675),
-        (583, 93.6573),
-        (584, 92.947),
-        (585, 92.2368),
-        (586, 91.5266),
-        (587, 90.8163),
-        (588, 90.1061),
-        (589, 89.3958),
-        (590, 88.6856),
-        (591, 88.8177),
-        (592, 88.9497),
-        (593, 89.0818),
-        (594, 89.2138),
-        (595, 89.3459),
-        (596, 89.478),
-        (597, 89.61),
-        (598, 89.7421),
-        (599, 89.8741),
-        (600, 90.0062),
-        (601, 89.9655),
-        (602, 89.9248),
-        (603, 89.8841),
-        (604, 89.8434),
-        (605, 89.8026),
-        (606, 89.7619),
-        (607, 89.7212),
-        (608, 89.6805),
-        (609, 89.6398),
-        (610, 89.5991),
-        (611, 89.4091),
-        (612, 89.219),
-        (613, 89.029),
-        (614, 88.8389),
-        (615, 88.6489),
-        (616, 88.4589),
-        (617, 88.2688),
-        (618, 88.0788),
-        (619, 87.8887),
-        (620, 87.6987),
-        (621, 87.2577),
-        (622, 86.8167),
-        (623, 86.3757),
-        (624, 85.9347),
-        (625, 85.4936),
-        (626, 85.0526),
-        (627, 84.6116),
-        (628, 84.1706),
-        (629, 83.7296),
-        (630, 83.2886),
-        (631, 83.3297),
-        (632, 83.3707),
-        (633, 83.4118),
-        (634, 83.4528),
-        (635, 83.4939),
-        (636, 83.535),
-        (637, 83.576),
-        (638, 83.6171),
-        (639, 83.6581),
-        (640, 83.6992),
-        (641, 83.332),
-        (642, 82.9647),
-        (643, 82.5975),
-        (644, 82.2302),
-        (645, 81.863),
-        (646, 81.4958),
-        (647, 81.1285),
-        (648, 80.7613),
-        (649, 80.394),
-        (650, 80.0268),
-        (651, 80.0456),
-        (652, 80.0644),
-        (653, 80.0831),
-        (654, 80.1019),
-        (655, 80.1207),
-        (656, 80.1395),
-        (657, 80.1583),
-        (658, 80.177),
-        (659, 80.1958),
-        (660, 80.2146),
-        (661, 80.4209),
-        (662, 80.6272),
-        (663, 80.8336),
-        (664, 81.0399),
-        (665, 81.2462),
-        (666, 81.4525),
-        (667, 81.6588),
-        (668, 81.8652),
-        (669, 82.0715),
-        (670, 82.2778),
-        (671, 81.8784),
-        (672, 81.4791),
-        (673, 81.0797),
-        (674, 80.6804),
-        (675, 80.281),
-        (676, 79.8816),
-        (677, 79.4823),
-        (678, 79.0829),
-        (679, 78.6836),
-        (680, 78.2842),
-        (681, 77.4279),
-        (682, 76.5716),
-        (683, 75.7153),
-        (684, 74.859),
-        (685, 74.0027),
-        (686, 73.1465),
-        (687, 72.2902),
-        (688, 71.4339),
-        (689, 70.5776),
-        (690, 69.7213),
-        (691, 69.9101),
-        (692, 70.0989),
-        (693, 70.2876),
-        (694, 70.4764),
-        (695, 70.6652),
-        (696, 70.854),
-        (697, 71.0428),
-        (698, 71.2315),
-        (699, 71.4203),
-        (700, 71.6091),
-        (701, 71.8831),
-        (702, 72.1571),
-        (703, 72.4311),
-        (704, 72.7051),
-        (705, 72.979),
-        (706, 73.253),
-        (707, 73.527),
-        (708, 73.801),
-        (709, 74.075),
-        (710, 74.349),
-        (711, 73.0745),
-        (712, 71.8),
-        (713, 70.5255),
-        (714, 69.251),
-        (715, 67.9765),
-        (716, 66.702),
-        (717, 65.4275),
-        (718, 64.153),
-        (719, 62.8785),
-        (720, 61.604),
-        (721, 62.4322),
-        (722, 63.2603),
-        (723, 64.0885),
-        (724, 64.9166),
-        (725, 65.7448),
-        (726, 66.573),
-        (727, 67.4011),
-        (728, 68.2293),
-        (729, 69.0574),
-        (730, 69.8856),
-        (731, 70.4057),
-        (732, 70.9259),
-        (733, 71.446),
-        (734, 71.9662),
-        (735, 72.4863),
-        (736, 73.0064),
-        (737, 73.5266),
-        (738, 74.0467),
-        (739, 74.5669),
-        (740, 75.087),
-        (741, 73.9376),
-        (742, 72.7881),
-        (743, 71.6387),
-        (744, 70.4893),
-        (745, 69.3398),
-        (746, 68.1904),
-        (747, 67.041),
-        (748, 65.8916),
-        (749, 64.7421),
-        (750, 63.5927),
-        (751, 61.8752),
-        (752, 60.1578),
-        (753, 58.4403),
-        (754, 56.7229),
-        (755, 55.0054),
-        (756, 53.288),
-        (757, 51.5705),
-        (758, 49.8531),
-        (759, 48.1356),
-        (760, 46.4182),
-        (761, 48.4569),
-        (762, 50.4956),
-        (763, 52.5344),
-        (764, 54.5731),
-        (765, 56.6118),
-        (766, 58.6505),
-        (767, 60.6892),
-        (768, 62.728),
-        (769, 64.7667),
-        (770, 66.8054),
-        (771, 66.4631),
-        (772, 66.1209),
-        (773, 65.7786),
-        (774, 65.4364),
-        (775, 65.0941),
-        (776, 64.7518),
-        (777, 64.4096),
-        (778, 64.0673),
-        (779, 63.7251),
-        (780, 63.3828),
-        (781, 63.4749),
-        (782, 63.567),
-        (783, 63.6592),
-        (784, 63.7513),
-        (785, 63.8434),
-        (786, 63.9355),
-        (787, 64.0276),
-        (788, 64.1198),
-        (789, 64.2119),
-        (790, 64.304),
-        (791, 63.8188),
-        (792, 63.3336),
-        (793, 62.8484),
-        (794, 62.3632),
-        (795, 61.8779),
-        (796, 61.3927),
-        (797, 60.9075),
-        (798, 60.4223),
-        (799, 59.9371),
-        (800, 59.4519),
-        (801, 58.7026),
-        (802, 57.9533),
-        (803, 57.204),
-        (804, 56.4547),
-        (805, 55.7054),
-        (806, 54.9562),
-        (807, 54.2069),
-        (808, 53.4576),
-        (809, 52.7083),
-        (810, 51.959),
-        (811, 52.5072),
-        (812, 53.0553),
-        (813, 53.6035),
-        (814, 54.1516),
-        (815, 54.6998),
-        (816, 55.248),
-        (817, 55.7961),
-        (818, 56.3443),
-        (819, 56.8924),
-        (820, 57.4406),
-        (821, 57.7278),
-        (822, 58.015),
-        (823, 58.3022),
-        (824, 58.5894),
-        (825, 58.8765),
-        (826, 59.1637),
-        (827, 59.4509),
-        (828, 59.7381),
-        (829, 60.0253),
-        (830, 60.3125),
-    ], dtype=[('wavelength', 'f'), ('intensity', 'f')]),
-    'E': np.array([(wl, 100) for wl in range(360, 831)], dtype=[('wavelength', 'f'), ('intensity', 'f')]),
-}
+OBSERVER_SENSITIVITY = {observer: tables.observer(observer) for observer in tables.OBSERVERS}
+
+ILLUMINANT_INTENSITY = {illuminant: tables.illuminant(illuminant) for illuminant in tables.ILLUMINANTS}
 
 def calculate_white_point(illuminant, observer):
     illuminant_data = ILLUMINANT_INTENSITY[illuminant]
@@ -1467,7 +47,7 @@ RGB_WHITE_POINT = {
 RGB_GAMMA = {
     'Adobe RGB': lambda x: x ** (1/2.2),
     'CIE RGB': lambda x: x ** (1/2.2),
-    'sRGB': lambda x: 12.92 * x if x <= 0.0031308 else 1.055 * x ** (1/2.4) - 0.055,
+    'sRGB': lambda x: np.where(x <= 0.0031308, 12.92 * x, 1.055 * x ** (1/2.4) - 0.055),
 }
 
 CHROMATIC_ADAPTATION_MATRIX = {
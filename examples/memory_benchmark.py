@@ -0,0 +1,82 @@
+"""
+Сравнение памяти, занимаемой множеством коротких спектров в разных представлениях.
+
+- прежнее представление: `@dataclass` с `__dict__` и общим массивом длин волн;
+- то же, но у каждого спектра своя копия длин волн, как при копировании спектров;
+- `Spectrum` с `__slots__` и общим массивом длин волн;
+- `SpectrumSeries`: один двумерный массив на все измерения.
+
+Накладные расходы `Spectrum` в основном состоят из заголовков его массивов numpy, поэтому
+`__slots__` уменьшает их лишь на размер словаря атрибутов; существенная экономия достигается
+общим массивом длин волн и хранением ряда в `SpectrumSeries`.
+
+Запуск: `python memory_benchmark.py [количество спектров] [количество отсчетов]`
+"""
+import sys
+import tracemalloc
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+
+from pyspectrum import Spectrum, SpectrumSeries
+
+
+@dataclass()
+class LegacySpectrum:
+    intensity: NDArray[float]
+    clipped: NDArray[bool]
+    exposure: int
+    wavelength: NDArray[float]
+    number: NDArray[float] | None = None
+
+
+def measure(name: str, build, payload: int) -> None:
+    tracemalloc.start()
+    objects = build()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f'{name:<28} {current / 2**20:9.1f} MiB  пик {peak / 2**20:9.1f} MiB  '
+          f'накладные расходы {(current - payload) / len(objects):7.0f} байт/спектр')
+    del objects
+
+
+def main():
+    n_spectra = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    n_numbers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    wavelength = np.linspace(400, 700, n_numbers)
+    rows = np.random.default_rng(0).random((n_spectra, n_numbers))
+    # собственно данные: интенсивности и флаги
+    payload = n_spectra * n_numbers * (8 + 1)
+
+    print(f'{n_spectra} спектров по {n_numbers} отсчетов, данные {payload / 2**20:.1f} MiB')
+
+    # влияние __slots__ и копирования длин волн измеряется по отдельности
+    measure('dataclass с __dict__', lambda: [
+        LegacySpectrum(rows[i:i + 1].copy(), np.zeros((1, n_numbers), dtype=bool), 10, wavelength)
+        for i in range(n_spectra)
+    ], payload)
+
+    measure('dataclass + копия длин волн', lambda: [
+        LegacySpectrum(rows[i:i + 1].copy(), np.zeros((1, n_numbers), dtype=bool), 10, wavelength.copy())
+        for i in range(n_spectra)
+    ], payload)
+
+    measure('Spectrum (__slots__)', lambda: [
+        Spectrum(rows[i:i + 1].copy(), np.zeros((1, n_numbers), dtype=bool), 10, wavelength)
+        for i in range(n_spectra)
+    ], payload)
+
+    def series():
+        result = SpectrumSeries(wavelength=wavelength, capacity=n_spectra)
+        frame = Spectrum(rows[:1].copy(), np.zeros((1, n_numbers), dtype=bool), 10, wavelength)
+        for i in range(n_spectra):
+            frame.intensity[0] = rows[i]
+            result.append(frame, timestamp=i * 0.01)
+        return result
+
+    measure('SpectrumSeries', series, payload)
+
+
+if __name__ == '__main__':
+    main()
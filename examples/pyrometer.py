@@ -1,24 +1,21 @@
 # This file contains Pyrometer class for pyrometer notebook
 from numpy.typing import NDArray
-from math import log
 import numpy as np
 from IPython.display import display
 import matplotlib.pyplot as plt
-import scipy.stats
-from typing import TypeAlias
+from typing import Callable, Optional, TypeAlias
 
 Nanometers: TypeAlias = float
 Kelvin: TypeAlias = float
 
-from pyspectrum import Spectrum
+from pyspectrum import Pyrometry, PyrometryMeter, PyrometryResult, Spectrometer, Spectrum
+from pyspectrum.pyrometry import C2 as c2
 
-c2 = 14_388 * 1000
-
-# TODO: calculate error
 class Pyrometer:
     def __init__(self, calibration_spectrum: Spectrum, calibration_temp: Kelvin) -> None:
         self.temp = calibration_temp
         self.calibration = calibration_spectrum
+        self.pyrometry = None
         # run results
         self.temperatures = None
         self.deltas = None
@@ -30,66 +27,36 @@ class Pyrometer:
         self.line_m = None
         self.line_c = None
 
-    def _convert_to_wien(self, y: NDArray, x: NDArray):
-        ry = np.zeros(y.shape, y.dtype)
-        rx = np.zeros(x.shape, x.dtype)
-        for i in range(y.shape[0]):
-            rx[i] = c2/x[i]
-            ry[i] = log((x[i]**4) * y[i])
-        return ry[::-1], rx[::-1]
-    
-    def _get_e(self, wl, intensity, t):
-        ys, xs = self._convert_to_wien(intensity, wl)
-        return np.vectorize(lambda x,y: -x/t - y)(xs, ys)
-    
-    def _get_temp(self, wl, intensity, xmin, xmax):
-        es = self._get_e(self.calibration.wavelength, self.calibration.intensity[-1], self.temp)
-
-        intensity[intensity <=0] = 0.1 # without this log freaks out on noisy negative values
-        ry, rx = self._convert_to_wien(intensity, wl)
-        ry = ry + es
+    def _pyrometry(self, wavelength_range: tuple[Nanometers, Nanometers]) -> Pyrometry:
+        # поправка по калибровке и параметры аппроксимации считаются один раз для диапазона
+        if self.pyrometry is None or self.pyrometry.wavelength_range != wavelength_range:
+            self.pyrometry = Pyrometry(self.calibration, self.temp, wavelength_range)
+        return self.pyrometry
 
-        self.wien_y = ry
-        self.wien_x = rx
-
-
-        converted = np.stack([rx, ry], axis=0).T
-        imin = (np.abs(converted.T[0] - xmin)).argmin()
-        imax = (np.abs(converted.T[0] - xmax)).argmin()
-        cropped = converted[imin:imax]
-
-        A = np.vstack([cropped.T[0], np.ones(cropped.shape[0])]).T
-        m, c = np.linalg.lstsq(A, cropped.T[1], rcond=None)[0]
-        self.line_c = c
-        self.line_m = m
-        
-        temperature = -1/m
-
-        # error calculation
-        xs = cropped.T[0]
-        ys = cropped.T[1]
-
-        ei2 = (ys - (xs*m + c))**2
-        s2 = (1/(len(intensity)-2))*ei2.sum()
-        Db = s2/( (xs - xs.mean())**2 ).sum()
-        # display(Db)
-
-        deltaM = scipy.stats.t.interval(0.95, df=len(intensity)-2)[1]*(Db**0.5)
-
-        deltaT = deltaM/(m**2)
-
-        return np.array([temperature, deltaT])
-    
     def run(self, spectrum: Spectrum, wavelength_range: tuple[Nanometers, Nanometers]) -> None:
         self.input_data = spectrum
-        xmax = c2/wavelength_range[0]
-        xmin = c2/wavelength_range[1]
-        self.xmax = xmax
-        self.xmin = xmin
-        self.temperatures, self.deltas = np.apply_along_axis(lambda a: self._get_temp(spectrum.wavelength, a, xmin, xmax), 1, spectrum.intensity).T
+        self.xmax = c2/wavelength_range[0]
+        self.xmin = c2/wavelength_range[1]
+
+        # все измерения одним вызовом
+        pyrometry = self._pyrometry(wavelength_range)
+        result = pyrometry(spectrum)
+        self.temperatures, self.deltas = result.temperature, result.deviation
 
         # fill result fields with data from last measurement
-        self._get_temp(spectrum.wavelength, spectrum.intensity[-1], xmin, xmax)
+        self.wien_x, self.wien_y = pyrometry.wien(spectrum.intensity[-1])
+        self.line_m, self.line_c = result.slope[-1], result.intercept[-1]
+
+    def stream(self,
+               spectrometer: Spectrometer,
+               wavelength_range: tuple[Nanometers, Nanometers],
+               on_result: Optional[Callable[[PyrometryResult], None]] = None,
+               frames_interval: int = 10) -> PyrometryMeter:
+        """Непрерывно оценивает температуру и вызывает on_result после каждого чтения (frames_interval * exposure мс).
+        Остановка - spectrometer.stop_reading()"""
+        meter = PyrometryMeter(self._pyrometry(wavelength_range), frames=frames_interval, on_result=on_result)
+        spectrometer.read_non_stop(meter, frames_interval=frames_interval)
+        return meter
 
     def show(self, filename: None|str =None):
         fig, ((ax1, ax5), (ax2, ax3), (ax4, ax6)) = plt.subplots(3, 2, figsize=(8*2, 6*3))
@@ -140,11 +107,11 @@ class Pyrometer:
         if filename is not None:
             fig.savefig(filename)
 
-    def get_temperature(self) -> NDArray[np.float_]:
+    def get_temperature(self) -> NDArray[np.float64]:
         """Get temperature in Kelvin"""
         return self.temperatures
     
-    def get_deviation(self) -> NDArray[np.float_]:
+    def get_deviation(self) -> NDArray[np.float64]:
         """Get temperature deviation in Kelvin"""
         return self.deltas
 
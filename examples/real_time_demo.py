@@ -107,7 +107,7 @@ def update_spectrum_plot(spectrum):
        return
 
     wavelengths = spectrum.wavelength
-    intensities = np.mean(spectrum.intensity, axis=0)
+    intensities = spectrum.mean(axis=0)
 
     spectrum_line.set_data(wavelengths,intensities)
 
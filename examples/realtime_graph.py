@@ -53,6 +53,6 @@ while running:
 
     ax.clear()
     axs[1].clear()
-    ax.plot(wl, np.mean(data.intensity, axis=0))
+    ax.plot(wl, data.mean(axis=0))
     axs[1].plot(wl, np.max(data.clipped, axis=0))
     plt.pause(0.05)
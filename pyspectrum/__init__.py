@@ -1,7 +1,16 @@
 from .errors import *
-from .data import Data, Spectrum
+from .data import Data, Spectrum, SpectrumSeries, FrameHeader
 from .spectrometer import Spectrometer, FactoryConfig
 from .usb_device import UsbDevice
+from .shared_ring import SpectrumPublisher, SpectrumSubscriber
+from .analysis_pool import AnalysisPool
+from .recording import Recorder, RecordingReader
+from .replay import Replay
+from .resample import Resampler
+from .colorimetry import Colorimetry
+from .led import LedAnalysis, LedMetrics, ColorRendering, PlanckianLocus
+from .flicker import FlickerAnalysis, FlickerMeter, FlickerMetrics
+from .pyrometry import Pyrometry, PyrometryMeter, PyrometryResult
 
 import platform
 if platform.system() != "Linux":
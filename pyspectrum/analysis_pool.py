@@ -0,0 +1,128 @@
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Optional
+
+from .data import Data
+from .errors import OverrunError
+from .shared_ring import SpectrumPublisher, SpectrumSubscriber
+
+# Подписчики, открытые в процессе-обработчике, по имени кольцевого буфера
+_subscribers: dict[str, SpectrumSubscriber] = {}
+
+
+def _run_analysis(name: str, seq: int, function: Callable[[Data], Any]) -> Any:
+    subscriber = _subscribers.get(name)
+    if subscriber is None:
+        subscriber = _subscribers[name] = SpectrumSubscriber(name)
+
+    result = function(subscriber.get(seq))
+    if not subscriber.is_valid(seq):
+        raise OverrunError(1)
+    return result
+
+
+class AnalysisPool:
+    """
+    Обрабатывает спектры в пуле процессов (`ProcessPoolExecutor`).
+
+    Спектры передаются обработчикам через кольцевой буфер в разделяемой памяти (`SpectrumPublisher`),
+    сериализуется только номер кадра. Результаты передаются в `on_result` в порядке поступления спектров.
+    Количество одновременно обрабатываемых спектров ограничено `max_in_flight`: при его достижении
+    `submit` ждет завершения самой старой задачи.
+
+    Объект можно передавать как callback в `Spectrometer.read_non_block` и `Spectrometer.read_non_stop`:
+    ```python
+    with AnalysisPool(fit_temperature, on_result=print, workers=4) as pool:
+        spectrometer.read_non_block(pool, frames_to_read=10_000, frames_interval=100)
+    ```
+
+    `function` выполняется в другом процессе, поэтому должна быть объявлена на уровне модуля.
+    Полученный ею спектр ссылается на разделяемую память и действителен только до возврата из функции.
+    """
+
+    def __init__(self,
+                 function: Callable[[Data], Any],
+                 on_result: Optional[Callable[[Any], None]] = None,
+                 workers: Optional[int] = None,
+                 max_in_flight: Optional[int] = None,
+                 mp_context=None):
+        """
+        :param function: Функция обработки спектра, выполняемая в процессе-обработчике.
+        :param on_result: Функция, получающая результаты обработки в порядке поступления спектров.
+        :param workers: Количество процессов. По умолчанию - количество процессоров.
+        :type workers: int | None
+        :param max_in_flight: Максимальное количество спектров в обработке. По умолчанию - `2 * workers`.
+        :type max_in_flight: int | None
+        :param mp_context: Контекст `multiprocessing` для создания процессов.
+        """
+        self._function = function
+        self._on_result = on_result
+        workers = workers or os.cpu_count() or 1
+        self._executor = ProcessPoolExecutor(max_workers=workers, mp_context=mp_context)
+        self._max_in_flight = max_in_flight or 2 * workers
+        self._publisher: Optional[SpectrumPublisher] = None
+        self._futures: deque[Future] = deque()
+
+    @property
+    def in_flight(self) -> int:
+        """Количество спектров, результаты обработки которых еще не переданы в `on_result`."""
+        return len(self._futures)
+
+    def submit(self, data: Data) -> None:
+        """
+        Отправляет спектр на обработку.
+
+        Первый спектр определяет размер слотов кольцевого буфера: последующие спектры
+        должны иметь то же количество отсчетов и не больше измерений.
+
+        :param data: Спектр для обработки
+        :type data: Data
+        """
+        if self._publisher is None:
+            self._publisher = SpectrumPublisher(
+                n_numbers=data.n_numbers,
+                max_times=data.n_times,
+                # слот переиспользуется только после получения результата его задачи
+                capacity=self._max_in_flight,
+                wavelength=getattr(data, 'wavelength', None),
+            )
+
+        self._collect(block=False)
+        while len(self._futures) >= self._max_in_flight:
+            self._deliver(self._futures.popleft())
+
+        seq = self._publisher.publish(data)
+        self._futures.append(self._executor.submit(_run_analysis, self._publisher.name, seq, self._function))
+
+    def __call__(self, data: Data) -> None:
+        self.submit(data)
+
+    def _deliver(self, future: Future) -> None:
+        result = future.result()
+        if self._on_result is not None:
+            self._on_result(result)
+
+    def _collect(self, block: bool) -> None:
+        while self._futures and (block or self._futures[0].done()):
+            self._deliver(self._futures.popleft())
+
+    def flush(self) -> None:
+        """Ожидает завершения обработки всех отправленных спектров и передает результаты в `on_result`."""
+        self._collect(block=True)
+
+    def close(self) -> None:
+        """Дожидается результатов, останавливает процессы и удаляет кольцевой буфер."""
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown()
+            if self._publisher is not None:
+                self._publisher.close()
+                self._publisher = None
+
+    def __enter__(self) -> 'AnalysisPool':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
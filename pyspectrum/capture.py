@@ -0,0 +1,148 @@
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .data import Data, Spectrum
+
+Predicate = Callable[[Data], bool | NDArray[bool]]
+
+
+class EventCapture:
+    """
+    Захват событий с предысторией.
+
+    До срабатывания триггера последние `pre_frames` измерений хранятся в заранее выделенном
+    кольцевом буфере, поэтому поступающие кадры не требуют выделения памяти. После срабатывания
+    триггера накапливается еще `post_frames` измерений, и `push` возвращает все измерения
+    события одним объектом: первые `trigger_index` строк - предыстория, остальные - кадр
+    триггера и последующие измерения.
+
+    Триггер срабатывает программно (`trigger`) или когда `predicate` для очередного кадра
+    возвращает `True`. Предикат может вернуть одномерный массив флагов по измерениям кадра,
+    тогда событие начинается с первого отмеченного измерения.
+    """
+
+    def __init__(self, n_numbers: int, pre_frames: int, post_frames: int, predicate: Optional[Predicate] = None):
+        """
+        :param int n_numbers: Количество отсчетов в одном измерении.
+        :param int pre_frames: Количество измерений, сохраняемых до триггера.
+        :param int post_frames: Количество измерений, сохраняемых начиная с триггера.
+        :param predicate: Условие срабатывания триггера для поступающего кадра.
+        """
+        if pre_frames < 0 or post_frames < 1:
+            raise ValueError('pre_frames must be non-negative and post_frames must be positive')
+
+        self.pre_frames = pre_frames
+        self.post_frames = post_frames
+        self.predicate = predicate
+
+        self._intensity = np.empty((pre_frames + post_frames, n_numbers), dtype=np.float64)
+        self._clipped = np.empty((pre_frames + post_frames, n_numbers), dtype=bool)
+        # до триггера первые pre_frames строк - кольцевой буфер, после - строки события подряд
+        self._position = 0
+        self._filled = 0
+        self._post = 0
+        self._triggered = False
+        self._software_trigger = threading.Event()
+
+    @property
+    def triggered(self) -> bool:
+        """Сработал ли триггер."""
+        return self._triggered
+
+    @property
+    def trigger_index(self) -> int:
+        """Номер строки события, с которой начинается кадр триггера."""
+        return self._filled
+
+    def trigger(self) -> None:
+        """Программный триггер: событие начнется с первого измерения следующего кадра. Потокобезопасен."""
+        self._software_trigger.set()
+
+    def reset(self) -> None:
+        """Сбрасывает буфер и взводит триггер заново."""
+        self._position = 0
+        self._filled = 0
+        self._post = 0
+        self._triggered = False
+        self._software_trigger.clear()
+
+    def _push_history(self, intensity: NDArray, clipped: NDArray) -> None:
+        size = self.pre_frames
+        n = intensity.shape[0]
+        if size == 0 or n == 0:
+            return
+        if n >= size:
+            self._intensity[:size] = intensity[n - size:]
+            self._clipped[:size] = clipped[n - size:]
+            self._position = 0
+            self._filled = size
+            return
+
+        head = min(n, size - self._position)
+        self._intensity[self._position:self._position + head] = intensity[:head]
+        self._clipped[self._position:self._position + head] = clipped[:head]
+        self._intensity[:n - head] = intensity[head:]
+        self._clipped[:n - head] = clipped[head:]
+        self._position = (self._position + n) % size
+        self._filled = min(size, self._filled + n)
+
+    def _freeze_history(self) -> None:
+        # разворачиваем кольцевой буфер: самое старое измерение в строку 0
+        if self._filled == self.pre_frames and self._position != 0:
+            self._intensity[:self.pre_frames] = np.roll(self._intensity[:self.pre_frames], -self._position, axis=0)
+            self._clipped[:self.pre_frames] = np.roll(self._clipped[:self.pre_frames], -self._position, axis=0)
+        self._position = 0
+
+    def _find_trigger(self, data: Data) -> Optional[int]:
+        if self._software_trigger.is_set():
+            return 0
+        if self.predicate is None:
+            return None
+
+        flags = self.predicate(data)
+        if isinstance(flags, np.ndarray) and flags.ndim == 1:
+            rows = np.flatnonzero(flags)
+            return int(rows[0]) if len(rows) else None
+        return 0 if flags else None
+
+    def push(self, data: Data) -> Optional[Data]:
+        """
+        Добавляет кадр.
+
+        :param data: Очередной кадр
+        :type data: Data
+        :return: Все измерения события, если оно завершено этим кадром, иначе `None`.
+        :rtype: Data | None
+        """
+        intensity, clipped = data.intensity, data.clipped
+        start = 0
+        if not self._triggered:
+            index = self._find_trigger(data)
+            if index is None:
+                self._push_history(intensity, clipped)
+                return None
+            self._push_history(intensity[:index], clipped[:index])
+            self._freeze_history()
+            self._triggered = True
+            start = index
+
+        begin = self._filled + self._post
+        n = min(intensity.shape[0] - start, self.post_frames - self._post)
+        self._intensity[begin:begin + n] = intensity[start:start + n]
+        self._clipped[begin:begin + n] = clipped[start:start + n]
+        self._post += n
+        if self._post < self.post_frames:
+            return None
+
+        end = self._filled + self._post
+        result = Data(
+            intensity=self._intensity[:end].copy(),
+            clipped=self._clipped[:end].copy(),
+            exposure=data.exposure,
+        )
+        if isinstance(data, Spectrum):
+            result = result.to_spectrum(data.wavelength)
+        return result
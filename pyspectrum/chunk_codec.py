@@ -0,0 +1,139 @@
+"""
+Сжатие блоков измерений без потерь.
+
+Интенсивности, кратные `quantum` (сырые отсчеты АЦП, спектры после вычитания темнового сигнала),
+хранятся как целые числа наименьшей подходящей разрядности. Перед сжатием к ним применяются фильтры:
+
+- `delta` - разность соседних измерений (строк), соседние измерения спектра сильно коррелированы.
+  Разность вычисляется по модулю 2^n в разрядности типа хранения (`wrap`), поэтому она не расширяет
+  тип и восстанавливается точно, в том числе для отсчетов `uint16` выше 32767;
+- `shuffle` - перестановка байт: сначала младшие байты всех значений, затем старшие.
+
+Остальные данные хранятся как `<f8` с фильтром `shuffle`. Флаги зашкаливания упаковываются
+по 8 в байт (`numpy.packbits`). Сжатие выполняется стандартными `zlib` или `lzma`.
+
+Заголовок блока (`CHUNK_HEADER`): кодек, фильтры, код типа хранения, размеры сжатых
+интенсивностей и флагов, `quantum`.
+"""
+import lzma
+import struct
+import zlib
+
+import numpy as np
+from numpy.typing import NDArray
+
+COMPRESSIONS = {None: 0, 'zlib': 1, 'lzma': 2}
+
+FILTER_DELTA = 1
+FILTER_SHUFFLE = 2
+FILTER_WRAP = 4
+
+_DTYPES = [np.dtype('<f8'), np.dtype('<u2'), np.dtype('<i2'), np.dtype('<i4')]
+
+CHUNK_HEADER = struct.Struct('<BBBxIQQd')
+
+
+def _compress(payload: bytes, codec: int, level: int | None) -> bytes:
+    if codec == 1:
+        return zlib.compress(payload, 6 if level is None else level)
+    if codec == 2:
+        return lzma.compress(payload, preset=6 if level is None else level)
+    return payload
+
+
+def _decompress(payload: bytes, codec: int) -> bytes:
+    if codec == 1:
+        return zlib.decompress(payload)
+    if codec == 2:
+        return lzma.decompress(payload)
+    return payload
+
+
+def _shuffle(values: NDArray) -> bytes:
+    return values.reshape(-1).view(np.uint8).reshape(-1, values.itemsize).T.tobytes()
+
+
+def _unshuffle(payload: bytes, dtype: np.dtype, shape: tuple[int, ...]) -> NDArray:
+    raw = np.frombuffer(payload, dtype=np.uint8).reshape(dtype.itemsize, -1)
+    return np.ascontiguousarray(raw.T).view(dtype).reshape(shape)
+
+
+def _smallest(values: NDArray, candidates: list[np.dtype]) -> np.dtype | None:
+    if not np.isfinite(values).all():
+        # бесконечности и nan хранятся только в исходном вещественном типе
+        return None
+    lo, hi = (int(values.min()), int(values.max())) if values.size else (0, 0)
+    for dtype in candidates:
+        info = np.iinfo(dtype)
+        if info.min <= lo and hi <= info.max:
+            return dtype
+    return None
+
+
+def encode(intensity: NDArray, clipped: NDArray, compression: str | None, level: int | None = None,
+           quantum: float = 1.0) -> bytes:
+    """
+    Кодирует блок измерений.
+
+    :param intensity: Интенсивности, двумерный массив
+    :param clipped: Флаги зашкаливания той же размерности
+    :param compression: `'zlib'`, `'lzma'` или `None`
+    :param level: Уровень сжатия. По умолчанию - уровень кодека по умолчанию.
+    :param float quantum: Шаг значений интенсивности, при котором они хранятся как целые числа
+    :return: Заголовок блока и сжатые данные
+    """
+    if not quantum > 0:
+        raise ValueError('quantum must be positive')
+    codec = COMPRESSIONS[compression]
+    filters = FILTER_SHUFFLE
+    dtype = _DTYPES[0]
+    values = np.asarray(intensity, dtype=np.float64)
+
+    counts = np.rint(values / quantum)
+    if np.array_equal(counts * quantum, values) and (stored := _smallest(counts, _DTYPES[1:])) is not None:
+        unsigned = counts.astype(stored).view(f'<u{stored.itemsize}')
+        # беззнаковая разность переполняется по модулю 2^n, первая строка хранится как есть
+        deltas = np.diff(unsigned, axis=0, prepend=np.zeros((1,) + unsigned.shape[1:], dtype=unsigned.dtype))
+        filters |= FILTER_DELTA | FILTER_WRAP
+        values, dtype = deltas.view(stored), stored
+
+    intensity_payload = _compress(_shuffle(values.astype(dtype, copy=False)), codec, level)
+    clipped_payload = _compress(np.packbits(np.asarray(clipped, dtype=bool)).tobytes(), codec, level)
+    header = CHUNK_HEADER.pack(codec, filters, _DTYPES.index(dtype), 0,
+                               len(intensity_payload), len(clipped_payload), quantum)
+    return header + intensity_payload + clipped_payload
+
+
+def decode(buffer, shape: tuple[int, int]) -> tuple[NDArray, NDArray]:
+    """
+    Декодирует блок измерений.
+
+    :param buffer: Блок, полученный `encode`
+    :param shape: Размерность блока (количество измерений, количество отсчетов)
+    :return: Интенсивности (`float64`) и флаги зашкаливания (`bool`)
+    """
+    buffer = memoryview(buffer)
+    codec, filters, dtype_code, _, intensity_size, clipped_size, quantum = CHUNK_HEADER.unpack_from(buffer)
+    dtype = _DTYPES[dtype_code]
+    start = CHUNK_HEADER.size
+
+    payload = _decompress(buffer[start:start + intensity_size], codec)
+    values = _unshuffle(payload, dtype, shape) if filters & FILTER_SHUFFLE \
+        else np.frombuffer(payload, dtype=dtype).reshape(shape)
+    if dtype == _DTYPES[0]:
+        intensity = values.astype(np.float64)
+    else:
+        if filters & FILTER_WRAP:
+            unsigned = np.dtype(f'<u{dtype.itemsize}')
+            counts = np.cumsum(values.view(unsigned), axis=0, dtype=unsigned).view(dtype)
+        elif filters & FILTER_DELTA:
+            # блоки прежних версий: разности в знаковом типе без переполнения
+            counts = np.cumsum(values, axis=0, dtype=np.int64)
+        else:
+            counts = values
+        intensity = np.multiply(counts, quantum, dtype=np.float64)
+
+    start += intensity_size
+    packed = np.frombuffer(_decompress(buffer[start:start + clipped_size], codec), dtype=np.uint8)
+    clipped = np.unpackbits(packed, count=shape[0] * shape[1]).astype(bool).reshape(shape)
+    return intensity, clipped
@@ -0,0 +1,394 @@
+"""
+Колориметрия: координаты цвета XYZ для всех измерений спектра.
+
+Координаты цвета - линейные функционалы спектра, поэтому для шкалы длин волн спектрометра
+строится матрица весов 3 x отсчеты (функции сложения цветов наблюдателя, умноженные
+на спектр источника и ширину отсчета), и координаты всех измерений вычисляются одним
+матричным произведением.
+
+Преобразования координат (xyY, RGB, CIELAB, CIELUV, LCh) принимают массивы (..., 3)
+и обрабатывают все измерения сразу.
+"""
+from functools import lru_cache
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import tables
+from .data import Data, _AxisIndex
+from .resample import _AxisCache
+
+
+def _frozen(array: NDArray) -> NDArray:
+    array.flags.writeable = False
+    return array
+
+
+class Colorimetry:
+    """
+    Вычисление координат цвета XYZ для заданных наблюдателя и источника.
+
+    Таблицы передаются структурированными массивами `numpy`:
+
+    - наблюдатель - поля `wavelength`, `X`, `Y`, `Z` (функции сложения цветов);
+    - источник - поля `wavelength`, `intensity` (относительное спектральное распределение).
+
+    Матрица весов для шкалы длин волн строится один раз и кэшируется.
+    Координаты нормированы так, что `Y = 1` для образца с единичным коэффициентом отражения.
+
+    Пример использования:
+    ```python
+    colorimetry = Colorimetry(observer, illuminant)
+    xyz = colorimetry.XYZ(sample, reference=white)  # (n_times, 3)
+    ```
+    """
+
+    def __init__(self, observer: Optional[NDArray] = None, illuminant: Optional[NDArray] = None, cache_size: int = 8):
+        """
+        :param observer: Функции сложения цветов наблюдателя. По умолчанию - `tables.observer('2deg')`.
+        :param illuminant: Спектр источника. По умолчанию - `tables.illuminant('D65')`.
+        :param int cache_size: Количество шкал длин волн, для которых хранятся матрицы весов
+        """
+        if observer is None:
+            observer = tables.observer()
+        if illuminant is None:
+            illuminant = tables.illuminant()
+        self.observer = observer
+        self.illuminant = illuminant
+        self._cache = _AxisCache(self.__build, cache_size)
+
+        cmf = np.stack([observer['X'], observer['Y'], observer['Z']]).astype(np.float64)
+        power = np.interp(observer['wavelength'], illuminant['wavelength'], illuminant['intensity'])
+        white = cmf @ power
+        self.white_point: NDArray[float] = _frozen(white / white[1])
+        """Координаты XYZ белой точки источника (`Y = 1`)"""
+
+    def __build(self, wavelength: NDArray[float]) -> tuple[slice, NDArray[float], NDArray[float]]:
+        wavelength = np.asarray(wavelength, dtype=np.float64)
+        illuminant = self.illuminant
+        columns = _AxisIndex(wavelength).range(float(illuminant['wavelength'][0]),
+                                               float(illuminant['wavelength'][-1]))
+        wl = wavelength[columns]
+        if len(wl) == 0:
+            raise ValueError('Wavelength axis does not overlap with the illuminant')
+
+        # ширина отсчета; последний отсчет диапазона считается нулевой ширины
+        dwl = np.abs(np.diff(wl, append=wl[-1]))
+        observer = self.observer
+        cmf = np.stack([
+            np.interp(wl, observer['wavelength'], observer[name]) for name in ('X', 'Y', 'Z')
+        ])
+        power = np.interp(wl, illuminant['wavelength'], illuminant['intensity'])
+        weights = cmf * (power * dwl)
+        weights /= weights[1].sum()
+
+        full = np.zeros((3, len(wavelength)))
+        full[:, columns] = weights
+        return columns, _frozen(np.ascontiguousarray(weights.T)), _frozen(full)
+
+    def weights(self, wavelength: NDArray[float]) -> NDArray[float]:
+        """
+        Матрица весов для шкалы длин волн: `XYZ = weights @ spectrum`.
+
+        :param wavelength: Шкала длин волн спектрометра
+        :return: Массив 3 x отсчеты только для чтения
+        """
+        return self._cache.get(wavelength)[2]
+
+    def XYZ(self,
+            data: Data | NDArray,
+            wavelength: Optional[NDArray[float]] = None,
+            reference: Data | NDArray | None = None) -> NDArray[float]:
+        """
+        Координаты цвета всех измерений.
+
+        :param data: Спектр (`Spectrum`, `Data`) или массив интенсивностей (отсчеты или измерения x отсчеты)
+        :param wavelength: Шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :param reference: Спектр белого образца. Если задан, используется коэффициент отражения
+            `data / reference`. Для `Data` берется среднее по измерениям.
+        :return: Массив (измерения, 3). Для одномерного входа - массив из 3 координат.
+        """
+        if wavelength is None:
+            wavelength = getattr(data, 'wavelength', None)
+        if wavelength is None:
+            raise ValueError('Wavelength axis is not set')
+        columns, weights, _ = self._cache.get(wavelength)
+
+        intensity = data.intensity if isinstance(data, Data) else np.asarray(data)
+        intensity = intensity[..., columns]
+        if reference is not None:
+            reference = reference.mean(axis=0) if isinstance(reference, Data) else np.asarray(reference)
+            intensity = intensity / reference[..., columns]
+        return intensity @ weights
+
+
+# Порог кусочно-заданной функции CIELAB / CIELUV
+_LAB_EPSILON = 0.008856
+_LAB_KAPPA = 903.3
+
+
+def _as_xyz(XYZ) -> NDArray[float]:
+    XYZ = np.asarray(XYZ, dtype=np.float64)
+    if XYZ.shape[-1] != 3:
+        raise ValueError('Last axis of color coordinates must have length 3')
+    return XYZ
+
+
+def _key(array) -> tuple:
+    return tuple(np.asarray(array, dtype=np.float64).ravel().tolist())
+
+
+@lru_cache(maxsize=64)
+def _rgb_matrix(primaries: tuple, white_point: tuple) -> NDArray[float]:
+    (xr, yr), (xg, yg), (xb, yb) = np.reshape(primaries, (3, 2))
+    m = np.array([
+        [xr / yr, xg / yg, xb / yb],
+        [1, 1, 1],
+        [(1 - xr - yr) / yr, (1 - xg - yg) / yg, (1 - xb - yb) / yb],
+    ])
+    m = m * np.linalg.solve(m, np.asarray(white_point))
+    return _frozen(np.linalg.inv(m))
+
+
+def rgb_matrix(primaries: NDArray, white_point: NDArray[float]) -> NDArray[float]:
+    """
+    Матрица перехода из XYZ в линейные координаты RGB. Результат кэшируется.
+
+    :param primaries: Координаты цветности x, y основных цветов R, G, B (3 x 2 или структурированный массив с полями `x`, `y`)
+    :param white_point: XYZ белой точки пространства
+    :return: Матрица 3 x 3 только для чтения
+    """
+    primaries = np.asarray(primaries)
+    if primaries.dtype.names:
+        primaries = np.stack([primaries['x'], primaries['y']], axis=-1)
+    return _rgb_matrix(_key(primaries), _key(white_point))
+
+
+@lru_cache(maxsize=64)
+def _adaptation_matrix(cone_matrix: tuple, source_white: tuple, target_white: tuple) -> NDArray[float]:
+    m = np.reshape(cone_matrix, (3, 3))
+    source = m @ np.asarray(source_white)
+    target = m @ np.asarray(target_white)
+    return _frozen(np.linalg.solve(m, (target / source)[:, None] * m))
+
+
+def adaptation_matrix(cone_matrix: NDArray[float], source_white: NDArray[float],
+                      target_white: NDArray[float]) -> NDArray[float]:
+    """
+    Матрица хроматической адаптации (преобразование фон Криса в пространстве `cone_matrix`).
+    Результат кэшируется.
+
+    :param cone_matrix: Матрица перехода в пространство колбочек (например, Bradford)
+    :param source_white: XYZ белой точки источника
+    :param target_white: XYZ белой точки целевого пространства
+    :return: Матрица 3 x 3 только для чтения
+    """
+    return _adaptation_matrix(_key(cone_matrix), _key(source_white), _key(target_white))
+
+
+def srgb_gamma(values: NDArray[float]) -> NDArray[float]:
+    """Гамма-коррекция sRGB."""
+    values = np.asarray(values, dtype=np.float64)
+    return np.where(values <= 0.0031308, 12.92 * values, 1.055 * np.power(values, 1 / 2.4) - 0.055)
+
+
+def XYZ_to_xyY(XYZ) -> NDArray[float]:
+    """
+    Координаты цветности xyY.
+
+    :param XYZ: Массив (..., 3)
+    :return: Массив (..., 3)
+    """
+    XYZ = _as_xyz(XYZ)
+    total = XYZ.sum(axis=-1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        xy = XYZ[..., :2] / total
+    return np.concatenate([xy, XYZ[..., 1:2]], axis=-1)
+
+
+def XYZ_to_RGB(XYZ, matrix: NDArray[float], gamma=None, adaptation: Optional[NDArray[float]] = None) -> NDArray[float]:
+    """
+    Координаты RGB, ограниченные диапазоном [0, 1].
+
+    :param XYZ: Массив (..., 3)
+    :param matrix: Матрица XYZ -> RGB (`rgb_matrix`)
+    :param gamma: Гамма-коррекция: функция над массивом (например, `srgb_gamma`), показатель степени
+        или ``None`` - без коррекции
+    :param adaptation: Матрица хроматической адаптации (`adaptation_matrix`)
+    :type adaptation: NDArray[float] | None
+    :return: Массив (..., 3)
+    """
+    XYZ = _as_xyz(XYZ)
+    m = matrix @ adaptation if adaptation is not None else np.asarray(matrix)
+    rgb = np.clip(XYZ @ m.T, 0, 1)
+    if gamma is None:
+        return rgb
+    if callable(gamma):
+        return gamma(rgb)
+    return np.power(rgb, gamma)
+
+
+def _lab_f(t: NDArray[float]) -> NDArray[float]:
+    return np.where(t > _LAB_EPSILON, np.cbrt(t), (_LAB_KAPPA * t + 16) / 116)
+
+
+def XYZ_to_Lab(XYZ, white_point: NDArray[float]) -> NDArray[float]:
+    """
+    Координаты CIELAB.
+
+    :param XYZ: Массив (..., 3)
+    :param white_point: XYZ белой точки
+    :return: Массив (..., 3): L, a, b
+    """
+    f = _lab_f(_as_xyz(XYZ) / np.asarray(white_point, dtype=np.float64))
+    fx, fy, fz = f[..., 0], f[..., 1], f[..., 2]
+    return np.stack([116 * fy - 16, 500 * (fx - fy), 200 * (fy - fz)], axis=-1)
+
+
+def XYZ_to_Luv(XYZ, white_point: NDArray[float]) -> NDArray[float]:
+    """
+    Координаты CIELUV.
+
+    :param XYZ: Массив (..., 3)
+    :param white_point: XYZ белой точки
+    :return: Массив (..., 3): L, u, v
+    """
+    XYZ = _as_xyz(XYZ)
+    wx, wy, wz = np.asarray(white_point, dtype=np.float64)
+    X, Y, Z = XYZ[..., 0], XYZ[..., 1], XYZ[..., 2]
+    y = Y / wy
+    L = np.where(y > _LAB_EPSILON, 116 * np.cbrt(y) - 16, _LAB_KAPPA * y)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        denominator = X + 15 * Y + 3 * Z
+        w_denominator = wx + 15 * wy + 3 * wz
+        u = 13 * L * (4 * X / denominator - 4 * wx / w_denominator)
+        v = 13 * L * (9 * Y / denominator - 9 * wy / w_denominator)
+    return np.stack([L, u, v], axis=-1)
+
+
+def to_LCh(Lab) -> NDArray[float]:
+    """
+    Цилиндрические координаты LCh для CIELAB или CIELUV.
+
+    :param Lab: Массив (..., 3): L, a, b (или L, u, v)
+    :return: Массив (..., 3): L, C, h (угол в градусах, от -180 до 180)
+    """
+    Lab = _as_xyz(Lab)
+    L, a, b = Lab[..., 0], Lab[..., 1], Lab[..., 2]
+    return np.stack([L, np.hypot(a, b), np.degrees(np.arctan2(b, a))], axis=-1)
+
+
+DELTA_E_METHODS = ('76', '94', '2000')
+
+# Количество пар (образец, эталон), обрабатываемых за один блок при вычислении цветовых различий
+_DELTA_E_BLOCK = 1 << 16
+
+
+def _delta_e76(sample: NDArray[float], reference: NDArray[float]) -> NDArray[float]:
+    return np.sqrt(np.square(sample - reference).sum(axis=-1))
+
+
+def _delta_e94(sample: NDArray[float], reference: NDArray[float]) -> NDArray[float]:
+    # CIE94 с коэффициентами для полиграфии; насыщенность берется по эталону
+    L1, a1, b1 = reference[..., 0], reference[..., 1], reference[..., 2]
+    L2, a2, b2 = sample[..., 0], sample[..., 1], sample[..., 2]
+    C1 = np.hypot(a1, b1)
+    dC = C1 - np.hypot(a2, b2)
+    dH2 = np.maximum(np.square(a1 - a2) + np.square(b1 - b2) - np.square(dC), 0)
+    SC = 1 + 0.045 * C1
+    SH = 1 + 0.015 * C1
+    return np.sqrt(np.square(L1 - L2) + np.square(dC / SC) + dH2 / np.square(SH))
+
+
+def _delta_e2000(sample: NDArray[float], reference: NDArray[float]) -> NDArray[float]:
+    L1, a1, b1 = reference[..., 0], reference[..., 1], reference[..., 2]
+    L2, a2, b2 = sample[..., 0], sample[..., 1], sample[..., 2]
+
+    C7 = np.power((np.hypot(a1, b1) + np.hypot(a2, b2)) / 2, 7)
+    G = 0.5 * (1 - np.sqrt(C7 / (C7 + 25.0 ** 7)))
+    a1, a2 = (1 + G) * a1, (1 + G) * a2
+    C1, C2 = np.hypot(a1, b1), np.hypot(a2, b2)
+    h1 = np.degrees(np.arctan2(b1, a1)) % 360
+    h2 = np.degrees(np.arctan2(b2, a2)) % 360
+    achromatic = C1 * C2 == 0
+
+    dh = h2 - h1
+    dh = np.where(dh > 180, dh - 360, np.where(dh < -180, dh + 360, dh))
+    dh = np.where(achromatic, 0, dh)
+    dL = L2 - L1
+    dC = C2 - C1
+    dH = 2 * np.sqrt(C1 * C2) * np.sin(np.radians(dh / 2))
+
+    L = (L1 + L2) / 2
+    C = (C1 + C2) / 2
+    h_sum = h1 + h2
+    h = np.where(np.abs(h1 - h2) <= 180, h_sum / 2, np.where(h_sum < 360, h_sum + 360, h_sum - 360) / 2)
+    h = np.where(achromatic, h_sum, h)
+
+    T = (1 - 0.17 * np.cos(np.radians(h - 30)) + 0.24 * np.cos(np.radians(2 * h))
+         + 0.32 * np.cos(np.radians(3 * h + 6)) - 0.20 * np.cos(np.radians(4 * h - 63)))
+    C7 = np.power(C, 7)
+    RT = -2 * np.sqrt(C7 / (C7 + 25.0 ** 7)) * np.sin(np.radians(60 * np.exp(-np.square((h - 275) / 25))))
+    SL = 1 + 0.015 * np.square(L - 50) / np.sqrt(20 + np.square(L - 50))
+    SC = 1 + 0.045 * C
+    SH = 1 + 0.015 * C * T
+
+    dL, dC, dH = dL / SL, dC / SC, dH / SH
+    return np.sqrt(np.maximum(np.square(dL) + np.square(dC) + np.square(dH) + RT * dC * dH, 0))
+
+
+_DELTA_E = {'76': _delta_e76, '94': _delta_e94, '2000': _delta_e2000}
+
+
+def _delta_e_blocks(Lab, reference, method: str):
+    """Блоки матрицы цветовых различий: (строки образцов, блок образцы x эталоны)."""
+    if method not in DELTA_E_METHODS:
+        raise ValueError(f'Unknown color difference method {method}, expected one of {DELTA_E_METHODS}')
+    function = _DELTA_E[method]
+    Lab = _as_xyz(Lab).reshape(-1, 3)
+    reference = _as_xyz(reference).reshape(-1, 3)
+    step = max(1, _DELTA_E_BLOCK // max(1, len(reference)))
+    for start in range(0, len(Lab), step):
+        rows = slice(start, start + step)
+        yield rows, function(Lab[rows, None, :], reference[None, :, :])
+
+
+def delta_E(Lab, reference, method: str = '2000') -> NDArray[float]:
+    """
+    Цветовые различия между образцами и эталонами.
+
+    Матрица вычисляется блоками, поэтому промежуточные массивы не зависят от количества образцов.
+
+    :param Lab: Координаты CIELAB образцов (..., 3) (`XYZ_to_Lab`)
+    :param reference: Координаты CIELAB эталонов (..., 3)
+    :param str method: `76` (CIE76), `94` (CIE94) или `2000` (CIEDE2000)
+    :return: Массив образцы x эталоны; для одной тройки координат соответствующая ось отсутствует
+    """
+    shape = np.shape(Lab)[:-1] + np.shape(reference)[:-1]
+    result = np.empty((int(np.prod(np.shape(Lab)[:-1])), int(np.prod(np.shape(reference)[:-1]))))
+    for rows, block in _delta_e_blocks(Lab, reference, method):
+        result[rows] = block
+    return result.reshape(shape)
+
+
+def nearest_reference(Lab, reference, method: str = '2000') -> tuple[NDArray[int], NDArray[float]]:
+    """
+    Ближайший эталон для каждого образца. Полная матрица различий не хранится.
+
+    :param Lab: Координаты CIELAB образцов (..., 3)
+    :param reference: Координаты CIELAB эталонов (M, 3)
+    :param str method: `76`, `94` или `2000`
+    :return: Номера ближайших эталонов и различия до них, формы `Lab.shape[:-1]`
+    """
+    if len(_as_xyz(reference).reshape(-1, 3)) == 0:
+        raise ValueError('Reference set is empty')
+    shape = np.shape(Lab)[:-1]
+    n = int(np.prod(shape))
+    index = np.empty(n, dtype=np.intp)
+    distance = np.empty(n)
+    for rows, block in _delta_e_blocks(Lab, reference, method):
+        index[rows] = np.argmin(block, axis=1)
+        distance[rows] = np.take_along_axis(block, index[rows, None], axis=1)[:, 0]
+    return index.reshape(shape), distance.reshape(shape)
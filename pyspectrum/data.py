@@ -1,134 +1,698 @@
 import pickle
-from dataclasses import dataclass, field
+import time
+from dataclasses import MISSING, FrozenInstanceError, dataclass, field, fields, replace
+from typing import Callable, Iterable, Optional
 
 import numpy as np
 from numpy.typing import NDArray
 
+from . import file_format
 from .errors import LoadError
 
 
-def _check_slice_key(key):
+def _normalize_index(key):
+    if isinstance(key, (int, np.integer)) and not isinstance(key, (bool, np.bool_)):
+        # целый индекс заменяется срезом, чтобы результат оставался двумерным
+        return slice(key, key + 1 or None)
     if type(key) == slice:
-        return
-    if type(key) == tuple:
-        for k in key:
-            if type(k) != slice:
-                raise Exception('Only slices are supported')
-        return
-    raise Exception('Only slices are supported')
-
-@dataclass()
+        return key
+    if isinstance(key, (list, np.ndarray)):
+        key = np.asarray(key)
+        if key.ndim == 1 and (key.dtype == bool or np.issubdtype(key.dtype, np.integer)):
+            return key
+    raise TypeError('Only integers, slices, boolean and integer arrays are supported')
+
+
+def _normalize_key(key) -> tuple:
+    """Приводит индекс к паре (измерения, отсчеты)."""
+    if type(key) != tuple:
+        key = (key,)
+    if len(key) > 2:
+        raise IndexError('Too many indices for Data')
+    key = tuple(_normalize_index(k) for k in key)
+    return key + (slice(None),) * (2 - len(key))
+
+
+class _AxisIndex:
+    """Поиск по монотонной шкале длин волн, возрастающей или убывающей."""
+
+    def __init__(self, axis: NDArray[float]):
+        self.axis = axis
+        self.reversed = len(axis) > 1 and axis[0] > axis[-1]
+        self.ascending = axis[::-1] if self.reversed else axis
+
+    def range(self, wl_min: float, wl_max: float) -> slice:
+        n = len(self.axis)
+        first = int(np.searchsorted(self.ascending, wl_min, side='left'))
+        last = int(np.searchsorted(self.ascending, wl_max, side='right'))
+        if self.reversed:
+            first, last = n - last, n - first
+        return slice(first, max(first, last))
+
+    def nearest(self, wavelengths) -> NDArray[int]:
+        values = np.asarray(wavelengths, dtype=np.float64)
+        n = len(self.ascending)
+        right = np.clip(np.searchsorted(self.ascending, values), 1, max(1, n - 1))
+        left = right - 1
+        if n > 1:
+            index = np.where(values - self.ascending[left] <= self.ascending[right] - values, left, right)
+        else:
+            index = np.zeros_like(right)
+        return n - 1 - index if self.reversed else index
+
+
+# Количество элементов в блоке при вычислении статистик: блок помещается в кэш процессора
+_STATS_BLOCK = 1 << 16
+
+
+def _as_float(block: NDArray) -> NDArray[float]:
+    return np.asarray(block, dtype=np.float64)
+
+
+def _can_write(ufunc: np.ufunc, array: NDArray, operand) -> bool:
+    """Можно ли записать результат `ufunc(array, operand)` в `array` (приведение `same_kind`)."""
+    # числа Python - "слабые" операнды: `uint16 + 1` остается `uint16`
+    operand = type(operand) if type(operand) in (int, float, complex) else np.asarray(operand).dtype
+    result = ufunc.resolve_dtypes((array.dtype, operand, None))[-1]
+    return np.can_cast(result, array.dtype, 'same_kind')
+
+
+def _moments(intensity: NDArray, axis: int | None,
+             convert: Callable[[NDArray], NDArray[float]] = _as_float) -> tuple[NDArray, NDArray, int]:
+    """
+    Сумма и сумма квадратов отклонений от среднего за один проход по данным.
+
+    Данные обрабатываются блоками строк, статистики блоков объединяются по формулам Чана,
+    что устойчивее вычисления через сумму квадратов. `convert` преобразует блок исходного
+    массива в интенсивности, так что весь массив интенсивностей не создается.
+    """
+    n_times, n_numbers = intensity.shape
+    step = max(1, _STATS_BLOCK // max(1, n_numbers))
+    if axis == 1:
+        total = np.empty(n_times, dtype=np.float64)
+        m2 = np.empty(n_times, dtype=np.float64)
+        for i in range(0, n_times, step):
+            block = convert(intensity[i:i + step])
+            total[i:i + step] = block.sum(axis=1)
+            deviation = block - (total[i:i + step] / n_numbers)[:, None]
+            m2[i:i + step] = np.einsum('ij,ij->i', deviation, deviation)
+        return total, m2, n_numbers
+
+    total = np.zeros(n_numbers, dtype=np.float64)
+    m2 = np.zeros(n_numbers, dtype=np.float64)
+    count = 0
+    for i in range(0, n_times, step):
+        block = convert(intensity[i:i + step])
+        k = len(block)
+        block_sum = block.sum(axis=0)
+        deviation = block - block_sum / k
+        block_m2 = np.einsum('ij,ij->j', deviation, deviation)
+        if count:
+            delta = block_sum / k - total / count
+            m2 += block_m2 + delta * delta * (count * k / (count + k))
+        else:
+            m2 = block_m2
+        total += block_sum
+        count += k
+    if axis is None:
+        mean = total.sum() / max(1, count * n_numbers)
+        pixel_mean = total / max(1, count)
+        return total.sum(), m2.sum() + count * np.sum((pixel_mean - mean) ** 2), count * n_numbers
+    return total, m2, count
+
+
+def _reduced(value: NDArray, axis: int | None) -> NDArray | float:
+    """Результат по всем данным (``axis=None``) возвращается числом, как у `numpy.ndarray.sum`."""
+    return float(value) if axis is None else value
+
+
+def _extrema(intensity: NDArray, axis: int,
+             convert: Callable[[NDArray], NDArray[float]] = _as_float) -> tuple[NDArray, NDArray]:
+    """Минимум и максимум блоками строк, см. `_moments`."""
+    n_times, n_numbers = intensity.shape
+    step = max(1, _STATS_BLOCK // max(1, n_numbers))
+    if axis == 1:
+        low = np.empty(n_times, dtype=np.float64)
+        high = np.empty(n_times, dtype=np.float64)
+        for i in range(0, n_times, step):
+            block = convert(intensity[i:i + step])
+            low[i:i + step] = block.min(axis=1)
+            high[i:i + step] = block.max(axis=1)
+        return low, high
+
+    low = np.full(n_numbers, np.inf)
+    high = np.full(n_numbers, -np.inf)
+    for i in range(0, n_times, step):
+        block = convert(intensity[i:i + step])
+        np.minimum(low, block.min(axis=0), out=low)
+        np.maximum(high, block.max(axis=0), out=high)
+    return low, high
+
+
+def _frozen(array: NDArray) -> NDArray:
+    array = np.asarray(array)
+    if array.ndim:
+        array.flags.writeable = False
+    return array
+
+
+@dataclass(slots=True)
 class Frame:
     samples: NDArray
     clipped: NDArray
 
-@dataclass()
+
+@dataclass(frozen=True, slots=True)
+class FrameHeader:
+    """Компактный заголовок измерения"""
+    timestamp: float
+    """Время начала измерения (`time.time()`)"""
+    exposure: int
+    """Экспозиция в миллисекундах"""
+    sequence: int
+    """Порядковый номер измерения"""
+
+
+@dataclass(frozen=True, slots=True)
+class _Raw:
+    """Необработанные отсчеты и отложенное преобразование: `intensity = (samples - offset) * scale`."""
+    samples: NDArray
+    clipped: NDArray
+    scale: float = 1.0
+    offset: NDArray[float] | None = None
+
+    def convert(self, samples: NDArray) -> NDArray[float]:
+        intensity = samples.astype(np.float64)
+        if self.offset is not None:
+            intensity -= self.offset
+        intensity *= self.scale
+        return intensity
+
+
+class _State:
+    """
+    Редко используемое состояние `Data`. Создается при первой необходимости, поэтому объекты,
+    для которых не вычислялись статистики, занимают только поля данных и одну ссылку.
+    """
+    __slots__ = ('stats', 'generation', 'raw', 'frozen', 'wavelength_index')
+
+    def __init__(self):
+        self.stats: dict | None = None
+        # счетчик изменений данных, общий для объекта и его представлений (`__getitem__`)
+        self.generation: list[int] | None = None
+        self.raw: _Raw | None = None
+        self.frozen = False
+        self.wavelength_index: _AxisIndex | None = None
+
+
+@dataclass(slots=True, init=False)
 class Data:
-    """Сырые данные, полученные со спектрометра"""
+    """
+    Сырые данные, полученные со спектрометра.
+
+    Объекты не имеют `__dict__` (`__slots__`), а кэш статистик, исходные отсчеты отложенного объекта
+    и признак неизменяемости хранятся в отдельном объекте, создаваемом по необходимости, поэтому
+    сам объект занимает несколько десятков байт. Основные накладные расходы короткого спектра -
+    заголовки его массивов numpy; множество коротких спектров компактнее хранить в `SpectrumSeries`.
+    """
     intensity: NDArray[float]
     """Двумерный массив данных измерения. Первый индекс - номер кадра, второй - номер сэмпла в кадре"""
     clipped: NDArray[bool]
     """Массив boolean значений. Если `clipped[i,j]==True`, `intensity[i,j]` содержит зашкаленное значение"""
     exposure: int
     """Экспозиция в миллисекундах"""
+    _state: _State | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __init__(self, intensity: NDArray[float], clipped: NDArray[bool], exposure: int):
+        # поля присваиваются напрямую, минуя проверки __setattr__
+        object.__setattr__(self, 'intensity', intensity)
+        object.__setattr__(self, 'clipped', clipped)
+        object.__setattr__(self, 'exposure', exposure)
+        object.__setattr__(self, '_state', None)
+
+    def __getstate__(self) -> dict:
+        state = {}
+        for f in fields(self):
+            if f.name == '_state':
+                continue
+            try:
+                state[f.name] = object.__getattribute__(self, f.name)
+            except AttributeError:
+                # еще не вычисленные поля отложенного объекта
+                pass
+        if self._raw is not None:
+            state['_raw'] = self._raw
+        if self._state is not None and self._state.frozen:
+            state['_frozen'] = True
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # объекты прежних версий сохранены без __slots__: состояние - словарь атрибутов,
+        # в том числе удаленного поля Spectrum.number, которое игнорируется
+        for f in fields(self):
+            if f.name in state and f.name != '_state':
+                object.__setattr__(self, f.name, state[f.name])
+            elif f.default is not MISSING:
+                object.__setattr__(self, f.name, f.default)
+        if state.get('_raw') is not None:
+            self._get_state().raw = state['_raw']
+        if state.get('_frozen'):
+            self.freeze()
+
+    def _get_state(self) -> _State:
+        state = self._state
+        if state is None:
+            state = _State()
+            object.__setattr__(self, '_state', state)
+        return state
+
+    @property
+    def _raw(self) -> _Raw | None:
+        """Исходные отсчеты отложенного объекта (см. `from_raw`)"""
+        state = self._state
+        return state.raw if state is not None else None
+
+    @property
+    def _frozen(self) -> bool:
+        state = self._state
+        return state is not None and state.frozen
+
+    def freeze(self) -> 'Data':
+        """
+        Запрещает изменение объекта: присваивание полей и арифметика на месте (`+=`) вызывают
+        `dataclasses.FrozenInstanceError`, массивы заменяются представлениями только для чтения
+        (исходные массивы не меняются). Изменение элементов массивов (`data.intensity += 1`)
+        выполняет numpy, поэтому оно вызывает `ValueError` (массив только для чтения).
+        Отложенный объект при этом вычисляется.
+
+        :return: Этот же объект
+        """
+        for f in fields(self):
+            if f.name == '_state':
+                continue
+            value = getattr(self, f.name)
+            if isinstance(value, np.ndarray) and value.flags.writeable:
+                value = value.view()
+                value.flags.writeable = False
+                object.__setattr__(self, f.name, value)
+        self._get_state().frozen = True
+        return self
+
+    @classmethod
+    def from_raw(cls,
+                 samples: NDArray,
+                 clipped: NDArray,
+                 exposure: int,
+                 scale: float = 1.0,
+                 offset: Optional[NDArray[float]] = None,
+                 **kwargs) -> 'Data':
+        """
+        Создает объект с отложенным преобразованием отсчетов.
+
+        `intensity = (samples - offset) * scale` и `clipped` вычисляются при первом обращении к ним.
+        До этого `mean`, `std`, `min`, `max`, `sum` и `save` работают с исходным буфером
+        (`save` записывает отсчеты в исходном типе, например `uint16`).
+
+        :param samples: Отсчеты, обычно представление кадра устройства (обрезка и разворот без копирования)
+        :param clipped: Флаги зашкаливания той же размерности
+        :param int exposure: Экспозиция в миллисекундах
+        :param float scale: Множитель интенсивности
+        :param offset: Вычитаемый темновой сигнал, в единицах `samples`
+        :type offset: NDArray[float] | None
+        :param kwargs: Остальные поля класса, например `wavelength` для `Spectrum`
+        """
+        result = object.__new__(cls)
+        for f in fields(cls):
+            if f.name in ('intensity', 'clipped'):
+                continue
+            if f.name in kwargs:
+                value = kwargs.pop(f.name)
+            elif f.name == 'exposure':
+                value = exposure
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                raise TypeError(f'from_raw() missing required argument: {f.name!r}')
+            object.__setattr__(result, f.name, value)
+        if kwargs:
+            raise TypeError(f'from_raw() got unexpected arguments: {", ".join(kwargs)}')
+        result._get_state().raw = _Raw(samples, clipped, scale, offset)
+        return result
+
+    @property
+    def is_lazy(self) -> bool:
+        """``True``, если `intensity` и `clipped` еще не вычислены из исходных отсчетов (см. `from_raw`)."""
+        return self._raw is not None
+
+    def __materialize(self) -> None:
+        raw = self._raw
+        object.__setattr__(self, 'intensity', raw.convert(raw.samples))
+        object.__setattr__(self, 'clipped', np.array(raw.clipped, dtype=bool))
+        # исходный буфер больше не нужен
+        self._state.raw = None
+
+    def __getattr__(self, name):
+        # вызывается только для отсутствующих атрибутов, то есть для еще не вычисленных полей
+        if name in ('intensity', 'clipped') and self.is_lazy:
+            self.__materialize()
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name, value):
+        state = self._state
+        if state is not None:
+            if state.frozen:
+                raise FrozenInstanceError(f'cannot assign to field {name!r}')
+            if name in ('intensity', 'clipped') and state.raw is not None:
+                # второе поле должно остаться согласованным с исходными отсчетами
+                self.__materialize()
+            if name == 'intensity':
+                # новый массив интенсивностей делает вычисленные статистики недействительными
+                state.stats = None
+        object.__setattr__(self, name, value)
+
+    def invalidate_cache(self) -> None:
+        """
+        Сбрасывает вычисленные статистики (`mean`, `std`, `min`, `max`, `sum`).
+
+        Вызывается автоматически при замене `intensity` и арифметике на месте (`+=`, `out=`).
+        Вызовите вручную после изменения элементов массива `intensity` напрямую.
+        Статистики объектов, массивы которых - представления тех же данных (`__getitem__`), также сбрасываются.
+        """
+        state = self._state
+        if state is None:
+            return
+        state.stats = None
+        if state.generation is not None:
+            state.generation[0] += 1
+
+    def __shared_generation(self) -> list[int]:
+        state = self._get_state()
+        if state.generation is None:
+            state.generation = [0]
+        return state.generation
+
+    def __cached(self, key: tuple, compute):
+        state = self._get_state()
+        stats = state.stats
+        generation = state.generation[0] if state.generation is not None else 0
+        if stats is None or stats['generation'] != generation:
+            stats = {'generation': generation}
+            state.stats = stats
+        if key not in stats:
+            stats[key] = compute()
+        return stats[key]
+
+    def __source(self) -> tuple[NDArray, Callable[[NDArray], NDArray[float]]]:
+        raw = self._raw
+        if raw is not None:
+            return raw.samples, raw.convert
+        return self.intensity, _as_float
+
+    def __moments(self, axis: int | None) -> tuple[NDArray, NDArray, int]:
+        def compute():
+            source, convert = self.__source()
+            total, m2, count = _moments(source, axis, convert)
+            return _frozen(total), m2, count
+        return self.__cached(('moments', axis), compute)
+
+    def __extrema(self, axis: int | None) -> tuple[NDArray, NDArray]:
+        def compute():
+            n_times, n_numbers = self.shape
+            if (n_times * n_numbers if axis is None else self.shape[axis]) == 0:
+                # как numpy: у минимума пустого набора нет значения
+                raise ValueError('Cannot compute min/max of empty data')
+            if axis is None:
+                low, high = self.__extrema(0)
+                return _frozen(low.min()), _frozen(high.max())
+            source, convert = self.__source()
+            low, high = _extrema(source, axis, convert)
+            return _frozen(low), _frozen(high)
+        return self.__cached(('extrema', axis), compute)
+
+    def sum(self, axis: int | None = 0) -> NDArray[float]:
+        """
+        Сумма интенсивностей. Результат вычисляется один раз и кэшируется до изменения данных.
+
+        :param axis: ``0`` - по измерениям для каждого отсчета, ``1`` - по отсчетам для каждого измерения,
+            ``None`` - по всем данным
+        :type axis: int | None
+        :return: Массив только для чтения, число при ``axis=None``
+        """
+        return _reduced(self.__moments(axis)[0], axis)
+
+    def mean(self, axis: int | None = 0) -> NDArray[float]:
+        """
+        Среднее интенсивностей. Вычисляется за один проход вместе с `sum` и `std`.
+
+        :param axis: Ось усреднения, см. `sum`
+        :type axis: int | None
+        :return: Массив только для чтения, число при ``axis=None``
+        """
+        def compute():
+            total, _, count = self.__moments(axis)
+            return _frozen(total / count)
+        return _reduced(self.__cached(('mean', axis), compute), axis)
+
+    def std(self, axis: int | None = 0, ddof: int = 0) -> NDArray[float]:
+        """
+        Стандартное отклонение интенсивностей. Вычисляется за один проход вместе с `sum` и `mean`.
+
+        :param axis: Ось, см. `sum`
+        :type axis: int | None
+        :param int ddof: Поправка числа степеней свободы, как в `numpy.std`
+        :return: Массив только для чтения, число при ``axis=None``
+        """
+        def compute():
+            _, m2, count = self.__moments(axis)
+            return _frozen(np.sqrt(m2 / (count - ddof)))
+        return _reduced(self.__cached(('std', axis, ddof), compute), axis)
+
+    def min(self, axis: int | None = 0) -> NDArray[float]:
+        """
+        Минимум интенсивностей. Вычисляется вместе с `max`.
+
+        :param axis: Ось, см. `sum`
+        :type axis: int | None
+        :return: Массив только для чтения, число при ``axis=None``
+        """
+        return _reduced(self.__extrema(axis)[0], axis)
+
+    def max(self, axis: int | None = 0) -> NDArray[float]:
+        """
+        Максимум интенсивностей. Вычисляется вместе с `min`.
+
+        :param axis: Ось, см. `sum`
+        :type axis: int | None
+        :return: Массив только для чтения, число при ``axis=None``
+        """
+        return _reduced(self.__extrema(axis)[1], axis)
 
     @property
     def n_times(self) -> int:
         """Количество измерений"""
-        return self.intensity.shape[0]
+        return self.shape[0]
 
     @property
     def n_numbers(self) -> int:
         """Количество отсчетов"""
-        return self.intensity.shape[1]
+        return self.shape[1]
 
     @property
     def shape(self) -> tuple[int, int]:
         """Размерность данынх"""
-        return self.intensity.shape
+        raw = self._raw
+        return raw.samples.shape if raw is not None else self.intensity.shape
+
+    def save(self, path: str, legacy: bool = False):
+        """
+        Сохранить объект в файл.
+
+        По умолчанию используется двоичный формат (`pyspectrum.file_format`), который
+        читается без загрузки всего файла в память.
 
-    def save(self, path: str):
-        """Сохранить объект в файл"""
-        with open(path, 'wb') as f:
-            pickle.dump(self, f)
+        :param str path: Путь к файлу
+        :param bool legacy: Если ``True``, объект сохраняется через `pickle`, как в прежних версиях
+        """
+        if legacy:
+            if self.is_lazy:
+                self.__materialize()
+            with open(path, 'wb') as f:
+                pickle.dump(self, f)
+            return
+        # отложенные объекты сохраняются в виде исходных отсчетов (версия 2 формата)
+        version = 2 if self.is_lazy else 1
+        file_format.write(path, self._file_meta(), self._file_arrays(), version=version)
+
+    def _file_meta(self) -> dict:
+        meta = {'type': type(self).__name__, 'exposure': int(self.exposure)}
+        if self.is_lazy:
+            meta['scale'] = float(self._raw.scale)
+        return meta
+
+    def _file_arrays(self) -> dict[str, NDArray]:
+        raw = self._raw
+        if raw is None:
+            return {'intensity': self.intensity, 'clipped': self.clipped}
+        arrays = {'samples': raw.samples, 'clipped': np.asarray(raw.clipped, dtype=bool)}
+        if raw.offset is not None:
+            arrays['offset'] = np.asarray(raw.offset, dtype=np.float64)
+        return arrays
 
     @classmethod
-    def load(cls, path: str) -> 'Data':
-        """Прочитать объект из файла"""
+    def load(cls, path: str, mmap: bool = True, allow_pickle: bool = True) -> 'Data':
+        """
+        Прочитать объект из файла.
 
-        with open(path, 'rb') as f:
-            result = pickle.load(f)
+        Файлы в двоичном формате по умолчанию отображаются в память: данные читаются с диска
+        только при обращении к ним. Изменения массивов загруженного объекта не попадают в файл.
+
+        :param str path: Путь к файлу
+        :param bool mmap: Отображать ли массивы в память вместо чтения целиком
+        :param bool allow_pickle: Разрешить чтение файлов, сохраненных через `pickle`.
+            Такие файлы можно загружать только из доверенных источников.
+        """
+        if file_format.is_binary(path):
+            meta, arrays = file_format.read(path, mmap=mmap)
+            types = {t.__name__: t for t in (Data, Spectrum)}
+            if meta.get('type') not in types:
+                raise LoadError(path)
+            result = types[meta['type']]._from_file(meta, arrays)
+        elif allow_pickle:
+            with open(path, 'rb') as f:
+                result = pickle.load(f)
+        else:
+            raise LoadError(path)
 
         if not isinstance(result, cls):
             raise LoadError(path)
 
         return result
 
+    @classmethod
+    def _from_file(cls, meta: dict, arrays: dict[str, NDArray], **kwargs) -> 'Data':
+        if 'samples' in arrays:
+            return cls.from_raw(arrays['samples'], arrays['clipped'], meta['exposure'],
+                                scale=meta['scale'], offset=arrays.get('offset'), **kwargs)
+        return cls(intensity=arrays['intensity'], clipped=arrays['clipped'], exposure=meta['exposure'], **kwargs)
+
     def check_exposure(self, other: 'Data'):
         if self.exposure != other.exposure:
             raise ValueError('Exposures are different')
 
     def to_spectrum(self, wavelength: NDArray[float]) -> 'Spectrum':
-        return Spectrum(self.intensity, self.clipped, self.exposure, wavelength, None)
+        raw = self._raw
+        if raw is not None:
+            return Spectrum.from_raw(raw.samples, raw.clipped, self.exposure, raw.scale, raw.offset,
+                                     wavelength=wavelength)
+        return Spectrum(self.intensity, self.clipped, self.exposure, wavelength)
 
-    def __add__(self, other):
+    def _apply(self, ufunc: np.ufunc, other, out: Optional['Data'], verb: str, inplace: bool = False) -> 'Data':
         if isinstance(other, Data):
-            # add Data or Spectrum
+            # only addition and subtraction of Data or Spectrum is supported
+            if ufunc not in (np.add, np.subtract):
+                raise TypeError(f'Cannot {verb} by Data')
             self.check_exposure(other)
-            return Data(
-                self.intensity + other.intensity,
-                np.bitwise_or(self.clipped, other.clipped),
-                self.exposure
-            )
+            operand = other.intensity
+            clipped = np.logical_or(self.clipped, other.clipped)
         else:
-            # add numpy array or scalar
-            return Data(
-                self.intensity + other,
-                self.clipped,
-                self.exposure
-            )
+            # numpy array or scalar
+            operand = other
+            clipped = self.clipped
+
+        if out is not None and out._frozen:
+            raise FrozenInstanceError('cannot modify frozen data')
+        if inplace and not _can_write(ufunc, out.intensity, operand):
+            # например, деление целочисленных данных: результат не помещается в массив, создается новый объект
+            out = None
+        if out is None:
+            return replace(self, intensity=ufunc(self.intensity, operand), clipped=clipped)
+
+        ufunc(self.intensity, operand, out=out.intensity)
+        out.invalidate_cache()
+        # массивы флагов могут быть общими у нескольких объектов, поэтому они не изменяются на месте
+        out.clipped = clipped
+        out.exposure = self.exposure
+        return out
+
+    def add(self, other, out: Optional['Data'] = None) -> 'Data':
+        """
+        Сложение с `Data`, массивом или числом.
+
+        Операторы `+=`, `-=`, `*=`, `/=` записывают результат в массив интенсивностей объекта, если
+        его тип это допускает, иначе (например, `/=` для целочисленных данных) создается новый объект.
+
+        :param other: Второе слагаемое. Экспозиции `Data` должны совпадать.
+        :param out: Объект, в массив интенсивностей которого записывается результат (например, `self`).
+            По умолчанию создается новый объект.
+        :type out: Data | None
+        :return: Результат. Отсчет зашкален, если он зашкален в любом из слагаемых.
+        """
+        return self._apply(np.add, other, out, 'add')
+
+    def subtract(self, other, out: Optional['Data'] = None) -> 'Data':
+        """
+        Вычитание `Data`, массива или числа. Параметры аналогичны `add`.
+        """
+        return self._apply(np.subtract, other, out, 'subtract')
+
+    def multiply(self, other, out: Optional['Data'] = None) -> 'Data':
+        """
+        Умножение на массив или число. Параметры аналогичны `add`.
+        """
+        return self._apply(np.multiply, other, out, 'multiply')
+
+    def divide(self, other, out: Optional['Data'] = None) -> 'Data':
+        """
+        Деление на массив или число. Параметры аналогичны `add`.
+        """
+        return self._apply(np.true_divide, other, out, 'divide')
+
+    def __add__(self, other):
+        return self.add(other)
 
     def __sub__(self, other):
-        if isinstance(other, Data):
-            # sub Data or Spectrum
-            self.check_exposure(other)
-            return Data(
-                self.intensity - other.intensity,
-                np.bitwise_or(self.clipped, other.clipped),
-                self.exposure
-            )
-        else:
-            # sub numpy array or scalar
-            return Data(
-                self.intensity - other,
-                self.clipped,
-                self.exposure
-            )
+        return self.subtract(other)
 
     def __mul__(self, other):
-        # multiplying by data is not supported
-        if isinstance(other, Data):
-            raise TypeError('Cannot multiply by Data')
-        return Data(
-            self.intensity * other,
-            self.clipped,
-            self.exposure
-        )
+        return self.multiply(other)
+
+    def __truediv__(self, other):
+        return self.divide(other)
+
+    def __iadd__(self, other):
+        return self._apply(np.add, other, self, 'add', inplace=True)
+
+    def __isub__(self, other):
+        return self._apply(np.subtract, other, self, 'subtract', inplace=True)
+
+    def __imul__(self, other):
+        return self._apply(np.multiply, other, self, 'multiply', inplace=True)
+
+    def __itruediv__(self, other):
+        return self._apply(np.true_divide, other, self, 'divide', inplace=True)
 
     def __repr__(self) -> str:
         cls = self.__class__
         return f'{cls.__name__}({self.n_times = }, {self.n_numbers = })'
 
     def __getitem__(self, key) -> 'Data':
-        _check_slice_key(key)
-        return Data(
-            intensity=self.intensity.__getitem__(key),
-            clipped=self.clipped.__getitem__(key),
-            exposure=self.exposure
-        )
+        """
+        Выбор измерений и отсчетов. Поддерживаются целые числа, срезы, логические и целочисленные массивы.
+        Результат всегда двумерный. Для срезов массивы результата - представления массивов объекта, без копирования.
+        """
+        rows, columns = _normalize_key(key)
+        if isinstance(rows, np.ndarray) and isinstance(columns, np.ndarray):
+            # отдельные индексы по двум осям - выбор подматрицы
+            rows = rows[:, None] if rows.dtype != bool else np.flatnonzero(rows)[:, None]
+        result = replace(self, intensity=self.intensity[rows, columns], clipped=self.clipped[rows, columns])
+        if np.may_share_memory(result.intensity, self.intensity):
+            # изменение данных через любое из представлений сбрасывает статистики остальных
+            result._get_state().generation = self.__shared_generation()
+        return result
 
 
-@dataclass()
+@dataclass(slots=True, init=False)
 class Spectrum(Data):
     """Обработанные данные, полученные со спектрометра.
     Содержит в себе информацию о длинах волн измерения.
@@ -137,28 +701,450 @@ class Spectrum(Data):
 
     wavelength: NDArray[float]
     """длина волны фотоячейки"""
-    number: NDArray[float] | None = field(default=None)  # номер фотоячейки TODO: not implemented
 
-    # TODO: slice support
-    def __add__(self, other):
-        return super().__add__(other).to_spectrum(self.wavelength)
+    def __init__(self, intensity: NDArray[float], clipped: NDArray[bool], exposure: int,
+                 wavelength: NDArray[float]):
+        object.__setattr__(self, 'intensity', intensity)
+        object.__setattr__(self, 'clipped', clipped)
+        object.__setattr__(self, 'exposure', exposure)
+        object.__setattr__(self, 'wavelength', wavelength)
+        object.__setattr__(self, '_state', None)
 
-    def __sub__(self, other):
-        return super().__sub__(other).to_spectrum(self.wavelength)
+    def __index(self) -> _AxisIndex:
+        if self.wavelength is None:
+            raise ValueError('Spectrum has no wavelengths')
+        state = self._get_state()
+        index = state.wavelength_index
+        if index is None or index.axis is not self.wavelength:
+            index = _AxisIndex(self.wavelength)
+            state.wavelength_index = index
+        return index
 
-    def __mul__(self, other):
-        return super().__mul__(other).to_spectrum(self.wavelength)
+    def sel(self, wl_min: float, wl_max: float) -> 'Spectrum':
+        """
+        Выделяет отсчеты с длинами волн в диапазоне `[wl_min, wl_max]` без копирования данных.
+        Работает и для убывающей шкалы длин волн (`FactoryConfig.reverse`).
+
+        :param float wl_min: Минимальная длина волны
+        :param float wl_max: Максимальная длина волны
+        :rtype: Spectrum
+        """
+        return self[:, self.__index().range(wl_min, wl_max)]
+
+    def at(self, wavelengths) -> 'Spectrum':
+        """
+        Выбирает отсчеты, ближайшие к заданным длинам волн.
+
+        :param wavelengths: Длина волны или массив длин волн
+        :return: Спектр с одним отсчетом на каждую заданную длину волны
+        :rtype: Spectrum
+        """
+        return self[:, np.atleast_1d(self.__index().nearest(wavelengths))]
+
+    def _file_arrays(self) -> dict[str, NDArray]:
+        arrays = Data._file_arrays(self)
+        if self.wavelength is not None:
+            arrays['wavelength'] = self.wavelength
+        return arrays
+
+    @classmethod
+    def _from_file(cls, meta: dict, arrays: dict[str, NDArray], **kwargs) -> 'Spectrum':
+        return super(Spectrum, cls)._from_file(meta, arrays, wavelength=arrays.get('wavelength'), **kwargs)
 
     def __getitem__(self, key) -> 'Spectrum':
-        _check_slice_key(key)
-        if type(key) == tuple and len(key) >= 2:
-            new_wl = self.wavelength[key[1]]
-        else:
-            new_wl = self.wavelength
+        result = Data.__getitem__(self, key)
+        if self.wavelength is not None:
+            result.wavelength = self.wavelength[_normalize_key(key)[1]]
+        return result
+
+
+
+class SpectrumSeries:
+    """
+    Временной ряд спектров с общей шкалой длин волн.
+
+    Измерения хранятся блоками фиксированного размера (`chunk_frames` измерений): при добавлении
+    кадра заполняется последний блок или выделяется новый, ранее записанные измерения не копируются.
+    Непрерывный двумерный массив собирается из блоков при первом обращении к `intensity`, `clipped`,
+    `timestamp`, `exposure` (или к срезу, пересекающему границу блоков) и дальше служит буфером ряда.
+    Буфер выделяется с запасом в размер ряда, поэтому следующие кадры дописываются в него без
+    объединения, и чередование добавления с чтением также выполняется за амортизированное O(1). Для каждого измерения хранятся время начала и экспозиция,
+    длины волн хранятся один раз.
+
+    Пример использования:
+    ```python
+    series = SpectrumSeries(wavelength=spectrometer.wavelength)
+    spectrometer.read_non_block(series.append, frames_to_read=1000, frames_interval=10)
+    series.mean(t0, t0 + 1.0)
+    ```
+    """
+
+    def __init__(self,
+                 wavelength: Optional[NDArray[float]] = None,
+                 n_numbers: Optional[int] = None,
+                 capacity: Optional[int] = None,
+                 chunk_frames: int = 1024):
+        """
+        :param wavelength: Общая шкала длин волн. Если не задана, берется из первого добавленного спектра.
+        :type wavelength: NDArray[float] | None
+        :param n_numbers: Количество отсчетов. Если не задано, определяется по `wavelength` или первому кадру.
+        :type n_numbers: int | None
+        :param capacity: Количество измерений в первом блоке. По умолчанию - `chunk_frames`.
+        :type capacity: int | None
+        :param int chunk_frames: Количество измерений в каждом следующем блоке
+        """
+        if chunk_frames < 1:
+            raise ValueError('chunk_frames must be positive')
+        if wavelength is not None:
+            wavelength = np.asarray(wavelength)
+            if n_numbers is not None and n_numbers != len(wavelength):
+                raise ValueError('Wavelength has incorrect number of pixels')
+            n_numbers = len(wavelength)
+
+        self.__wavelength = wavelength
+        self.__n_numbers = n_numbers
+        self.__n_times = 0
+        self.__chunk_frames = chunk_frames
+        self.__first_chunk = chunk_frames if capacity is None else max(1, capacity)
+        # блоки (intensity, clipped, timestamp, exposure); блоки до self.__chunk заполнены полностью,
+        # в блоке self.__chunk заполнено self.__filled измерений
+        self.__chunks: list[tuple[NDArray, NDArray, NDArray, NDArray]] = []
+        self.__chunk = 0
+        self.__filled = 0
+
+    @classmethod
+    def _from_arrays(cls,
+                     intensity: NDArray[float],
+                     clipped: NDArray[bool],
+                     timestamp: NDArray[float],
+                     exposure: NDArray[int],
+                     wavelength: Optional[NDArray[float]]) -> 'SpectrumSeries':
+        series = cls(wavelength=wavelength, n_numbers=intensity.shape[1])
+        series.__chunks = [(intensity, clipped, timestamp, exposure)]
+        series.__n_times = series.__filled = len(intensity)
+        return series
+
+    def __allocate(self, n_times: int) -> None:
+        self.__chunks.append((
+            np.empty((n_times, self.__n_numbers), dtype=np.float64),
+            np.empty((n_times, self.__n_numbers), dtype=bool),
+            np.empty(n_times, dtype=np.float64),
+            np.empty(n_times, dtype=np.int64),
+        ))
+
+    def __reserve(self, n_times: int) -> None:
+        missing = n_times + self.__filled - sum(len(chunk[0]) for chunk in self.__chunks[self.__chunk:])
+        if missing > 0:
+            size = self.__chunk_frames if self.__chunks else self.__first_chunk
+            self.__allocate(max(missing, size))
+
+    def __merge(self) -> None:
+        chunks = self.__chunks[:self.__chunk]
+        chunks.append(tuple(array[:self.__filled] for array in self.__chunks[self.__chunk]))
+        # объединенный буфер растет с запасом, чтобы следующие кадры дописывались в него же
+        # и повторное объединение требовалось только после удвоения ряда
+        n = self.__n_times
+        self.__chunks = []
+        self.__allocate(max(2 * n, n + self.__chunk_frames))
+        offset = 0
+        for chunk in chunks:
+            size = len(chunk[0])
+            for target, array in zip(self.__chunks[0], chunk):
+                target[offset:offset + size] = array
+            offset += size
+        self.__chunk = 0
+        self.__filled = n
+
+    def __rows(self, rows: slice) -> tuple[NDArray, NDArray, NDArray, NDArray]:
+        if not self.__chunks:
+            n_numbers = self.__n_numbers or 0
+            return (np.empty((0, n_numbers)), np.empty((0, n_numbers), dtype=bool),
+                    np.empty(0), np.empty(0, dtype=np.int64))
+        start, stop, _ = rows.indices(self.__n_times)
+        stop = max(start, stop)
+        offset = 0
+        for chunk in self.__chunks[:self.__chunk + 1]:
+            if stop <= offset + len(chunk[0]):
+                if start >= offset:
+                    return tuple(array[start - offset:stop - offset] for array in chunk)
+                break
+            offset += len(chunk[0])
+        # измерения лежат в нескольких блоках
+        self.__merge()
+        return tuple(array[start:stop] for array in self.__chunks[0])
+
+    @property
+    def n_times(self) -> int:
+        """Количество измерений"""
+        return self.__n_times
+
+    @property
+    def n_numbers(self) -> Optional[int]:
+        """Количество отсчетов"""
+        return self.__n_numbers
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Размерность данных"""
+        return self.__n_times, self.__n_numbers or 0
+
+    @property
+    def capacity(self) -> int:
+        """Количество измерений в выделенных блоках"""
+        return sum(len(chunk[0]) for chunk in self.__chunks)
+
+    @property
+    def wavelength(self) -> Optional[NDArray[float]]:
+        """Общая шкала длин волн"""
+        return self.__wavelength
+
+    @property
+    def intensity(self) -> NDArray[float]:
+        """Двумерный массив интенсивностей (представление внутреннего буфера)"""
+        return self.__rows(slice(None))[0]
+
+    @property
+    def clipped(self) -> NDArray[bool]:
+        """Флаги зашкаливания (представление внутреннего буфера)"""
+        return self.__rows(slice(None))[1]
+
+    @property
+    def timestamp(self) -> NDArray[float]:
+        """Время начала каждого измерения (`time.time()`)"""
+        return self.__rows(slice(None))[2]
+
+    @property
+    def exposure(self) -> NDArray[int]:
+        """Экспозиция каждого измерения в миллисекундах"""
+        return self.__rows(slice(None))[3]
+
+    def __len__(self) -> int:
+        return self.__n_times
+
+    def __repr__(self) -> str:
+        cls = self.__class__
+        return f'{cls.__name__}({self.n_times = }, {self.n_numbers = })'
+
+    def append(self, data: Data, timestamp: Optional[float] = None) -> None:
+        """
+        Добавляет измерения кадра в конец ряда. Данные кадра копируются.
+
+        :param data: Кадр
+        :type data: Data
+        :param timestamp: Время начала первого измерения кадра (`time.time()`).
+            По умолчанию вычисляется из текущего времени и экспозиции.
+        :type timestamp: float | None
+        """
+        if isinstance(data, Spectrum) and data.wavelength is not None:
+            if self.__wavelength is None:
+                self.__wavelength = data.wavelength
+            elif data.wavelength is not self.__wavelength and not np.array_equal(data.wavelength, self.__wavelength):
+                raise ValueError('Spectrum has different wavelengths')
+        if self.__n_numbers is None:
+            self.__n_numbers = data.n_numbers
+        elif data.n_numbers != self.__n_numbers:
+            raise ValueError('Data has incorrect number of pixels')
+
+        if timestamp is None:
+            timestamp = time.time() - data.n_times * data.exposure / 1000
+
+        self.__reserve(data.n_times)
+        period = data.exposure / 1000
+        position = 0
+        while position < data.n_times:
+            intensity, clipped, timestamps, exposure = self.__chunks[self.__chunk]
+            if self.__filled == len(intensity):
+                self.__chunk += 1
+                self.__filled = 0
+                continue
+            n = min(data.n_times - position, len(intensity) - self.__filled)
+            rows = slice(self.__filled, self.__filled + n)
+            intensity[rows] = data.intensity[position:position + n]
+            clipped[rows] = data.clipped[position:position + n]
+            timestamps[rows] = timestamp + np.arange(position, position + n) * period
+            exposure[rows] = data.exposure
+            self.__filled += n
+            position += n
+        self.__n_times += data.n_times
+
+    def __call__(self, data: Data) -> None:
+        self.append(data)
+
+    def extend(self, frames: Iterable[Data], timestamps: Optional[Iterable[float]] = None) -> None:
+        """
+        Добавляет несколько кадров.
+
+        :param frames: Кадры
+        :param timestamps: Время начала первого измерения каждого кадра
+        """
+        frames = list(frames)
+        timestamps = [None] * len(frames) if timestamps is None else list(timestamps)
+        if len(timestamps) != len(frames):
+            raise ValueError('Number of timestamps does not match number of frames')
+        self.__reserve(sum(frame.n_times for frame in frames))
+        for frame, timestamp in zip(frames, timestamps):
+            self.append(frame, timestamp)
+
+    def header(self, index: int) -> FrameHeader:
+        """
+        Заголовок измерения с номером `index`.
+
+        :param int index: Номер измерения
+        :rtype: FrameHeader
+        """
+        index = range(self.__n_times)[index]
+        _, _, timestamp, exposure = self.__rows(slice(index, index + 1))
+        return FrameHeader(float(timestamp[0]), int(exposure[0]), index)
+
+    def clear(self) -> None:
+        """Удаляет все измерения, сохраняя выделенную память."""
+        self.__n_times = 0
+        self.__chunk = 0
+        self.__filled = 0
+
+    def window(self, start: Optional[float] = None, stop: Optional[float] = None) -> slice:
+        """
+        Возвращает срез измерений, начатых в интервале времени `[start, stop)`.
+        Предполагается, что измерения добавлялись в порядке времени.
+
+        :param start: Начало интервала (`time.time()`), по умолчанию - начало ряда
+        :type start: float | None
+        :param stop: Конец интервала (`time.time()`), по умолчанию - конец ряда
+        :type stop: float | None
+        :rtype: slice
+        """
+        timestamp = self.timestamp
+        first = 0 if start is None else int(np.searchsorted(timestamp, start, side='left'))
+        last = self.__n_times if stop is None else int(np.searchsorted(timestamp, stop, side='left'))
+        return slice(first, max(first, last))
+
+    @staticmethod
+    def __uniform_exposure(exposure: NDArray[int]) -> int:
+        if len(exposure) == 0:
+            raise ValueError('Series slice is empty')
+        if np.any(exposure != exposure[0]):
+            raise ValueError('Exposures are different')
+        return int(exposure[0])
+
+    def to_spectrum(self, start: Optional[int] = None, stop: Optional[int] = None) -> Spectrum:
+        """
+        Возвращает измерения `[start, stop)` как `Spectrum` без копирования данных
+        (если измерения лежат в разных блоках, блоки предварительно объединяются).
+        Массивы результата ссылаются на буфер ряда и становятся недействительны после `clear`.
+
+        :raises ValueError: Если экспозиции измерений различаются.
+        :rtype: Spectrum
+        """
+        intensity, clipped, _, exposure = self.__rows(slice(start, stop))
         return Spectrum(
-            wavelength=new_wl,
+            intensity=intensity,
+            clipped=clipped,
+            exposure=self.__uniform_exposure(exposure),
+            wavelength=self.__wavelength,
+        )
+
+    def __getitem__(self, key: int | slice) -> Spectrum:
+        if isinstance(key, (int, np.integer)):
+            index = range(self.__n_times)[key]
+            return self.to_spectrum(index, index + 1)
+        if type(key) != slice or key.step not in (None, 1):
+            raise Exception('Only contiguous slices are supported')
+        return self.to_spectrum(key.start, key.stop)
+
+    def mean(self, start: Optional[float] = None, stop: Optional[float] = None) -> Spectrum:
+        """
+        Усредняет измерения, начатые в интервале времени `[start, stop)`.
+
+        :param start: Начало интервала (`time.time()`)
+        :type start: float | None
+        :param stop: Конец интервала (`time.time()`)
+        :type stop: float | None
+        :return: Спектр из одного измерения. Отсчет зашкален, если он зашкален в любом из измерений.
+        :rtype: Spectrum
+        """
+        rows = self.window(start, stop)
+        exposure = self.__uniform_exposure(self.exposure[rows])
+        return Spectrum(
+            intensity=self.intensity[rows].mean(axis=0, keepdims=True),
+            clipped=self.clipped[rows].any(axis=0, keepdims=True),
+            exposure=exposure,
+            wavelength=self.__wavelength,
+        )
+
+    def binned(self, period: float) -> 'SpectrumSeries':
+        """
+        Усредняет измерения по последовательным интервалам времени длительностью `period`.
+
+        :param float period: Длительность интервала в секундах
+        :return: Ряд, в котором каждое измерение - среднее по интервалу. Время измерения - начало интервала.
+        :rtype: SpectrumSeries
+        """
+        if period <= 0:
+            raise ValueError('Period must be positive')
+        n = self.__n_times
+        if n == 0:
+            return SpectrumSeries(wavelength=self.__wavelength, n_numbers=self.__n_numbers)
+
+        timestamp = self.timestamp
+        bins = np.floor((timestamp - timestamp[0]) / period + 1e-9).astype(np.int64)
+        starts = np.flatnonzero(np.diff(bins, prepend=-1))
+        counts = np.diff(starts, append=n)
+        exposure = self.exposure
+        if np.any(np.maximum.reduceat(exposure, starts) != np.minimum.reduceat(exposure, starts)):
+            raise ValueError('Exposures are different')
+
+        return SpectrumSeries._from_arrays(
+            intensity=np.add.reduceat(self.intensity, starts, axis=0) / counts[:, None],
+            clipped=np.logical_or.reduceat(self.clipped, starts, axis=0),
+            timestamp=timestamp[0] + bins[starts] * period,
+            exposure=exposure[starts].copy(),
+            wavelength=self.__wavelength,
+        )
+
+    def __columns(self, wl_min: float, wl_max: float) -> slice:
+        if self.__wavelength is None:
+            raise ValueError('Series has no wavelengths')
+        return _AxisIndex(self.__wavelength).range(wl_min, wl_max)
+
+    def band(self, wl_min: float, wl_max: float) -> 'SpectrumSeries':
+        """
+        Выделяет отсчеты с длинами волн в диапазоне `[wl_min, wl_max]`.
+        Массивы результата ссылаются на буфер ряда.
+
+        :param float wl_min: Минимальная длина волны
+        :param float wl_max: Максимальная длина волны
+        :rtype: SpectrumSeries
+        """
+        columns = self.__columns(wl_min, wl_max)
+        return SpectrumSeries._from_arrays(
+            intensity=self.intensity[:, columns],
+            clipped=self.clipped[:, columns],
+            timestamp=self.timestamp,
             exposure=self.exposure,
-            intensity=self.intensity.__getitem__(key),
-            clipped=self.clipped.__getitem__(key)
+            wavelength=self.__wavelength[columns],
         )
 
+    def resample(self, wavelength: NDArray[float], method: str = 'linear') -> 'SpectrumSeries':
+        """
+        Передискретизирует все измерения на новую шкалу длин волн одним матричным произведением
+        (см. `pyspectrum.Resampler`). Значения вне исходного диапазона равны `nan`.
+        Отсчет зашкален, если зашкален любой из исходных отсчетов, от которых он зависит.
+
+        :param wavelength: Новая шкала длин волн
+        :type wavelength: NDArray[float]
+        :param str method: `nearest`, `linear` или `area`
+        :rtype: SpectrumSeries
+        """
+        from .resample import Resampler  # resample зависит от data
+
+        if self.__wavelength is None:
+            raise ValueError('Series has no wavelengths')
+        resampler = Resampler(wavelength, method=method)
+        _, pattern, _ = resampler.matrix(self.__wavelength)
+        return SpectrumSeries._from_arrays(
+            intensity=resampler.apply(self.intensity, self.__wavelength),
+            clipped=np.ascontiguousarray((pattern @ self.clipped.T.astype(np.float64)).T > 0),
+            timestamp=self.timestamp.copy(),
+            exposure=self.exposure.copy(),
+            wavelength=resampler.wavelength,
+        )
@@ -11,3 +11,9 @@ class MeasurementIncompatibleError(Exception):
 class ConfigurationError(Exception):
     def __int__(self, what: str):
         super().__init__(what)
+
+
+class OverrunError(Exception):
+    def __init__(self, lost: int):
+        super().__init__(f'Reader was overrun, {lost} frames lost')
+        self.lost = lost
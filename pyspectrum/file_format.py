@@ -0,0 +1,146 @@
+"""
+Двоичный формат файлов для `Data` и `Spectrum`.
+
+Структура файла:
+```
+- [ MAGIC | VERSION | HEADER_LENGTH | HEADER | ... | ARRAY_0 | ... | ARRAY_N ]
+- MAGIC = b'PYSPECTR' - 8 байт
+- VERSION - uint32, little-endian
+- HEADER_LENGTH - uint32, little-endian, длина HEADER в байтах
+- HEADER - JSON в кодировке UTF-8
+- каждый массив начинается со смещения, кратного 64 байтам, и хранится в C-порядке
+```
+
+Заголовок содержит тип объекта, его скалярные поля и описание массивов:
+```
+{"type": "Spectrum", "exposure": 10,
+ "arrays": {"intensity": {"dtype": "<f8", "shape": [100, 1800], "offset": 128}, ...}}
+```
+
+Версия 2 добавляет представление отложенных объектов (`Data.from_raw`): вместо `intensity`
+хранятся исходные отсчеты `samples` (например, `uint16`), необязательный массив `offset`
+и поле `scale`. Объекты без отложенного преобразования записываются в версии 1.
+
+Так как массивы выровнены и не сжаты, при чтении они отображаются в память (`numpy.memmap`),
+и обращение к части записи читает с диска только нужные страницы.
+"""
+import json
+import os
+import secrets
+import struct
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+MAGIC = b'PYSPECTR'
+VERSION = 2
+ALIGNMENT = 64
+
+_PREAMBLE = struct.Struct('<8sII')
+# Размер блока при записи массива, байт
+_WRITE_BLOCK = 1 << 24
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def is_binary(path: str) -> bool:
+    """
+    Проверяет, записан ли файл в двоичном формате.
+
+    :param str path: Путь к файлу
+    :rtype: bool
+    """
+    with open(path, 'rb') as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def _write_array(f, array: NDArray) -> None:
+    if array.ndim == 0 or array.size == 0:
+        f.write(np.ascontiguousarray(array).tobytes())
+        return
+    # пишем блоками строк, чтобы не копировать целиком несмежные массивы и memmap
+    row_bytes = max(1, array[0].nbytes)
+    step = max(1, _WRITE_BLOCK // row_bytes)
+    for i in range(0, array.shape[0], step):
+        np.ascontiguousarray(array[i:i + step]).tofile(f)
+
+
+def write(path: str, meta: dict[str, Any], arrays: dict[str, NDArray], version: int = VERSION) -> None:
+    """
+    Записывает массивы и скалярные поля в файл.
+
+    :param str path: Путь к файлу
+    :param meta: Скалярные поля, сериализуемые в JSON
+    :param arrays: Массивы для записи
+    :param int version: Версия формата, записываемая в файл
+    """
+    arrays = {name: np.asarray(array) for name, array in arrays.items()}
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            raise TypeError(f'Array {name} has unsupported dtype {array.dtype}')
+
+    # смещения зависят от длины заголовка, а заголовок - от смещений: считаем до сходимости
+    descriptions: dict[str, dict[str, Any]] = {}
+    header = b''
+    while True:
+        offset = _align(_PREAMBLE.size + len(header))
+        for name, array in arrays.items():
+            descriptions[name] = {'dtype': array.dtype.str, 'shape': list(array.shape), 'offset': offset}
+            offset = _align(offset + array.nbytes)
+        new_header = json.dumps({**meta, 'arrays': descriptions}).encode('utf-8')
+        converged = len(new_header) == len(header)
+        header = new_header
+        if converged:
+            break
+
+    # массивы могут быть отображены из того же файла (`Data.load(path).save(path)`), поэтому
+    # файл записывается во временный в том же каталоге и заменяет исходный только целиком
+    directory, basename = os.path.split(os.path.abspath(path))
+    temporary = os.path.join(directory, f'.{basename}.{secrets.token_hex(4)}.tmp')
+    try:
+        with open(temporary, 'xb') as f:
+            f.write(_PREAMBLE.pack(MAGIC, version, len(header)))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(descriptions[name]['offset'])
+                _write_array(f, array)
+            f.truncate(_align(f.tell()))
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+
+
+def read(path: str, mmap: bool = True) -> tuple[dict[str, Any], dict[str, NDArray]]:
+    """
+    Читает файл в двоичном формате.
+
+    :param str path: Путь к файлу
+    :param bool mmap: Если ``True``, массивы отображаются в память в режиме копирования при записи:
+        изменения массивов не попадают в файл.
+    :return: Скалярные поля и массивы
+    :raises ValueError: Если файл не в двоичном формате или его версия не поддерживается.
+    """
+    with open(path, 'rb') as f:
+        magic, version, header_length = _PREAMBLE.unpack(f.read(_PREAMBLE.size))
+        if magic != MAGIC:
+            raise ValueError(f'File {path} is not in pyspectrum binary format')
+        if version > VERSION:
+            raise ValueError(f'File {path} has unsupported format version {version}')
+        meta = json.loads(f.read(header_length).decode('utf-8'))
+
+        arrays = {}
+        for name, description in meta.pop('arrays').items():
+            dtype = np.dtype(description['dtype'])
+            shape = tuple(description['shape'])
+            offset = description['offset']
+            if mmap and np.prod(shape) > 0:
+                arrays[name] = np.memmap(path, dtype=dtype, mode='c', offset=offset, shape=shape)
+            else:
+                f.seek(offset)
+                arrays[name] = np.fromfile(f, dtype=dtype, count=int(np.prod(shape))).reshape(shape)
+    return meta, arrays
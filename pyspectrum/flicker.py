@@ -0,0 +1,241 @@
+"""
+Мерцание источников света.
+
+Строки кадра (`Spectrometer.read`) - последовательные измерения с периодом, равным экспозиции, поэтому
+световой сигнал во времени получается умножением матрицы измерения x отсчеты на вектор весов
+(функция видности, умноженная на ширину отсчета). Показатели мерцания и частота основной гармоники
+вычисляются по этому сигналу, для множества окон сразу.
+"""
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from numpy.typing import NDArray
+
+from . import tables
+from .colorimetry import _frozen
+from .data import Data
+from .resample import _AxisCache
+
+
+@dataclass(frozen=True, slots=True)
+class FlickerMetrics:
+    """Показатели мерцания для каждого окна (сигнала)"""
+    percent_flicker: NDArray[float]
+    """Коэффициент пульсации `100 * (max - min) / (max + min)`, %"""
+    flicker_index: NDArray[float]
+    """Индекс мерцания: площадь сигнала выше среднего, деленная на полную площадь"""
+    frequency: NDArray[float]
+    """Частота основной гармоники, Гц (`nan` для постоянного сигнала)"""
+    mean: NDArray[float]
+    """Среднее значение сигнала"""
+
+
+def _dominant_frequency(signal: NDArray[float], sample_rate: float) -> NDArray[float]:
+    n = signal.shape[-1]
+    spectrum = np.abs(np.fft.rfft(signal * np.hanning(n), axis=-1))
+    spectrum[..., 0] = 0
+    peak = np.argmax(spectrum, axis=-1)
+    magnitude = np.take_along_axis(spectrum, peak[..., None], axis=-1)[..., 0]
+
+    # уточнение положения пика параболой по логарифмам соседних гармоник
+    left = np.take_along_axis(spectrum, np.maximum(peak - 1, 0)[..., None], axis=-1)[..., 0]
+    right = np.take_along_axis(spectrum, np.minimum(peak + 1, spectrum.shape[-1] - 1)[..., None], axis=-1)[..., 0]
+    inner = (peak > 0) & (peak < spectrum.shape[-1] - 1) & (left > 0) & (right > 0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        a, b, c = np.log(left), np.log(magnitude), np.log(right)
+        shift = np.where(inner, 0.5 * (a - c) / (a - 2 * b + c), 0)
+    shift = np.nan_to_num(np.clip(shift, -0.5, 0.5))
+    frequency = (peak + shift) * sample_rate / n
+    return np.where(magnitude > 0, frequency, np.nan)[()]
+
+
+def flicker_metrics(signal: NDArray[float], sample_rate: float) -> FlickerMetrics:
+    """
+    Показатели мерцания сигналов.
+
+    :param signal: Световой сигнал (..., отсчеты по времени)
+    :param float sample_rate: Частота отсчетов, Гц
+    :rtype: FlickerMetrics
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+    lo, hi = signal.min(axis=-1), signal.max(axis=-1)
+    mean = signal.mean(axis=-1)
+    detrended = signal - mean[..., None]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        percent_flicker = 100 * (hi - lo) / (hi + lo)
+        flicker_index = np.maximum(detrended, 0).sum(axis=-1) / signal.sum(axis=-1)
+    return FlickerMetrics(
+        percent_flicker=percent_flicker,
+        flicker_index=flicker_index,
+        frequency=_dominant_frequency(detrended, sample_rate),
+        mean=mean,
+    )
+
+
+class FlickerAnalysis:
+    """
+    Анализ мерцания по записанным спектрам.
+
+    Функция видности передается структурированным массивом `numpy` с полями `wavelength`, `V`.
+    Вектор весов для шкалы длин волн строится один раз и кэшируется.
+
+    Пример использования:
+    ```python
+    analysis = FlickerAnalysis(efficiency)
+    spectrometer.set_config(exposure=1)
+    metrics = analysis(spectrometer.read(n_times=2000), window=500, step=250)
+    print(metrics.percent_flicker, metrics.frequency)
+    ```
+    """
+
+    def __init__(self, efficiency: Optional[NDArray] = None, cache_size: int = 8):
+        """
+        :param efficiency: Функция видности. По умолчанию - `tables.efficiency()`.
+        :param int cache_size: Количество шкал длин волн, для которых хранятся веса
+        """
+        self.efficiency = tables.efficiency() if efficiency is None else efficiency
+        self._cache = _AxisCache(self.__build, cache_size)
+
+    def __build(self, wavelength: NDArray[float]) -> NDArray[float]:
+        wavelength = np.asarray(wavelength, dtype=np.float64)
+        dwl = np.abs(np.gradient(wavelength)) if len(wavelength) > 1 else np.ones(1)
+        efficiency = np.interp(wavelength, self.efficiency['wavelength'], self.efficiency['V'], left=0, right=0)
+        return _frozen(efficiency * dwl)
+
+    def weights(self, wavelength: NDArray[float]) -> NDArray[float]:
+        """
+        Веса отсчетов: `signal = intensity @ weights`.
+
+        :param wavelength: Шкала длин волн спектрометра
+        :return: Массив только для чтения
+        """
+        return self._cache.get(wavelength)
+
+    def signal(self, data: Data, wavelength: Optional[NDArray[float]] = None) -> NDArray[float]:
+        """
+        Световой сигнал каждого измерения.
+
+        :param data: Спектр или данные
+        :param wavelength: Шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :return: Массив (измерения,)
+        """
+        if wavelength is None:
+            wavelength = getattr(data, 'wavelength', None)
+        if wavelength is None:
+            raise ValueError('Wavelength axis is not set')
+        return data.intensity @ self.weights(wavelength)
+
+    def __call__(self,
+                 data: Data,
+                 wavelength: Optional[NDArray[float]] = None,
+                 window: Optional[int] = None,
+                 step: Optional[int] = None) -> FlickerMetrics:
+        """
+        Показатели мерцания.
+
+        :param data: Спектр или данные, измерения - отсчеты по времени с периодом `data.exposure`
+        :param wavelength: Шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :param window: Длина окна в измерениях. По умолчанию - вся запись одним окном.
+        :type window: int | None
+        :param step: Шаг между окнами. По умолчанию равен `window` (окна без перекрытия).
+        :type step: int | None
+        :return: Показатели для всей записи (скаляры) или для каждого окна (массивы)
+        :rtype: FlickerMetrics
+        """
+        signal = self.signal(data, wavelength)
+        if window is not None:
+            if not 0 < window <= len(signal):
+                raise ValueError('Window must be positive and not longer than the data')
+            signal = sliding_window_view(signal, window)[::step or window]
+        return flicker_metrics(signal, 1000 / data.exposure)
+
+
+class FlickerMeter:
+    """
+    Потоковый анализ мерцания с перекрывающимися окнами.
+
+    Объект можно передавать как callback в `Spectrometer.read_non_block` и `Spectrometer.read_non_stop`.
+    Для каждого полученного спектра вычисляется световой сигнал (одно матричное произведение);
+    показатели вычисляются для всех окон, которые завершились с приходом этого спектра.
+
+    ```python
+    meter = FlickerMeter(FlickerAnalysis(efficiency), window=1000, step=100, on_result=print)
+    spectrometer.read_non_stop(meter, frames_interval=100)
+    ```
+    """
+
+    def __init__(self,
+                 analysis: FlickerAnalysis,
+                 window: int,
+                 step: Optional[int] = None,
+                 on_result: Optional[Callable[[FlickerMetrics], None]] = None):
+        """
+        :param analysis: Анализ мерцания (веса отсчетов)
+        :type analysis: FlickerAnalysis
+        :param int window: Длина окна в измерениях
+        :param step: Шаг между окнами. По умолчанию равен `window`. Если шаг больше окна,
+            измерения между окнами пропускаются.
+        :type step: int | None
+        :param on_result: Функция, вызываемая с показателями завершившихся окон
+        """
+        if window <= 0 or (step is not None and step <= 0):
+            raise ValueError('Window and step must be positive')
+        self.analysis = analysis
+        self.window = window
+        self.step = step or window
+        self._on_result = on_result
+        self._tail = np.empty(0)
+        # измерения между окнами (`step > window`), которые еще не получены и должны быть пропущены
+        self._skip = 0
+        self._exposure: Optional[int] = None
+        self.position = 0
+        """Номер первого измерения следующего окна от начала потока"""
+
+    def reset(self) -> None:
+        """Сбрасывает накопленный сигнал."""
+        self._tail = np.empty(0)
+        self._skip = 0
+        self._exposure = None
+        self.position = 0
+
+    def update(self, data: Data) -> Optional[FlickerMetrics]:
+        """
+        Добавляет измерения и вычисляет показатели завершившихся окон.
+
+        При изменении экспозиции накопленный сигнал сбрасывается.
+
+        :param data: Спектр или данные
+        :return: Показатели завершившихся окон или `None`, если ни одно окно не завершилось
+        :rtype: FlickerMetrics | None
+        """
+        if data.exposure != self._exposure:
+            self.reset()
+            self._exposure = data.exposure
+
+        signal = self.analysis.signal(data)
+        if self._skip:
+            skipped = min(self._skip, len(signal))
+            signal = signal[skipped:]
+            self._skip -= skipped
+        buffer = np.concatenate([self._tail, signal])
+        n_windows = (len(buffer) - self.window) // self.step + 1 if len(buffer) >= self.window else 0
+        if n_windows == 0:
+            self._tail = buffer
+            return None
+
+        windows = sliding_window_view(buffer, self.window)[::self.step][:n_windows]
+        metrics = flicker_metrics(windows, 1000 / data.exposure)
+        consumed = n_windows * self.step
+        self._skip = max(consumed - len(buffer), 0)
+        self._tail = buffer[consumed:]
+        self.position += consumed
+        if self._on_result is not None:
+            self._on_result(metrics)
+        return metrics
+
+    def __call__(self, data: Data) -> None:
+        self.update(data)
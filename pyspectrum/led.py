@@ -0,0 +1,525 @@
+"""
+Параметры светодиодов: координаты цветности, коррелированная цветовая температура, световой поток.
+
+Все спектры переводятся на общую сетку длин волн (по умолчанию 400-780 нм с шагом 1 нм),
+после чего параметры всех измерений вычисляются матричными операциями над массивом
+измерения x отсчеты сетки.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import tables
+from .colorimetry import XYZ_to_xyY, _frozen
+from .data import Data
+from .resample import Resampler
+
+KM = 683
+"""Максимальная световая эффективность излучения, лм/Вт"""
+LIGHT_VELOCITY = 299792458
+"""Скорость света, м/с"""
+
+# Радиационные постоянные закона Планка
+_C1 = 3.741771e-16
+_C2 = 1.4388e-2
+
+# Начиная с этой температуры эталоном цветопередачи служит дневной свет серии D (CIE 13.3), К
+_DAYLIGHT_CCT = 5000
+# Шаг округления цветовой температуры при кэшировании эталонных источников, К
+_CCT_RESOLUTION = 1.0
+# Количество образцов, по которым вычисляется общий индекс цветопередачи Ra
+_RA_SAMPLES = 8
+
+
+def planck(wavelength: NDArray[float], temperature: float | NDArray[float]) -> NDArray[float]:
+    """
+    Спектр абсолютно черного тела (закон Планка), Вт / (м^2 нм).
+
+    :param wavelength: Длины волн в нанометрах
+    :param temperature: Температура в кельвинах или массив температур
+    :return: Массив (температуры..., длины волн)
+    """
+    wl = np.asarray(wavelength, dtype=np.float64) * 1e-9
+    temperature = np.asarray(temperature, dtype=np.float64)[..., None]
+    return _C1 / np.expm1(_C2 / (wl * temperature)) / wl ** 5 * 1e-9
+
+
+def _daylight_weights(temperature: float | NDArray[float]) -> NDArray[float]:
+    """Множители компонент S0, S1, S2 дневного света для коррелированной цветовой температуры (..., 3)."""
+    t = np.asarray(temperature, dtype=np.float64)
+    x = np.where(t <= 7000,
+                 -4.6070e9 / t ** 3 + 2.9678e6 / t ** 2 + 0.09911e3 / t + 0.244063,
+                 -2.0064e9 / t ** 3 + 1.9018e6 / t ** 2 + 0.24748e3 / t + 0.237040)
+    y = -3.000 * x ** 2 + 2.870 * x - 0.275
+    m = 0.0241 + 0.2562 * x - 0.7341 * y
+    return np.stack([np.ones_like(x), (-1.3515 - 1.7703 * x + 5.9114 * y) / m,
+                     (0.0300 - 31.4424 * x + 30.0717 * y) / m], axis=-1)
+
+
+def _daylight_components(wavelength: NDArray[float]) -> NDArray[float]:
+    table = tables.daylight_components()
+    return np.stack([np.interp(wavelength, table['wavelength'], table[name]) for name in ('S0', 'S1', 'S2')])
+
+
+def daylight(wavelength: NDArray[float], temperature: float | NDArray[float]) -> NDArray[float]:
+    """
+    Относительный спектр дневного света CIE серии D (100 на 560 нм).
+
+    Формулы координат цветности определены для температур 4000-25000 К.
+
+    :param wavelength: Длины волн в нанометрах (300-830 нм)
+    :param temperature: Коррелированная цветовая температура в кельвинах или массив температур
+    :return: Массив (температуры..., длины волн)
+    """
+    return _daylight_weights(temperature) @ _daylight_components(np.asarray(wavelength, dtype=np.float64))
+
+
+def _piecewise_gaussian(wavelength: NDArray[float], mu: float, sigma_left: float, sigma_right: float) -> NDArray[float]:
+    sigma = np.where(wavelength < mu, sigma_left, sigma_right)
+    return np.exp(-0.5 * np.square(wavelength - mu) / np.square(sigma))
+
+
+def analytic_cmf(wavelength: NDArray[float]) -> NDArray[float]:
+    """
+    Аналитическое приближение функций сложения цветов CIE 1931 (суммы кусочно-гауссовых функций,
+    Wyman, Sloan, Shirley, 2013). Не требует таблиц и вычисляется на любой шкале длин волн.
+
+    :param wavelength: Длины волн в нанометрах
+    :return: Массив (3, длины волн): x, y, z
+    """
+    wl = np.asarray(wavelength, dtype=np.float64)
+    return np.stack([
+        1.056 * _piecewise_gaussian(wl, 599.8, 37.9, 31.0) + 0.362 * _piecewise_gaussian(wl, 442.0, 16.0, 26.7)
+        - 0.065 * _piecewise_gaussian(wl, 501.1, 20.4, 26.2),
+        0.821 * _piecewise_gaussian(wl, 568.8, 46.9, 40.5) + 0.286 * _piecewise_gaussian(wl, 530.9, 16.3, 31.1),
+        1.217 * _piecewise_gaussian(wl, 437.0, 11.8, 36.0) + 0.681 * _piecewise_gaussian(wl, 459.0, 26.0, 13.8),
+    ])
+
+
+def xy_to_uv(xy: NDArray[float]) -> NDArray[float]:
+    """
+    Координаты цветности CIE 1960 UCS.
+
+    :param xy: Массив (..., 2) или (..., 3) (xyY)
+    :return: Массив (..., 2): u, v
+    """
+    xy = np.asarray(xy, dtype=np.float64)
+    x, y = xy[..., 0], xy[..., 1]
+    denominator = 12 * y - 2 * x + 3
+    return np.stack([4 * x / denominator, 6 * y / denominator], axis=-1)
+
+
+def _XYZ_to_uv(XYZ: NDArray[float]) -> NDArray[float]:
+    X, Y, Z = XYZ[..., 0], XYZ[..., 1], XYZ[..., 2]
+    denominator = X + 15 * Y + 3 * Z
+    return np.stack([4 * X / denominator, 6 * Y / denominator], axis=-1)
+
+
+def _color_rendering(source: NDArray[float], reference: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+    """
+    Специальные индексы цветопередачи и расстояние до эталона по CIE 13.3.
+
+    :param source: XYZ источника и образцов под ним (измерения, 1 + образцы, 3)
+    :param reference: XYZ эталонного источника и образцов под ним (измерения, 1 + образцы, 3)
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        # Y источника приводится к 100
+        source = source * (100 / source[:, :1, 1:2])
+        reference = reference * (100 / reference[:, :1, 1:2])
+        uv_s, uv_r = _XYZ_to_uv(source), _XYZ_to_uv(reference)
+        c_s = (4 - uv_s[..., 0] - 10 * uv_s[..., 1]) / uv_s[..., 1]
+        d_s = (1.708 * uv_s[..., 1] - 1.481 * uv_s[..., 0] + 0.404) / uv_s[..., 1]
+        c_r = (4 - uv_r[..., 0] - 10 * uv_r[..., 1]) / uv_r[..., 1]
+        d_r = (1.708 * uv_r[..., 1] - 1.481 * uv_r[..., 0] + 0.404) / uv_r[..., 1]
+
+        # адаптация фон Криса образцов под источником к белой точке эталона
+        c = c_r[:, :1] * c_s[:, 1:] / c_s[:, :1]
+        d = d_r[:, :1] * d_s[:, 1:] / d_s[:, :1]
+        denominator = 16.518 + 1.481 * c - d
+        u_adapted = (10.872 + 0.404 * c - 4 * d) / denominator
+        v_adapted = 5.52 / denominator
+
+        u_white, v_white = uv_r[:, :1, 0], uv_r[:, :1, 1]
+        W_s = 25 * np.cbrt(source[:, 1:, 1]) - 17
+        W_r = 25 * np.cbrt(reference[:, 1:, 1]) - 17
+        dE = np.sqrt(
+            np.square(W_s - W_r)
+            + np.square(13 * W_s * (u_adapted - u_white) - 13 * W_r * (uv_r[:, 1:, 0] - u_white))
+            + np.square(13 * W_s * (v_adapted - v_white) - 13 * W_r * (uv_r[:, 1:, 1] - v_white))
+        )
+    return 100 - 4.6 * dE, np.hypot(*(uv_s[:, 0] - uv_r[:, 0]).T)
+
+
+def approximate_cct(xy: NDArray[float], exponential: bool = True) -> NDArray[float]:
+    """
+    Коррелированная цветовая температура по приближенной формуле.
+
+    :param xy: Массив (..., 2) или (..., 3) (xyY)
+    :param bool exponential: Экспоненциальная формула Эрнандес-Андреса. `False` - кубическая формула МакКами.
+    :return: Температура в кельвинах, массив формы `xy.shape[:-1]`
+    """
+    xy = np.asarray(xy, dtype=np.float64)
+    p = (xy[..., 0] - 0.332) / (xy[..., 1] - 0.1858)
+    if not exponential:
+        return 5520.33 - 6823.3 * p + 3525 * p ** 2 - 449 * p ** 3
+    return -949.8 + 6253.8 * np.exp(-p / 0.92) + 28.7 * np.exp(-p / 0.2) + 0.00004 * np.exp(-p / 0.07)
+
+
+class PlanckianLocus:
+    """
+    Локус Планка в координатах CIE 1960 UCS и оценка коррелированной цветовой температуры и Duv.
+
+    Таблица локуса (равномерная по обратной температуре, в майредах) строится один раз для функций
+    сложения цветов и сетки длин волн. Температура находится методом Робертсона: для каждой точки
+    векторизованным двоичным поиском находится пара соседних изотерм таблицы (знак расстояния до изотермы
+    монотонно меняется вдоль локуса), и температура линейно интерполируется в майредах между ними.
+    Duv - расстояние до локуса со знаком (положительное выше локуса).
+    """
+
+    def __init__(self,
+                 cmf: NDArray[float],
+                 wavelength: NDArray[float],
+                 temperature_range: tuple[float, float] = (1000, 100_000),
+                 mired_step: float = 0.5):
+        """
+        :param cmf: Функции сложения цветов на сетке (3 x сетка)
+        :param wavelength: Сетка длин волн
+        :param temperature_range: Диапазон температур таблицы, К
+        :param float mired_step: Шаг таблицы в майредах (10^6 / T)
+        """
+        lo, hi = temperature_range
+        self.mired: NDArray[float] = _frozen(np.arange(1e6 / hi, 1e6 / lo + mired_step, mired_step))
+        """Узлы таблицы в майредах (по возрастанию, т.е. по убыванию температуры)"""
+        self.uv: NDArray[float] = _frozen(_XYZ_to_uv(planck(wavelength, 1e6 / self.mired) @ np.asarray(cmf).T))
+        """Координаты uv локуса в узлах таблицы (узлы x 2)"""
+        # единичные касательные к локусу в направлении роста майредов; изотермы им перпендикулярны
+        tangent = np.gradient(self.uv, self.mired, axis=0)
+        self._tangent = _frozen(tangent / np.hypot(tangent[:, 0], tangent[:, 1])[:, None])
+
+    def __distance(self, uv: NDArray[float], index: NDArray[int]) -> NDArray[float]:
+        """Расстояние со знаком от точек до изотерм `index`: положительное за изотермой (в сторону роста майредов)."""
+        return np.einsum('ij,ij->i', uv - self.uv[index], self._tangent[index])
+
+    def cct(self, uv: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+        """
+        Коррелированная цветовая температура и Duv.
+
+        :param uv: Координаты CIE 1960 UCS (..., 2)
+        :return: Температура в кельвинах и Duv, массивы формы `uv.shape[:-1]`.
+            Для точек вне диапазона таблицы - `nan`.
+        """
+        uv = np.asarray(uv, dtype=np.float64)
+        shape = uv.shape[:-1]
+        uv = uv.reshape(-1, 2)
+        n = len(self.mired)
+
+        lo = np.zeros(len(uv), dtype=np.intp)
+        hi = np.full(len(uv), n - 1, dtype=np.intp)
+        inside = (self.__distance(uv, lo) >= 0) & (self.__distance(uv, hi) <= 0)
+        for _ in range(int(np.ceil(np.log2(n)))):
+            middle = (lo + hi) // 2
+            ahead = self.__distance(uv, middle) >= 0
+            lo = np.where(ahead, middle, lo)
+            hi = np.where(ahead, hi, middle)
+
+        hi = np.minimum(lo + 1, n - 1)
+        d_lo, d_hi = self.__distance(uv, lo), self.__distance(uv, hi)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            fraction = np.clip(np.where(d_lo != d_hi, d_lo / (d_lo - d_hi), 0), 0, 1)
+        mired = self.mired[lo] + fraction * (self.mired[hi] - self.mired[lo])
+
+        locus = self.uv[lo] + fraction[:, None] * (self.uv[hi] - self.uv[lo])
+        tangent = self._tangent[lo] + fraction[:, None] * (self._tangent[hi] - self._tangent[lo])
+        offset = uv - locus
+        side = np.sign(tangent[:, 0] * offset[:, 1] - tangent[:, 1] * offset[:, 0])
+        duv = side * np.hypot(offset[:, 0], offset[:, 1])
+
+        cct = np.where(inside, 1e6 / mired, np.nan)
+        duv = np.where(inside, duv, np.nan)
+        return cct.reshape(shape), duv.reshape(shape)
+
+
+@dataclass(frozen=True, slots=True)
+class ColorRendering:
+    """Индексы цветопередачи (CIE 13.3) для каждого измерения"""
+    ra: NDArray[float]
+    """Общий индекс цветопередачи Ra (среднее R1-R8)"""
+    ri: NDArray[float]
+    """Специальные индексы цветопередачи R1, R2, ... (измерения, образцы)"""
+    cct: NDArray[float]
+    """Цветовая температура эталонного источника, К"""
+    dc: NDArray[float]
+    """Расстояние между цветностями источника и эталона в координатах uv. CIE 13.3 требует `dc < 5.4e-3`."""
+
+
+@dataclass(frozen=True, slots=True)
+class LedMetrics:
+    """Параметры светодиода для каждого измерения"""
+    xyY: NDArray[float]
+    """Координаты цветности xyY (измерения, 3)"""
+    uv: NDArray[float]
+    """Координаты цветности CIE 1960 UCS (измерения, 2)"""
+    cct: NDArray[float]
+    """Коррелированная цветовая температура, К"""
+    duv: NDArray[float]
+    """Расстояние до локуса Планка в координатах uv со знаком"""
+    luminous_power: NDArray[float]
+    """Световая мощность (взвешенная функцией видности)"""
+    color_rendering: Optional[ColorRendering] = None
+    """Индексы цветопередачи, если заданы тестовые образцы цвета"""
+
+
+class LedAnalysis:
+    """
+    Вычисление параметров светодиодов для множества спектров.
+
+    Таблицы передаются структурированными массивами `numpy`:
+
+    - наблюдатель - поля `wavelength`, `X`, `Y`, `Z` (функции сложения цветов, как в `Colorimetry`);
+    - функция видности - поля `wavelength`, `V`;
+    - тестовые образцы цвета (для индекса цветопередачи) - поля `wavelength`, `reflectance`
+      (коэффициенты отражения всех образцов, подмассив).
+
+    Таблицы интерполируются на сетку один раз при создании объекта. Образцы хранятся матрицей,
+    поэтому индексы цветопередачи всех образцов для всех измерений вычисляются одним матричным
+    произведением. Эталонный источник, как в CIE 13.3, - абсолютно черное тело с той же цветовой
+    температурой ниже 5000 К и дневной свет серии D от 5000 К; его координаты кэшируются
+    для каждой температуры (с шагом 1 К).
+
+    Пример использования:
+    ```python
+    analysis = LedAnalysis(observer, efficiency)
+    metrics = analysis(spectrometer.read(n_times=100))
+    print(metrics.cct)
+    ```
+    """
+
+    def __init__(self,
+                 observer: Optional[NDArray] = None,
+                 efficiency: Optional[NDArray] = None,
+                 wavelength: Optional[NDArray[float]] = None,
+                 samples: Optional[NDArray] = None,
+                 cache_size: int = 4096):
+        """
+        :param observer: Функции сложения цветов наблюдателя. По умолчанию - `tables.observer('2deg')`.
+        :param efficiency: Функция видности. По умолчанию - `tables.efficiency()`.
+        :param wavelength: Общая сетка длин волн. По умолчанию 400-780 нм с шагом 1 нм.
+        :type wavelength: NDArray[float] | None
+        :param samples: Тестовые образцы цвета. Без них индекс цветопередачи не вычисляется. Стандартные - `tables.color_samples()`.
+        :param int cache_size: Количество цветовых температур, для которых хранятся координаты эталонного источника
+        """
+        if observer is None:
+            observer = tables.observer()
+        if efficiency is None:
+            efficiency = tables.efficiency()
+        if wavelength is None:
+            wavelength = np.arange(400, 781, dtype=np.float64)
+        self.wavelength: NDArray[float] = _frozen(np.array(wavelength, dtype=np.float64))
+        """Общая сетка длин волн"""
+        self.resampler = Resampler(self.wavelength, method='nearest', fill_value=None)
+
+        self.cmf: NDArray[float] = _frozen(np.stack([
+            np.interp(self.wavelength, observer['wavelength'], observer[name]) for name in ('X', 'Y', 'Z')
+        ]))
+        """Функции сложения цветов на сетке (3 x сетка)"""
+        self.efficiency: NDArray[float] = _frozen(
+            np.interp(self.wavelength, efficiency['wavelength'], efficiency['V']))
+        """Функция видности на сетке"""
+        self._xyz_weights = _frozen(np.ascontiguousarray((self.cmf / self.cmf[1].sum()).T))
+        self._daylight = _frozen(_daylight_components(self.wavelength))
+
+        self.reflectance: Optional[NDArray[float]] = None
+        """Коэффициенты отражения тестовых образцов на сетке (образцы x сетка)"""
+        self._cri_weights = None
+        if samples is not None:
+            reflectance = np.atleast_2d(np.asarray(samples['reflectance'], dtype=np.float64).T)
+            self.reflectance = _frozen(np.stack([
+                np.interp(self.wavelength, samples['wavelength'], row) for row in reflectance
+            ]))
+            # XYZ источника и каждого образца под ним: столбцы (1 + образцы) x 3
+            weights = np.concatenate([np.ones((1, len(self.wavelength))), self.reflectance])[:, None, :] * self.cmf
+            self._cri_weights = _frozen(np.ascontiguousarray(weights.reshape(-1, len(self.wavelength)).T))
+        self._cache_size = max(1, cache_size)
+        self._references: OrderedDict[int, NDArray[float]] = OrderedDict()
+        self._locus: Optional[PlanckianLocus] = None
+
+    def resample(self, data: Data | NDArray, wavelength: Optional[NDArray[float]] = None) -> NDArray[float]:
+        """
+        Переводит спектры на общую сетку (значения ближайших отсчетов).
+
+        :param data: Спектр или массив интенсивностей (отсчеты или измерения x отсчеты)
+        :param wavelength: Шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :return: Массив (..., сетка)
+        """
+        if wavelength is None:
+            wavelength = getattr(data, 'wavelength', None)
+        if wavelength is None:
+            raise ValueError('Wavelength axis is not set')
+        intensity = data.intensity if isinstance(data, Data) else data
+        return self.resampler.apply(intensity, wavelength)
+
+    @staticmethod
+    def normalize(spd: NDArray[float]) -> NDArray[float]:
+        """
+        Нормирует каждый спектр на диапазон [0, 1].
+
+        :param spd: Массив (..., сетка)
+        """
+        spd = np.asarray(spd, dtype=np.float64)
+        lo = spd.min(axis=-1, keepdims=True)
+        return (spd - lo) / (spd.max(axis=-1, keepdims=True) - lo)
+
+    def XYZ(self, spd: NDArray[float]) -> NDArray[float]:
+        """
+        Координаты цвета спектров на сетке (равноэнергетический источник, `Y = 1` для единичного спектра).
+
+        :param spd: Массив (..., сетка)
+        :return: Массив (..., 3)
+        """
+        return np.asarray(spd, dtype=np.float64) @ self._xyz_weights
+
+    def xyY(self, spd: NDArray[float]) -> NDArray[float]:
+        """
+        Координаты цветности спектров на сетке.
+
+        :param spd: Массив (..., сетка)
+        :return: Массив (..., 3)
+        """
+        return XYZ_to_xyY(self.XYZ(spd))
+
+    def luminous_power(self, spd: NDArray[float]) -> NDArray[float]:
+        """
+        Световая мощность: спектр, взвешенный функцией видности.
+
+        :param spd: Массив (..., сетка)
+        :return: Массив формы `spd.shape[:-1]`
+        """
+        return np.asarray(spd, dtype=np.float64) @ self.efficiency * (KM / LIGHT_VELOCITY)
+
+    def blackbody(self, temperature: float | NDArray[float]) -> NDArray[float]:
+        """
+        Спектры абсолютно черного тела на сетке.
+
+        :param temperature: Температура в кельвинах или массив температур
+        :return: Массив (температуры..., сетка)
+        """
+        return planck(self.wavelength, temperature)
+
+    def reference(self, temperature: float | NDArray[float]) -> NDArray[float]:
+        """
+        Спектры эталонных источников для индекса цветопередачи (CIE 13.3) на сетке:
+        абсолютно черное тело ниже 5000 К, дневной свет серии D от 5000 К.
+        Спектры разных типов имеют разный масштаб, индексы от него не зависят.
+
+        :param temperature: Температура в кельвинах или массив температур
+        :return: Массив (температуры..., сетка)
+        """
+        temperature = np.asarray(temperature, dtype=np.float64)
+        is_daylight = (temperature >= _DAYLIGHT_CCT)[..., None]
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            return np.where(is_daylight, _daylight_weights(temperature) @ self._daylight,
+                            planck(self.wavelength, temperature))
+
+    @property
+    def locus(self) -> PlanckianLocus:
+        """Таблица локуса Планка для функций сложения цветов на сетке (строится при первом обращении)."""
+        if self._locus is None:
+            self._locus = PlanckianLocus(self.cmf, self.wavelength)
+        return self._locus
+
+    def cct_duv(self, xy: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+        """
+        Коррелированная цветовая температура и Duv (метод Робертсона по таблице локуса Планка).
+
+        :param xy: Координаты цветности (..., 2) или xyY (..., 3)
+        :return: Температура в кельвинах и Duv
+        """
+        return self.locus.cct(xy_to_uv(xy))
+
+    def cct(self, xy: NDArray[float]) -> NDArray[float]:
+        """
+        Коррелированная цветовая температура.
+
+        :param xy: Координаты цветности (..., 2) или xyY (..., 3)
+        :return: Температура в кельвинах
+        """
+        return self.cct_duv(xy)[0]
+
+    def __reference(self, cct: NDArray[float]) -> NDArray[float]:
+        """XYZ эталонных источников и образцов под ними для цветовых температур `cct` (кэшируются)."""
+        keys = np.round(cct / _CCT_RESOLUTION)
+        valid = np.isfinite(keys) & (keys > 0)
+        result = np.full((len(cct), self._cri_weights.shape[1]), np.nan)
+        unique, inverse = np.unique(keys[valid].astype(np.int64), return_inverse=True)
+
+        cache = self._references
+        missing = [key for key in unique.tolist() if key not in cache]
+        if missing:
+            values = self.reference(np.array(missing) * _CCT_RESOLUTION) @ self._cri_weights
+            cache.update(zip(missing, values))
+        rows = np.empty((len(unique), result.shape[1]))
+        for i, key in enumerate(unique.tolist()):
+            rows[i] = cache[key]
+            cache.move_to_end(key)
+        while len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+        result[valid] = rows[inverse]
+        return result
+
+    def color_rendering(self, spd: NDArray[float], cct: Optional[NDArray[float]] = None) -> ColorRendering:
+        """
+        Индексы цветопередачи (CIE 13.3) всех спектров.
+
+        :param spd: Массив (измерения, сетка) или один спектр на сетке
+        :param cct: Цветовая температура эталонных источников. По умолчанию - `cct` спектров.
+        :type cct: NDArray[float] | None
+        :raises ValueError: Если тестовые образцы не заданы
+        :rtype: ColorRendering
+        """
+        if self._cri_weights is None:
+            raise ValueError('Test color samples are not set')
+        spd = np.asarray(spd, dtype=np.float64)
+        shape = spd.shape[:-1]
+        spd = spd.reshape(-1, len(self.wavelength))
+        if cct is None:
+            cct = self.cct(self.xyY(spd))
+        else:
+            cct = np.broadcast_to(np.asarray(cct, dtype=np.float64), shape).reshape(-1)
+
+        n_columns = self._cri_weights.shape[1]
+        source = (spd @ self._cri_weights).reshape(len(spd), n_columns // 3, 3)
+        reference = self.__reference(cct).reshape(len(spd), n_columns // 3, 3)
+        ri, dc = _color_rendering(source, reference)
+        return ColorRendering(
+            ra=ri[:, :_RA_SAMPLES].mean(axis=1).reshape(shape),
+            ri=ri.reshape(shape + ri.shape[1:]),
+            cct=cct.reshape(shape),
+            dc=dc.reshape(shape),
+        )
+
+    def __call__(self, data: Data | NDArray, wavelength: Optional[NDArray[float]] = None) -> LedMetrics:
+        """
+        Параметры всех измерений.
+
+        :param data: Спектр или массив интенсивностей (измерения x отсчеты)
+        :param wavelength: Шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :rtype: LedMetrics
+        """
+        spd = self.resample(data, wavelength)
+        xyY = self.xyY(spd)
+        uv = xy_to_uv(xyY)
+        cct, duv = self.locus.cct(uv)
+        return LedMetrics(
+            xyY=xyY,
+            uv=uv,
+            cct=cct,
+            duv=duv,
+            luminous_power=self.luminous_power(spd),
+            color_rendering=self.color_rendering(spd, cct) if self._cri_weights is not None else None,
+        )
@@ -0,0 +1,287 @@
+"""
+Спектральная пирометрия: температура по спектру теплового излучения в координатах Вина.
+
+В приближении Вина `ln(lambda^4 * N) = ln(eps) + const - C2 / (lambda * T)`, поэтому в координатах
+`x = C2 / lambda`, `y = ln(lambda^4 * N)` спектр - прямая с наклоном `-1 / T`. Поправка на излучательную
+способность и чувствительность прибора берется из калибровочного спектра с известной температурой.
+
+Для заданного диапазона длин волн поправка, координаты `x`, их центрированная сумма квадратов и
+критическое значение распределения Стьюдента вычисляются один раз, после чего прямые для всех
+измерений находятся методом наименьших квадратов в замкнутом виде - матричными операциями над блоками измерений.
+"""
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+import scipy.stats
+from numpy.typing import NDArray
+
+from .colorimetry import _frozen
+from .data import Data
+
+C2 = 14_388 * 1000
+"""Вторая радиационная постоянная, нм К"""
+
+# Значение, которым заменяются неположительные интенсивности перед логарифмированием
+_FLOOR = 0.1
+# Количество элементов в блоке измерений, обрабатываемом за один проход (помещается в кэш процессора)
+_FIT_BLOCK = 1 << 15
+
+
+def to_wien(wavelength: NDArray[float], intensity: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+    """
+    Координаты Вина.
+
+    :param wavelength: Длины волн в нанометрах
+    :param intensity: Интенсивности (..., отсчеты). Неположительные значения заменяются на 0.1.
+    :return: `x = C2 / lambda` и `y = ln(lambda^4 * N)` (..., отсчеты)
+    """
+    wavelength = np.asarray(wavelength, dtype=np.float64)
+    intensity = np.asarray(intensity, dtype=np.float64)
+    return C2 / wavelength, np.log(wavelength ** 4 * np.where(intensity > 0, intensity, _FLOOR))
+
+
+@dataclass(frozen=True, slots=True)
+class PyrometryResult:
+    """Результаты пирометрии для каждого измерения"""
+    temperature: NDArray[float]
+    """Температура, К"""
+    deviation: NDArray[float]
+    """Полуширина доверительного интервала температуры, К"""
+    slope: NDArray[float]
+    """Наклон прямой в координатах Вина (`-1 / T`)"""
+    intercept: NDArray[float]
+    """Свободный член прямой в координатах Вина"""
+
+
+class Pyrometry:
+    """
+    Определение температуры по спектрам теплового излучения.
+
+    Пример использования:
+    ```python
+    pyrometry = Pyrometry(calibration, 2200, wavelength_range=(500, 1000))
+    result = pyrometry(spectrometer.read(n_times=10_000))
+    print(result.temperature, result.deviation)
+    ```
+    """
+
+    def __init__(self,
+                 calibration: Data,
+                 calibration_temperature: float,
+                 wavelength_range: tuple[float, float],
+                 wavelength: NDArray[float] | None = None,
+                 confidence: float = 0.95):
+        """
+        :param calibration: Спектр излучателя с известной температурой. Используется последнее измерение.
+        :param float calibration_temperature: Температура калибровочного излучателя, К
+        :param wavelength_range: Диапазон длин волн для аппроксимации, нм
+        :param wavelength: Шкала длин волн. По умолчанию - `calibration.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :param float confidence: Доверительная вероятность для погрешности температуры
+        """
+        if wavelength is None:
+            wavelength = getattr(calibration, 'wavelength', None)
+        if wavelength is None:
+            raise ValueError('Wavelength axis is not set')
+        self.wavelength: NDArray[float] = _frozen(np.array(wavelength, dtype=np.float64))
+        """Шкала длин волн"""
+        self.calibration_temperature = calibration_temperature
+        self.wavelength_range = wavelength_range
+        self.confidence = confidence
+
+        x, y = to_wien(self.wavelength, calibration.intensity[-1])
+        n = len(x)
+        # поправка: калибровочный спектр, приведенный к прямой -x / T
+        self.correction: NDArray[float] = _frozen(-x / calibration_temperature - y)
+        """Поправка к координате `y` для каждого отсчета"""
+
+        # границы - ближайшие отсчеты к краям диапазона в порядке возрастания x (правая не включается)
+        lo, hi = C2 / max(wavelength_range), C2 / min(wavelength_range)
+        ascending = x[::-1]
+        start, stop = np.abs(ascending - lo).argmin(), np.abs(ascending - hi).argmin()
+        if stop - start < 2:
+            raise ValueError('Wavelength range must contain at least two samples')
+        self.window = slice(n - stop, n - start)
+        """Отсчеты, по которым строится прямая"""
+
+        self._x = _frozen(x[self.window])
+        self._x_mean = self._x.mean()
+        self._x_centered = _frozen(self._x - self._x_mean)
+        self._sxx = float(self._x_centered @ self._x_centered)
+        self._log_wavelength = _frozen(4 * np.log(self.wavelength[self.window]) + self.correction[self.window])
+        # число степеней свободы считается по всем отсчетам спектра
+        self._dof = n - 2
+        self._t = float(scipy.stats.t.interval(confidence, df=self._dof)[1])
+
+    def wien(self, intensity: NDArray[float]) -> tuple[NDArray[float], NDArray[float]]:
+        """
+        Координаты Вина с поправкой по калибровке, по возрастанию `x`.
+
+        :param intensity: Интенсивности (..., отсчеты)
+        :return: `x` и `y` (..., отсчеты)
+        """
+        x, y = to_wien(self.wavelength, intensity)
+        return x[::-1], (y + self.correction)[..., ::-1]
+
+    def __call__(self, data: Data | NDArray) -> PyrometryResult:
+        """
+        Температура для всех измерений.
+
+        :param data: Спектр или массив интенсивностей (отсчеты или измерения x отсчеты) на шкале калибровки.
+            Входные данные не изменяются.
+        :rtype: PyrometryResult
+        """
+        intensity = data.intensity if isinstance(data, Data) else np.asarray(data)
+        if intensity.shape[-1] != len(self.wavelength):
+            raise ValueError('Data has incorrect number of pixels')
+
+        shape = intensity.shape[:-1]
+        window = intensity.reshape(-1, intensity.shape[-1])[:, self.window]
+        n = len(window)
+        slope, intercept, deviation = np.empty(n), np.empty(n), np.empty(n)
+        step = max(1, _FIT_BLOCK // window.shape[1])
+        buffers = self._buffers(min(step, n))
+        for start in range(0, n, step):
+            rows = slice(start, min(start + step, n))
+            self._fit(window[rows], *(buffer[:rows.stop - rows.start] for buffer in buffers),
+                      slope[rows], intercept[rows], deviation[rows])
+
+        return PyrometryResult(
+            temperature=(-1 / slope).reshape(shape),
+            deviation=deviation.reshape(shape),
+            slope=slope.reshape(shape),
+            intercept=intercept.reshape(shape),
+        )
+
+    def _buffers(self, n: int) -> tuple[NDArray[float], NDArray[bool], NDArray[float]]:
+        """Рабочие буферы `_fit` для `n` измерений: координаты `y`, маска неположительных значений, вектор."""
+        k = self.window.stop - self.window.start
+        return np.empty((n, k)), np.empty((n, k), dtype=bool), np.empty(n)
+
+    def _fit(self, window: NDArray, y: NDArray[float], mask: NDArray[bool], scratch: NDArray[float],
+             slope: NDArray[float], intercept: NDArray[float], deviation: NDArray[float]) -> None:
+        """
+        Аппроксимация прямыми в координатах Вина для блока измерений. Все вычисления выполняются
+        в переданных буферах, новые массивы не выделяются.
+
+        :param window: Интенсивности отсчетов диапазона (измерения x отсчеты)
+        :param y: Буфер той же формы для координат `y`
+        :param mask: Буфер той же формы для маски неположительных интенсивностей
+        :param scratch: Буфер (измерения,)
+        :param slope: Выход: наклоны
+        :param intercept: Выход: свободные члены
+        :param deviation: Выход: погрешности температуры
+        """
+        np.copyto(y, window)
+        np.less_equal(y, 0, out=mask)
+        np.copyto(y, _FLOOR, where=mask)
+        np.log(y, out=y)
+        y += self._log_wavelength
+
+        # метод наименьших квадратов в замкнутом виде:
+        # сумма квадратов остатков = sum(y^2) - k * mean(y)^2 - slope^2 * Sxx
+        k = y.shape[1]
+        np.matmul(y, self._x_centered, out=slope)
+        slope /= self._sxx
+        np.sum(y, axis=1, out=intercept)
+        intercept /= k
+        np.einsum('ij,ij->i', y, y, out=deviation)
+        np.multiply(intercept, intercept, out=scratch)
+        scratch *= k
+        deviation -= scratch
+        np.multiply(slope, slope, out=scratch)
+        scratch *= self._sxx
+        deviation -= scratch
+        np.maximum(deviation, 0, out=deviation)
+        deviation /= self._dof * self._sxx
+        np.sqrt(deviation, out=deviation)
+        deviation *= self._t
+        np.multiply(slope, slope, out=scratch)
+        deviation /= scratch
+        np.multiply(slope, self._x_mean, out=scratch)
+        intercept -= scratch
+
+
+class PyrometryMeter:
+    """
+    Потоковое определение температуры.
+
+    Объект можно передавать как callback в `Spectrometer.read_non_block` и `Spectrometer.read_non_stop`.
+    Окно отсчетов, поправка и параметры аппроксимации берутся из `Pyrometry`, рабочие буферы выделяются
+    один раз, поэтому обработка каждого спектра - O(отсчеты) операций на измерение без выделения памяти.
+    Период обновления равен `frames_interval * exposure`.
+
+    ```python
+    meter = PyrometryMeter(Pyrometry(calibration, 2200, (500, 1000)), on_result=control)
+    spectrometer.read_non_stop(meter, frames_interval=10)
+    ```
+    """
+
+    def __init__(self,
+                 pyrometry: Pyrometry,
+                 frames: int = 100,
+                 on_result: Optional[Callable[[PyrometryResult], None]] = None):
+        """
+        :param pyrometry: Калибровка и диапазон длин волн
+        :type pyrometry: Pyrometry
+        :param int frames: Ожидаемое количество измерений в одном спектре (`frames_interval`).
+            При получении большего количества буферы увеличиваются.
+        :param on_result: Функция, вызываемая с результатами для каждого полученного спектра
+        """
+        self.pyrometry = pyrometry
+        self._on_result = on_result
+        self.__allocate(max(1, frames))
+        self._last = 0
+        self.position = 0
+        """Количество обработанных измерений от начала потока"""
+
+    def __allocate(self, frames: int) -> None:
+        self._buffers = self.pyrometry._buffers(frames)
+        self._temperature, self._deviation, self._slope, self._intercept = np.empty((4, frames))
+
+    @property
+    def temperature(self) -> float:
+        """Температура последнего измерения, К (`nan` до первого измерения)"""
+        return float(self._temperature[self._last]) if self.position else np.nan
+
+    @property
+    def deviation(self) -> float:
+        """Погрешность температуры последнего измерения, К (`nan` до первого измерения)"""
+        return float(self._deviation[self._last]) if self.position else np.nan
+
+    def reset(self) -> None:
+        """Сбрасывает счетчик измерений."""
+        self.position = 0
+
+    def update(self, data: Data | NDArray) -> PyrometryResult:
+        """
+        Вычисляет температуру для всех измерений спектра.
+
+        :param data: Спектр или массив интенсивностей (отсчеты или измерения x отсчеты) на шкале калибровки
+        :return: Результаты для каждого измерения. Массивы - представления внутренних буферов,
+            они перезаписываются при следующем вызове.
+        :rtype: PyrometryResult
+        """
+        intensity = data.intensity if isinstance(data, Data) else np.asarray(data)
+        if intensity.shape[-1] != len(self.pyrometry.wavelength):
+            raise ValueError('Data has incorrect number of pixels')
+        window = np.atleast_2d(intensity)[:, self.pyrometry.window]
+        n = len(window)
+        if n > len(self._temperature):
+            self.__allocate(n)
+
+        temperature, deviation = self._temperature[:n], self._deviation[:n]
+        slope, intercept = self._slope[:n], self._intercept[:n]
+        self.pyrometry._fit(window, *(buffer[:n] for buffer in self._buffers), slope, intercept, deviation)
+        np.divide(-1, slope, out=temperature)
+
+        self._last = n - 1
+        self.position += n
+        result = PyrometryResult(temperature=temperature, deviation=deviation, slope=slope, intercept=intercept)
+        if self._on_result is not None:
+            self._on_result(result)
+        return result
+
+    def __call__(self, data: Data) -> None:
+        self.update(data)
@@ -0,0 +1,473 @@
+"""
+Запись длительных измерений в файл с дозаписью.
+
+Запись состоит из двух файлов:
+
+- файл данных: преамбула (`MAGIC`, версия, длина заголовка), JSON-заголовок, массив длин волн
+  и блоки измерений. Каждый блок содержит до `chunk_frames` измерений: массив интенсивностей
+  (`<f8`), затем массив флагов зашкаливания (`|b1`). Все массивы выровнены по 64 байтам.
+  Если в заголовке указано сжатие (`compression`), блок закодирован `pyspectrum.chunk_codec`.
+- файл индекса (`<путь>.idx`): по одной записи `INDEX_DTYPE` на блок - номер первого измерения,
+  количество измерений, экспозиция, время начала первого измерения и положение блока в файле данных.
+
+Запись индекса добавляется только после записи блока, поэтому индекс никогда не ссылается
+на незаписанные данные.
+"""
+import json
+import math
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import chunk_codec
+from .data import Data, Spectrum
+
+MAGIC = b'PYSPREC1'
+VERSION = 2
+ALIGNMENT = 64
+INDEX_SUFFIX = '.idx'
+
+INDEX_DTYPE = np.dtype([
+    ('frame', '<u8'),
+    ('n_frames', '<u4'),
+    ('exposure', '<u4'),
+    ('timestamp', '<f8'),
+    ('offset', '<u8'),
+    ('size', '<u8'),
+])
+
+_PREAMBLE = struct.Struct('<8sII')
+
+
+def _align(offset: int) -> int:
+    return (offset + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+def _pad(f) -> int:
+    offset = _align(f.tell())
+    f.write(b'\0' * (offset - f.tell()))
+    return offset
+
+
+class Recorder:
+    """
+    Записывает поступающие кадры в файл с дозаписью блоками фиксированного размера.
+
+    Запись на диск выполняется в отдельном потоке: `write` только ставит кадр в очередь,
+    поэтому задержки диска не останавливают чтение со спектрометра. Объект можно передавать
+    как callback в `Spectrometer.read_non_block` и `Spectrometer.read_non_stop`.
+
+    Блоки можно сжимать без потерь (`compression='zlib'` или `'lzma'`, см. `pyspectrum.chunk_codec`).
+    Сжатие выполняется параллельно в пуле потоков, блоки записываются в исходном порядке.
+
+    Пример использования:
+    ```python
+    with Recorder('run.rec', chunk_frames=1000, compression='zlib') as recorder:
+        spectrometer.read_non_stop(recorder, frames_interval=100)
+        ...
+        spectrometer.stop_reading()
+
+    reader = RecordingReader('run.rec')
+    spectrum = reader.time_range(t0, t0 + 1.5)
+    ```
+    """
+
+    def __init__(self,
+                 path: str,
+                 chunk_frames: int = 1000,
+                 max_queue: int = 0,
+                 compression: Optional[str] = None,
+                 level: Optional[int] = None,
+                 quantum: float = 1.0,
+                 workers: Optional[int] = None):
+        """
+        :param str path: Путь к файлу данных. Индекс записывается в файл `<path>.idx`.
+        :param int chunk_frames: Количество измерений в одном блоке.
+        :param int max_queue: Максимальная длина очереди записи, 0 - без ограничения.
+        :param compression: Сжатие блоков: `'zlib'`, `'lzma'` или `None`.
+        :type compression: str | None
+        :param level: Уровень сжатия.
+        :type level: int | None
+        :param float quantum: Шаг значений интенсивности. Интенсивности, кратные ему (например,
+            `FactoryConfig.intensity_scale` для сырых данных), хранятся как целые отсчеты.
+        :param workers: Количество потоков сжатия. По умолчанию - количество процессоров.
+        :type workers: int | None
+        """
+        if chunk_frames < 1:
+            raise ValueError('chunk_frames must be positive')
+        if compression not in chunk_codec.COMPRESSIONS:
+            raise ValueError(f'Unknown compression: {compression}')
+        if not quantum > 0:
+            raise ValueError('quantum must be positive')
+
+        self.path = path
+        self.chunk_frames = chunk_frames
+        self._codec = None if compression is None else _Codec(compression, level, quantum, workers)
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+
+        self._data_file = open(path, 'wb')
+        self._index_file = open(path + INDEX_SUFFIX, 'wb')
+        self._thread = threading.Thread(target=self._run, name='pyspectrum-recorder', daemon=True)
+        self._thread.start()
+
+    def write(self, data: Data, timestamp: Optional[float] = None) -> None:
+        """
+        Ставит кадр в очередь на запись. Массивы кадра не копируются и не должны изменяться после вызова.
+
+        :param data: Кадр
+        :type data: Data
+        :param timestamp: Время начала первого измерения кадра (`time.time()`).
+            По умолчанию вычисляется из текущего времени и экспозиции.
+        :type timestamp: float | None
+        """
+        self._check_error()
+        if self._closed:
+            raise RuntimeError('Recorder is closed')
+        if timestamp is None:
+            timestamp = time.time() - data.n_times * data.exposure / 1000
+        self._queue.put((data, timestamp))
+
+    def __call__(self, data: Data) -> None:
+        self.write(data)
+
+    def close(self) -> None:
+        """Записывает оставшиеся кадры, дожидается окончания записи и закрывает файлы."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+            self._data_file.close()
+            self._index_file.close()
+        self._check_error()
+
+    def _check_error(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError('Recording failed') from error
+
+    def __enter__(self) -> 'Recorder':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    # --------        writer thread        --------
+    def _run(self) -> None:
+        writer = None
+        stopped = False
+        try:
+            while True:
+                item = self._queue.get()
+                if item is None:
+                    stopped = True
+                    break
+                data, timestamp = item
+                if writer is None:
+                    writer = _ChunkWriter(self._data_file, self._index_file, self.chunk_frames, data, self._codec)
+                writer.append(data, timestamp)
+            if writer is not None:
+                writer.flush()
+                writer.drain(block=True)
+        except BaseException as e:
+            self._error = e
+            # освобождаем очередь, чтобы write не блокировался на заполненной очереди
+            while not stopped and self._queue.get() is not None:
+                pass
+        finally:
+            if self._codec is not None:
+                self._codec.executor.shutdown()
+
+
+class _Codec:
+    def __init__(self, compression: str, level: Optional[int], quantum: float, workers: Optional[int]):
+        self.compression = compression
+        self.level = level
+        self.quantum = quantum
+        workers = workers or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pyspectrum-compress')
+        self.max_pending = 2 * workers
+
+    def encode(self, intensity: NDArray, clipped: NDArray) -> bytes:
+        return chunk_codec.encode(intensity, clipped, self.compression, self.level, self.quantum)
+
+
+class _ChunkWriter:
+    def __init__(self, data_file, index_file, chunk_frames: int, first: Data, codec: Optional[_Codec]):
+        self._data_file = data_file
+        self._index_file = index_file
+        self._codec = codec
+        self._pending: deque[tuple[tuple, Future]] = deque()
+        self._n_numbers = first.n_numbers
+        wavelength = getattr(first, 'wavelength', None)
+
+        header = json.dumps({
+            'n_numbers': self._n_numbers,
+            'chunk_frames': chunk_frames,
+            'wavelength': wavelength is not None,
+            'compression': None if codec is None else codec.compression,
+        }).encode('utf-8')
+        data_file.write(_PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        data_file.write(header)
+        if wavelength is not None:
+            _pad(data_file)
+            data_file.write(np.ascontiguousarray(wavelength, dtype='<f8').tobytes())
+
+        self._intensity = np.empty((chunk_frames, self._n_numbers), dtype='<f8')
+        self._clipped = np.empty((chunk_frames, self._n_numbers), dtype=np.bool_)
+        self._filled = 0
+        self._frame = 0
+        self._exposure = first.exposure
+        self._timestamp = 0.0
+
+    def append(self, data: Data, timestamp: float) -> None:
+        if data.n_numbers != self._n_numbers:
+            raise ValueError('Data has incorrect number of pixels')
+        if data.exposure != self._exposure:
+            # в блоке хранится одна экспозиция
+            self.flush()
+            self._exposure = data.exposure
+
+        period = data.exposure / 1000
+        position = 0
+        while position < data.n_times:
+            if self._filled == 0:
+                self._timestamp = timestamp + position * period
+            n = min(data.n_times - position, len(self._intensity) - self._filled)
+            self._intensity[self._filled:self._filled + n] = data.intensity[position:position + n]
+            self._clipped[self._filled:self._filled + n] = data.clipped[position:position + n]
+            self._filled += n
+            position += n
+            if self._filled == len(self._intensity):
+                self.flush()
+
+    def flush(self) -> None:
+        if self._filled == 0:
+            return
+        n = self._filled
+        entry = (self._frame, n, self._exposure, self._timestamp)
+        self._frame += n
+        self._filled = 0
+
+        if self._codec is None:
+            offset = _pad(self._data_file)
+            self._data_file.write(self._intensity[:n].data)
+            _pad(self._data_file)
+            self._data_file.write(self._clipped[:n].data)
+            self._write_entry(entry, offset)
+            return
+
+        # буфер блока переиспользуется, поэтому в пул сжатия передается его копия
+        future = self._codec.executor.submit(self._codec.encode, self._intensity[:n].copy(), self._clipped[:n].copy())
+        self._pending.append((entry, future))
+        self.drain(block=False)
+        while len(self._pending) >= self._codec.max_pending:
+            self._write_chunk(*self._pending.popleft())
+
+    def drain(self, block: bool) -> None:
+        while self._pending and (block or self._pending[0][1].done()):
+            self._write_chunk(*self._pending.popleft())
+
+    def _write_chunk(self, entry: tuple, future: Future) -> None:
+        chunk = future.result()
+        offset = _pad(self._data_file)
+        self._data_file.write(chunk)
+        self._write_entry(entry, offset)
+
+    def _write_entry(self, entry: tuple, offset: int) -> None:
+        size = self._data_file.tell() - offset
+        self._data_file.flush()
+
+        record = np.array([(*entry, offset, size)], dtype=INDEX_DTYPE)
+        self._index_file.write(record.tobytes())
+        self._index_file.flush()
+
+
+class RecordingReader:
+    """
+    Читает запись, созданную `Recorder`.
+
+    Файл данных отображается в память, а поиск измерения по номеру или времени выполняется
+    двоичным поиском по индексу блоков (O(log n)). Измерения из одного несжатого блока возвращаются
+    без копирования. Сжатые блоки распаковываются по одному при обращении к ним.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param str path: Путь к файлу данных записи
+        :raises ValueError: Если файл пуст (в `Recorder` не было записано ни одного кадра)
+            или не является записью pyspectrum.
+        """
+        with open(path, 'rb') as f:
+            preamble = f.read(_PREAMBLE.size)
+            if not preamble:
+                # Recorder записывает заголовок вместе с первым кадром
+                raise ValueError(f'Recording {path} is empty: no frames were written')
+            if len(preamble) < _PREAMBLE.size:
+                raise ValueError(f'File {path} is not a pyspectrum recording')
+            magic, version, header_length = _PREAMBLE.unpack(preamble)
+            if magic != MAGIC:
+                raise ValueError(f'File {path} is not a pyspectrum recording')
+            if version > VERSION:
+                raise ValueError(f'File {path} has unsupported recording version {version}')
+            header = json.loads(f.read(header_length).decode('utf-8'))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.n_numbers: int = header['n_numbers']
+        """Количество отсчетов в одном измерении"""
+        self.compression: Optional[str] = header.get('compression')
+        """Сжатие блоков записи"""
+        self._cached: tuple[int, tuple[NDArray, NDArray]] | None = None
+        self.wavelength: Optional[NDArray[float]] = None
+        """Длины волн, если записывались спектры"""
+        if header['wavelength']:
+            offset = _align(_PREAMBLE.size + header_length)
+            self.wavelength = np.ndarray((self.n_numbers,), dtype='<f8', buffer=self._mmap, offset=offset)
+
+        self.index: NDArray = np.fromfile(path + INDEX_SUFFIX, dtype=INDEX_DTYPE)
+        """Индекс блоков записи (`INDEX_DTYPE`)"""
+        self._frames = self.index['frame'].astype(np.int64)
+        self._timestamps = self.index['timestamp']
+
+    @property
+    def n_frames(self) -> int:
+        """Количество измерений в записи."""
+        if len(self.index) == 0:
+            return 0
+        last = self.index[-1]
+        return int(last['frame']) + int(last['n_frames'])
+
+    def __len__(self) -> int:
+        return self.n_frames
+
+    def _chunk(self, i: int) -> tuple[NDArray, NDArray]:
+        entry = self.index[i]
+        n = int(entry['n_frames'])
+        offset = int(entry['offset'])
+        if self.compression is not None:
+            if self._cached is None or self._cached[0] != i:
+                size = int(entry['size'])
+                self._cached = i, chunk_codec.decode(self._mmap[offset:offset + size], (n, self.n_numbers))
+            return self._cached[1]
+
+        intensity = np.ndarray((n, self.n_numbers), dtype='<f8', buffer=self._mmap, offset=offset)
+        clipped_offset = _align(offset + intensity.nbytes)
+        clipped = np.ndarray((n, self.n_numbers), dtype=np.bool_, buffer=self._mmap, offset=clipped_offset)
+        return intensity, clipped
+
+    def _make(self, intensity: NDArray, clipped: NDArray, exposure: int) -> Data:
+        if self.wavelength is None:
+            return Data(intensity=intensity, clipped=clipped, exposure=exposure)
+        return Spectrum(intensity=intensity, clipped=clipped, exposure=exposure, wavelength=self.wavelength)
+
+    def read(self, start: int, stop: int) -> Data:
+        """
+        Возвращает измерения с номерами `[start, stop)`.
+
+        :param int start: Номер первого измерения
+        :param int stop: Номер измерения, следующего за последним
+        :rtype: Data
+        :raises ValueError: Если измерения записаны с разной экспозицией.
+        """
+        start = max(0, start)
+        stop = min(self.n_frames, stop)
+        if start >= stop:
+            return self._make(np.empty((0, self.n_numbers)), np.empty((0, self.n_numbers), dtype=bool), 0)
+
+        first = int(np.searchsorted(self._frames, start, side='right')) - 1
+        last = int(np.searchsorted(self._frames, stop - 1, side='right')) - 1
+        exposures = self.index['exposure'][first:last + 1]
+        if np.any(exposures != exposures[0]):
+            raise ValueError('Requested frames were recorded with different exposures')
+
+        parts = []
+        for i in range(first, last + 1):
+            intensity, clipped = self._chunk(i)
+            frame = int(self._frames[i])
+            lo = max(start - frame, 0)
+            hi = min(stop - frame, len(intensity))
+            parts.append((intensity[lo:hi], clipped[lo:hi]))
+
+        if len(parts) == 1:
+            intensity, clipped = parts[0]
+        else:
+            intensity = np.concatenate([p[0] for p in parts])
+            clipped = np.concatenate([p[1] for p in parts])
+        return self._make(intensity, clipped, int(exposures[0]))
+
+    def __getitem__(self, key: int | slice) -> Data:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self.n_frames)
+            if step != 1:
+                raise ValueError('Only contiguous slices are supported')
+            return self.read(start, stop)
+        if key < 0:
+            key += self.n_frames
+        if not 0 <= key < self.n_frames:
+            raise IndexError('Frame index out of range')
+        return self.read(key, key + 1)
+
+    def frame_at(self, timestamp: float) -> int:
+        """
+        Возвращает номер первого измерения, начатого не раньше момента `timestamp`.
+
+        :param float timestamp: Время (`time.time()`)
+        :rtype: int
+        """
+        i = int(np.searchsorted(self._timestamps, timestamp, side='right')) - 1
+        if i < 0:
+            return 0
+        entry = self.index[i]
+        period = int(entry['exposure']) / 1000
+        if period > 0:
+            inside = math.ceil((timestamp - float(entry['timestamp'])) / period - 1e-9)
+        else:
+            inside = 1 if timestamp > entry['timestamp'] else 0
+        return int(entry['frame']) + min(max(inside, 0), int(entry['n_frames']))
+
+    def time_range(self, start: float, stop: float) -> Data:
+        """
+        Возвращает измерения, начатые в интервале времени `[start, stop)`.
+
+        :param float start: Начало интервала (`time.time()`)
+        :param float stop: Конец интервала (`time.time()`)
+        :rtype: Data
+        """
+        return self.read(self.frame_at(start), self.frame_at(stop))
+
+    def timestamp(self, frame: int) -> float:
+        """
+        Возвращает время начала измерения с номером `frame`.
+
+        :param int frame: Номер измерения
+        :rtype: float
+        """
+        i = int(np.searchsorted(self._frames, frame, side='right')) - 1
+        entry = self.index[i]
+        return float(entry['timestamp']) + (frame - int(entry['frame'])) * int(entry['exposure']) / 1000
+
+    def close(self) -> None:
+        """Закрывает отображение файла. Полученные ранее измерения становятся недействительными."""
+        self.wavelength = None
+        self._cached = None
+        try:
+            self._mmap.close()
+        except BufferError:
+            # на данные еще ссылаются выданные измерения, отображение закроется вместе с ними
+            pass
+
+    def __enter__(self) -> 'RecordingReader':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
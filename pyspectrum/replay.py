@@ -0,0 +1,161 @@
+import time
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from . import recording
+from .data import Data, Frame
+from .recording import RecordingReader
+
+
+def _is_recording(path: str) -> bool:
+    with open(path, 'rb') as f:
+        return f.read(len(recording.MAGIC)) == recording.MAGIC
+
+
+class Replay:
+    """
+    Источник записанных данных для воспроизведения через `Spectrometer`.
+
+    Источником может быть объект `Data`, файл `Data.save` или запись `Recorder`. Файлы
+    отображаются в память, поэтому воспроизведение больших записей не загружает их целиком.
+
+    Записанные измерения должны соответствовать `Spectrometer.read_raw` (сырые данные без вычитания
+    темнового сигнала), тогда `read` и остальные методы спектрометра обрабатывают их как данные с устройства.
+
+    Пример использования:
+    ```python
+    spectrometer = Spectrometer(factory_config=factory_config, replay=Replay('run.rec', speed=10))
+    spectrometer.read_non_block(callback, frames_to_read=10_000)
+    ```
+    """
+
+    def __init__(self, source: str | Data, speed: Optional[float] = 1.0, loop: bool = True):
+        """
+        :param source: Данные или путь к файлу
+        :type source: str | Data
+        :param speed: Скорость воспроизведения относительно реального времени (экспозиции).
+            `None` - без задержек.
+        :type speed: float | None
+        :param bool loop: Начинать воспроизведение сначала после окончания данных.
+        """
+        if speed is not None and speed <= 0:
+            raise ValueError('Replay speed must be positive')
+
+        self.speed = speed
+        self.loop = loop
+        self.position = 0
+        """Номер следующего воспроизводимого измерения"""
+
+        self._reader: Optional[RecordingReader] = None
+        self._data: Optional[Data] = None
+        if isinstance(source, Data):
+            self._data = source
+        elif _is_recording(source):
+            self._reader = RecordingReader(source)
+        else:
+            self._data = Data.load(source, mmap=True)
+
+    @property
+    def n_frames(self) -> int:
+        """Количество записанных измерений."""
+        return self._reader.n_frames if self._reader is not None else self._data.n_times
+
+    @property
+    def n_numbers(self) -> int:
+        """Количество отсчетов в одном измерении."""
+        return self._reader.n_numbers if self._reader is not None else self._data.n_numbers
+
+    def _slice(self, start: int, stop: int) -> tuple[NDArray, NDArray]:
+        if self._reader is not None:
+            data = self._reader.read(start, stop)
+            return data.intensity, data.clipped
+        raw = self._data._raw
+        if raw is not None:
+            # отложенные данные (например, отображенный в память файл версии 2): преобразуются только нужные строки
+            return raw.convert(raw.samples[start:stop]), raw.clipped[start:stop]
+        return self._data.intensity[start:stop], self._data.clipped[start:stop]
+
+    def take(self, n_times: int, intensity: NDArray, clipped: NDArray) -> None:
+        """
+        Копирует следующие `n_times` измерений в `intensity` и `clipped`.
+
+        :raises RuntimeError: Если данные закончились и `loop` выключен.
+        """
+        total = self.n_frames
+        if total == 0:
+            raise RuntimeError('Replay source is empty')
+
+        filled = 0
+        while filled < n_times:
+            if self.position >= total:
+                if not self.loop:
+                    raise RuntimeError('Replay source is exhausted')
+                self.position = 0
+            n = min(n_times - filled, total - self.position)
+            source_intensity, source_clipped = self._slice(self.position, self.position + n)
+            intensity[filled:filled + n] = source_intensity
+            clipped[filled:filled + n] = source_clipped
+            filled += n
+            self.position += n
+
+
+class ReplayDevice:
+    """
+    Устройство, воспроизводящее записанные данные (`Replay`) вместо USB спектрометра.
+
+    Повторяет интерфейс `UsbDevice`, необходимый `Spectrometer`. Кадры восстанавливаются
+    обратным преобразованием заводских настроек (обрезка, разворот, масштаб), поэтому
+    `Spectrometer.read_raw` возвращает записанные данные.
+    """
+
+    def __init__(self, replay: Replay, factory_config):
+        """
+        :param replay: Источник данных
+        :type replay: Replay
+        :param factory_config: Заводские настройки спектрометра
+        :type factory_config: FactoryConfig
+        """
+        if replay.n_numbers != factory_config.end - factory_config.start:
+            raise ValueError('Replay data has incorrect number of pixels')
+
+        self._replay = replay
+        self._factory_config = factory_config
+        self._timer = 0
+        self._opened = True
+
+    @property
+    def is_opened(self) -> bool:
+        return self._opened
+
+    def close(self):
+        if not self._opened:
+            raise RuntimeError("Device is not opened.")
+        self._opened = False
+
+    def set_timer(self, millis: int):
+        self._timer = millis
+
+    def get_pixel_count(self) -> int:
+        return self._factory_config.end
+
+    def read_frame(self, n_times: int) -> Frame:
+        started = time.monotonic()
+        config = self._factory_config
+        direction = -1 if config.reverse else 1
+
+        samples = np.zeros((n_times, config.end), dtype=np.float64)
+        clipped = np.zeros((n_times, config.end), dtype=bool)
+        window = samples[:, config.start:config.end][:, ::direction]
+        self._replay.take(n_times, window, clipped[:, config.start:config.end][:, ::direction])
+        window /= config.intensity_scale
+
+        if self._replay.speed is not None:
+            # устройство отдает кадр через n_times экспозиций после запроса
+            duration = n_times * self._timer / 1000 / self._replay.speed
+            delay = started + duration - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+
+        return Frame(samples=samples, clipped=clipped)
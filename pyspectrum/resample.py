@@ -0,0 +1,217 @@
+"""
+Передискретизация спектров на заданную сетку длин волн.
+
+Передискретизация - линейное отображение, поэтому для пары (исходная шкала, целевая сетка)
+оно строится один раз как разреженная матрица `scipy.sparse` размера (целевая сетка x отсчеты)
+и применяется ко всем измерениям одним матричным произведением.
+"""
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+from scipy import sparse
+
+from .data import Data, Spectrum, _AxisIndex
+
+METHODS = ('nearest', 'linear', 'area')
+
+
+def _edges(centers: NDArray[float]) -> NDArray[float]:
+    """Границы интервалов с центрами `centers`: середины между соседними точками."""
+    if len(centers) == 1:
+        return np.array([centers[0] - 0.5, centers[0] + 0.5])
+    middle = (centers[1:] + centers[:-1]) / 2
+    return np.concatenate([[2 * centers[0] - middle[0]], middle, [2 * centers[-1] - middle[-1]]])
+
+
+def _nearest(source: NDArray[float], target: NDArray[float]) -> tuple[NDArray, NDArray, NDArray]:
+    columns = _AxisIndex(source).nearest(target)
+    rows = np.arange(len(target))
+    return rows, columns, np.ones(len(target))
+
+
+def _linear(source: NDArray[float], target: NDArray[float]) -> tuple[NDArray, NDArray, NDArray]:
+    n = len(source)
+    if n == 1:
+        return _nearest(source, target)
+    right = np.clip(np.searchsorted(source, target, side='right'), 1, n - 1)
+    left = right - 1
+    width = source[right] - source[left]
+    weight = np.divide(target - source[left], width, out=np.zeros_like(target), where=width != 0)
+    weight = np.clip(weight, 0, 1)
+    rows = np.arange(len(target))
+    return np.concatenate([rows, rows]), np.concatenate([left, right]), np.concatenate([1 - weight, weight])
+
+
+def _area(source: NDArray[float], target: NDArray[float]) -> tuple[NDArray, NDArray, NDArray]:
+    source_edges = _edges(source)
+    target_edges = _edges(target)
+    lo, hi = target_edges[:-1], target_edges[1:]
+
+    # каждый целевой интервал пересекается с непрерывным диапазоном исходных интервалов
+    first = np.clip(np.searchsorted(source_edges, lo, side='right') - 1, 0, len(source) - 1)
+    last = np.clip(np.searchsorted(source_edges, hi, side='left'), 1, len(source))
+    counts = np.maximum(last - first, 0)
+    rows = np.repeat(np.arange(len(target)), counts)
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    columns = np.repeat(first, counts) + np.arange(counts.sum()) - starts
+
+    overlap = np.minimum(source_edges[columns + 1], hi[rows]) - np.maximum(source_edges[columns], lo[rows])
+    overlap = np.maximum(overlap, 0)
+    # среднее по покрытой части целевого интервала
+    covered = np.bincount(rows, weights=overlap, minlength=len(target))
+    weight = np.divide(overlap, covered[rows], out=np.zeros_like(overlap), where=covered[rows] > 0)
+    return rows, columns, weight
+
+
+_BUILDERS = {'nearest': _nearest, 'linear': _linear, 'area': _area}
+
+
+class _AxisCache:
+    """
+    Кэш значений, вычисляемых по шкале длин волн. Сначала проверяется совпадение
+    с последней шкалой по идентичности объекта, затем - по содержимому (LRU).
+    """
+
+    def __init__(self, build: Callable[[NDArray[float]], Any], size: int = 8):
+        self._build = build
+        self._size = max(1, size)
+        self._entries: OrderedDict[bytes, Any] = OrderedDict()
+        self._last: Optional[tuple[NDArray, Any]] = None
+
+    def get(self, axis: NDArray[float]) -> Any:
+        last = self._last
+        if last is not None and last[0] is axis:
+            return last[1]
+
+        key = np.asarray(axis, dtype=np.float64).tobytes()
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._build(axis)
+            self._entries[key] = entry
+            if len(self._entries) > self._size:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        self._last = (axis, entry)
+        return entry
+
+
+class Resampler:
+    """
+    Передискретизация спектров на фиксированную сетку длин волн.
+
+    Методы:
+
+    - `nearest` - значение ближайшего отсчета;
+    - `linear` - линейная интерполяция между соседними отсчетами;
+    - `area` - среднее по интервалу целевой сетки с весами, равными длине пересечения
+      с интервалами отсчетов (сохраняет площадь под спектром при переходе к более грубой сетке).
+
+    Матрица для исходной шкалы строится при первом вызове и кэшируется, повторные вызовы
+    с той же шкалой сводятся к одному матричному произведению. Шкала может убывать (`FactoryConfig.reverse`).
+
+    Пример использования:
+    ```python
+    resampler = Resampler(np.arange(380, 781), method='area')
+    spectrum_1nm = resampler(spectrometer.read())
+    ```
+    """
+
+    def __init__(self,
+                 wavelength: NDArray[float],
+                 method: str = 'linear',
+                 fill_value: Optional[float] = np.nan,
+                 cache_size: int = 8):
+        """
+        :param wavelength: Целевая сетка длин волн
+        :type wavelength: NDArray[float]
+        :param str method: `nearest`, `linear` или `area`
+        :param fill_value: Значение в точках сетки вне исходной шкалы.
+            ``None`` - не заменять: для `nearest` и `linear` это значения крайних отсчетов.
+        :type fill_value: float | None
+        :param int cache_size: Количество исходных шкал, для которых хранятся матрицы
+        """
+        if method not in METHODS:
+            raise ValueError(f'Unknown resampling method {method}, expected one of {METHODS}')
+        self.wavelength = np.asarray(wavelength, dtype=np.float64)
+        """Целевая сетка длин волн"""
+        self.method = method
+        self.fill_value = fill_value
+        self._cache = _AxisCache(self.__build, cache_size)
+
+    def __build(self, source: NDArray[float]) -> tuple:
+        source = np.asarray(source, dtype=np.float64)
+        n = len(source)
+        if n == 0:
+            raise ValueError('Source wavelength axis is empty')
+        index = _AxisIndex(source)
+        rows, columns, weights = _BUILDERS[self.method](index.ascending, self.wavelength)
+        if index.reversed:
+            columns = n - 1 - columns
+
+        matrix = sparse.csr_matrix((weights, (rows, columns)), shape=(len(self.wavelength), n))
+        matrix.eliminate_zeros()
+        matrix.sum_duplicates()
+        # отсчеты, от которых зависит точка сетки: по ним определяется зашкаливание
+        pattern = matrix.copy()
+        pattern.data[:] = 1.0
+
+        lo, hi = index.ascending[0], index.ascending[-1]
+        outside = (self.wavelength < lo) | (self.wavelength > hi)
+        if self.method == 'area':
+            # точка сетки вне шкалы, если ее центр вне шкалы или интервал не пересекается с отсчетами
+            outside |= np.diff(matrix.indptr) == 0
+        return matrix, pattern, outside
+
+    def matrix(self, source: NDArray[float]) -> tuple[sparse.csr_matrix, sparse.csr_matrix, NDArray[bool]]:
+        """
+        Матрица передискретизации для исходной шкалы.
+
+        :param source: Исходная шкала длин волн
+        :return: Матрица весов (сетка x отсчеты), матрица зависимостей и маска точек сетки вне шкалы
+        """
+        return self._cache.get(source)
+
+    def apply(self, intensity: NDArray, source: NDArray[float]) -> NDArray[float]:
+        """
+        Передискретизирует массив интенсивностей.
+
+        :param intensity: Одномерный массив (отсчеты) или двумерный (измерения x отсчеты)
+        :param source: Исходная шкала длин волн
+        :return: Массив той же размерности с последней осью по целевой сетке
+        """
+        matrix, _, outside = self.matrix(source)
+        intensity = np.asarray(intensity)
+        if intensity.ndim == 1:
+            result = matrix @ intensity
+        else:
+            result = np.ascontiguousarray((matrix @ intensity.T).T)
+        if self.fill_value is not None and outside.any():
+            result[..., outside] = self.fill_value
+        return result
+
+    def __call__(self, data: Data, wavelength: Optional[NDArray[float]] = None) -> Spectrum:
+        """
+        Передискретизирует все измерения спектра.
+
+        :param data: Спектр или данные
+        :type data: Spectrum | Data
+        :param wavelength: Исходная шкала длин волн. По умолчанию - `data.wavelength`.
+        :type wavelength: NDArray[float] | None
+        :return: Спектр на целевой сетке. Отсчет зашкален, если зашкален любой исходный отсчет, от которого он зависит.
+        :rtype: Spectrum
+        """
+        if wavelength is None:
+            wavelength = getattr(data, 'wavelength', None)
+        if wavelength is None:
+            raise ValueError('Source wavelength axis is not set')
+        _, pattern, _ = self.matrix(wavelength)
+        clipped = (pattern @ np.asarray(data.clipped, dtype=np.float64).T).T > 0
+        return Spectrum(
+            intensity=self.apply(data.intensity, wavelength),
+            clipped=np.ascontiguousarray(clipped),
+            exposure=data.exposure,
+            wavelength=self.wavelength,
+        )
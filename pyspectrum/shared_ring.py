@@ -0,0 +1,326 @@
+import time
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+from .data import Data, Spectrum
+from .errors import OverrunError
+
+_MAGIC = b'PSRING01'
+_ALIGN = 64
+
+# Поля заголовка кольцевого буфера (int64)
+_H_CAPACITY = 1
+_H_MAX_TIMES = 2
+_H_N_NUMBERS = 3
+_H_HAS_WAVELENGTH = 4
+_H_WRITE_SEQ = 5
+_HEADER_SIZE = 8
+
+# Поля метаданных слота (int64)
+_M_BEGIN = 0
+_M_END = 1
+_M_N_TIMES = 2
+_M_EXPOSURE = 3
+_META_SIZE = 4
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGN - 1) // _ALIGN * _ALIGN
+
+
+class _Layout:
+    """Раскладка кольцевого буфера в разделяемой памяти."""
+
+    def __init__(self, capacity: int, max_times: int, n_numbers: int):
+        self.capacity = capacity
+        self.max_times = max_times
+        self.n_numbers = n_numbers
+
+        offset = _HEADER_SIZE * 8
+        self.wavelength = _align(offset)
+        offset = self.wavelength + n_numbers * 8
+        self.meta = _align(offset)
+        offset = self.meta + capacity * _META_SIZE * 8
+        self.intensity = _align(offset)
+        offset = self.intensity + capacity * max_times * n_numbers * 8
+        self.clipped = _align(offset)
+        self.size = self.clipped + capacity * max_times * n_numbers
+
+    def map(self, buf) -> tuple[NDArray, NDArray, NDArray, NDArray, NDArray]:
+        header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=buf)
+        wavelength = np.ndarray((self.n_numbers,), dtype=np.float64, buffer=buf, offset=self.wavelength)
+        meta = np.ndarray((self.capacity, _META_SIZE), dtype=np.int64, buffer=buf, offset=self.meta)
+        shape = (self.capacity, self.max_times, self.n_numbers)
+        intensity = np.ndarray(shape, dtype=np.float64, buffer=buf, offset=self.intensity)
+        clipped = np.ndarray(shape, dtype=np.bool_, buffer=buf, offset=self.clipped)
+        return header, wavelength, meta, intensity, clipped
+
+
+def _attach(name: str) -> SharedMemory:
+    try:
+        return SharedMemory(name=name, track=False)
+    except TypeError:
+        # Python < 3.13: подписчик не должен удалять сегмент при завершении процесса
+        shm = SharedMemory(name=name)
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return shm
+
+
+def _close(shm: SharedMemory) -> None:
+    try:
+        shm.close()
+    except BufferError:
+        # на буфер еще ссылаются выданные кадры, память освободится вместе с ними
+        pass
+
+
+class SpectrumPublisher:
+    """
+    Публикует спектры в кольцевой буфер в разделяемой памяти (`multiprocessing.shared_memory`).
+
+    Каждый опубликованный кадр получает последовательный номер. Подписчики (`SpectrumSubscriber`)
+    из других процессов получают кадры как представления NumPy без копирования и сериализации.
+    Объект можно передавать как callback в `Spectrometer.read_non_block` и `Spectrometer.read_non_stop`.
+
+    Пример использования:
+    ```python
+    publisher = SpectrumPublisher(n_numbers=1800, max_times=100, wavelength=wavelengths)
+    spectrometer.read_non_stop(publisher, frames_interval=100)
+    # в другом процессе: SpectrumSubscriber(publisher.name)
+    ```
+    """
+
+    def __init__(self,
+                 n_numbers: int,
+                 max_times: int = 1,
+                 capacity: int = 16,
+                 wavelength: Optional[NDArray[float]] = None,
+                 name: Optional[str] = None):
+        """
+        :param int n_numbers: Количество отсчетов в одном измерении.
+        :param int max_times: Максимальное количество измерений в одном кадре.
+        :param int capacity: Количество слотов кольцевого буфера.
+        :param wavelength: Длины волн, общие для всех кадров. Если не указаны, подписчики получают `Data`.
+        :type wavelength: NDArray[float] | None
+        :param name: Имя сегмента разделяемой памяти. По умолчанию генерируется автоматически.
+        :type name: str | None
+        """
+        if capacity < 1 or max_times < 1 or n_numbers < 1:
+            raise ValueError('Ring buffer dimensions must be positive')
+        if wavelength is not None and len(wavelength) != n_numbers:
+            raise ValueError('Wavelength has incorrect number of pixels')
+
+        layout = _Layout(capacity, max_times, n_numbers)
+        self._shm = SharedMemory(name=name, create=True, size=layout.size)
+        self._layout = layout
+        self._header, self._wavelength, self._meta, self._intensity, self._clipped = layout.map(self._shm.buf)
+
+        self._meta[:] = -1
+        if wavelength is not None:
+            self._wavelength[:] = wavelength
+        self._header[_H_CAPACITY] = capacity
+        self._header[_H_MAX_TIMES] = max_times
+        self._header[_H_N_NUMBERS] = n_numbers
+        self._header[_H_HAS_WAVELENGTH] = wavelength is not None
+        self._header[_H_WRITE_SEQ] = 0
+        self._shm.buf[:len(_MAGIC)] = _MAGIC
+
+    @property
+    def name(self) -> str:
+        """Имя сегмента разделяемой памяти, которое нужно передать подписчикам."""
+        return self._shm.name
+
+    @property
+    def capacity(self) -> int:
+        """Количество слотов кольцевого буфера."""
+        return self._layout.capacity
+
+    @property
+    def sequence(self) -> int:
+        """Номер, который получит следующий опубликованный кадр."""
+        return int(self._header[_H_WRITE_SEQ])
+
+    def publish(self, data: Data) -> int:
+        """
+        Записывает кадр в очередной слот кольцевого буфера.
+
+        Самый старый кадр перезаписывается без ожидания подписчиков.
+
+        :param data: Публикуемый кадр
+        :type data: Data
+        :return: Последовательный номер кадра
+        :rtype: int
+        """
+        n_times, n_numbers = data.shape
+        if n_numbers != self._layout.n_numbers:
+            raise ValueError('Data has incorrect number of pixels')
+        if n_times > self._layout.max_times:
+            raise ValueError(f'Data has {n_times} measurements, ring slot holds {self._layout.max_times}')
+
+        seq = int(self._header[_H_WRITE_SEQ])
+        slot = seq % self._layout.capacity
+        meta = self._meta[slot]
+
+        # seqlock: BEGIN пишется до данных, END - после
+        meta[_M_BEGIN] = seq
+        self._intensity[slot, :n_times] = data.intensity
+        self._clipped[slot, :n_times] = data.clipped
+        meta[_M_N_TIMES] = n_times
+        meta[_M_EXPOSURE] = data.exposure
+        meta[_M_END] = seq
+        self._header[_H_WRITE_SEQ] = seq + 1
+        return seq
+
+    def __call__(self, data: Data) -> None:
+        self.publish(data)
+
+    def close(self) -> None:
+        """Закрывает доступ к разделяемой памяти и удаляет сегмент."""
+        if self._shm is None:
+            return
+        self._header = self._wavelength = self._meta = self._intensity = self._clipped = None
+        self._shm.unlink()
+        _close(self._shm)
+        self._shm = None
+
+    def __enter__(self) -> 'SpectrumPublisher':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+class SpectrumSubscriber:
+    """
+    Читает кадры, опубликованные `SpectrumPublisher`, из разделяемой памяти.
+
+    Возвращаемые объекты ссылаются на память кольцевого буфера без копирования, поэтому
+    кадр остается корректным, только пока издатель не перезапишет его слот. Проверить это
+    после обработки можно методом `is_valid`.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param str name: Имя сегмента разделяемой памяти (`SpectrumPublisher.name`)
+        """
+        self._shm = _attach(name)
+        if bytes(self._shm.buf[:len(_MAGIC)]) != _MAGIC:
+            self._shm.close()
+            raise ValueError(f'Shared memory {name} is not a spectrum ring buffer')
+
+        header = np.ndarray((_HEADER_SIZE,), dtype=np.int64, buffer=self._shm.buf)
+        layout = _Layout(int(header[_H_CAPACITY]), int(header[_H_MAX_TIMES]), int(header[_H_N_NUMBERS]))
+        self._layout = layout
+        self._header, wavelength, self._meta, self._intensity, self._clipped = layout.map(self._shm.buf)
+        self._wavelength = wavelength if header[_H_HAS_WAVELENGTH] else None
+
+        self._next_seq = 0
+        self.lost = 0
+        """Количество кадров, пропущенных из-за переполнения буфера"""
+
+    @property
+    def name(self) -> str:
+        """Имя сегмента разделяемой памяти."""
+        return self._shm.name
+
+    @property
+    def available(self) -> int:
+        """Номер, который получит следующий опубликованный кадр."""
+        return int(self._header[_H_WRITE_SEQ])
+
+    def is_valid(self, seq: int) -> bool:
+        """
+        Проверяет, что слот с кадром `seq` не был перезаписан издателем.
+
+        :param int seq: Последовательный номер кадра
+        :rtype: bool
+        """
+        meta = self._meta[seq % self._layout.capacity]
+        return meta[_M_BEGIN] == seq and meta[_M_END] == seq
+
+    def get(self, seq: int) -> Optional[Data]:
+        """
+        Возвращает кадр с номером `seq` без копирования данных.
+
+        :param int seq: Последовательный номер кадра
+        :return: Кадр или `None`, если он еще не опубликован
+        :rtype: Data | None
+        :raises OverrunError: Если кадр уже перезаписан издателем.
+        """
+        write_seq = int(self._header[_H_WRITE_SEQ])
+        if seq >= write_seq:
+            return None
+        if write_seq - seq > self._layout.capacity:
+            raise OverrunError(write_seq - seq - self._layout.capacity)
+
+        slot = seq % self._layout.capacity
+        meta = self._meta[slot]
+        n_times = int(meta[_M_N_TIMES])
+        exposure = int(meta[_M_EXPOSURE])
+        if not self.is_valid(seq):
+            raise OverrunError(1)
+
+        intensity = self._intensity[slot, :n_times]
+        clipped = self._clipped[slot, :n_times]
+        if self._wavelength is None:
+            return Data(intensity=intensity, clipped=clipped, exposure=exposure)
+        return Spectrum(intensity=intensity, clipped=clipped, exposure=exposure, wavelength=self._wavelength)
+
+    def next(self, timeout: Optional[float] = None, poll_interval: float = 0.0005) -> Optional[Data]:
+        """
+        Возвращает следующий по порядку кадр, ожидая его публикации.
+
+        При переполнении буфера подписчик переходит к самому старому доступному кадру,
+        а количество пропущенных кадров добавляется к `lost`.
+
+        :param timeout: Максимальное время ожидания в секундах. `None` - ждать бесконечно.
+        :type timeout: float | None
+        :param float poll_interval: Интервал опроса в секундах.
+        :return: Кадр или `None`, если время ожидания истекло
+        :rtype: Data | None
+        :raises OverrunError: Если подписчик отстал от издателя больше чем на `capacity` кадров.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            write_seq = int(self._header[_H_WRITE_SEQ])
+            if write_seq - self._next_seq > self._layout.capacity:
+                # оставляем запас в один слот, который издатель может перезаписывать прямо сейчас
+                lost = write_seq - self._layout.capacity + 1 - self._next_seq
+                self._next_seq += lost
+                self.lost += lost
+                raise OverrunError(lost)
+            try:
+                data = self.get(self._next_seq)
+            except OverrunError as e:
+                self._next_seq += 1
+                self.lost += 1
+                raise e
+            if data is not None:
+                self._next_seq += 1
+                return data
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+    @property
+    def last_sequence(self) -> int:
+        """Номер последнего кадра, возвращенного методом `next`."""
+        return self._next_seq - 1
+
+    def close(self) -> None:
+        """Закрывает доступ к разделяемой памяти. Кадры, полученные ранее, становятся недействительными."""
+        if self._shm is None:
+            return
+        self._header = self._wavelength = self._meta = self._intensity = self._clipped = None
+        _close(self._shm)
+        self._shm = None
+
+    def __enter__(self) -> 'SpectrumSubscriber':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
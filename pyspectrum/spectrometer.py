@@ -1,14 +1,19 @@
 import json
+import math
 import sys
+import tempfile
 from dataclasses import dataclass
 import threading
+import time
 from typing import Callable, Optional
 
 import numpy as np
 from numpy.typing import NDArray
 
+from .capture import EventCapture, Predicate
 from .data import Data, Spectrum, Frame
 from .errors import ConfigurationError, LoadError
+from .replay import Replay, ReplayDevice
 from .usb_device import UsbDevice
 
 
@@ -16,6 +21,49 @@ def eprint(*args, **kwargs):
     print(*args, file=sys.stderr, **kwargs)
 
 
+# Оценка памяти на один отсчет устройства при чтении кадра: принятые байты,
+# их копия, отсчеты после декодирования и флаги зашкаливания
+_DEVICE_BYTES_PER_SAMPLE = 16
+# Размер блока (в отсчетах) при поблочной обработке результата
+_PROCESSING_BLOCK = 1 << 20
+
+
+def _plan_read(n_times: int, n_numbers: int, device: UsbDevice, memory_budget: Optional[int]) -> tuple[int, bool]:
+    """
+    Возвращает количество измерений в одном запросе к устройству и нужно ли размещать результат на диске.
+
+    :raises ValueError: Если в бюджет не помещается одно измерение устройства.
+    """
+    if memory_budget is None or n_times == 0:
+        return max(n_times, 1), False
+
+    line_bytes = device.get_pixel_count() * _DEVICE_BYTES_PER_SAMPLE
+    if memory_budget < line_bytes:
+        raise ValueError(f'Memory budget of {memory_budget} bytes is less than one device line ({line_bytes} bytes)')
+    result_bytes = n_times * n_numbers * (np.dtype(np.float64).itemsize + np.dtype(np.bool_).itemsize)
+    spill = result_bytes + line_bytes > memory_budget
+    available = memory_budget if spill else memory_budget - result_bytes
+    return max(1, min(n_times, available // line_bytes)), spill
+
+
+def _subtract_dark(intensity: NDArray[float], dark: NDArray[float], scale: float) -> None:
+    """Вычитает темновой сигнал (в единицах отсчетов) на месте, по частям, чтобы не создавать копий."""
+    step = max(1, _PROCESSING_BLOCK // max(1, intensity.shape[1]))
+    for i in range(0, intensity.shape[0], step):
+        block = intensity[i:i + step]
+        block /= scale
+        block -= dark
+        block *= scale
+
+
+def _allocate(shape: tuple[int, int], dtype, spill: bool) -> NDArray:
+    if not spill:
+        return np.empty(shape, dtype=dtype)
+    # файл удаляется при закрытии, отображение остается доступным до удаления массива
+    with tempfile.TemporaryFile() as f:
+        return np.memmap(f, dtype=dtype, mode='w+', shape=shape)
+
+
 @dataclass(frozen=True)
 class FactoryConfig:
     """
@@ -65,6 +113,7 @@ class Config:
     exposure: int = 10  # время экспозиции, ms
     n_times: int = 1  # количество измерений
     dark_signal_path: Optional[str] = None
+    memory_budget: Optional[int] = None  # бюджет памяти на одно чтение, байт
 
 
 class Spectrometer:
@@ -72,7 +121,11 @@ class Spectrometer:
     Класс, предоставляющий высокоуровневую абстракцию для работы со спетрометром
     """
 
-    def __init__(self, vendor=0x0403, product=0x6014, factory_config: FactoryConfig = FactoryConfig.default()):
+    def __init__(self,
+                 vendor=0x0403,
+                 product=0x6014,
+                 factory_config: FactoryConfig = FactoryConfig.default(),
+                 replay: Optional[Replay] = None):
         """
         При инициализации класса соединение с устройством не открывается.
 
@@ -80,10 +133,13 @@ class Spectrometer:
         :param int product: Идентификатор продукта.
         :param factory_config: Заводские настройки
         :type factory_config: FactoryConfig
+        :param replay: Записанные данные, воспроизводимые вместо чтения с USB устройства.
+        :type replay: Replay | None
         """
         self.__device = None
         self.__vendor = vendor
         self.__product = product
+        self.__replay = replay
         self.__factory_config = factory_config
         self.__config = Config()
         self.__dark_signal: Data | None = None
@@ -95,6 +151,7 @@ class Spectrometer:
 
         self.__stop_reading_flag = False
         self.__reading_thread: Optional[threading.Thread] = None
+        self.__capture: Optional[EventCapture] = None
 
     def open(self):
         """
@@ -103,7 +160,10 @@ class Spectrometer:
         if self.__is_opened:
             return
             
-        self.__device: UsbDevice = UsbDevice(vendor=self.__vendor, product=self.__product)
+        if self.__replay is not None:
+            self.__device = ReplayDevice(self.__replay, self.__factory_config)
+        else:
+            self.__device: UsbDevice = UsbDevice(vendor=self.__vendor, product=self.__product)
         self.__device.set_timer(self.__config.exposure)
         self.__is_opened = True
 
@@ -143,17 +203,19 @@ class Spectrometer:
         self.__dark_signal = data
         eprint('Dark signal loaded')
 
-    def read_dark_signal(self, n_times: Optional[int] = None) -> None:
+    def read_dark_signal(self, n_times: Optional[int] = None, memory_budget: Optional[int] = None) -> None:
         """
         Измеряет темновой сигнал.
         :param n_times: Количество измерений. При обработке данных будет использовано среднее значение
         :type n_timess: int | None
+        :param memory_budget: Бюджет памяти в байтах, см. `read_raw`.
+        :type memory_budget: int | None
         """
         is_opened = self.__is_opened
         try:
             if not is_opened:
                self.open() 
-            self.__dark_signal = self.read_raw(n_times)
+            self.__dark_signal = self.read_raw(n_times, memory_budget)
         finally:
             if not is_opened:
                self.close()
@@ -182,17 +244,60 @@ class Spectrometer:
         self.__wavelengths = wavelengths
         eprint('Wavelength calibration loaded')
 
-    def read_raw(self, n_times: Optional[int] = None) -> Data:
+    def __read_lazy(self, n_times: int, memory_budget: Optional[int]) -> Optional[tuple[NDArray, NDArray]]:
+        """Читает кадр целиком и возвращает представления отсчетов окна без копирования."""
+        start = self.__factory_config.start
+        end = self.__factory_config.end
+        direction = -1 if self.__factory_config.reverse else 1
+
+        chunk, spill = _plan_read(n_times, end - start, self.__device, memory_budget)
+        if chunk < n_times or spill:
+            # кадр не помещается в бюджет памяти, читается по частям
+            return None
+        frame = self.__device.read_frame(n_times)  # type: Frame
+        return frame.samples[:, start:end][:, ::direction], frame.clipped[:, start:end][:, ::direction]
+
+    def __read_into(self, intensity: NDArray[float], clipped: NDArray[bool], chunk: int) -> None:
+        """Читает `len(intensity)` измерений в заранее выделенные массивы, запрашивая у устройства по `chunk`."""
+        device = self.__device
+        start = self.__factory_config.start
+        end = self.__factory_config.end
+        scale = self.__factory_config.intensity_scale
+        direction = -1 if self.__factory_config.reverse else 1
+
+        n_times = intensity.shape[0]
+        for i in range(0, n_times, chunk):
+            k = min(chunk, n_times - i)
+            data = device.read_frame(k)  # type: Frame
+            np.multiply(data.samples[:, start:end][:, ::direction], scale, out=intensity[i:i + k])
+            clipped[i:i + k] = data.clipped[:, start:end][:, ::direction]
+            del data
+
+    def read_raw(self,
+                 n_times: Optional[int] = None,
+                 memory_budget: Optional[int] = None,
+                 lazy: bool = False) -> Data:
         """
         Получить сырые данные с устройства.
 
+        Если задан бюджет памяти, измерения запрашиваются у устройства частями, так чтобы
+        промежуточные буферы помещались в бюджет. Если в бюджет не помещается и результат,
+        он размещается во временном файле (`numpy.memmap`), и пиковое потребление памяти
+        не зависит от `n_times`.
+
         :param n_times: Количество измерений.
         :type n_timess: int | None
+        :param memory_budget: Бюджет памяти в байтах. Если не указан, используется значение из конфига.
+        :type memory_budget: int | None
+        :param bool lazy: Если ``True``, возвращается объект с отложенным преобразованием (`Data.from_raw`):
+            кадр устройства хранится как есть, а `intensity` вычисляется при первом обращении.
+            Если кадр не помещается в бюджет памяти, данные читаются обычным образом.
 
         :return: Данные с устройства.
         :rtype: Data
         
         :raises RuntimeError: Если устройство не открыто.
+        :raises ValueError: Если бюджет памяти меньше одного измерения устройства.
         """
         if self.__device == None or self.__is_opened == False:
             raise RuntimeError('Device is not opened')
@@ -203,12 +308,18 @@ class Spectrometer:
         end = self.__factory_config.end
         scale = self.__factory_config.intensity_scale
 
-        direction = -1 if self.__factory_config.reverse else 1
         n_times = config.n_times if n_times is None else n_times
+        memory_budget = config.memory_budget if memory_budget is None else memory_budget
+
+        if lazy and (window := self.__read_lazy(n_times, memory_budget)) is not None:
+            samples, clipped = window
+            return Data.from_raw(samples, clipped, config.exposure, scale=scale)
 
-        data = device.read_frame(n_times)  # type: Frame
-        intensity = data.samples[:, start:end][:, ::direction] * scale
-        clipped = data.clipped[:, start:end][:, ::direction]
+        n_numbers = end - start
+        chunk, spill = _plan_read(n_times, n_numbers, device, memory_budget)
+        intensity = _allocate((n_times, n_numbers), np.float64, spill)
+        clipped = _allocate((n_times, n_numbers), np.bool_, spill)
+        self.__read_into(intensity, clipped, chunk)
 
         return Data(
             intensity=intensity,
@@ -216,7 +327,11 @@ class Spectrometer:
             exposure=config.exposure,
         )
 
-    def read(self, n_times: Optional[int] = None, force: bool = False) -> Spectrum:
+    def read(self,
+             n_times: Optional[int] = None,
+             force: bool = False,
+             memory_budget: Optional[int] = None,
+             lazy: bool = False) -> Spectrum:
         """
         Получить обработанный спектр с устройства.
         
@@ -225,6 +340,10 @@ class Spectrometer:
 
         :param bool force: Если ``True``, позволяет считать сигнал без калибровки по длина волн
         :param int n_times: Количество измерений. Если не указано, используется значение из конфига.
+        :param memory_budget: Бюджет памяти в байтах, см. `read_raw`.
+        :type memory_budget: int | None
+        :param bool lazy: Отложить вычисление интенсивностей до первого обращения, см. `read_raw`.
+            Вычитание темнового сигнала также выполняется при вычислении.
 
         :return: Считанный спектр
         :rtype: Spectrum
@@ -238,11 +357,27 @@ class Spectrometer:
         try:
             if not is_opened:
                self.open()
-            data = self.read_raw(n_times)
             scale = self.__factory_config.intensity_scale
+            dark = np.round(self.__dark_signal.mean(axis=0) / scale)
+
+            if lazy:
+                window = self.__read_lazy(
+                    self.__config.n_times if n_times is None else n_times,
+                    self.__config.memory_budget if memory_budget is None else memory_budget,
+                )
+                if window is not None:
+                    samples, clipped = window
+                    return Spectrum.from_raw(samples, clipped, self.__config.exposure, scale=scale,
+                                             offset=dark, wavelength=self.__wavelengths)
+
+            data = self.read_raw(n_times, memory_budget)
+
+            # вычитание темнового сигнала на месте, по частям, чтобы не создавать копий результата
+            intensity = data.intensity
+            _subtract_dark(intensity, dark, scale)
+
             return Spectrum(
-                intensity=(data.intensity / scale - np.round(
-                    np.mean(self.__dark_signal.intensity / scale, axis=0))) * scale,
+                intensity=intensity,
                 clipped=data.clipped,
                 wavelength=self.__wavelengths,
                 exposure=self.__config.exposure,
@@ -312,6 +447,95 @@ class Spectrometer:
         self.__reading_thread = threading.Thread(target=self.read_non_block, args=(callback, None, frames_interval))
         self.__reading_thread.start()
 
+    def __frames_for(self, frames: Optional[int], seconds: Optional[float]) -> int:
+        if seconds is None:
+            return frames or 0
+        return max(frames or 0, math.ceil(seconds * 1000 / self.__config.exposure))
+
+    def capture_event(self,
+                      pre_frames: Optional[int] = None,
+                      post_frames: Optional[int] = None,
+                      predicate: Optional[Predicate] = None,
+                      frames_interval: int = 100,
+                      pre_seconds: Optional[float] = None,
+                      post_seconds: Optional[float] = None,
+                      timeout: Optional[float] = None) -> Spectrum | None:
+        """
+        Непрерывно считывает спектры, сохраняя предысторию в кольцевом буфере, до срабатывания триггера.
+
+        Триггер срабатывает при вызове `trigger` (например, из другого потока) или когда `predicate`
+        возвращает `True` для очередного кадра. Предикат может вернуть одномерный массив флагов
+        по измерениям кадра, тогда событие начинается с первого отмеченного измерения.
+        Длительность предыстории и события задается в кадрах или в секундах (пересчитывается по экспозиции).
+
+        Кадры читаются в буферы, выделенные один раз: спектр, передаваемый в `predicate`, перезаписывается
+        следующим кадром, поэтому сохранять его нужно копией.
+
+        :param pre_frames: Количество измерений до триггера.
+        :param post_frames: Количество измерений начиная с триггера.
+        :param predicate: Условие срабатывания триггера для очередного кадра.
+        :param frames_interval: Кол-во кадров для считывания в одной итерации цикла.
+        :param pre_seconds: Длительность предыстории в секундах.
+        :param post_seconds: Длительность события в секундах.
+        :param timeout: Максимальное время ожидания триггера в секундах.
+
+        :return: Спектр события. Последние `post_frames` измерений начинаются с кадра триггера.
+            `None`, если триггер не сработал за `timeout` или чтение было остановлено `stop_reading`.
+        :rtype: Spectrum | None
+        """
+        if not self.is_configured:
+            raise ConfigurationError("Spectrometer not configured.")
+
+        factory_config = self.__factory_config
+        capture = EventCapture(
+            n_numbers=factory_config.end - factory_config.start,
+            pre_frames=self.__frames_for(pre_frames, pre_seconds),
+            post_frames=self.__frames_for(post_frames, post_seconds),
+            predicate=predicate,
+        )
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        n_numbers = factory_config.end - factory_config.start
+        scale = factory_config.intensity_scale
+        frame = Spectrum(
+            intensity=np.empty((frames_interval, n_numbers)),
+            clipped=np.empty((frames_interval, n_numbers), dtype=bool),
+            exposure=self.__config.exposure,
+            wavelength=self.__wavelengths,
+        )
+
+        is_opened = self.__is_opened
+        self.__capture = capture
+        try:
+            if not is_opened:
+                self.open()
+            chunk, _ = _plan_read(frames_interval, n_numbers, self.__device, self.__config.memory_budget)
+            dark = np.round(self.__dark_signal.mean(axis=0) / scale)
+            self._reset_stop_reading()
+            while not self.__stop_reading_flag:
+                self.__read_into(frame.intensity, frame.clipped, chunk)
+                _subtract_dark(frame.intensity, dark, scale)
+                frame.invalidate_cache()
+                result = capture.push(frame)
+                if result is not None:
+                    return result
+                if deadline is not None and not capture.triggered and time.monotonic() >= deadline:
+                    return None
+            return None
+        finally:
+            self.__capture = None
+            if not is_opened:
+                self.close()
+
+    def trigger(self):
+        """
+        Программный триггер для `capture_event`. Событие начнется с первого измерения следующего кадра.
+        """
+        capture = self.__capture
+        if capture is None:
+            raise RuntimeError("Event capture is not running")
+        capture.trigger()
+
     # --------        config        --------
     @property
     def config(self) -> Config:
@@ -334,6 +558,7 @@ class Spectrometer:
                    n_times: Optional[int] = None,
                    dark_signal_path: Optional[str] = None,
                    wavelength_calibration_path: Optional[str] = None,
+                   memory_budget: Optional[int] = None,
                    ):
         """
         Установить настройки спектрометра. Все параметры опциональны, при
@@ -350,6 +575,9 @@ class Spectrometer:
 
         :param wavelength_calibration_path: Путь к файлу данных калибровки по длине волны
         :type wavelength_calibration_path: str | None
+
+        :param memory_budget: Бюджет памяти на одно чтение в байтах, см. `read_raw`
+        :type memory_budget: int | None
         """
         if (exposure is not None) and (exposure != self.__config.exposure):
             self.__config.exposure = exposure
@@ -367,3 +595,6 @@ class Spectrometer:
 
         if wavelength_calibration_path is not None:
             self.__load_wavelength_calibration(wavelength_calibration_path)
+
+        if memory_budget is not None:
+            self.__config.memory_budget = memory_budget
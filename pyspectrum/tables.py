@@ -0,0 +1,89 @@
+"""
+Стандартные таблицы колориметрии CIE.
+
+Таблицы хранятся в пакете в виде файлов `.npy` и загружаются при первом обращении как массивы,
+отображенные в память (только для чтения); повторные обращения возвращают тот же массив.
+Формат таблиц совпадает с ожидаемым `Colorimetry`, `LedAnalysis` и `FlickerAnalysis`:
+
+- наблюдатель - поля `wavelength`, `X`, `Y`, `Z`;
+- источник - поля `wavelength`, `intensity`;
+- функция видности - поля `wavelength`, `V`;
+- тестовые образцы цвета - поля `wavelength`, `reflectance` (образцы);
+- компоненты дневного света - поля `wavelength`, `S0`, `S1`, `S2`.
+
+```python
+from pyspectrum import tables
+colorimetry = Colorimetry(tables.observer('10deg'), tables.illuminant('D65'))
+```
+"""
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+from numpy.typing import NDArray
+
+_RESOURCES = Path(__file__).parent / 'resources'
+
+_OBSERVER_FILES = {'2deg': 'cie1931_2deg.npy', '10deg': 'cie1964_10deg.npy'}
+_ILLUMINANT_FILES = {'D65': 'd65.npy', 'E': 'e.npy'}
+
+OBSERVERS = tuple(_OBSERVER_FILES)
+"""Доступные наблюдатели: CIE 1931 2° и CIE 1964 10°"""
+ILLUMINANTS = tuple(_ILLUMINANT_FILES)
+"""Доступные источники"""
+
+
+@lru_cache(maxsize=None)
+def _load(filename: str) -> NDArray:
+    return np.load(_RESOURCES / filename, mmap_mode='r')
+
+
+def observer(name: str = '2deg') -> NDArray:
+    """
+    Функции сложения цветов стандартного наблюдателя, 360-830 нм с шагом 1 нм.
+
+    :param str name: `2deg` или `10deg`
+    :return: Структурированный массив только для чтения
+    """
+    if name not in _OBSERVER_FILES:
+        raise ValueError(f'Unknown observer {name}, expected one of {OBSERVERS}')
+    return _load(_OBSERVER_FILES[name])
+
+
+def illuminant(name: str = 'D65') -> NDArray:
+    """
+    Относительное спектральное распределение стандартного источника, 360-830 нм с шагом 1 нм.
+
+    :param str name: `D65` или `E`
+    :return: Структурированный массив только для чтения
+    """
+    if name not in _ILLUMINANT_FILES:
+        raise ValueError(f'Unknown illuminant {name}, expected one of {ILLUMINANTS}')
+    return _load(_ILLUMINANT_FILES[name])
+
+
+def efficiency() -> NDArray:
+    """
+    Функция видности для дневного зрения V(λ), 360-830 нм с шагом 1 нм.
+
+    :return: Структурированный массив только для чтения
+    """
+    return _load('cie_photopic.npy')
+
+
+def daylight_components() -> NDArray:
+    """
+    Компоненты S0, S1, S2 спектра дневного света CIE серии D, 300-830 нм с шагом 10 нм.
+
+    :return: Структурированный массив только для чтения
+    """
+    return _load('cie_daylight.npy')
+
+
+def color_samples() -> NDArray:
+    """
+    Коэффициенты отражения 14 тестовых образцов цвета CIE 13.3, 360-830 нм с шагом 5 нм.
+
+    :return: Структурированный массив только для чтения, поле `reflectance` - (длины волн x образцы)
+    """
+    return _load('cie13_3_tcs.npy')
@@ -252,6 +252,6 @@ class UsbDevice:
         data_array = np.frombuffer(data, dtype=np.uint16)
         samples = data_array.reshape((n_times, pixel_count))
         samples = samples ^ (1 << 15)
-        clipped = np.where(samples == np.iinfo(np.uint16).max, 1, 0)
+        clipped = samples == np.iinfo(np.uint16).max
 
         return Frame(samples=samples, clipped=clipped)
\ No newline at end of file
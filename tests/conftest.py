@@ -0,0 +1,19 @@
+import numpy as np
+from pyspectrum import Data, Spectrum
+
+
+def make_frame(intensity, exposure: int = 10, wavelength=None, clipped=None) -> Data:
+    """
+    Кадр с заданными интенсивностями: `Spectrum`, если задана шкала длин волн, иначе `Data`.
+
+    :param intensity: Двумерный массив интенсивностей
+    :param int exposure: Экспозиция в миллисекундах
+    :param wavelength: Шкала длин волн
+    :param clipped: Флаги зашкаливания, по умолчанию ни один отсчет не зашкален
+    """
+    intensity = np.asarray(intensity, dtype=float)
+    if clipped is None:
+        clipped = np.zeros(intensity.shape, dtype=bool)
+    if wavelength is None:
+        return Data(intensity, clipped, exposure)
+    return Spectrum(intensity, clipped, exposure, np.asarray(wavelength, dtype=float))
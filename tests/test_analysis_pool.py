@@ -0,0 +1,51 @@
+import time
+
+import numpy as np
+import pytest
+from pyspectrum import AnalysisPool, Spectrum
+from .conftest import make_frame
+
+
+def frame_mean(spectrum):
+    return float(spectrum.intensity.mean()), spectrum.exposure, spectrum.wavelength[0]
+
+
+def slow_first(spectrum):
+    value = float(spectrum.intensity[0, 0])
+    if value == 0:
+        time.sleep(0.3)
+    return value
+
+
+def fail(spectrum):
+    raise ValueError('analysis failed')
+
+
+def make_spectrum(value, n_times=3) -> Spectrum:
+    return make_frame(np.full((n_times, 4), value), exposure=7, wavelength=[400., 401., 402., 403.])
+
+
+def test_results_in_order():
+    results = []
+    with AnalysisPool(slow_first, on_result=results.append, workers=2, max_in_flight=3) as pool:
+        for i in range(10):
+            pool(make_spectrum(i))
+            assert pool.in_flight <= 3
+    assert results == list(range(10))
+
+
+def test_spectrum_fields():
+    results = []
+    with AnalysisPool(frame_mean, on_result=results.append, workers=1) as pool:
+        pool.submit(make_spectrum(2.0))
+        pool.submit(make_spectrum(4.0, n_times=1))
+        pool.flush()
+        assert pool.in_flight == 0
+    assert results == [(2.0, 7, 400.), (4.0, 7, 400.)]
+
+
+def test_worker_error():
+    with AnalysisPool(fail, workers=1) as pool:
+        pool.submit(make_spectrum(0))
+        with pytest.raises(ValueError):
+            pool.flush()
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+from pyspectrum import Colorimetry, Spectrum
+from pyspectrum import colorimetry as colorimetry_module
+from pyspectrum.colorimetry import (XYZ_to_Lab, XYZ_to_Luv, XYZ_to_RGB, XYZ_to_xyY, adaptation_matrix, delta_E,
+                                    nearest_reference, rgb_matrix, srgb_gamma, to_LCh)
+
+
+def make_tables():
+    wl = np.arange(360, 831, 1.0)
+    observer = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('X', 'f8'), ('Y', 'f8'), ('Z', 'f8')])
+    observer['wavelength'] = wl
+    observer['X'] = np.exp(-0.5 * ((wl - 600) / 40) ** 2)
+    observer['Y'] = np.exp(-0.5 * ((wl - 555) / 45) ** 2)
+    observer['Z'] = np.exp(-0.5 * ((wl - 450) / 25) ** 2)
+    illuminant = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('intensity', 'f8')])
+    illuminant['wavelength'] = wl
+    illuminant['intensity'] = 100
+    return observer, illuminant
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_xyz(reverse):
+    observer, illuminant = make_tables()
+    colorimetry = Colorimetry(observer, illuminant)
+    wavelength = np.linspace(340, 850, 1021)
+    intensity = np.random.default_rng(0).random((4, 1021))
+    if reverse:
+        wavelength, intensity = wavelength[::-1], intensity[:, ::-1]
+    spectrum = Spectrum(intensity, np.zeros(intensity.shape, dtype=bool), 1, wavelength)
+
+    xyz = colorimetry.XYZ(spectrum)
+    assert xyz.shape == (4, 3)
+    for i in range(4):
+        assert np.allclose(colorimetry.XYZ(intensity[i], wavelength), xyz[i])
+
+    # perfect reflector has Y = 1 and the white point of the illuminant
+    white = colorimetry.XYZ(np.ones((1, 1021)), wavelength, reference=np.ones(1021))
+    assert np.allclose(white[0], colorimetry.white_point, rtol=1e-3)
+    assert colorimetry.weights(wavelength).shape == (3, 1021)
+    assert colorimetry.weights(wavelength) is colorimetry.weights(wavelength)
+
+    with pytest.raises(ValueError):
+        colorimetry.XYZ(np.ones(5), np.arange(5.0))
+
+
+SRGB_PRIMARIES = np.array([(0.64, 0.33), (0.30, 0.60), (0.15, 0.06)])
+D65 = np.array([0.95047, 1.0, 1.08883])
+BRADFORD = np.array([[0.8951, 0.2664, -0.1614], [-0.7502, 1.7135, 0.0367], [0.0389, -0.0685, 1.0296]])
+
+
+def test_rgb_matrix():
+    m = rgb_matrix(SRGB_PRIMARIES, D65)
+    assert np.allclose(m @ D65, 1)
+    assert np.allclose(m[0], [3.2406, -1.5372, -0.4986], atol=1e-3)
+    assert m is rgb_matrix(SRGB_PRIMARIES.copy(), D65.copy())
+    assert not m.flags.writeable
+
+    a = adaptation_matrix(BRADFORD, np.ones(3), D65)
+    assert np.allclose(a @ np.ones(3), D65)
+    assert np.allclose(adaptation_matrix(BRADFORD, D65, D65), np.eye(3))
+
+
+def test_conversions_match_single_values():
+    xyz = np.random.default_rng(1).random((6, 3))
+    xyz[0] = [0.001, 0.002, 0.003]  # linear part of the Lab function
+    m = rgb_matrix(SRGB_PRIMARIES, D65)
+    rgb = XYZ_to_RGB(xyz, m, gamma=srgb_gamma)
+    lab = XYZ_to_Lab(xyz, D65)
+    luv = XYZ_to_Luv(xyz, D65)
+    for i, (X, Y, Z) in enumerate(xyz):
+        assert np.allclose(XYZ_to_xyY(xyz)[i], [X / (X + Y + Z), Y / (X + Y + Z), Y])
+        assert np.allclose(XYZ_to_Lab(xyz[i], D65), lab[i])
+        assert np.allclose(XYZ_to_Luv(xyz[i], D65), luv[i])
+        assert np.allclose(XYZ_to_RGB(xyz[i], m, gamma=srgb_gamma), rgb[i])
+
+    assert np.allclose(XYZ_to_Lab(D65, D65), [100, 0, 0])
+    assert np.allclose(XYZ_to_Luv(D65, D65), [100, 0, 0])
+    assert np.allclose(XYZ_to_Lab(xyz[0], D65)[0], 903.3 * 0.002)
+    assert np.all((rgb >= 0) & (rgb <= 1))
+    assert np.allclose(XYZ_to_RGB(D65, m, gamma=1 / 2.2), 1)
+
+    lch = to_LCh(lab)
+    assert np.allclose(lch[:, 1] * np.cos(np.radians(lch[:, 2])), lab[:, 1])
+    assert np.allclose(lch[:, 1] * np.sin(np.radians(lch[:, 2])), lab[:, 2])
+
+
+# Sharma, Wu, Dalal, "The CIEDE2000 color-difference formula" (2005), test data
+CIEDE2000_PAIRS = [
+    ((50.0000, 2.6772, -79.7751), (50.0000, 0.0000, -82.7485), 2.0425),
+    ((50.0000, 0.0000, 0.0000), (50.0000, -1.0000, 2.0000), 2.3669),
+    ((50.0000, 2.5000, 0.0000), (50.0000, 0.0000, -2.5000), 4.3065),
+    ((50.0000, 2.5000, 0.0000), (73.0000, 25.0000, -18.0000), 27.1492),
+    ((60.2574, -34.0099, 36.2677), (60.4626, -34.1751, 39.4387), 1.2644),
+    ((90.8027, -2.0831, 1.4410), (91.1528, -1.6435, 0.0447), 1.4441),
+]
+
+
+def test_delta_e2000():
+    first = np.array([pair[0] for pair in CIEDE2000_PAIRS])
+    second = np.array([pair[1] for pair in CIEDE2000_PAIRS])
+    expected = np.array([pair[2] for pair in CIEDE2000_PAIRS])
+    matrix = delta_E(first, second)
+    assert matrix.shape == (6, 6)
+    assert np.allclose(np.diag(matrix), expected, atol=1e-4)
+    assert np.allclose(np.diag(delta_E(second, first)), expected, atol=1e-4)
+
+
+@pytest.mark.parametrize("method", ['76', '94', '2000'])
+def test_delta_e_blocks(method, monkeypatch):
+    rng = np.random.default_rng(2)
+    lab = rng.uniform([0, -60, -60], [100, 60, 60], (500, 3))
+    reference = rng.uniform([0, -60, -60], [100, 60, 60], (70, 3))
+    full = delta_E(lab, reference, method)
+
+    monkeypatch.setattr(colorimetry_module, '_DELTA_E_BLOCK', 100)
+    assert np.array_equal(delta_E(lab, reference, method), full)
+    index, distance = nearest_reference(lab, reference, method)
+    assert np.array_equal(index, full.argmin(axis=1))
+    assert np.allclose(distance, full.min(axis=1))
+
+    assert delta_E(lab[0], reference, method).shape == (70,)
+    assert delta_E(lab[0], lab[0], method) == 0
+    # for neutral colors only the lightness term remains (weighted by S_L in CIEDE2000)
+    s_l = 1 + 0.015 * 25 / np.sqrt(20 + 25) if method == '2000' else 1
+    assert np.isclose(delta_E([50, 0, 0], [60, 0, 0], method), 10 / s_l)
+    if method == '76':
+        assert np.allclose(full, np.linalg.norm(lab[:, None] - reference[None], axis=-1))
@@ -0,0 +1,429 @@
+import copyreg
+import dataclasses
+import pickle
+
+import numpy as np
+import pytest
+from pyspectrum import Data, FrameHeader, Spectrum, SpectrumSeries, LoadError
+from pyspectrum import file_format
+from .conftest import make_frame
+
+
+def make_spectrum(n_times=4, n_numbers=6) -> Spectrum:
+    return make_frame(np.arange(n_times * n_numbers).reshape(n_times, n_numbers), exposure=5,
+                      wavelength=np.linspace(400, 700, n_numbers), clipped=np.eye(n_times, n_numbers, dtype=bool))
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_binary_save_load(tmp_path, mmap):
+    path = str(tmp_path / 'spectrum.bin')
+    spectrum = make_spectrum()
+    spectrum.save(path)
+    assert file_format.is_binary(path)
+
+    loaded = Spectrum.load(path, mmap=mmap)
+    assert type(loaded) == Spectrum
+    assert isinstance(loaded.intensity, np.memmap) == mmap
+    assert np.array_equal(loaded.intensity, spectrum.intensity)
+    assert np.array_equal(loaded.clipped, spectrum.clipped)
+    assert np.array_equal(loaded.wavelength, spectrum.wavelength)
+    assert loaded.exposure == 5
+
+    # loaded arrays can be changed without touching the file
+    loaded.intensity[0, 0] = -1
+    assert Spectrum.load(path).intensity[0, 0] == 0
+
+    # Spectrum is Data, but plain Data is not a Spectrum
+    assert isinstance(Data.load(path), Spectrum)
+    data_path = str(tmp_path / 'data.bin')
+    Data(spectrum.intensity[:, ::-1], spectrum.clipped, 5).save(data_path)
+    assert np.array_equal(Data.load(data_path).intensity, spectrum.intensity[:, ::-1])
+    with pytest.raises(LoadError):
+        Spectrum.load(data_path)
+
+
+def test_save_over_loaded_file(tmp_path):
+    path = str(tmp_path / 'spectrum.bin')
+    make_spectrum(50, 40).save(path)
+
+    loaded = Spectrum.load(path)
+    assert isinstance(loaded.intensity, np.memmap)
+    loaded += 1
+    loaded.save(path)
+    assert np.array_equal(loaded.intensity, make_spectrum(50, 40).intensity + 1)
+    assert np.array_equal(Spectrum.load(path).intensity, make_spectrum(50, 40).intensity + 1)
+    assert [p.name for p in tmp_path.iterdir()] == ['spectrum.bin']
+
+    make_raw().save(path)
+    lazy = Spectrum.load(path)
+    lazy.save(path)
+    assert np.array_equal(Spectrum.load(path).intensity, make_raw().intensity)
+
+
+def test_binary_alignment(tmp_path):
+    path = str(tmp_path / 'spectrum.bin')
+    make_spectrum(3, 5).save(path)
+    with open(path, 'rb') as f:
+        f.seek(file_format._PREAMBLE.size - 4)
+        header_length = int.from_bytes(f.read(4), 'little')
+    meta, arrays = file_format.read(path)
+    for array in arrays.values():
+        assert array.offset % file_format.ALIGNMENT == 0
+        assert array.offset >= file_format._PREAMBLE.size + header_length
+
+
+def test_legacy_pickle(tmp_path):
+    path = str(tmp_path / 'legacy.pkl')
+    spectrum = make_spectrum()
+    spectrum.save(path, legacy=True)
+    with open(path, 'rb') as f:
+        assert type(pickle.load(f)) == Spectrum
+
+    assert np.array_equal(Spectrum.load(path).intensity, spectrum.intensity)
+    with pytest.raises(LoadError):
+        Spectrum.load(path, allow_pickle=False)
+
+
+def test_series_append():
+    wavelength = np.linspace(400, 700, 31)
+    series = SpectrumSeries(capacity=4)
+    for i in range(50):
+        frame = Spectrum(np.full((2, 31), float(i)), np.zeros((2, 31), dtype=bool), 10, wavelength)
+        series.append(frame, timestamp=i * 0.02)
+
+    assert series.shape == (100, 31)
+    assert series.capacity >= 100
+    assert series.wavelength is wavelength
+    assert np.allclose(series.timestamp[:3], [0, 0.01, 0.02])
+    assert np.array_equal(series[-1].intensity, np.full((1, 31), 49.0))
+
+    mean = series.mean(0.1, 0.2)
+    assert np.array_equal(mean.intensity, np.full((1, 31), 7.0))
+
+    binned = series.binned(0.1)
+    assert binned.shape == (10, 31)
+    assert np.array_equal(binned.intensity[:, 0], np.arange(10) * 5 + 2)
+
+    with pytest.raises(ValueError):
+        series.append(Spectrum(np.zeros((1, 31)), np.zeros((1, 31), dtype=bool), 10, wavelength + 1))
+    series.append(Data(np.zeros((1, 31)), np.zeros((1, 31), dtype=bool), 20))
+    with pytest.raises(ValueError):
+        series.mean()
+
+
+def test_series_chunks():
+    series = SpectrumSeries(capacity=2, chunk_frames=4)
+    for i in range(4):
+        series.append(Data(np.full((3, 5), float(i)), np.zeros((3, 5), dtype=bool), 10), timestamp=i * 0.03)
+    first = series[0].intensity
+    series.append(Data(np.full((3, 5), 4.0), np.zeros((3, 5), dtype=bool), 10), timestamp=0.12)
+
+    # ранее записанные измерения не копируются при добавлении
+    assert np.shares_memory(series[0].intensity, first)
+    assert series.capacity == 3 + 4 * 3
+    assert series.header(7).timestamp == pytest.approx(0.07)
+    assert np.array_equal(series[1:4].intensity[:, 0], [0, 0, 1])
+
+    assert np.array_equal(series.intensity[:, 0], np.repeat(np.arange(5.0), 3))
+    assert np.allclose(series.timestamp, np.arange(15) * 0.01)
+    assert series.intensity.flags.c_contiguous
+    merged = series.intensity
+    assert series.capacity == 30
+    series.append(Data(np.zeros((1, 5)), np.zeros((1, 5), dtype=bool), 10), timestamp=0.15)
+    assert series.shape == (16, 5)
+    assert series.intensity[-1, 0] == 0
+    # объединенный буфер выделен с запасом, новые кадры дописываются в него
+    assert np.shares_memory(series.intensity, merged)
+    assert series.mean().intensity[0, 0] == pytest.approx(30 / 16)
+
+    series.clear()
+    assert series.shape == (0, 5)
+    assert SpectrumSeries().intensity.shape == (0, 0)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_series_band_resample(reverse):
+    wavelength = np.linspace(400, 700, 31)
+    intensity = np.stack([wavelength, 2 * wavelength])
+    if reverse:
+        wavelength, intensity = wavelength[::-1], intensity[:, ::-1]
+    series = SpectrumSeries(wavelength=wavelength)
+    series.append(Spectrum(intensity, np.zeros((2, 31), dtype=bool), 10, wavelength))
+
+    band = series.band(450, 500)
+    assert np.array_equal(np.sort(band.wavelength), [450, 460, 470, 480, 490, 500])
+    assert np.array_equal(band.intensity[0], band.wavelength)
+
+    resampled = series.resample([395, 405, 699.5])
+    assert np.isnan(resampled.intensity[:, 0]).all()
+    assert np.allclose(resampled.intensity[:, 1:], [[405, 699.5], [810, 1399]])
+
+
+def test_inplace_arithmetics():
+    spectrum = make_spectrum()
+    intensity, clipped = spectrum.intensity, spectrum.clipped.copy()
+    dark = Data(np.ones((1, 6)), np.array([[1, 0, 0, 0, 0, 0]], dtype=bool), 5)
+
+    spectrum -= dark
+    assert type(spectrum) == Spectrum
+    assert spectrum.intensity is intensity
+    assert np.array_equal(spectrum.intensity[0], np.arange(6) - 1)
+    assert np.array_equal(spectrum.clipped[:, 0], [1, 1, 1, 1])
+    # source flags are not modified
+    assert np.array_equal(clipped, np.eye(4, 6, dtype=bool))
+
+    spectrum *= 2
+    spectrum /= 4
+    spectrum += 1
+    assert spectrum.intensity is intensity
+    assert np.array_equal(spectrum.intensity[0], (np.arange(6) - 1) / 2 + 1)
+
+    divided = make_spectrum() / 2
+    assert type(divided) == Spectrum
+    assert np.array_equal(divided.wavelength, make_spectrum().wavelength)
+    assert np.array_equal(divided.intensity, make_spectrum().intensity / 2)
+
+    out = make_spectrum()
+    result = make_spectrum().add(make_spectrum(), out=out)
+    assert result is out
+    assert np.array_equal(out.intensity, make_spectrum().intensity * 2)
+
+    with pytest.raises(TypeError):
+        spectrum /= dark
+    with pytest.raises(ValueError):
+        spectrum += Data(np.ones((1, 6)), np.zeros((1, 6), dtype=bool), 1)
+
+
+def test_inplace_integer_arithmetics():
+    data = Data(np.array([1, 2, 999]), np.array([0, 0, 1]), 3)
+    intensity = data.intensity
+
+    data += 1
+    data *= 2
+    assert data.intensity is intensity
+    assert np.array_equal(intensity, [4, 6, 2000])
+
+    # the result does not fit into an integer array: a new object is created, as for `data = data / 2`
+    source = data
+    data /= 2
+    assert data is not source and data.intensity.dtype == np.float64
+    assert np.array_equal(data.intensity, [2, 3, 1000])
+    assert np.array_equal(source.intensity, [4, 6, 2000])
+    data = source
+    data += 0.5
+    assert np.array_equal(data.intensity, [4.5, 6.5, 2000.5])
+    assert np.array_equal(source.intensity, [4, 6, 2000])
+
+    # explicit `out` keeps numpy casting rules
+    with pytest.raises(TypeError):
+        source.divide(2, out=source)
+
+
+def test_getitem_views():
+    spectrum = make_spectrum()
+    part = spectrum[1:3, 2:]
+    assert type(part) == Spectrum
+    assert np.shares_memory(part.intensity, spectrum.intensity)
+    assert np.shares_memory(part.clipped, spectrum.clipped)
+    assert np.array_equal(part.wavelength, spectrum.wavelength[2:])
+    part.intensity[0, 0] = -1
+    assert spectrum.intensity[1, 2] == -1
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_wavelength_selection(reverse):
+    spectrum = make_spectrum(n_numbers=31)
+    if reverse:
+        spectrum = spectrum[:, ::-1]
+
+    part = spectrum.sel(450, 500)
+    assert np.array_equal(np.sort(part.wavelength), [450, 460, 470, 480, 490, 500])
+    assert np.shares_memory(part.intensity, spectrum.intensity)
+    in_range = (spectrum.wavelength >= 450) & (spectrum.wavelength <= 500)
+    assert np.array_equal(part.intensity, spectrum.intensity[:, in_range])
+    assert spectrum.sel(800, 900).shape == (4, 0)
+
+    nearest = spectrum.at([401, 556, 1000])
+    assert np.array_equal(nearest.wavelength, [400, 560, 700])
+    assert spectrum.at(600).shape == (4, 1)
+
+
+def test_fancy_indexing():
+    spectrum = make_spectrum()
+    assert spectrum[1].shape == (1, 6)
+    assert np.array_equal(spectrum[-1].intensity, spectrum.intensity[-1:])
+    assert np.array_equal(spectrum[:, 2].wavelength, spectrum.wavelength[2:3])
+
+    mask = spectrum.wavelength > 500
+    assert np.array_equal(spectrum[:, mask].intensity, spectrum.intensity[:, mask])
+    assert np.array_equal(spectrum[[0, 2], [1, 3]].intensity, spectrum.intensity[[0, 2]][:, [1, 3]])
+    assert np.array_equal(spectrum[[True, False, True, False], [1, 3]].clipped, spectrum.clipped[[0, 2]][:, [1, 3]])
+
+    with pytest.raises(TypeError):
+        spectrum['a']
+
+
+@pytest.mark.parametrize("axis", [0, 1, None])
+def test_statistics(monkeypatch, axis):
+    # small blocks to exercise merging of per-block moments
+    monkeypatch.setattr('pyspectrum.data._STATS_BLOCK', 20)
+    values = np.random.default_rng(0).normal(1e4, 3, (37, 7))
+    data = Data(values.copy(), np.zeros(values.shape, dtype=bool), 1)
+
+    assert np.allclose(data.sum(axis), values.sum(axis))
+    assert np.allclose(data.mean(axis), values.mean(axis))
+    assert np.allclose(data.std(axis), values.std(axis))
+    assert np.allclose(data.std(axis, ddof=1), values.std(axis, ddof=1))
+    assert np.allclose(data.min(axis), values.min(axis))
+    assert np.allclose(data.max(axis), values.max(axis))
+    if axis is None:
+        assert type(data.sum(axis)) is float and type(data.max(axis)) is float
+    else:
+        assert data.mean(axis) is data.mean(axis)
+
+
+def test_statistics_empty():
+    data = Data(np.zeros((0, 4)), np.zeros((0, 4), dtype=bool), 1)
+    for axis in (0, None):
+        with pytest.raises(ValueError):
+            data.min(axis)
+        with pytest.raises(ValueError):
+            data.max(axis)
+    assert data.min(1).shape == (0,)
+    assert np.array_equal(data.sum(), np.zeros(4))
+    assert data.sum(None) == 0.0
+
+
+def test_statistics_invalidation():
+    data = make_spectrum()
+    mean = data.mean()
+    with pytest.raises(ValueError):
+        mean[0] = 1
+
+    data += 1
+    assert np.array_equal(data.mean(), mean + 1)
+    data.intensity = np.zeros((2, 6))
+    assert np.array_equal(data.max(), np.zeros(6))
+    data.intensity[0] = 2
+    data.invalidate_cache()
+    assert np.array_equal(data.max(), np.full(6, 2))
+
+
+def test_statistics_of_views():
+    data = make_spectrum()
+    part = data[0:2]
+    mean, part_mean = data.mean(), part.mean()
+
+    # in-place arithmetic on a view changes the parent data
+    part += 100
+    assert np.array_equal(data.mean(), mean + 50)
+    assert np.array_equal(part.mean(), part_mean + 100)
+
+    # and vice versa
+    data -= 100
+    assert np.array_equal(part.mean(), part_mean)
+    data.intensity[1:3] = 0
+    part.invalidate_cache()
+    assert np.array_equal(data.max(), data.intensity.max(axis=0))
+
+    # copies do not share the cache generation
+    copy = data[[0, 1]]
+    copy += 1
+    assert np.array_equal(data.mean(), data.intensity.mean(axis=0))
+
+
+def make_raw(offset=None) -> Spectrum:
+    samples = (np.arange(24, dtype=np.uint16).reshape(4, 6) * 100)[:, ::-1]
+    clipped = np.zeros((4, 6), dtype=bool)
+    clipped[1, 2] = True
+    return Spectrum.from_raw(samples, clipped, 5, scale=0.5, offset=offset, wavelength=np.linspace(400, 700, 6))
+
+
+def test_lazy_data():
+    offset = np.arange(6, dtype=float)
+    spectrum = make_raw(offset)
+    expected = (spectrum._raw.samples - offset) * 0.5
+
+    assert spectrum.is_lazy
+    assert spectrum.shape == (4, 6)
+    assert np.allclose(spectrum.mean(), expected.mean(axis=0))
+    assert np.allclose(spectrum.std(1), expected.std(axis=1))
+    assert np.allclose(spectrum.max(None), expected.max())
+    assert spectrum.is_lazy
+
+    assert np.array_equal(spectrum.intensity, expected)
+    assert spectrum.clipped.dtype == bool and spectrum.clipped[1, 2]
+    assert not spectrum.is_lazy
+
+    spectrum = make_raw()
+    spectrum.clipped = np.ones((4, 6), dtype=bool)
+    assert np.array_equal(spectrum.intensity, make_raw().intensity)
+    assert spectrum.clipped.all()
+
+
+@pytest.mark.parametrize("offset", [None, np.arange(6, dtype=float)])
+def test_lazy_save_load(tmp_path, offset):
+    path = str(tmp_path / 'raw.bin')
+    spectrum = make_raw(offset)
+    spectrum.save(path)
+    assert spectrum.is_lazy
+
+    loaded = Spectrum.load(path)
+    assert loaded.is_lazy
+    assert loaded._raw.samples.dtype == np.uint16
+    assert np.array_equal(loaded.intensity, spectrum.intensity)
+    assert np.array_equal(loaded.clipped, spectrum.clipped)
+    assert np.array_equal(loaded.wavelength, spectrum.wavelength)
+
+    # materialized objects are written in version 1
+    loaded.save(path)
+    with open(path, 'rb') as f:
+        assert file_format._PREAMBLE.unpack(f.read(file_format._PREAMBLE.size))[1] == 1
+
+
+class _LegacySpectrum:
+    """Pickles like a Spectrum saved by versions without __slots__."""
+
+    def __init__(self, state):
+        self.state = state
+
+    def __reduce_ex__(self, protocol):
+        return copyreg._reconstructor, (Spectrum, object, None), self.state
+
+
+def test_slots_and_legacy_state():
+    spectrum = make_spectrum()
+    assert not hasattr(spectrum, '__dict__')
+
+    restored = pickle.loads(pickle.dumps(spectrum))
+    assert np.array_equal(restored.intensity, spectrum.intensity)
+    assert np.array_equal(restored.wavelength, spectrum.wavelength)
+
+    state = {'intensity': spectrum.intensity, 'clipped': spectrum.clipped, 'exposure': 5,
+             'wavelength': spectrum.wavelength, 'number': None}
+    legacy = pickle.loads(pickle.dumps(_LegacySpectrum(state)))
+    assert type(legacy) == Spectrum
+    assert np.array_equal(legacy.intensity, spectrum.intensity)
+    assert np.array_equal(legacy.mean(), spectrum.mean())
+
+
+def test_freeze():
+    spectrum = make_spectrum()
+    intensity = spectrum.intensity
+    assert spectrum.freeze() is spectrum
+    assert intensity.flags.writeable
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spectrum.exposure = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        spectrum += 1
+    # массивы только для чтения: изменение элементов отклоняет numpy
+    with pytest.raises(ValueError, match='read-only'):
+        spectrum.intensity += 1
+    assert np.array_equal(spectrum.intensity, intensity)
+    assert np.array_equal(spectrum.mean(), intensity.mean(axis=0))
+    assert not pickle.loads(pickle.dumps(spectrum)).intensity.flags.writeable
+
+    header = FrameHeader(timestamp=1.5, exposure=10, sequence=3)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        header.sequence = 4
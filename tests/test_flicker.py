@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from pyspectrum import FlickerAnalysis, FlickerMeter
+from pyspectrum.flicker import flicker_metrics
+from .conftest import make_frame
+
+
+def make_analysis():
+    wl = np.arange(380, 781, 1.0)
+    efficiency = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('V', 'f8')])
+    efficiency['wavelength'] = wl
+    efficiency['V'] = np.exp(-0.5 * ((wl - 555) / 45) ** 2)
+    return FlickerAnalysis(efficiency)
+
+
+def make_spectrum(n_times=4000, frequency=123.4, depth=0.3, exposure=1):
+    wavelength = np.linspace(360, 800, 300)
+    t = np.arange(n_times) * exposure / 1000
+    modulation = 1 + depth * np.sin(2 * np.pi * frequency * t)
+    intensity = modulation[:, None] * np.exp(-0.5 * ((wavelength - 560) / 40) ** 2) * 100
+    return make_frame(intensity, exposure, wavelength)
+
+
+def test_metrics_of_sine():
+    metrics = make_analysis()(make_spectrum())
+    assert metrics.percent_flicker == pytest.approx(30, rel=1e-3)
+    # area above the mean of a sine: depth / pi
+    assert metrics.flicker_index == pytest.approx(0.3 / np.pi, rel=1e-2)
+    assert metrics.frequency == pytest.approx(123.4, abs=0.1)
+
+    steady = flicker_metrics(np.ones((2, 100)), 1000)
+    assert np.all(steady.percent_flicker == 0) and np.all(steady.flicker_index == 0)
+    assert np.all(np.isnan(steady.frequency))
+
+
+def test_signal_is_weighted_sum():
+    analysis = make_analysis()
+    spectrum = make_spectrum(n_times=10)
+    weights = analysis.weights(spectrum.wavelength)
+    assert weights is analysis.weights(spectrum.wavelength)
+    assert weights[0] == 0  # outside of the efficiency table
+    assert np.allclose(analysis.signal(spectrum), [row @ weights for row in spectrum.intensity])
+
+
+def test_windows_and_streaming():
+    analysis = make_analysis()
+    spectrum = make_spectrum(n_times=3000, frequency=50, exposure=2)
+    windows = analysis(spectrum, window=1000, step=250)
+    assert windows.frequency.shape == (9,)
+    assert np.allclose(windows.frequency, 50, atol=0.1)
+    with pytest.raises(ValueError):
+        analysis(spectrum, window=5000)
+
+    results = []
+    meter = FlickerMeter(analysis, window=1000, step=250, on_result=results.append)
+    for start in range(0, 3000, 70):
+        meter(spectrum[start:start + 70])
+    assert np.allclose(np.concatenate([r.frequency for r in results]), windows.frequency)
+    assert np.allclose(np.concatenate([r.percent_flicker for r in results]), windows.percent_flicker)
+    assert meter.position == 9 * 250
+
+
+def test_streaming_step_longer_than_window():
+    analysis = make_analysis()
+    spectrum = make_spectrum(n_times=3000, frequency=50, exposure=2)
+    spectrum.intensity *= np.linspace(1, 2, 3000)[:, None]
+    windows = analysis(spectrum, window=200, step=450)
+    assert windows.mean.shape == (7,)
+
+    results = []
+    meter = FlickerMeter(analysis, window=200, step=450, on_result=results.append)
+    for start in range(0, 3000, 70):
+        meter(spectrum[start:start + 70])
+    # frames between windows are skipped even if they arrive in later updates
+    assert np.allclose(np.concatenate([r.mean for r in results]), windows.mean)
+    assert meter.position == 7 * 450
@@ -0,0 +1,141 @@
+import numpy as np
+import pytest
+from pyspectrum import LedAnalysis, Spectrum, tables
+from pyspectrum.led import analytic_cmf, approximate_cct, daylight, planck, xy_to_uv
+
+
+def make_samples(n_samples=14):
+    wl = np.arange(360, 831, 5.0)
+    samples = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('reflectance', 'f8', (n_samples,))])
+    samples['wavelength'] = wl
+    centers = np.linspace(400, 700, n_samples)
+    samples['reflectance'] = 0.2 + 0.6 * np.exp(-0.5 * ((wl[:, None] - centers) / 60) ** 2)
+    return samples
+
+
+def make_analysis(**kwargs):
+    wl = np.arange(360, 831, 1.0)
+    cmf = analytic_cmf(wl)
+    observer = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('X', 'f8'), ('Y', 'f8'), ('Z', 'f8')])
+    observer['wavelength'] = wl
+    observer['X'], observer['Y'], observer['Z'] = cmf
+    efficiency = np.zeros(len(wl), dtype=[('wavelength', 'f8'), ('V', 'f8')])
+    efficiency['wavelength'] = wl
+    efficiency['V'] = cmf[1]
+    return LedAnalysis(observer, efficiency, wl, **kwargs)
+
+
+def test_planck():
+    # Wien's displacement law
+    wl = np.arange(300, 2000, 1.0)
+    spd = planck(wl, [3000, 5000])
+    assert spd.shape == (2, len(wl))
+    assert np.allclose(wl[spd.argmax(axis=1)], 2.897771955e6 / np.array([3000, 5000]), atol=1)
+
+
+def test_batch_matches_single_spectra():
+    analysis = make_analysis()
+    wavelength = np.linspace(340, 850, 700)
+    intensity = np.random.default_rng(0).random((5, 700)) + np.exp(-0.5 * ((wavelength - 450) / 15) ** 2)
+    spectrum = Spectrum(intensity, np.zeros(intensity.shape, dtype=bool), 10, wavelength)
+
+    metrics = analysis(spectrum)
+    assert metrics.xyY.shape == (5, 3)
+    assert metrics.uv.shape == (5, 2)
+    assert metrics.cct.shape == metrics.duv.shape == metrics.luminous_power.shape == (5,)
+    for i in range(5):
+        spd = analysis.resample(intensity[i], wavelength)
+        assert spd.shape == analysis.wavelength.shape
+        assert np.allclose(analysis.xyY(spd), metrics.xyY[i])
+        assert np.isclose(analysis.luminous_power(spd), metrics.luminous_power[i])
+
+    normalized = analysis.normalize(analysis.resample(spectrum))
+    assert np.allclose(normalized.min(axis=1), 0) and np.allclose(normalized.max(axis=1), 1)
+
+
+@pytest.mark.parametrize("temperature", [2700, 4000, 6500])
+def test_cct_of_blackbody(temperature):
+    analysis = make_analysis()
+    xyY = analysis.xyY(analysis.blackbody(temperature))
+    assert xyY[1] == pytest.approx(1.0 / 3, abs=0.2)
+    assert approximate_cct(xyY, exponential=False) == pytest.approx(temperature, rel=0.01)
+    cct, duv = analysis.cct_duv(xyY)
+    assert cct == pytest.approx(temperature, abs=0.5)
+    assert duv == pytest.approx(0, abs=1e-6)
+
+    u, v = xy_to_uv(xyY)
+    assert 0.15 < u < 0.3 and 0.3 < v < 0.4
+
+
+def test_color_rendering():
+    analysis = make_analysis(samples=make_samples(), cache_size=4)
+    assert analysis.reflectance.shape == (14, len(analysis.wavelength))
+
+    # a black body is its own reference
+    temperature = np.array([2700.0, 4000.0, 4900.0])
+    rendering = analysis.color_rendering(analysis.blackbody(temperature), temperature)
+    assert rendering.ri.shape == (3, 14)
+    assert np.allclose(rendering.ri, 100) and np.allclose(rendering.ra, 100) and np.allclose(rendering.dc, 0)
+
+    wavelength = analysis.wavelength
+    led = np.exp(-0.5 * ((wavelength - 450) / 10) ** 2) + 1.2 * np.exp(-0.5 * ((wavelength - 580) / 55) ** 2)
+    spd = led * np.linspace(1, 2, 6)[:, None] + np.random.default_rng(1).random((6, len(wavelength))) * 0.05
+    batch = analysis.color_rendering(spd)
+    assert batch.ra.shape == batch.cct.shape == batch.dc.shape == (6,)
+    assert np.all(batch.ri < 100) and np.all(batch.ra > 50)
+    assert np.allclose(batch.cct, analysis.cct(analysis.xyY(spd)))
+    # the reference follows the CCT estimate, so a black body without explicit CCT still gets Ra = 100
+    assert np.allclose(analysis.color_rendering(analysis.blackbody(temperature)).ra, 100, atol=0.05)
+    assert np.allclose(batch.ra, batch.ri[:, :8].mean(axis=1))
+    for i in range(6):
+        single = analysis.color_rendering(spd[i])
+        assert single.ri.shape == (14,)
+        assert np.allclose(single.ri, batch.ri[i])
+
+    metrics = analysis(spd, wavelength)
+    assert np.allclose(metrics.color_rendering.ra, batch.ra)
+    assert make_analysis()(spd, wavelength).color_rendering is None
+    with pytest.raises(ValueError):
+        make_analysis().color_rendering(spd)
+
+
+def test_cct_duv_off_locus():
+    locus = make_analysis().locus
+    index = np.array([100, 700, 1500])
+    temperature = 1e6 / locus.mired[index]
+    tangent = locus._tangent[index]
+    normal = np.stack([-tangent[:, 1], tangent[:, 0]], axis=-1)
+    for duv in (-0.02, 0.0, 0.01):
+        uv = locus.uv[index] + duv * normal
+        cct, estimated = locus.cct(uv)
+        assert np.allclose(cct, temperature, rtol=1e-6)
+        assert np.allclose(estimated, duv, atol=1e-6)
+    # above the locus has a positive Duv
+    assert locus.cct(locus.uv[700] + [0, 0.005])[1] > 0
+
+    grid = np.stack(np.meshgrid(np.linspace(0.19, 0.26, 30), np.linspace(0.29, 0.35, 30)), axis=-1)
+    cct, duv = locus.cct(grid)
+    assert cct.shape == duv.shape == (30, 30)
+    assert np.all(np.isfinite(cct))
+    assert np.all(np.isnan(locus.cct(np.array([[0.5, 0.1], [0.1, 0.1]]))[0]))
+
+
+def test_daylight_reference():
+    analysis = LedAnalysis(wavelength=np.arange(360, 831.0), samples=tables.color_samples())
+    d65 = tables.illuminant('D65')
+    d65 = np.interp(analysis.wavelength, d65['wavelength'], d65['intensity'])
+    assert np.allclose(daylight(analysis.wavelength, 6504), d65, atol=0.1)
+
+    # CIE 13.3: from 5000 K the reference is CIE daylight, so D65 renders perfectly
+    rendering = analysis.color_rendering(d65)
+    assert rendering.cct == pytest.approx(6504, abs=2)
+    assert rendering.ra == pytest.approx(100, abs=0.01)
+    assert np.allclose(rendering.ri, 100, atol=0.01)
+    # while a black body of the same temperature does not
+    assert analysis.color_rendering(planck(analysis.wavelength, 6504.0)).ra < 99
+    assert analysis.color_rendering(daylight(analysis.wavelength, [5003.0, 7500.0])).ra == pytest.approx(100, abs=0.05)
+
+    # below 5000 K the reference is still a black body
+    reference = analysis.reference([4000.0, 5000.0])
+    assert np.allclose(reference[0], planck(analysis.wavelength, 4000.0))
+    assert np.allclose(reference[1], daylight(analysis.wavelength, 5000.0))
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import scipy.stats
+from pyspectrum import Pyrometry, PyrometryMeter
+from pyspectrum import pyrometry as pyrometry_module
+from pyspectrum.led import planck
+from pyspectrum.pyrometry import C2, to_wien
+from .conftest import make_frame
+
+
+def make_spectrum(temperature, noise=0.0, seed=0):
+    wavelength = np.linspace(400, 1100, 512)
+    response = 0.5 + np.exp(-0.5 * ((wavelength - 700) / 200) ** 2)
+    intensity = planck(wavelength, temperature) * response * 5000 / planck(1100.0, 2500.0)
+    intensity = intensity + noise * np.random.default_rng(seed).standard_normal(intensity.shape)
+    return make_frame(np.atleast_2d(intensity), 10, wavelength)
+
+
+def reference_fit(pyrometry, intensity):
+    x, y = pyrometry.wien(intensity)
+    lo, hi = C2 / 1000, C2 / 500
+    start, stop = np.abs(x - lo).argmin(), np.abs(x - hi).argmin()
+    m, c = np.polyfit(x[start:stop], y[start:stop], 1)
+    residuals = y[start:stop] - (m * x[start:stop] + c)
+    df = len(intensity) - 2
+    deviation = scipy.stats.t.interval(0.95, df=df)[1] * np.sqrt(
+        (residuals ** 2).sum() / df / ((x[start:stop] - x[start:stop].mean()) ** 2).sum()) / m ** 2
+    return -1 / m, deviation
+
+
+def test_temperature(monkeypatch):
+    pyrometry = Pyrometry(make_spectrum(2200.0), 2200.0, (500, 1000))
+    temperature = np.linspace(1500, 2500, 7)
+    spectrum = make_spectrum(temperature, noise=0.05)
+    before = spectrum.intensity.copy()
+
+    result = pyrometry(spectrum)
+    assert result.temperature.shape == result.deviation.shape == (7,)
+    assert np.allclose(result.temperature, temperature, rtol=0.05)
+    assert np.array_equal(spectrum.intensity, before)
+    assert np.any(before <= 0)  # noisy dark pixels are floored, not modified in place
+
+    for i in range(7):
+        expected_temperature, expected_deviation = reference_fit(pyrometry, spectrum.intensity[i])
+        assert result.temperature[i] == pytest.approx(expected_temperature, rel=1e-9)
+        assert result.deviation[i] == pytest.approx(expected_deviation, rel=1e-4)
+    assert pyrometry(spectrum.intensity[3]).temperature == pytest.approx(result.temperature[3])
+
+    monkeypatch.setattr(pyrometry_module, '_FIT_BLOCK', 1000)
+    assert np.allclose(pyrometry(spectrum).temperature, result.temperature, rtol=1e-12)
+
+
+def test_noise_free_blackbody():
+    pyrometry = Pyrometry(make_spectrum(2200.0), 2200.0, (500, 1000))
+    result = pyrometry(make_spectrum(2200.0))
+    assert result.temperature[0] == pytest.approx(2200.0, rel=1e-9)
+    assert result.deviation[0] == pytest.approx(0, abs=1e-3)
+    x, y = to_wien([500.0], [1.0])
+    assert x[0] == C2 / 500 and y[0] == pytest.approx(4 * np.log(500))
+
+    with pytest.raises(ValueError):
+        pyrometry(np.ones(10))
+    with pytest.raises(ValueError):
+        Pyrometry(make_spectrum(2200.0), 2200.0, (600, 600.5))
+
+
+def test_meter():
+    pyrometry = Pyrometry(make_spectrum(2200.0), 2200.0, (500, 1000))
+    spectrum = make_spectrum(np.linspace(1500, 2500, 5), noise=0.05)
+    expected = pyrometry(spectrum)
+
+    results = []
+    meter = PyrometryMeter(pyrometry, frames=2, on_result=lambda result: results.append(result.temperature.copy()))
+    assert np.isnan(meter.temperature)
+    meter(spectrum)
+    meter(spectrum.intensity[1])
+    assert np.array_equal(results[0], expected.temperature)
+    assert results[1] == pytest.approx([expected.temperature[1]])
+    assert meter.temperature == pytest.approx(expected.temperature[1])
+    assert meter.deviation == pytest.approx(expected.deviation[1])
+    assert meter.position == 6
+
+    with pytest.raises(ValueError):
+        meter(np.ones(10))
@@ -0,0 +1,166 @@
+import zlib
+
+import numpy as np
+import pytest
+from pyspectrum import Data, Spectrum, Recorder, RecordingReader, chunk_codec
+from .conftest import make_frame
+
+
+def make_spectrum(first_line, n_times, exposure=10) -> Spectrum:
+    lines = np.arange(first_line, first_line + n_times, dtype=float)
+    return make_frame(np.repeat(lines[:, None], 4, axis=1), exposure, wavelength=[400., 500., 600., 700.])
+
+
+def test_record_and_seek(tmp_path):
+    path = str(tmp_path / 'run.rec')
+    with Recorder(path, chunk_frames=4) as recorder:
+        for i in range(5):
+            recorder.write(make_spectrum(3 * i, 3), timestamp=100 + 3 * i * 0.01)
+
+    reader = RecordingReader(path)
+    assert reader.n_frames == len(reader) == 15
+    assert len(reader.index) == 4
+    assert list(reader.index['n_frames']) == [4, 4, 4, 3]
+    assert np.array_equal(reader.wavelength, [400., 500., 600., 700.])
+
+    frame = reader[5]
+    assert isinstance(frame, Spectrum)
+    assert frame.exposure == 10
+    assert np.all(frame.intensity == 5)
+
+    # across chunk boundaries
+    frames = reader[2:11]
+    assert np.array_equal(frames.intensity[:, 0], np.arange(2, 11))
+    assert not frames.clipped.any()
+    assert np.array_equal(reader[-1].intensity[:, 0], [14])
+
+    # one chunk is returned without copying
+    assert not reader[4:8].intensity.flags.owndata
+
+    assert reader.timestamp(7) == pytest.approx(100.07)
+    assert reader.frame_at(100.07) == 7
+    assert reader.frame_at(100.071) == 8
+    assert np.array_equal(reader.time_range(100.02, 100.065).intensity[:, 0], [2, 3, 4, 5, 6])
+    assert reader.time_range(200, 300).n_times == 0
+    reader.close()
+
+
+def test_record_data_and_exposure_change(tmp_path):
+    path = str(tmp_path / 'run.rec')
+    recorder = Recorder(path, chunk_frames=10)
+    data = make_spectrum(0, 2)
+    recorder(Data(data.intensity, data.clipped, 10))
+    recorder(Data(data.intensity, data.clipped, 20))
+    recorder.close()
+
+    reader = RecordingReader(path)
+    assert reader.wavelength is None
+    assert type(reader[0]) == Data
+    assert list(reader.index['exposure']) == [10, 20]
+    assert reader[2].exposure == 20
+    with pytest.raises(ValueError):
+        reader.read(0, 4)
+    with pytest.raises(IndexError):
+        reader[4]
+
+
+def test_writer_error(tmp_path):
+    recorder = Recorder(str(tmp_path / 'run.rec'))
+    recorder.write(make_spectrum(0, 1))
+    recorder.write(Data(np.zeros((1, 3)), np.zeros((1, 3), dtype=bool), 10))
+    with pytest.raises(RuntimeError):
+        recorder.close()
+
+
+def test_writer_error_on_close(tmp_path, monkeypatch):
+    def fail(*args):
+        raise ValueError('encode failed')
+
+    monkeypatch.setattr(chunk_codec, 'encode', fail)
+    recorder = Recorder(str(tmp_path / 'run.rec'), compression='zlib', workers=1)
+    recorder.write(make_spectrum(0, 1))
+    with pytest.raises(RuntimeError):
+        recorder.close()
+
+
+def test_empty_recording(tmp_path):
+    path = str(tmp_path / 'run.rec')
+    Recorder(path).close()
+    with pytest.raises(ValueError, match='empty'):
+        RecordingReader(path)
+
+
+@pytest.mark.parametrize("compression", ['zlib', 'lzma'])
+def test_compressed_recording(tmp_path, compression):
+    rng = np.random.default_rng(0)
+    base = rng.integers(1000, 3000, size=64)
+    counts = base + rng.integers(-3, 4, size=(200, 64))
+    raw = Data(counts * 0.5, counts == counts.max(), 10)
+    noisy = Spectrum(rng.normal(size=(30, 64)), np.zeros((30, 64), dtype=bool), 10, np.arange(64.))
+
+    plain_path = str(tmp_path / 'plain.rec')
+    with Recorder(plain_path, chunk_frames=32) as recorder:
+        recorder.write(raw, timestamp=0)
+
+    path = str(tmp_path / 'raw.rec')
+    with Recorder(path, chunk_frames=32, compression=compression, quantum=0.5, workers=3) as recorder:
+        for i in range(0, 200, 50):
+            recorder.write(raw[i:i + 50], timestamp=i / 100)
+
+    reader = RecordingReader(path)
+    assert reader.compression == compression
+    assert np.array_equal(reader[:].intensity, raw.intensity)
+    assert np.array_equal(reader[:].clipped, raw.clipped)
+    assert np.array_equal(reader[70:75].intensity, raw.intensity[70:75])
+    assert reader.index['size'].sum() * 4 < RecordingReader(plain_path).index['size'].sum()
+
+    # values which are not multiples of quantum are stored as floats without loss
+    noisy_path = str(tmp_path / 'noisy.rec')
+    with Recorder(noisy_path, chunk_frames=8, compression=compression) as recorder:
+        recorder.write(noisy)
+    spectrum = RecordingReader(noisy_path)[:]
+    assert np.array_equal(spectrum.intensity, noisy.intensity)
+    assert np.array_equal(spectrum.wavelength, noisy.wavelength)
+
+    # so are non-finite values
+    for value in (np.inf, np.nan):
+        special = Data(np.array([[1, 2, value, 4], [-np.inf, 0, 5, 3]]), np.zeros((2, 4), dtype=bool), 10)
+        special_path = str(tmp_path / 'special.rec')
+        with Recorder(special_path, compression=compression) as recorder:
+            recorder.write(special)
+        assert np.array_equal(RecordingReader(special_path)[:].intensity, special.intensity, equal_nan=True)
+
+
+@pytest.mark.parametrize("low, high", [(38000, 40076), (-500, 500), (-40000, 70000)])
+def test_codec_delta(low, high):
+    rng = np.random.default_rng(1)
+    base = rng.integers(low, high - 10, size=(1, 64))
+    counts = base + rng.integers(0, 10, size=(100, 64))
+    intensity = counts * 0.25
+    clipped = counts == counts.max()
+
+    block = chunk_codec.encode(intensity, clipped, 'zlib', quantum=0.25)
+    _, filters, dtype_code, *_ = chunk_codec.CHUNK_HEADER.unpack_from(block)
+    # разность не расширяет тип хранения даже для отсчетов выше 32767
+    assert filters & chunk_codec.FILTER_DELTA
+    assert chunk_codec._DTYPES[dtype_code].itemsize == (2 if high - low < 2 ** 16 else 4)
+    decoded, decoded_clipped = chunk_codec.decode(block, counts.shape)
+    assert np.array_equal(decoded, intensity)
+    assert np.array_equal(decoded_clipped, clipped)
+
+
+def test_codec_legacy_delta():
+    counts = np.array([[30000, 10], [40000, 12]])
+    deltas = np.array([[30000, 10], [10000, 2]], dtype='<i2')
+    payload = zlib.compress(chunk_codec._shuffle(deltas))
+    clipped = zlib.compress(np.packbits(np.zeros(4, dtype=bool)).tobytes())
+    header = chunk_codec.CHUNK_HEADER.pack(1, chunk_codec.FILTER_DELTA | chunk_codec.FILTER_SHUFFLE, 2, 0,
+                                           len(payload), len(clipped), 1.0)
+    assert np.array_equal(chunk_codec.decode(header + payload + clipped, (2, 2))[0], counts)
+
+
+def test_codec_quantum(tmp_path):
+    with pytest.raises(ValueError):
+        chunk_codec.encode(np.zeros((1, 4)), np.zeros((1, 4), dtype=bool), 'zlib', quantum=0)
+    with pytest.raises(ValueError):
+        Recorder(str(tmp_path / 'run.rec'), compression='zlib', quantum=-1.0)
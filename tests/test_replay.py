@@ -0,0 +1,93 @@
+import json
+import time
+
+import numpy as np
+import pytest
+from pyspectrum import Data, FactoryConfig, Recorder, Replay, Spectrometer, Spectrum
+from .conftest import make_frame
+
+
+def make_raw(n_times=20, n_numbers=10) -> Data:
+    lines = np.arange(n_times, dtype=float)[:, None]
+    return make_frame((lines * 100 + np.arange(n_numbers)) * 0.5, exposure=2)
+
+
+def create_device(tmp_path, replay: Replay) -> Spectrometer:
+    device = Spectrometer(factory_config=FactoryConfig(5, 15, True, 0.5), replay=replay)
+    profile_path = str(tmp_path / 'profile.json')
+    with open(profile_path, 'w') as f:
+        json.dump({'wavelengths': list(range(10))}, f)
+    device.set_config(exposure=2, wavelength_calibration_path=profile_path)
+    return device
+
+
+@pytest.mark.parametrize("source", ['data', 'file', 'recording'])
+def test_replay_raw(tmp_path, source):
+    raw = make_raw()
+    if source == 'file':
+        path = str(tmp_path / 'raw.bin')
+        raw.save(path)
+        raw_source = path
+    elif source == 'recording':
+        path = str(tmp_path / 'raw.rec')
+        with Recorder(path, chunk_frames=7) as recorder:
+            recorder.write(raw)
+        raw_source = path
+    else:
+        raw_source = raw
+
+    device = create_device(tmp_path, Replay(raw_source, speed=None))
+    device.open()
+    assert np.array_equal(device.read_raw(n_times=15).intensity, raw.intensity[:15])
+    # the replay loops over the source
+    assert np.array_equal(device.read_raw(n_times=10).intensity, np.concatenate([raw.intensity[15:], raw.intensity[:5]]))
+    device.close()
+
+
+def test_replay_lazy_file(tmp_path):
+    raw = make_raw()
+    samples = (raw.intensity * 2).astype(np.uint16)
+    path = str(tmp_path / 'raw.bin')
+    Data.from_raw(samples, raw.clipped, raw.exposure, scale=0.5).save(path)
+
+    replay = Replay(path, speed=None)
+    device = create_device(tmp_path, replay)
+    device.open()
+    assert np.array_equal(device.read_raw(n_times=15).intensity, raw.intensity[:15])
+    device.close()
+    # only the replayed rows are converted, the recording stays memory-mapped samples
+    assert replay._data.is_lazy
+
+
+def test_replay_read(tmp_path):
+    raw = make_raw()
+    replay = Replay(raw, speed=None, loop=False)
+    device = create_device(tmp_path, replay)
+    device.read_dark_signal(n_times=1)
+
+    spectra = []
+    device.read_non_block(spectra.append, frames_to_read=18, frames_interval=6)
+    assert len(spectra) == 3
+    assert isinstance(spectra[0], Spectrum)
+    assert np.array_equal(spectra[0].intensity, raw.intensity[1:7] - raw.intensity[0])
+
+    device.open()
+    with pytest.raises(RuntimeError):
+        device.read_raw(n_times=2)
+    device.close()
+
+
+def test_replay_speed(tmp_path):
+    device = create_device(tmp_path, Replay(make_raw(), speed=2))
+    device.set_config(exposure=20)
+    device.open()
+    started = time.monotonic()
+    device.read_raw(n_times=10)
+    assert time.monotonic() - started >= 0.1
+    device.close()
+
+
+def test_replay_incompatible(tmp_path):
+    device = create_device(tmp_path, Replay(make_raw(n_numbers=4)))
+    with pytest.raises(ValueError):
+        device.open()
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+from pyspectrum import Resampler, Spectrum
+from .conftest import make_frame
+
+
+def make_spectrum(reverse=False) -> Spectrum:
+    wavelength = np.linspace(400, 700, 301)
+    intensity = np.random.default_rng(0).random((3, 301))
+    clipped = np.zeros((3, 301), dtype=bool)
+    clipped[1, 100] = True  # 500 nm
+    if reverse:
+        wavelength, intensity, clipped = wavelength[::-1], intensity[:, ::-1], clipped[:, ::-1]
+    return make_frame(intensity, 10, wavelength, clipped)
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_linear(reverse):
+    spectrum = make_spectrum(reverse)
+    target = np.arange(390.5, 710, 2.0)
+    result = Resampler(target, method='linear')(spectrum)
+
+    order = np.argsort(spectrum.wavelength)
+    expected = [np.interp(target, spectrum.wavelength[order], row[order], left=np.nan, right=np.nan)
+                for row in spectrum.intensity]
+    assert result.shape == (3, len(target))
+    assert np.allclose(result.intensity, expected, equal_nan=True)
+    assert np.array_equal(result.wavelength, target)
+    assert np.array_equal(np.flatnonzero(result.clipped[1]), np.flatnonzero(np.abs(target - 500) < 1))
+
+
+def test_nearest():
+    spectrum = make_spectrum()
+    resampler = Resampler([399, 400.2, 555.6, 800], method='nearest', fill_value=None)
+    result = resampler.apply(spectrum.intensity[0], spectrum.wavelength)
+    assert np.array_equal(result, spectrum.intensity[0, [0, 0, 156, 300]])
+
+
+def test_area():
+    spectrum = make_spectrum()
+    target = np.arange(405, 700, 10.0)
+    result = Resampler(target, method='area').apply(spectrum.intensity, spectrum.wavelength)
+
+    row = spectrum.intensity[0]
+    assert np.isclose(result[0, 0], (0.5 * row[0] + row[1:10].sum() + 0.5 * row[10]) / 10)
+    # area under the spectrum is preserved
+    assert np.allclose(result.sum(axis=1) * 10, np.trapezoid(spectrum.intensity, spectrum.wavelength, axis=1))
+
+
+def test_matrix_cache():
+    spectrum = make_spectrum()
+    resampler = Resampler(np.arange(400, 701, 5.0), cache_size=1)
+    matrix = resampler.matrix(spectrum.wavelength)
+    assert resampler.matrix(spectrum.wavelength) is matrix
+    assert resampler.matrix(spectrum.wavelength.copy()) is matrix
+    resampler.matrix(spectrum.wavelength[::-1].copy())
+    assert resampler.matrix(spectrum.wavelength.copy()) is not matrix
+
+    with pytest.raises(ValueError):
+        Resampler([1, 2], method='cubic')
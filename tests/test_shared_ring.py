@@ -0,0 +1,90 @@
+import multiprocessing
+
+import numpy as np
+import pytest
+from pyspectrum import Data, Spectrum, SpectrumPublisher, SpectrumSubscriber, OverrunError
+from .conftest import make_frame
+
+
+def make_data(value, n_times=2, n_numbers=5, exposure=3) -> Data:
+    return make_frame(np.full((n_times, n_numbers), value), exposure)
+
+
+def test_publish_and_read():
+    wl = np.arange(5, dtype=float)
+    with SpectrumPublisher(n_numbers=5, max_times=2, capacity=4, wavelength=wl) as publisher:
+        with SpectrumSubscriber(publisher.name) as subscriber:
+            assert subscriber.next(timeout=0) is None
+
+            publisher(make_data(1.0))
+            publisher(make_data(2.0, n_times=1))
+
+            first = subscriber.next(timeout=0)
+            assert isinstance(first, Spectrum)
+            assert first.shape == (2, 5)
+            assert first.exposure == 3
+            assert np.array_equal(first.wavelength, wl)
+            assert np.all(first.intensity == 1.0)
+            # zero-copy: the spectrum is a view into the ring buffer
+            assert not first.intensity.flags.owndata
+
+            second = subscriber.next(timeout=0)
+            assert second.shape == (1, 5)
+            assert np.all(second.intensity == 2.0)
+            assert subscriber.is_valid(subscriber.last_sequence)
+            del first, second
+
+
+def test_overrun():
+    with SpectrumPublisher(n_numbers=5, max_times=2, capacity=3) as publisher:
+        with SpectrumSubscriber(publisher.name) as subscriber:
+            for i in range(3):
+                publisher.publish(make_data(i))
+            data = subscriber.next(timeout=0)
+            assert type(data) == Data
+            assert np.all(data.intensity == 0)
+
+            publisher.publish(make_data(3))
+            assert not subscriber.is_valid(0)
+
+            for i in range(4, 10):
+                publisher.publish(make_data(i))
+            with pytest.raises(OverrunError):
+                subscriber.next(timeout=0)
+            assert subscriber.lost > 0
+
+            data = subscriber.next(timeout=0)
+            assert np.all(data.intensity == subscriber.last_sequence)
+            del data
+
+
+def test_incompatible_data():
+    with SpectrumPublisher(n_numbers=5, max_times=2) as publisher:
+        with pytest.raises(ValueError):
+            publisher.publish(make_data(0, n_numbers=4))
+        with pytest.raises(ValueError):
+            publisher.publish(make_data(0, n_times=3))
+
+
+def _consume(name, n_frames, queue):
+    with SpectrumSubscriber(name) as subscriber:
+        sums = []
+        for _ in range(n_frames):
+            data = subscriber.next(timeout=10)
+            sums.append(float(data.intensity.sum()))
+        del data
+    queue.put(sums)
+
+
+def test_other_process():
+    ctx = multiprocessing.get_context('spawn')
+    queue = ctx.Queue()
+    with SpectrumPublisher(n_numbers=5, max_times=2, capacity=8) as publisher:
+        process = ctx.Process(target=_consume, args=(publisher.name, 3, queue))
+        process.start()
+        for i in range(3):
+            publisher.publish(make_data(i + 1))
+        sums = queue.get(timeout=30)
+        process.join(timeout=30)
+
+    assert sums == [10.0, 20.0, 30.0]
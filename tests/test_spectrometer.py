@@ -12,11 +12,16 @@ class MockUsbDevice:
     def __init__(self, vendor=0, product=0, read_timeout=0):
         self._opened = True
         self._timer = 0
+        self.requests = []
         
     def set_timer(self, millis):
         self._timer = millis
         
+    def get_pixel_count(self):
+        return self.resolution
+
     def read_frame(self, n_times):
+        self.requests.append(n_times)
         samples = np.array([np.arange(0, self.resolution, 1) + i for i in range(n_times)])
         clipped = np.zeros((n_times, self.resolution), dtype=bool)
         return Frame(samples=samples, clipped=clipped)
@@ -227,4 +232,119 @@ def test_non_block_read(device: Spectrometer, tmp_path):
 
     frames_read = 0
     device.read_non_block(callback, frames_to_read=6, frames_interval=2)  # Read 6 frames, 2 at time
-    assert frames_read == 3
\ No newline at end of file
+    assert frames_read == 3
+
+def configure(device: Spectrometer, tmp_path):
+    profile_path = str(tmp_path / 'profile.json')
+    write_calibration_data(profile_path, np.arange(0, 10, 1).tolist())
+    device.set_config(dark_signal_path=str(tmp_path / 'dark'), wavelength_calibration_path=profile_path)
+    device.read_dark_signal()
+
+
+def test_capture_event_predicate(device: Spectrometer, tmp_path):
+    configure(device, tmp_path)
+    reads = 0
+
+    # intensity of every line equals its line number in the frame
+    def predicate(spectrum):
+        nonlocal reads
+        reads += 1
+        flags = np.zeros(spectrum.n_times, dtype=bool)
+        if reads == 4:
+            flags[2] = True
+        return flags
+
+    event = device.capture_event(pre_frames=5, post_frames=7, predicate=predicate, frames_interval=4)
+    assert isinstance(event, Spectrum)
+    assert event.shape == (12, 10)
+    assert np.array_equal(event.intensity[:, 0], [1, 2, 3, 0, 1, 2, 3, 0, 1, 2, 3, 0])
+    assert np.array_equal(event.wavelength, np.arange(0, 10, 1))
+
+
+def test_capture_event_reuses_buffers(device: Spectrometer, tmp_path):
+    configure(device, tmp_path)
+    buffers = []
+
+    def predicate(spectrum):
+        buffers.append((spectrum.intensity, spectrum.clipped))
+        return False
+
+    assert device.capture_event(pre_frames=6, post_frames=2, predicate=predicate, frames_interval=3, timeout=0.05) is None
+    # every frame is read into the same arrays
+    assert len(buffers) > 1
+    assert all(intensity is buffers[0][0] and clipped is buffers[0][1] for intensity, clipped in buffers)
+
+
+def test_capture_event_short_history(device: Spectrometer, tmp_path):
+    configure(device, tmp_path)
+    event = device.capture_event(pre_frames=10, post_frames=3, predicate=lambda s: True, frames_interval=2)
+    assert event.shape == (3, 10)
+
+
+def test_capture_event_software_trigger(device: Spectrometer, tmp_path):
+    configure(device, tmp_path)
+    device.set_config(exposure=1)
+    device.read_dark_signal()
+    with pytest.raises(RuntimeError):
+        device.trigger()
+
+    def trigger_later():
+        time.sleep(0.05)
+        device.trigger()
+
+    thread = threading.Thread(target=trigger_later)
+    thread.start()
+    event = device.capture_event(pre_seconds=0.003, post_frames=2, frames_interval=1)
+    thread.join()
+    assert event.shape == (5, 10)
+
+    assert device.capture_event(pre_frames=1, post_frames=1, timeout=0.01) is None
+
+
+def test_memory_budget(device: Spectrometer, tmp_path):
+    configure(device, tmp_path)
+    device.open()
+
+    # result fits into the budget, device is asked for sub-frames of 3 lines
+    # (mock line values restart from zero in every sub-frame)
+    budget = 50 * 10 * 9 + 3 * MockUsbDevice.resolution * 16
+    spectrum = device.read(n_times=50, memory_budget=budget)
+    assert spectrum.shape == (50, 10)
+    assert np.array_equal(spectrum.intensity[:, 0], np.arange(50) % 3)
+    assert np.array_equal(spectrum.intensity[:, 0], spectrum.intensity[:, 9])
+    assert type(spectrum.intensity) == np.ndarray
+
+    # result does not fit, it is spilled to disk
+    device.set_config(memory_budget=MockUsbDevice.resolution * 16 + 100)
+    raw = device.read_raw(n_times=50)
+    assert isinstance(raw.intensity, np.memmap)
+    assert np.array_equal(raw.intensity[:, 0], np.zeros(50))
+    assert not raw.clipped.any()
+
+    # a budget below one device line cannot be met
+    with pytest.raises(ValueError):
+        device.read_raw(n_times=5, memory_budget=MockUsbDevice.resolution * 16 - 1)
+    with pytest.raises(ValueError):
+        device.read(n_times=5, memory_budget=100, lazy=True)
+    device.close()
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_lazy_read(tmp_path, reverse):
+    device = create_device(tmp_path, 2, 12, reverse)
+    configure(device, tmp_path)
+    device.open()
+
+    raw = device.read_raw(n_times=3, lazy=True)
+    assert raw.is_lazy
+    assert np.array_equal(raw.intensity, device.read_raw(n_times=3).intensity)
+
+    spectrum = device.read(n_times=3, lazy=True)
+    assert spectrum.is_lazy
+    assert np.array_equal(spectrum.mean(), device.read(n_times=3).mean())
+    assert np.array_equal(spectrum.intensity, device.read(n_times=3).intensity)
+    assert np.array_equal(spectrum.wavelength, np.arange(0, 10, 1))
+
+    # does not fit into the memory budget, read eagerly in parts
+    assert not device.read(n_times=3, lazy=True, memory_budget=MockUsbDevice.resolution * 16 + 100).is_lazy
+    device.close()
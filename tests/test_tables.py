@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+from pyspectrum import Colorimetry, FlickerAnalysis, LedAnalysis, tables
+
+
+def test_tables():
+    for name in tables.OBSERVERS:
+        observer = tables.observer(name)
+        assert observer.dtype.names == ('wavelength', 'X', 'Y', 'Z')
+        assert observer['wavelength'][0] == 360 and observer['wavelength'][-1] == 830
+    for name in tables.ILLUMINANTS:
+        assert tables.illuminant(name).dtype.names == ('wavelength', 'intensity')
+    assert np.allclose(tables.efficiency()['V'], tables.observer('2deg')['Y'])
+    assert tables.color_samples()['reflectance'].shape == (95, 14)
+
+    # memory-mapped, read-only and loaded once
+    observer = tables.observer()
+    assert isinstance(observer, np.memmap) and not observer.flags.writeable
+    assert tables.observer('2deg') is observer
+
+    with pytest.raises(ValueError):
+        tables.observer('5deg')
+    with pytest.raises(ValueError):
+        tables.illuminant('A')
+
+
+def test_defaults():
+    colorimetry = Colorimetry()
+    assert np.allclose(colorimetry.white_point, [0.95047, 1, 1.08883], atol=1e-4)
+    assert np.allclose(Colorimetry(illuminant=tables.illuminant('E')).white_point, 1, atol=1e-3)
+
+    analysis = LedAnalysis(wavelength=np.arange(360, 831.0), samples=tables.color_samples())
+    d65 = np.interp(analysis.wavelength, tables.illuminant()['wavelength'], tables.illuminant()['intensity'])
+    assert analysis.cct(analysis.xyY(d65)) == pytest.approx(6504, abs=2)
+    temperature = np.array([2700.0, 4500.0])
+    assert np.allclose(analysis.color_rendering(analysis.blackbody(temperature), temperature).ra, 100)
+
+    wavelength = np.arange(300, 900, 2.0)
+    assert np.array_equal(FlickerAnalysis().weights(wavelength),
+                          FlickerAnalysis(tables.efficiency()).weights(wavelength))